@@ -0,0 +1,79 @@
+"""Construction throughput of a typical root entity.
+
+Run it from the package root with ``python -m benchmarks.construction``. The JSON results are written to the standard output
+(or to the ``--output`` file), and they can be compared with the results of a previous run with ``--compare``.
+"""
+
+from collections.abc import (
+    Iterator,
+)
+from datetime import (
+    datetime,
+)
+from typing import (
+    Optional,
+)
+from unittest.mock import (
+    MagicMock,
+)
+from uuid import (
+    uuid4,
+)
+
+from minos.aggregate import (
+    EventRepository,
+    RootEntity,
+    SnapshotRepository,
+)
+from minos.common import (
+    current_datetime,
+)
+from minos.common.benchmarks import (
+    Case,
+    main,
+)
+
+# The repositories are not used while building instances, so they are replaced by placeholders.
+EVENT_REPOSITORY = MagicMock(spec=EventRepository)
+SNAPSHOT_REPOSITORY = MagicMock(spec=SnapshotRepository)
+
+
+class Product(RootEntity):
+    """Product class."""
+
+    title: str
+    description: Optional[str]
+    price: float
+    stock: int
+    tags: list[str]
+    released_at: Optional[datetime]
+
+
+def build_product() -> Product:
+    """Build a root entity instance."""
+    return Product(
+        "Foo",
+        "A very nice product",
+        34.5,
+        12,
+        ["one", "two", "three"],
+        current_datetime(),
+        uuid=uuid4(),
+        version=3,
+        created_at=current_datetime(),
+        updated_at=current_datetime(),
+        _event_repository=EVENT_REPOSITORY,
+        _snapshot_repository=SNAPSHOT_REPOSITORY,
+    )
+
+
+def build_cases() -> Iterator[Case]:
+    """Build all the cases of the suite.
+
+    :return: An iterator of ``Case`` instances.
+    """
+    yield Case("RootEntity", build_product)
+
+
+if __name__ == "__main__":
+    main(build_cases(), __doc__)
@@ -0,0 +1,120 @@
+"""Decoding throughput of large root entity snapshots.
+
+Run it from the package root with ``python -m benchmarks.snapshots``. The JSON results are written to the standard output
+(or to the ``--output`` file), and they can be compared with the results of a previous run with ``--compare``.
+"""
+
+import sys
+from collections.abc import (
+    Iterator,
+)
+from typing import (
+    Optional,
+)
+from unittest.mock import (
+    MagicMock,
+)
+from uuid import (
+    uuid4,
+)
+
+from dependency_injector import (
+    containers,
+    providers,
+)
+
+from minos.aggregate import (
+    EventRepository,
+    RootEntity,
+    SnapshotEntry,
+    SnapshotRepository,
+    ValueObject,
+)
+from minos.common import (
+    current_datetime,
+)
+from minos.common.benchmarks import (
+    Case,
+    main,
+)
+
+# The repositories are not used while building instances, so they are replaced by placeholders.
+EVENT_REPOSITORY = MagicMock(spec=EventRepository)
+SNAPSHOT_REPOSITORY = MagicMock(spec=SnapshotRepository)
+
+
+class Review(ValueObject):
+    """Review class."""
+
+    author: str
+    rating: int
+    comment: Optional[str]
+
+
+class Catalog(RootEntity):
+    """Catalog class."""
+
+    title: str
+    description: Optional[str]
+    tags: list[str]
+    attributes: dict[str, str]
+    reviews: list[Review]
+
+
+def build_entry(size: int) -> SnapshotEntry:
+    """Build a snapshot entry containing a large root entity.
+
+    :param size: The number of items of each collection.
+    :return: A ``SnapshotEntry`` instance.
+    """
+    instance = Catalog(
+        "Foo",
+        "A very nice catalog",
+        [f"tag-{i}" for i in range(size)],
+        {f"key-{i}": f"value-{i}" for i in range(size)},
+        [Review(f"author-{i}", i % 5, None if i % 2 else "Great!") for i in range(size)],
+        uuid=uuid4(),
+        version=3,
+        created_at=current_datetime(),
+        updated_at=current_datetime(),
+        _event_repository=EVENT_REPOSITORY,
+        _snapshot_repository=SNAPSHOT_REPOSITORY,
+    )
+    return SnapshotEntry.from_root_entity(instance)
+
+
+def build_untrusted(entry: SnapshotEntry) -> RootEntity:
+    """Rebuild the root entity validating again every field, as ``SnapshotEntry.build`` did before.
+
+    :param entry: The snapshot entry.
+    :return: A ``RootEntity`` instance.
+    """
+    data = entry.data | {
+        "uuid": entry.uuid,
+        "version": entry.version,
+        "created_at": entry.created_at,
+        "updated_at": entry.updated_at,
+    }
+    return RootEntity.from_avro(entry.schema, data)
+
+
+def build_cases() -> Iterator[Case]:
+    """Build all the cases of the suite.
+
+    :return: An iterator of ``Case`` instances.
+    """
+    for size in (10, 100, 1000):
+        entry = build_entry(size)
+        yield Case(f"SnapshotEntry.build (size={size})", entry.build)
+        yield Case(f"RootEntity.from_avro (size={size})", lambda entry=entry: build_untrusted(entry))
+
+
+if __name__ == "__main__":
+    container = containers.DynamicContainer()
+    container.event_repository = providers.Object(EVENT_REPOSITORY)
+    container.snapshot_repository = providers.Object(SNAPSHOT_REPOSITORY)
+    container.wire(modules=[sys.modules["minos.aggregate"]])
+    try:
+        main(build_cases(), __doc__)
+    finally:
+        container.unwire()
@@ -143,7 +143,7 @@ class EventEntry:
 
         :return: An ``Event`` instance.
         """
-        return Event(
+        return Event.from_trusted(
             self.uuid,
             self.name,
             self.version,
@@ -161,7 +161,7 @@ class EventEntry:
         if not self.data:
             return FieldDiffContainer.empty()
 
-        return FieldDiffContainer.from_avro_bytes(self.data)
+        return FieldDiffContainer.from_avro_bytes(self.data, trusted=True)
 
     def __eq__(self, other: "EventEntry") -> bool:
         return type(self) == type(other) and tuple(self) == tuple(other)
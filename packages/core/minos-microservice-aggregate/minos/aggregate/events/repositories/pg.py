@@ -61,10 +61,10 @@ class PostgreSqlEventRepository(PostgreSqlMinosDatabase, EventRepository):
         if entry.uuid != NULL_UUID:
             lock = entry.uuid.int & (1 << 32) - 1
 
-        query, params = await self._build_query(entry)
-
         try:
-            response = await self.submit_query_and_fetchone(query, params, lock=lock)
+            async with self.session():
+                query, params = await self._build_query(entry)
+                response = await self.submit_query_and_fetchone(query, params, lock=lock)
         except IntegrityError:
             raise EventRepositoryConflictException(
                 f"{entry!r} could not be submitted due to a key (uuid, version, transaction) collision",
@@ -177,7 +177,7 @@ class SnapshotEntry:
             "updated_at": self.updated_at,
         }
         data |= kwargs
-        instance = RootEntity.from_avro(self.schema, data)
+        instance = RootEntity.from_avro(self.schema, data, trusted=True)
         return instance
 
     @property
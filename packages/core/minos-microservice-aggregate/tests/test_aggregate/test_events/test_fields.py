@@ -102,7 +102,7 @@ class TestFieldDiffContainer(MinosTestCase):
                         "type": {
                             "fields": [{"name": "name", "type": "string"}, {"name": "value", "type": "int"}],
                             "name": "FieldDiff",
-                            "namespace": "minos.aggregate.events.fields.hola",
+                            "namespace": "minos.aggregate.events.fields._0",
                             "type": "record",
                         },
                     },
@@ -111,20 +111,19 @@ class TestFieldDiffContainer(MinosTestCase):
                         "type": {
                             "fields": [{"name": "name", "type": "string"}, {"name": "value", "type": "string"}],
                             "name": "FieldDiff",
-                            "namespace": "minos.aggregate.events.fields.adios",
+                            "namespace": "minos.aggregate.events.fields._1",
                             "type": "record",
                         },
                     },
                 ],
                 "name": "FieldDiffContainer",
-                "namespace": "minos.aggregate.events.fields.uno",
+                "namespace": "minos.aggregate.events.fields._0",
                 "type": "record",
             }
         ]
         with patch("minos.aggregate.FieldDiffContainer.generate_random_str", side_effect=["hello", "goodbye"]):
             diff = FieldDiffContainer([FieldDiff("doors", int, 5), FieldDiff("color", str, "yellow")])
-        with patch("minos.common.AvroSchemaEncoder.generate_random_str", side_effect=["uno", "hola", "adios"]):
-            self.assertEqual(expected, diff.avro_schema)
+        self.assertEqual(expected, diff.avro_schema)
 
     def test_avro_data(self):
         expected = {"hello": {"name": "doors", "value": 5}, "goodbye": {"name": "color", "value": "yellow"}}
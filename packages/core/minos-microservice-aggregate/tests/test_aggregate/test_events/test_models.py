@@ -109,6 +109,16 @@ class TestEvent(MinosTestCase):
         deserialized = Event.from_avro_bytes(serialized)
         self.assertEqual(self.diff, deserialized)
 
+    def test_avro_cached(self):
+        self.assertIs(self.diff.avro_data, self.diff.avro_data)
+        self.assertIs(self.diff.avro_bytes, self.diff.avro_bytes)
+
+        deserialized = Event.from_avro_bytes(self.diff.avro_bytes)
+        self.assertIs(deserialized.avro_bytes, deserialized.avro_bytes)
+
+        self.diff.version = 2
+        self.assertEqual(2, Event.from_avro_bytes(self.diff.avro_bytes).version)
+
     def test_decompose(self):
         aggr = Event(
             uuid=self.uuid,
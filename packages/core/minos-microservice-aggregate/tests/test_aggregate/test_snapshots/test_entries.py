@@ -2,9 +2,6 @@ import unittest
 from datetime import (
     datetime,
 )
-from unittest.mock import (
-    patch,
-)
 from uuid import (
     uuid4,
 )
@@ -64,15 +61,14 @@ class TestSnapshotEntry(MinosTestCase):
 
     def test_from_root_entity(self):
         car = Car(3, "blue", uuid=self.uuid, version=1)
-        with patch("minos.common.AvroSchemaEncoder.generate_random_str", return_value="hello"):
-            entry = SnapshotEntry.from_root_entity(car)
-            self.assertEqual(car.uuid, entry.uuid)
-            self.assertEqual(car.classname, entry.name)
-            self.assertEqual(car.version, entry.version)
-            self.assertEqual(car.avro_schema, entry.schema)
-            self.assertEqual({"color": "blue", "doors": 3, "owner": None}, entry.data)
-            self.assertEqual(car.created_at, entry.created_at)
-            self.assertEqual(car.updated_at, entry.updated_at)
+        entry = SnapshotEntry.from_root_entity(car)
+        self.assertEqual(car.uuid, entry.uuid)
+        self.assertEqual(car.classname, entry.name)
+        self.assertEqual(car.version, entry.version)
+        self.assertEqual(car.avro_schema, entry.schema)
+        self.assertEqual({"color": "blue", "doors": 3, "owner": None}, entry.data)
+        self.assertEqual(car.created_at, entry.created_at)
+        self.assertEqual(car.updated_at, entry.updated_at)
 
     def test_equals(self):
         a = SnapshotEntry(self.uuid, "example.Car", 0, self.schema, self.data)
@@ -0,0 +1,82 @@
+"""Json serialization time of models, compared with serializing their avro data.
+
+Run it from the package root with ``python -m benchmarks.json_encoding``.
+"""
+
+from __future__ import (
+    annotations,
+)
+
+from collections.abc import (
+    Callable,
+)
+from datetime import (
+    datetime,
+)
+from typing import (
+    Optional,
+)
+from uuid import (
+    UUID,
+    uuid4,
+)
+
+import orjson
+
+from minos.common import (
+    AvroDataEncoder,
+    DeclarativeModel,
+    JsonDataEncoder,
+    current_datetime,
+)
+from minos.common.benchmarks import (
+    measure,
+)
+
+SIZE = 1_000
+
+
+class Line(DeclarativeModel):
+    """Line class."""
+
+    sku: str
+    quantity: int
+    price: float
+    notes: Optional[str]
+
+
+class Order(DeclarativeModel):
+    """Order class, with the same fields as an aggregate entity."""
+
+    uuid: UUID
+    version: int
+    created_at: datetime
+    updated_at: datetime
+    customer: str
+    lines: list[Line]
+
+
+def build_orders() -> list[Order]:
+    """Build the orders of a large query response.
+
+    :return: A list of ``Order`` instances.
+    """
+    now = current_datetime()
+    lines = [Line(f"sku-{i}", i, 12.5, None) for i in range(10)]
+    return [Order(uuid4(), 1, now, now, "john", lines) for _ in range(SIZE)]
+
+
+def main() -> None:
+    """Run the benchmark."""
+    orders = build_orders()
+
+    avro = measure(lambda: orjson.dumps(AvroDataEncoder(orders).build()))
+    json = measure(lambda: JsonDataEncoder(orders).build())
+    assert orjson.dumps(AvroDataEncoder(orders).build()) == JsonDataEncoder(orders).build()
+
+    print(f"{SIZE} orders through avro data: {avro:,.2f} responses/sec")
+    print(f"{SIZE} orders through json encoder: {json:,.2f} responses/sec ({json / avro:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
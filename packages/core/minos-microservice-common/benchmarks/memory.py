@@ -0,0 +1,139 @@
+"""Memory footprint and attribute access time of declarative and slotted models.
+
+Run it from the package root with ``python -m benchmarks.memory``.
+"""
+
+from __future__ import (
+    annotations,
+)
+
+import gc
+import tracemalloc
+from collections.abc import (
+    Callable,
+)
+from datetime import (
+    datetime,
+)
+from typing import (
+    Optional,
+)
+from uuid import (
+    UUID,
+    uuid4,
+)
+
+from minos.common import (
+    DeclarativeModel,
+    Model,
+    SlottedDeclarativeModel,
+    current_datetime,
+)
+from minos.common.benchmarks import (
+    measure,
+)
+
+SIZE = 10_000
+
+
+class Review(DeclarativeModel):
+    """Review class."""
+
+    author: str
+    rating: int
+    comment: Optional[str]
+
+
+class SlottedReview(SlottedDeclarativeModel):
+    """Slotted Review class."""
+
+    author: str
+    rating: int
+    comment: Optional[str]
+
+
+class Item(DeclarativeModel):
+    """Item class, with the same fields as an aggregate entity."""
+
+    uuid: UUID
+    version: int
+    created_at: datetime
+    updated_at: datetime
+    name: str
+    price: float
+
+
+class SlottedItem(SlottedDeclarativeModel):
+    """Slotted Item class, with the same fields as an aggregate entity."""
+
+    uuid: UUID
+    version: int
+    created_at: datetime
+    updated_at: datetime
+    name: str
+    price: float
+
+
+NOW = current_datetime()
+
+
+def build_review(cls: type[Model], i: int) -> Model:
+    """Build a review instance.
+
+    :param cls: The review class.
+    :param i: The instance index.
+    :return: A ``Model`` instance.
+    """
+    return cls("author", i % 5, None)
+
+
+def build_item(cls: type[Model], i: int) -> Model:
+    """Build an item instance.
+
+    :param cls: The item class.
+    :param i: The instance index.
+    :return: A ``Model`` instance.
+    """
+    return cls(uuid4(), 1, NOW, NOW, "item", 12.5)
+
+
+def measure_memory(cls: type[Model], build: Callable[[type[Model], int], Model]) -> float:
+    """Compute the number of bytes allocated per instance.
+
+    The values of the fields are built before starting the measure, so only the model overhead is counted.
+
+    :param cls: The model class.
+    :param build: The function that builds a single instance.
+    :return: A ``float`` value.
+    """
+    instances = [build(cls, i) for i in range(SIZE)]
+    values = [[getattr(instance, name) for name in instance] for instance in instances]
+    del instances
+
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    instances = [cls(*row) for row in values]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    return (after - before) / len(instances)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    for cls, build in (
+        (Review, build_review),
+        (SlottedReview, build_review),
+        (Item, build_item),
+        (SlottedItem, build_item),
+    ):
+        instance = build(cls, 0)
+        name = next(iter(instance))
+        print(f"{cls.__name__}: {measure_memory(cls, build):,.1f} bytes/instance")
+        print(f"{cls.__name__} construction: {measure(lambda: build(cls, 0)):,.2f} instances/sec")
+        print(f"{cls.__name__}.{name}: {measure(lambda: getattr(instance, name)):,.2f} reads/sec")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,219 @@
+"""Serialization benchmark suite of models and protocols.
+
+Run it from the package root with ``python -m benchmarks.serialization``. The JSON results are written to the standard
+output (or to the ``--output`` file), and they can be compared with the results of a previous run with ``--compare``,
+which fails if any case is slower than the given ``--threshold``.
+"""
+
+from __future__ import (
+    annotations,
+)
+
+from collections.abc import (
+    Iterator,
+)
+from datetime import (
+    datetime,
+)
+from typing import (
+    Any,
+    Generic,
+    Optional,
+    TypeVar,
+    Union,
+)
+from uuid import (
+    UUID,
+    uuid4,
+)
+
+from minos.common import (
+    AvroDataEncoder,
+    DeclarativeModel,
+    MinosAvroProtocol,
+    MinosJsonBinaryProtocol,
+    Model,
+    TypeHintBuilder,
+    current_datetime,
+)
+from minos.common.benchmarks import (
+    Case,
+    main,
+)
+
+SIZES = (1, 10, 100)
+
+NOW = current_datetime()
+
+T = TypeVar("T", str, int)
+
+
+class Flat(DeclarativeModel):
+    """Flat class, with scalar fields only."""
+
+    uuid: UUID
+    name: str
+    quantity: int
+    price: float
+    active: bool
+    created_at: datetime
+
+
+class Nested(DeclarativeModel):
+    """Nested class, with nested models and containers."""
+
+    uuid: UUID
+    owner: Flat
+    items: list[Flat]
+    tags: dict[str, str]
+
+
+class Box(DeclarativeModel, Generic[T]):
+    """Box class, with generic fields."""
+
+    label: str
+    items: list[T]
+
+
+class Shelf(DeclarativeModel):
+    """Shelf class, with a parametrized generic model."""
+
+    name: str
+    box: Box[int]
+
+
+class Sparse(DeclarativeModel):
+    """Sparse class, with optional and union fields."""
+
+    number: Optional[int]
+    key: Union[int, str, None]
+    values: Optional[list[Union[int, str]]]
+    owner: Optional[Flat]
+    reference: Union[Flat, str]
+    scores: Optional[dict[str, Optional[float]]]
+
+
+def build_flat(i: int = 0) -> Flat:
+    """Build a flat instance.
+
+    :param i: The instance index.
+    :return: A ``Flat`` instance.
+    """
+    return Flat(uuid4(), f"name-{i}", i, 12.5, True, NOW)
+
+
+def build_nested(size: int) -> Nested:
+    """Build a nested instance.
+
+    :param size: The number of items of its containers.
+    :return: A ``Nested`` instance.
+    """
+    return Nested(uuid4(), build_flat(), [build_flat(i) for i in range(size)], {str(i): "tag" for i in range(size)})
+
+
+def build_shelf(size: int) -> Shelf:
+    """Build a shelf instance.
+
+    :param size: The number of items of its box.
+    :return: A ``Shelf`` instance.
+    """
+    return Shelf("shelf", Box("box", list(range(size))))
+
+
+def build_sparse(size: int) -> Sparse:
+    """Build a sparse instance.
+
+    :param size: The number of items of its containers.
+    :return: A ``Sparse`` instance.
+    """
+    return Sparse(
+        None,
+        "key",
+        [i if i % 2 else str(i) for i in range(size)],
+        build_flat(),
+        "reference",
+        {str(i): (None if i % 2 else 0.5) for i in range(size)},
+    )
+
+
+def collect_models(value: Any) -> list[Model]:
+    """Collect the model instances contained in the given value, including itself.
+
+    :param value: The value to be inspected.
+    :return: A list of ``Model`` instances.
+    """
+    if isinstance(value, Model):
+        return [value, *(model for field in value.fields.values() for model in collect_models(field.value))]
+    if isinstance(value, dict):
+        return [model for v in value.values() for model in collect_models(v)]
+    if isinstance(value, (list, tuple, set)):
+        return [model for v in value for model in collect_models(v)]
+    return []
+
+
+def model_cases(label: str, model: Model) -> Iterator[Case]:
+    """Build the cases of the given model instance.
+
+    :param label: The label of the cases.
+    :param model: The model instance.
+    :return: An iterator of ``Case`` instances.
+    """
+    cls = type(model)
+    values = {name: field.value for name, field in model.fields.items()}
+    avro_bytes = model.avro_bytes
+    name, value = next(iter(values.items()))
+    models = collect_models(model)
+
+    def _build_uncached() -> Any:
+        # The avro data caches of the whole graph are discarded, so every model is encoded again.
+        for m in models:
+            object.__setattr__(m, "_avro_data_cache", None)
+        return AvroDataEncoder().build(model)
+
+    yield Case(f"{label}.construction", lambda: cls(**values))
+    yield Case(f"{label}.construction.trusted", lambda: cls.from_trusted(**values))
+    yield Case(f"{label}.avro_data", lambda: model.avro_data)
+    yield Case(f"{label}.avro_data.uncached", _build_uncached)
+    yield Case(f"{label}.avro_schema", lambda: model.avro_schema)
+    yield Case(f"{label}.avro_bytes", lambda: model.avro_bytes)
+    yield Case(f"{label}.from_avro_bytes", lambda: cls.from_avro_bytes(avro_bytes))
+    yield Case(f"{label}.from_avro_bytes.trusted", lambda: cls.from_avro_bytes(avro_bytes, trusted=True))
+    yield Case(f"{label}.field_assignment", lambda: setattr(model, name, value))
+    yield Case(f"{label}.type_hint_builder", lambda: TypeHintBuilder(model).build())
+
+
+def protocol_cases(size: int) -> Iterator[Case]:
+    """Build the cases of the protocols.
+
+    :param size: The number of values of each batch.
+    :return: An iterator of ``Case`` instances.
+    """
+    models = [build_flat(i) for i in range(size)]
+    data = [model.avro_data for model in models]
+    schema = models[0].avro_schema
+
+    avro_bytes = MinosAvroProtocol.encode(data, schema, batch_mode=True)
+    yield Case(f"MinosAvroProtocol[{size}].encode", lambda: MinosAvroProtocol.encode(data, schema, batch_mode=True))
+    yield Case(f"MinosAvroProtocol[{size}].decode", lambda: MinosAvroProtocol.decode(avro_bytes, batch_mode=True))
+
+    json_bytes = MinosJsonBinaryProtocol.encode(data)
+    yield Case(f"MinosJsonBinaryProtocol[{size}].encode", lambda: MinosJsonBinaryProtocol.encode(data))
+    yield Case(f"MinosJsonBinaryProtocol[{size}].decode", lambda: MinosJsonBinaryProtocol.decode(json_bytes))
+    yield Case(f"MinosJsonBinaryProtocol[{size}].encode.models", lambda: MinosJsonBinaryProtocol.encode(models))
+
+
+def build_cases() -> Iterator[Case]:
+    """Build all the cases of the suite.
+
+    :return: An iterator of ``Case`` instances.
+    """
+    yield from model_cases("Flat", build_flat())
+    for size in SIZES:
+        yield from model_cases(f"Nested[{size}]", build_nested(size))
+        yield from model_cases(f"Shelf[{size}]", build_shelf(size))
+        yield from model_cases(f"Sparse[{size}]", build_sparse(size))
+        yield from protocol_cases(size)
+
+
+if __name__ == "__main__":
+    main(build_cases(), __doc__)
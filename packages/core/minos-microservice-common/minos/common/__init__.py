@@ -5,21 +5,29 @@ __version__ = "0.5.2"
 from .configuration import (
     BROKER,
     DISCOVERY,
+    POOL,
     QUEUE,
     REPOSITORY,
     REST,
     SAGA,
+    SCHEMA_REGISTRY,
     SERVICE,
     SNAPSHOT,
     STORAGE,
     MinosConfig,
     MinosConfigAbstract,
 )
+from .contextvars import (
+    SETUP_SPAN_CONTEXT_VAR,
+)
 from .database import (
+    POSTGRESQL_SESSION_CONTEXT_VAR,
     PostgreSqlLock,
     PostgreSqlLockPool,
     PostgreSqlMinosDatabase,
     PostgreSqlPool,
+    PostgreSqlPreparedStatementCache,
+    PostgreSqlSession,
 )
 from .datetime import (
     NULL_DATETIME,
@@ -38,6 +46,7 @@ from .exceptions import (
     MinosHandlerException,
     MinosImportException,
     MinosLockException,
+    MinosLockTimeoutException,
     MinosMalformedAttributeException,
     MinosMessageException,
     MinosModelAttributeException,
@@ -55,19 +64,30 @@ from .importlib import (
 )
 from .injectors import (
     DependencyInjector,
+    get_injection_markers,
 )
 from .launchers import (
     EntrypointLauncher,
 )
 from .locks import (
     Lock,
+    LockMetrics,
+    stable_hash,
 )
 from .meta import (
     classproperty,
     property_or_classproperty,
     self_or_classmethod,
 )
+from .metrics import (
+    METRICS_REGISTRY,
+    Histogram,
+    MetricsRegistry,
+    MetricsSource,
+)
 from .model import (
+    IS_LAZY_CONSTRUCTION_CONTEXT_VAR,
+    IS_TRUSTED_CONSTRUCTION_CONTEXT_VAR,
     AvroDataDecoder,
     AvroDataEncoder,
     AvroSchemaDecoder,
@@ -80,6 +100,8 @@ from .model import (
     DynamicModel,
     Field,
     GenericTypeProjector,
+    JsonDataEncoder,
+    LazyAvroData,
     MinosModel,
     MissingSentinel,
     Model,
@@ -88,6 +110,12 @@ from .model import (
     NoneType,
     SchemaDecoder,
     SchemaEncoder,
+    SlotField,
+    SlottedDeclarativeModel,
+    TrackedContainer,
+    TrackedDict,
+    TrackedList,
+    TrackedSet,
     TypeHintBuilder,
     TypeHintComparator,
     is_model_type,
@@ -95,12 +123,23 @@ from .model import (
 from .pools import (
     MinosPool,
 )
+from .profiling import (
+    SETUP_PROFILER,
+    SetupProfiler,
+    SetupSpan,
+)
 from .protocol import (
+    AvroSchemaRegistry,
+    AvroStreamReader,
+    AvroStreamWriter,
+    InMemoryAvroSchemaRegistry,
     MinosAvroDatabaseProtocol,
     MinosAvroMessageProtocol,
     MinosAvroProtocol,
     MinosBinaryProtocol,
     MinosJsonBinaryProtocol,
+    PostgreSqlAvroSchemaRegistry,
+    StorageAvroSchemaRegistry,
 )
 from .setup import (
     MinosSetup,
@@ -0,0 +1,139 @@
+"""Plain benchmark harness, shared by the benchmark suites of every package.
+
+The results are emitted as JSON, so that they can be compared across commits.
+"""
+
+from __future__ import (
+    annotations,
+)
+
+import json
+import platform
+import subprocess
+import sys
+import timeit
+from argparse import (
+    ArgumentParser,
+)
+from collections.abc import (
+    Callable,
+    Iterable,
+)
+from datetime import (
+    datetime,
+    timezone,
+)
+from pathlib import (
+    Path,
+)
+from typing import (
+    Any,
+    NamedTuple,
+    Optional,
+)
+
+
+class Case(NamedTuple):
+    """Benchmark case class."""
+
+    name: str
+    func: Callable[[], object]
+
+
+def measure(func: Callable[[], object], repeat: int = 5) -> float:
+    """Compute the number of calls per second of the given function.
+
+    :param func: The function to be measured.
+    :param repeat: The number of repetitions, from which the fastest one is selected.
+    :return: A ``float`` value.
+    """
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    return number / min(timer.repeat(repeat=repeat, number=number))
+
+
+def run(cases: Iterable[Case], repeat: int = 5, pattern: Optional[str] = None) -> dict[str, Any]:
+    """Run the given cases.
+
+    :param cases: The cases to be run.
+    :param repeat: The number of repetitions of each case.
+    :param pattern: If set, only the cases whose name contains it are run.
+    :return: A dictionary containing the metadata of the run and the results of each case.
+    """
+    results = dict()
+    for case in cases:
+        if pattern is not None and pattern not in case.name:
+            continue
+        ops = measure(case.func, repeat)
+        results[case.name] = {"ops_per_sec": ops, "usec_per_op": 1e6 / ops}
+        print(f"{case.name}: {ops:,.2f} ops/sec", file=sys.stderr)
+
+    return {"metadata": _metadata(), "results": results}
+
+
+def compare(previous: dict[str, Any], current: dict[str, Any], threshold: float) -> list[str]:
+    """Compare two runs.
+
+    :param previous: The results of the baseline run.
+    :param current: The results of the new run.
+    :param threshold: The maximum allowed slowdown, as a fraction of the baseline throughput.
+    :return: The names of the cases whose throughput has decreased more than the threshold.
+    """
+    regressions = list()
+    for name, result in current["results"].items():
+        if name not in previous["results"]:
+            continue
+        ratio = result["ops_per_sec"] / previous["results"][name]["ops_per_sec"]
+        flag = ""
+        if ratio < 1 - threshold:
+            regressions.append(name)
+            flag = " REGRESSION"
+        print(f"{name}: {ratio:.2f}x{flag}", file=sys.stderr)
+    return regressions
+
+
+def main(cases: Iterable[Case], description: str) -> None:
+    """Run the given cases from the command line.
+
+    :param cases: The cases to be run.
+    :param description: The description of the suite.
+    :return: This function does not return anything.
+    """
+    parser = ArgumentParser(description=description)
+    parser.add_argument(
+        "-o", "--output", type=Path, help="File in which the JSON results are stored (stdout if unset)."
+    )
+    parser.add_argument("-k", "--pattern", help="Only run the cases whose name contains this value.")
+    parser.add_argument("-r", "--repeat", type=int, default=5, help="Number of repetitions of each case.")
+    parser.add_argument("-c", "--compare", type=Path, help="JSON results of a previous run to be compared with.")
+    parser.add_argument("-t", "--threshold", type=float, default=0.1, help="Maximum allowed slowdown (default: 0.1).")
+    args = parser.parse_args()
+
+    current = run(cases, args.repeat, args.pattern)
+
+    content = json.dumps(current, indent=2)
+    if args.output is None:
+        print(content)
+    else:
+        args.output.write_text(content)
+
+    if args.compare is not None:
+        previous = json.loads(args.compare.read_text())
+        if compare(previous, current, args.threshold):
+            sys.exit(1)
+
+
+def _metadata() -> dict[str, Any]:
+    try:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    return {
+        "commit": commit,
+        "timestamp": datetime.now(tz=timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "system": platform.system(),
+    }
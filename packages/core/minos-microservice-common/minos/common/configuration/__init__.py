@@ -1,10 +1,12 @@
 from .config import (
     BROKER,
     DISCOVERY,
+    POOL,
     QUEUE,
     REPOSITORY,
     REST,
     SAGA,
+    SCHEMA_REGISTRY,
     SERVICE,
     SNAPSHOT,
     STORAGE,
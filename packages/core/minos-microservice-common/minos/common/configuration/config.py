@@ -31,6 +31,8 @@ REST = namedtuple("Rest", "host port")
 REPOSITORY = namedtuple("Repository", "database user password host port")
 SNAPSHOT = namedtuple("Snapshot", "database user password host port")
 DISCOVERY = namedtuple("Discovery", "client host port")
+SCHEMA_REGISTRY = namedtuple("SchemaRegistry", "database user password host port")
+POOL = namedtuple("Pool", "minsize maxsize replenish_interval")
 
 _ENVIRONMENT_MAPPER = {
     "service.name": "MINOS_SERVICE_NAME",
@@ -58,6 +60,14 @@ _ENVIRONMENT_MAPPER = {
     "discovery.client": "MINOS_DISCOVERY_CLIENT",
     "discovery.host": "MINOS_DISCOVERY_HOST",
     "discovery.port": "MINOS_DISCOVERY_PORT",
+    "schema_registry.host": "MINOS_SCHEMA_REGISTRY_HOST",
+    "schema_registry.port": "MINOS_SCHEMA_REGISTRY_PORT",
+    "schema_registry.database": "MINOS_SCHEMA_REGISTRY_DATABASE",
+    "schema_registry.user": "MINOS_SCHEMA_REGISTRY_USER",
+    "schema_registry.password": "MINOS_SCHEMA_REGISTRY_PASSWORD",
+    "pool.minsize": "MINOS_POOL_MINSIZE",
+    "pool.maxsize": "MINOS_POOL_MAXSIZE",
+    "pool.replenish_interval": "MINOS_POOL_REPLENISH_INTERVAL",
 }
 
 _PARAMETERIZED_MAPPER = {
@@ -88,6 +98,14 @@ _PARAMETERIZED_MAPPER = {
     "discovery.client": "minos_discovery_client",
     "discovery.host": "minos_discovery_host",
     "discovery.port": "minos_discovery_port",
+    "schema_registry.host": "schema_registry_host",
+    "schema_registry.port": "schema_registry_port",
+    "schema_registry.database": "schema_registry_database",
+    "schema_registry.user": "schema_registry_user",
+    "schema_registry.password": "schema_registry_password",
+    "pool.minsize": "pool_minsize",
+    "pool.maxsize": "pool_maxsize",
+    "pool.replenish_interval": "pool_replenish_interval",
 }
 
 
@@ -309,3 +327,37 @@ class MinosConfig(MinosConfigAbstract):
         host = self._get("discovery.host")
         port = self._get("discovery.port")
         return DISCOVERY(client=client, host=host, port=port)
+
+    @property
+    def schema_registry(self) -> SCHEMA_REGISTRY:
+        """Get the schema registry config.
+
+        :return: A ``SCHEMA_REGISTRY`` NamedTuple instance.
+        """
+        return SCHEMA_REGISTRY(
+            database=self._get("schema_registry.database"),
+            user=self._get("schema_registry.user"),
+            password=self._get("schema_registry.password"),
+            host=self._get("schema_registry.host"),
+            port=int(self._get("schema_registry.port")),
+        )
+
+    @property
+    def pool(self) -> POOL:
+        """Get the database pools config.
+
+        The options that are not defined are ``None``, so the pools use their own defaults for them.
+
+        :return: A ``POOL`` NamedTuple instance.
+        """
+        return POOL(
+            minsize=self._get_pool_option("minsize", int),
+            maxsize=self._get_pool_option("maxsize", int),
+            replenish_interval=self._get_pool_option("replenish_interval", float),
+        )
+
+    def _get_pool_option(self, name: str, type_: type) -> Any:
+        try:
+            return type_(self._get(f"pool.{name}"))
+        except MinosConfigException:
+            return None
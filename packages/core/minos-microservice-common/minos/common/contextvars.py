@@ -0,0 +1,19 @@
+from __future__ import (
+    annotations,
+)
+
+from contextvars import (
+    ContextVar,
+)
+from typing import (
+    TYPE_CHECKING,
+    Final,
+    Optional,
+)
+
+if TYPE_CHECKING:
+    from .profiling import (
+        SetupSpan,
+    )
+
+SETUP_SPAN_CONTEXT_VAR: Final[ContextVar[Optional[SetupSpan]]] = ContextVar("setup_span", default=None)
@@ -1,6 +1,9 @@
 from .abc import (
     PostgreSqlMinosDatabase,
 )
+from .contextvars import (
+    POSTGRESQL_SESSION_CONTEXT_VAR,
+)
 from .locks import (
     PostgreSqlLock,
 )
@@ -8,3 +11,9 @@ from .pools import (
     PostgreSqlLockPool,
     PostgreSqlPool,
 )
+from .sessions import (
+    PostgreSqlSession,
+)
+from .statements import (
+    PostgreSqlPreparedStatementCache,
+)
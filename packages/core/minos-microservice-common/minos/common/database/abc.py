@@ -1,5 +1,10 @@
 from collections.abc import (
     Hashable,
+    Iterable,
+    Sequence,
+)
+from itertools import (
+    islice,
 )
 from typing import (
     Any,
@@ -12,12 +17,19 @@ from aiomisc.pool import (
     ContextManager,
 )
 from aiopg import (
+    Connection,
     Cursor,
 )
 from dependency_injector.wiring import (
     Provide,
     inject,
 )
+from psycopg2.sql import (
+    SQL,
+    Composable,
+    Identifier,
+    Placeholder,
+)
 
 from ..setup import (
     MinosSetup,
@@ -28,6 +40,9 @@ from .locks import (
 from .pools import (
     PostgreSqlPool,
 )
+from .sessions import (
+    PostgreSqlSession,
+)
 
 
 class PostgreSqlMinosDatabase(MinosSetup):
@@ -89,7 +104,7 @@ class PostgreSqlMinosDatabase(MinosSetup):
             context_manager = self.locked_cursor(lock)
 
         async with context_manager as cursor:
-            await cursor.execute(operation=operation, parameters=parameters, timeout=timeout)
+            await self.execute(cursor, operation, parameters, timeout=timeout)
 
             if streaming_mode:
                 async for row in cursor:
@@ -121,7 +136,140 @@ class PostgreSqlMinosDatabase(MinosSetup):
             context_manager = self.locked_cursor(lock)
 
         async with context_manager as cursor:
+            await self.execute(cursor, operation, parameters, timeout=timeout)
+
+    # noinspection PyUnusedLocal
+    async def submit_many(
+        self,
+        operation: Any,
+        seq_of_parameters: Iterable[Any],
+        *,
+        timeout: Optional[float] = None,
+        lock: Any = None,
+        page_size: int = 100,
+        **kwargs,
+    ) -> None:
+        """Submit a SQL query once for each set of parameters, using a single connection and a single transaction.
+
+        The executions are grouped into pages of ``page_size`` statements, each of them sent in a single round trip.
+
+        :param operation: Query to be executed.
+        :param seq_of_parameters: Sequence of parameters to be projected into the query, one for each execution.
+        :param timeout: An optional timeout.
+        :param lock: Optional key to perform the query with locking. If not set, the query is performed without any
+            lock.
+        :param page_size: The maximum number of statements sent in a single round trip.
+        :param kwargs: Additional named arguments.
+        :return: This method does not return anything.
+        """
+        async with self.session(transaction=True, lock=lock):
+            async with self.cursor() as cursor:
+                for page in _paginate(seq_of_parameters, page_size):
+                    statements = b"; ".join(cursor.mogrify(operation, parameters) for parameters in page)
+                    await cursor.execute(statements, timeout=timeout)
+
+    # noinspection PyUnusedLocal
+    async def insert_many(
+        self,
+        table: str,
+        columns: Sequence[str],
+        rows: Iterable[Sequence[Any]],
+        *,
+        timeout: Optional[float] = None,
+        lock: Any = None,
+        page_size: int = 1000,
+        **kwargs,
+    ) -> int:
+        """Insert the given rows into a table, using a single connection and a single transaction.
+
+        The rows are grouped into multi-row ``INSERT`` statements of ``page_size`` rows, as ``COPY`` is not
+        available on asynchronous connections.
+
+        :param table: The name of the table, optionally qualified with its schema (``schema.table``).
+        :param columns: The names of the columns.
+        :param rows: The rows to be inserted, each of them containing a value for each column.
+        :param timeout: An optional timeout.
+        :param lock: Optional key to perform the query with locking. If not set, the query is performed without any
+            lock.
+        :param page_size: The maximum number of rows inserted by a single statement.
+        :param kwargs: Additional named arguments.
+        :return: The number of inserted rows.
+        """
+        count = 0
+        async with self.session(transaction=True, lock=lock):
+            async with self.cursor() as cursor:
+                for page in _paginate(rows, page_size):
+                    operation, parameters = self.build_insert_many(table, columns, page)
+                    await self.execute(cursor, operation, parameters, timeout=timeout)
+                    count += len(page)
+        return count
+
+    @staticmethod
+    def build_insert_many(
+        table: str, columns: Sequence[str], rows: Iterable[Sequence[Any]], returning: Optional[Sequence[str]] = None
+    ) -> tuple[Composable, tuple[Any, ...]]:
+        """Build a multi-row ``INSERT ... VALUES ... RETURNING`` query.
+
+        :param table: The name of the table, optionally qualified with its schema (``schema.table``).
+        :param columns: The names of the columns.
+        :param rows: The rows to be inserted, each of them containing a value for each column.
+        :param returning: The names of the columns to be returned. If not set, nothing is returned.
+        :return: A tuple containing the query and its parameters.
+        """
+        rows = list(rows)
+        if not rows:
+            raise ValueError("At least one row must be given.")
+        if any(len(row) != len(columns) for row in rows):
+            raise ValueError(f"All the rows must contain a value for each column: {columns!r}")
+
+        values = SQL("({})").format(SQL(", ").join(Placeholder() * len(columns)))
+        operation = SQL("INSERT INTO {table} ({columns}) VALUES {values}").format(
+            table=Identifier(*table.split(".")),
+            columns=SQL(", ").join(map(Identifier, columns)),
+            values=SQL(", ").join([values] * len(rows)),
+        )
+        if returning:
+            operation += SQL(" RETURNING {}").format(SQL(", ").join(map(Identifier, returning)))
+
+        parameters = tuple(value for row in rows for value in row)
+        return operation, parameters
+
+    async def execute(
+        self, cursor: Cursor, operation: Any, parameters: Any = None, *, timeout: Optional[float] = None
+    ) -> None:
+        """Execute a SQL query on the given cursor.
+
+        The frequently executed queries are transparently prepared on the cursor's connection, so that the following
+        executions are neither parsed nor planned again.
+
+        :param cursor: The cursor in which the query is executed.
+        :param operation: Query to be executed.
+        :param parameters: Parameters to be projected into the query.
+        :param timeout: An optional timeout.
+        :return: This method does not return anything.
+        """
+        statements = None
+        if isinstance(self.pool, PostgreSqlPool):
+            statements = self.pool.get_prepared_statements(cursor.connection)
+
+        if statements is None:
             await cursor.execute(operation=operation, parameters=parameters, timeout=timeout)
+            return
+
+        await statements.execute(cursor, operation, parameters, timeout=timeout)
+
+    def session(self, transaction: bool = False, lock: Optional[Hashable] = None) -> PostgreSqlSession:
+        """Get a new session, that pins a connection to the current task until it is finished.
+
+        All the queries submitted inside the session (by this database or by any other one sharing its pool) reuse
+        the pinned connection, so that a sequence of queries does not acquire and release a connection for each one.
+
+        :param transaction: If ``True``, the queries are submitted inside a transaction that is committed when the
+            session is finished, or rolled back if an exception is raised. Nested transactional sessions use savepoints.
+        :param lock: Optional key to hold an advisory lock during the whole session.
+        :return: A ``PostgreSqlSession`` instance, that must be used as an asynchronous context manager.
+        """
+        return PostgreSqlSession(self.pool, transaction=transaction, lock=lock)
 
     def locked_cursor(self, key: Hashable, *args, **kwargs) -> AsyncContextManager[Cursor]:
         """Get a new locked cursor.
@@ -131,7 +279,7 @@ class PostgreSqlMinosDatabase(MinosSetup):
         :param kwargs: Additional named arguments.
         :return: A Cursor wrapped into an asynchronous context manager.
         """
-        lock = PostgreSqlLock(self.pool.acquire(), key, *args, **kwargs)
+        lock = PostgreSqlLock(self._acquire(), key, *args, scope=self.pool.address, **kwargs)
 
         async def _fn_enter():
             await lock.__aenter__()
@@ -149,7 +297,7 @@ class PostgreSqlMinosDatabase(MinosSetup):
         :param kwargs: Additional named arguments.
         :return: A Cursor wrapped into an asynchronous context manager.
         """
-        acquired = self.pool.acquire()
+        acquired = self._acquire()
 
         async def _fn_enter():
             connection = await acquired.__aenter__()
@@ -163,6 +311,12 @@ class PostgreSqlMinosDatabase(MinosSetup):
 
         return ContextManager(_fn_enter, _fn_exit)
 
+    def _acquire(self) -> AsyncContextManager[Connection]:
+        session = PostgreSqlSession.get_current(self.pool)
+        if session is None:
+            return self.pool.acquire()
+        return session.acquire()
+
     @property
     def pool(self) -> PostgreSqlPool:
         """Get the connections pool.
@@ -182,3 +336,9 @@ class PostgreSqlMinosDatabase(MinosSetup):
             host=self.host, port=self.port, database=self.database, user=self.user, password=self.password
         )
         return pool, True
+
+
+def _paginate(iterable: Iterable[Any], size: int) -> Iterable[list[Any]]:
+    iterator = iter(iterable)
+    while page := list(islice(iterator, size)):
+        yield page
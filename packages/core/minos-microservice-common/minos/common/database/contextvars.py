@@ -0,0 +1,21 @@
+from __future__ import (
+    annotations,
+)
+
+from contextvars import (
+    ContextVar,
+)
+from typing import (
+    TYPE_CHECKING,
+    Final,
+    Optional,
+)
+
+if TYPE_CHECKING:
+    from .sessions import (
+        PostgreSqlSession,
+    )
+
+POSTGRESQL_SESSION_CONTEXT_VAR: Final[ContextVar[Optional[PostgreSqlSession]]] = ContextVar(
+    "postgresql_session", default=None
+)
@@ -1,8 +1,18 @@
+from __future__ import (
+    annotations,
+)
+
+import asyncio
 from collections.abc import (
     Hashable,
 )
+from time import (
+    perf_counter,
+)
 from typing import (
     AsyncContextManager,
+    ClassVar,
+    NoReturn,
     Optional,
 )
 
@@ -11,36 +21,210 @@ from aiopg import (
     Cursor,
 )
 
+from ..exceptions import (
+    MinosLockException,
+    MinosLockTimeoutException,
+)
 from ..locks import (
     Lock,
+    LockMetrics,
+)
+from ..metrics import (
+    METRICS_REGISTRY,
 )
 
 
 class PostgreSqlLock(Lock):
-    """ "PostgreSql Lock class."""
+    """ "PostgreSql Lock class.
+
+    The waiters of the same process are queued in memory, so only the first one acquires a connection and holds the
+    advisory lock, while the following ones wait without using any connection nor performing any round trip. The
+    in-memory locks are grouped by ``scope`` (usually the database address), as the advisory locks of different
+    databases are independent.
+
+    The advisory lock is only reentrant for the connection holding it, so the lock can only be acquired again by the
+    task holding it through the same connection (like the queries of a ``PostgreSqlSession``). Otherwise, a
+    ``MinosLockException`` is raised instead of waiting forever for the lock held by the task itself.
+
+    If a ``timeout`` is given, the advisory lock is polled with ``pg_try_advisory_lock``, waiting an exponentially
+    increasing delay (from ``backoff`` up to ``max_backoff`` seconds) between attempts, and a
+    ``MinosLockTimeoutException`` is raised if the lock could not be acquired in time. Otherwise, the acquisition waits
+    as long as needed.
+
+    The wait and hold times, and the contention and timeout counts of each key are collected by ``metrics``.
+    """
+
+    metrics: ClassVar[LockMetrics] = LockMetrics()
 
     cursor: Optional[Cursor]
 
-    def __init__(self, wrapped_connection: AsyncContextManager[Connection], key: Hashable, *args, **kwargs):
+    def __init__(
+        self,
+        wrapped_connection: AsyncContextManager[Connection],
+        key: Hashable,
+        *args,
+        timeout: Optional[float] = None,
+        backoff: float = 0.01,
+        max_backoff: float = 0.5,
+        scope: Hashable = None,
+        **kwargs,
+    ):
         super().__init__(key, *args, **kwargs)
 
         self.wrapped_connection = wrapped_connection
         self.cursor = None
+        self.scope = scope
+
+        self.timeout = timeout
+        self.backoff = backoff
+        self.max_backoff = max_backoff
 
         self._args = args
         self._kwargs = kwargs
+        self._acquired_at = None
 
     async def __aenter__(self):
+        start = perf_counter()
+        deadline = None if self.timeout is None else start + self.timeout
+
+        try:
+            local, contended = await _LocalLock.acquire(self._local_key, deadline)
+        except asyncio.TimeoutError:
+            self._raise_timeout(start)
+
+        try:
+            contended |= await self._acquire_advisory_lock(local, deadline)
+        except BaseException as exc:
+            _LocalLock.release(self._local_key)
+            if isinstance(exc, _AdvisoryLockTimeout):
+                self._raise_timeout(start)
+            raise
+
+        self._acquired_at = perf_counter()
+        self.metrics.observe_acquisition(self.key, self._acquired_at - start, contended)
+        return self
+
+    @property
+    def _local_key(self) -> tuple[Hashable, int]:
+        return self.scope, self.hashed_key
+
+    async def _acquire_advisory_lock(self, local: _LocalLock, deadline: Optional[float]) -> bool:
         connection = await self.wrapped_connection.__aenter__()
-        cursor = await connection.cursor(*self._args, **self._kwargs).__aenter__()
+        try:
+            if local.depth == 1:
+                local.connection = connection
+            elif connection is not local.connection:
+                raise MinosLockException(
+                    f"The {self.key!r} lock is already held by the current task through another connection, so it "
+                    "can only be acquired again through the same one (for example, within a session)."
+                )
+
+            cursor = await connection.cursor(*self._args, **self._kwargs).__aenter__()
+            try:
+                contended = await self._advisory_lock(cursor, deadline)
+            except BaseException:
+                cursor.close()
+                raise
+        except BaseException as exc:
+            await self.wrapped_connection.__aexit__(type(exc), exc, exc.__traceback__)
+            raise
 
         self.cursor = cursor
-        await self.cursor.execute("select pg_advisory_lock(%(hashed_key)s)", {"hashed_key": self.hashed_key})
-        return self
+        return contended
+
+    async def _advisory_lock(self, cursor: Cursor, deadline: Optional[float]) -> bool:
+        if await self._try_advisory_lock(cursor):
+            return False
+
+        if deadline is None:
+            await cursor.execute("select pg_advisory_lock(%(hashed_key)s)", {"hashed_key": self.hashed_key})
+            return True
+
+        delay = self.backoff
+        while (remaining := deadline - perf_counter()) > 0:
+            await asyncio.sleep(min(delay, remaining))
+            if await self._try_advisory_lock(cursor):
+                return True
+            delay = min(delay * 2, self.max_backoff)
+
+        raise _AdvisoryLockTimeout()
+
+    def _raise_timeout(self, start: float) -> NoReturn:
+        self.metrics.observe_timeout(self.key, perf_counter() - start)
+        raise MinosLockTimeoutException(f"The {self.key!r} lock could not be acquired in {self.timeout!r} seconds.")
+
+    async def _try_advisory_lock(self, cursor: Cursor) -> bool:
+        await cursor.execute("select pg_try_advisory_lock(%(hashed_key)s)", {"hashed_key": self.hashed_key})
+        return (await cursor.fetchone())[0]
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        await self.cursor.execute("select pg_advisory_unlock(%(hashed_key)s)", {"hashed_key": self.hashed_key})
-        if not self.cursor.closed:
-            self.cursor.close()
-        self.cursor = None
-        await self.wrapped_connection.__aexit__(exc_type, exc_val, exc_tb)
+        try:
+            try:
+                await self.cursor.execute("select pg_advisory_unlock(%(hashed_key)s)", {"hashed_key": self.hashed_key})
+            finally:
+                if not self.cursor.closed:
+                    self.cursor.close()
+                self.cursor = None
+                await self.wrapped_connection.__aexit__(exc_type, exc_val, exc_tb)
+        finally:
+            _LocalLock.release(self._local_key)
+            self.metrics.observe_release(self.key, perf_counter() - self._acquired_at)
+            self._acquired_at = None
+
+
+METRICS_REGISTRY.register(PostgreSqlLock.__name__, PostgreSqlLock.metrics)
+
+
+class _AdvisoryLockTimeout(Exception):
+    pass
+
+
+class _LocalLock:
+    _locks: dict[tuple[Hashable, int], _LocalLock] = dict()
+
+    def __init__(self):
+        self.lock = asyncio.Lock()
+        self.owner: Optional[asyncio.Task] = None
+        self.connection: Optional[Connection] = None
+        self.depth = 0
+        self.references = 0
+
+    @classmethod
+    async def acquire(cls, key: tuple[Hashable, int], deadline: Optional[float] = None) -> tuple[_LocalLock, bool]:
+        if (local := cls._locks.get(key)) is None:
+            local = cls._locks[key] = cls()
+        local.references += 1
+
+        task = asyncio.current_task()
+        if local.owner is not None and local.owner is task:
+            local.depth += 1
+            return local, False
+
+        contended = local.lock.locked()
+        try:
+            if deadline is None or not contended:
+                await local.lock.acquire()
+            else:
+                await asyncio.wait_for(local.lock.acquire(), max(deadline - perf_counter(), 0))
+        except BaseException:
+            local._dereference(key)
+            raise
+
+        local.owner = task
+        local.depth = 1
+        return local, contended
+
+    @classmethod
+    def release(cls, key: tuple[Hashable, int]) -> None:
+        local = cls._locks[key]
+        local.depth -= 1
+        if not local.depth:
+            local.owner = None
+            local.connection = None
+            local.lock.release()
+        local._dereference(key)
+
+    def _dereference(self, key: tuple[Hashable, int]) -> None:
+        self.references -= 1
+        if not self.references:
+            del self._locks[key]
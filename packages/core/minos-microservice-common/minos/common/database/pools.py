@@ -1,13 +1,19 @@
 import logging
 from asyncio import (
+    TimeoutError,
+    get_running_loop,
     sleep,
 )
 from collections.abc import (
     Hashable,
 )
 from typing import (
+    Any,
     Optional,
 )
+from weakref import (
+    WeakKeyDictionary,
+)
 
 import aiopg
 from aiomisc.pool import (
@@ -17,8 +23,12 @@ from aiopg import (
     Connection,
 )
 from psycopg2 import (
+    Error,
     OperationalError,
 )
+from psycopg2.extensions import (
+    TRANSACTION_STATUS_UNKNOWN,
+)
 
 from ..pools import (
     MinosPool,
@@ -26,14 +36,34 @@ from ..pools import (
 from .locks import (
     PostgreSqlLock,
 )
+from .statements import (
+    PostgreSqlPreparedStatementCache,
+)
 
 logger = logging.getLogger(__name__)
 
 
 class PostgreSqlPool(MinosPool[ContextManager]):
-    """Postgres Pool class."""
-
-    def __init__(self, host: str, port: int, database: str, user: str, password: str, *args, **kwargs):
+    """Postgres Pool class.
+
+    The connections that have been idle for more than ``health_check_interval`` seconds are checked with a round trip to
+    the database before being acquired, so the ones closed by the server are recycled instead of failing on use.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        database: str,
+        user: str,
+        password: str,
+        *args,
+        prepare_threshold: Optional[int] = 5,
+        prepared_statements_maxsize: int = 256,
+        health_check_interval: Optional[float] = 30.0,
+        health_check_timeout: float = 5.0,
+        **kwargs,
+    ):
         super().__init__(*args, **kwargs)
         self.host = host
         self.port = port
@@ -41,9 +71,26 @@ class PostgreSqlPool(MinosPool[ContextManager]):
         self.user = user
         self.password = password
 
+        self.health_check_interval = health_check_interval
+        self.health_check_timeout = health_check_timeout
+
+        self.prepare_threshold = prepare_threshold
+        self.prepared_statements_maxsize = prepared_statements_maxsize
+        self._prepared_statements: WeakKeyDictionary[Connection, PostgreSqlPreparedStatementCache] = WeakKeyDictionary()
+
     @classmethod
     def _from_config(cls, *args, config, **kwargs):
-        return cls(*args, **config.repository._asdict(), **kwargs)
+        # The pool options that are not defined on the configuration keep their defaults, and the given ones prevail.
+        options = {name: value for name, value in config.pool._asdict().items() if value is not None}
+        return cls(*args, **(config.repository._asdict() | options | kwargs))
+
+    @property
+    def address(self) -> tuple[str, int, str]:
+        """Get the address of the database, which is shared by all the pools connected to it.
+
+        :return: A tuple containing the host, the port and the database name.
+        """
+        return self.host, self.port, self.database
 
     async def _create_instance(self) -> Optional[Connection]:
         try:
@@ -58,7 +105,24 @@ class PostgreSqlPool(MinosPool[ContextManager]):
         logger.info(f"Created {self.database!r} database connection identified by {id(connection)}!")
         return connection
 
+    def get_prepared_statements(self, connection: Connection) -> Optional[PostgreSqlPreparedStatementCache]:
+        """Get the prepared statement cache of the given connection.
+
+        :param connection: A connection created by the pool.
+        :return: A ``PostgreSqlPreparedStatementCache`` instance or ``None`` if statement preparing is disabled.
+        """
+        if self.prepare_threshold is None:
+            return None
+
+        if connection not in self._prepared_statements:
+            self._prepared_statements[connection] = PostgreSqlPreparedStatementCache(
+                self.prepared_statements_maxsize, self.prepare_threshold
+            )
+        return self._prepared_statements[connection]
+
     async def _destroy_instance(self, instance: Connection):
+        # The prepared statements belong to the server session, so they are lost with the connection.
+        self._prepared_statements.pop(instance, None)
         if not instance.closed:
             await instance.close()
         logger.info(f"Destroyed {self.database!r} database connection identified by {id(instance)}!")
@@ -73,16 +137,45 @@ class PostgreSqlPool(MinosPool[ContextManager]):
         except OperationalError:
             return False
 
-        return not instance.closed
+        if instance.closed or instance.raw.get_transaction_status() == TRANSACTION_STATUS_UNKNOWN:
+            return False
+
+        if (
+            self.health_check_interval is None
+            or get_running_loop().time() - instance.last_usage < self.health_check_interval
+        ):
+            return True
+
+        try:
+            async with instance.cursor(timeout=self.health_check_timeout) as cursor:
+                await cursor.execute("SELECT 1;")
+        except (Error, TimeoutError) as exc:
+            logger.warning(f"The database connection identified by {id(instance)} failed its health check: {exc!r}")
+            return False
+
+        return True
+
+    def metrics(self) -> dict[str, Any]:
+        """Get a snapshot of the pool metrics.
+
+        :return: A dictionary containing the metrics of the base pool plus the database name and the number of prepared
+            statements.
+        """
+        return super().metrics() | {
+            "database": self.database,
+            "prepared_statements": sum(map(len, self._prepared_statements.values())),
+        }
 
 
 class PostgreSqlLockPool(PostgreSqlPool):
     """Postgres Locking Pool class."""
 
-    def acquire(self, key: Hashable, *args, **kwargs) -> PostgreSqlLock:
+    def acquire(self, key: Hashable, *args, timeout: Optional[float] = None, **kwargs) -> PostgreSqlLock:
         """Acquire a new lock.
 
         :param key: The key to be used for locking.
+        :param timeout: Optional maximum number of seconds to wait for the lock. If it is exceeded, a
+            ``MinosLockTimeoutException`` is raised. If not set, the lock is waited as long as needed.
         :return: A ``PostgreSqlLock`` instance.
         """
-        return PostgreSqlLock(super().acquire(), key, *args, **kwargs)
+        return PostgreSqlLock(super().acquire(), key, *args, timeout=timeout, scope=self.address, **kwargs)
@@ -0,0 +1,178 @@
+from __future__ import (
+    annotations,
+)
+
+from asyncio import (
+    current_task,
+)
+from collections.abc import (
+    Hashable,
+)
+from itertools import (
+    count,
+)
+from typing import (
+    TYPE_CHECKING,
+    AsyncContextManager,
+    Optional,
+)
+
+from aiomisc.pool import (
+    ContextManager,
+)
+from aiopg import (
+    Connection,
+)
+from psycopg2.extensions import (
+    TRANSACTION_STATUS_IDLE,
+    TRANSACTION_STATUS_INTRANS,
+)
+
+from .contextvars import (
+    POSTGRESQL_SESSION_CONTEXT_VAR,
+)
+from .locks import (
+    PostgreSqlLock,
+)
+
+if TYPE_CHECKING:
+    from .pools import (
+        PostgreSqlPool,
+    )
+
+_SAVEPOINTS = count()
+
+
+class PostgreSqlSession:
+    """PostgreSql Session class.
+
+    Pins a connection of the given pool to the current task, so that the queries submitted by any database sharing the
+    pool reuse it instead of acquiring and releasing a connection each time. Optionally, the session also holds an
+    advisory lock and wraps its queries into a transaction, or into a savepoint if it is nested into another
+    transactional session.
+
+    The session is bound to the task that entered it, so the tasks created inside it acquire their own connections.
+    """
+
+    connection: Optional[Connection]
+
+    def __init__(self, pool: PostgreSqlPool, transaction: bool = False, lock: Optional[Hashable] = None):
+        self.pool = pool
+        self.transaction = transaction
+        self.lock = lock
+
+        self.connection = None
+
+        self._acquired = None
+        self._lock = None
+        self._savepoint = None
+        self._task = None
+        self._parent = None
+        self._token = None
+
+    @classmethod
+    def get_current(cls, pool: PostgreSqlPool) -> Optional[PostgreSqlSession]:
+        """Get the innermost session of the current task on the given pool.
+
+        :param pool: The pool of the session.
+        :return: A ``PostgreSqlSession`` instance or ``None`` if there is not any active session.
+        """
+        task = current_task()
+        session = POSTGRESQL_SESSION_CONTEXT_VAR.get()
+        while session is not None:
+            if session.pool is pool and session._task is task:
+                return session
+            session = session._parent
+        return None
+
+    def acquire(self) -> AsyncContextManager[Connection]:
+        """Get the pinned connection, wrapped into an asynchronous context manager that does not release it.
+
+        :return: A Connection wrapped into an asynchronous context manager.
+        """
+
+        async def _fn_enter():
+            if self.connection is None:
+                raise ValueError("The session must be entered before acquiring its connection.")
+            return self.connection
+
+        async def _fn_exit(_):
+            pass
+
+        return ContextManager(_fn_enter, _fn_exit)
+
+    async def __aenter__(self) -> PostgreSqlSession:
+        outer = self.get_current(self.pool)
+        if outer is not None:
+            self.connection = outer.connection
+        else:
+            self._acquired = self.pool.acquire()
+            self.connection = await self._acquired.__aenter__()
+
+        try:
+            if self.lock is not None:
+                self._lock = PostgreSqlLock(self.acquire(), self.lock, scope=self.pool.address)
+                await self._lock.__aenter__()
+
+            if self.transaction:
+                await self._begin()
+        except BaseException as exc:
+            await self._finish(type(exc), exc, exc.__traceback__)
+            raise
+
+        self._task = current_task()
+        self._parent = POSTGRESQL_SESSION_CONTEXT_VAR.get()
+        self._token = POSTGRESQL_SESSION_CONTEXT_VAR.set(self)
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        POSTGRESQL_SESSION_CONTEXT_VAR.reset(self._token)
+        self._token = None
+        self._parent = None
+        self._task = None
+
+        try:
+            if self.transaction:
+                await self._end(commit=exc_type is None)
+        finally:
+            await self._finish(exc_type, exc_val, exc_tb)
+
+    async def _begin(self) -> None:
+        async with self.connection.cursor() as cursor:
+            if self.connection.raw.get_transaction_status() == TRANSACTION_STATUS_INTRANS:
+                self._savepoint = f"minos_session_{next(_SAVEPOINTS)}"
+                await cursor.execute(f"SAVEPOINT {self._savepoint}")
+            else:
+                await cursor.execute("BEGIN")
+
+    async def _end(self, commit: bool) -> None:
+        async with self.connection.cursor() as cursor:
+            if self._savepoint is None:
+                await cursor.execute("COMMIT" if commit else "ROLLBACK")
+                return
+
+            savepoint, self._savepoint = self._savepoint, None
+            if not commit:
+                await cursor.execute(f"ROLLBACK TO SAVEPOINT {savepoint}")
+            await cursor.execute(f"RELEASE SAVEPOINT {savepoint}")
+
+    async def _finish(self, exc_type, exc_val, exc_tb) -> None:
+        try:
+            if self._lock is not None:
+                lock, self._lock = self._lock, None
+                await lock.__aexit__(exc_type, exc_val, exc_tb)
+        finally:
+            connection, self.connection = self.connection, None
+            if self._acquired is not None:
+                acquired, self._acquired = self._acquired, None
+                await self._release(acquired, connection, exc_type, exc_val, exc_tb)
+
+    @staticmethod
+    async def _release(acquired, connection: Connection, exc_type, exc_val, exc_tb) -> None:
+        try:
+            # The connection is returned to the pool, so any transaction left open on it is discarded.
+            if not connection.closed and connection.raw.get_transaction_status() != TRANSACTION_STATUS_IDLE:
+                async with connection.cursor() as cursor:
+                    await cursor.execute("ROLLBACK")
+        finally:
+            await acquired.__aexit__(exc_type, exc_val, exc_tb)
@@ -0,0 +1,242 @@
+from __future__ import (
+    annotations,
+)
+
+import logging
+import re
+from collections import (
+    OrderedDict,
+)
+from collections.abc import (
+    Mapping,
+)
+from itertools import (
+    count,
+)
+from typing import (
+    Any,
+    NamedTuple,
+    Optional,
+    Union,
+)
+
+from aiopg import (
+    Cursor,
+)
+from psycopg2 import (
+    DataError,
+    Error,
+    ProgrammingError,
+)
+from psycopg2.errors import (
+    InvalidSqlStatementName,
+)
+from psycopg2.extensions import (
+    TRANSACTION_STATUS_IDLE,
+    TRANSACTION_STATUS_INTRANS,
+)
+from psycopg2.sql import (
+    Composable,
+)
+
+logger = logging.getLogger(__name__)
+
+_PLACEHOLDER = re.compile(r"%(?:\(([^)]*)\))?([s%])")
+_PREPARABLE = {"SELECT", "INSERT", "UPDATE", "DELETE", "VALUES", "WITH"}
+
+
+class PostgreSqlPreparedStatementCache:
+    """PostgreSql Prepared Statement Cache class.
+
+    Keeps track of the statements executed on a single connection. Once a statement has been executed ``threshold``
+    times, it is prepared on the server and the following executions only send its name and parameters. The prepared
+    statements are bounded by ``maxsize`` using a least recently used policy, so queries that embed generated
+    identifiers are evicted before being prepared, or deallocated after being prepared.
+
+    Only ``SELECT``, ``INSERT``, ``UPDATE``, ``DELETE``, ``VALUES`` and ``WITH`` single statements are prepared.
+    The ones that cannot be prepared (for example, the ones that expand a tuple parameter, that should be written as
+    ``= ANY(%s)`` with a list instead) are executed as usual.
+    """
+
+    def __init__(self, maxsize: int = 256, threshold: int = 5):
+        self.maxsize = maxsize
+        self.threshold = threshold
+
+        self._counts: OrderedDict[tuple[str, bool], int] = OrderedDict()
+        self._statements: OrderedDict[tuple[str, bool], Optional[_PreparedStatement]] = OrderedDict()
+        self._names = count()
+        self._deallocations: list[str] = list()
+
+    def __len__(self) -> int:
+        return sum(statement is not None for statement in self._statements.values())
+
+    def clear(self) -> None:
+        """Forget all the statements, for example, when the server session has been reset.
+
+        :return: This method does not return anything.
+        """
+        self._counts.clear()
+        self._statements.clear()
+        self._deallocations.clear()
+
+    async def execute(
+        self, cursor: Cursor, operation: Any, parameters: Any = None, timeout: Optional[float] = None
+    ) -> None:
+        """Execute the given operation, using a prepared statement if possible.
+
+        :param cursor: The cursor in which the operation is executed.
+        :param operation: Query to be executed.
+        :param parameters: Parameters to be projected into the query.
+        :param timeout: An optional timeout.
+        :return: This method does not return anything.
+        """
+        status = cursor.connection.raw.get_transaction_status()
+        if status not in (TRANSACTION_STATUS_IDLE, TRANSACTION_STATUS_INTRANS) or _expands(parameters):
+            await cursor.execute(operation, parameters, timeout=timeout)
+            return
+
+        sql = operation.as_string(cursor.raw) if isinstance(operation, Composable) else operation
+        key = (sql, parameters is None)
+
+        statement = await self._get_or_prepare(cursor, key, status, timeout)
+        if statement is None:
+            await cursor.execute(operation, parameters, timeout=timeout)
+            return
+
+        try:
+            values = statement.values(parameters)
+        except (KeyError, IndexError, TypeError):
+            # The parameters do not match the placeholders, so the usual execution raises the appropriate error.
+            await cursor.execute(operation, parameters, timeout=timeout)
+            return
+
+        try:
+            await cursor.execute(statement.execute_sql, values, timeout=timeout)
+        except InvalidSqlStatementName:
+            # The server session has been reset, so all the prepared statements have been lost.
+            self.clear()
+            if status != TRANSACTION_STATUS_IDLE:
+                raise
+            await cursor.execute(operation, parameters, timeout=timeout)
+        except (ProgrammingError, DataError):
+            if status != TRANSACTION_STATUS_IDLE:
+                raise
+            # Outside a transaction the failed statement has no effects, so it is retried without being prepared.
+            self._statements[key] = None
+            await cursor.execute(operation, parameters, timeout=timeout)
+
+    async def _get_or_prepare(
+        self, cursor: Cursor, key: tuple[str, bool], status: int, timeout: Optional[float]
+    ) -> Optional[_PreparedStatement]:
+        if key in self._statements:
+            self._statements.move_to_end(key)
+            return self._statements[key]
+
+        executions = self._counts.pop(key, 0) + 1
+        if executions < self.threshold:
+            self._counts[key] = executions
+            if len(self._counts) > self.maxsize:
+                self._counts.popitem(last=False)
+            return None
+
+        if len(self._statements) >= self.maxsize:
+            _, evicted = self._statements.popitem(last=False)
+            if evicted is not None:
+                self._deallocations.append(evicted.name)
+
+        statement = _PreparedStatement.from_sql(f"minos_{next(self._names)}", *key)
+        if statement is not None and not await self._prepare(cursor, statement, status, timeout):
+            statement = None
+
+        self._statements[key] = statement
+        return statement
+
+    async def _prepare(
+        self, cursor: Cursor, statement: _PreparedStatement, status: int, timeout: Optional[float]
+    ) -> bool:
+        # Inside a transaction, a failure would abort it, so the statement is prepared within a savepoint.
+        in_transaction = status == TRANSACTION_STATUS_INTRANS
+        if in_transaction:
+            await cursor.execute("SAVEPOINT minos_prepare", timeout=timeout)
+
+        try:
+            for name in self._deallocations:
+                await cursor.execute(f"DEALLOCATE {name}", timeout=timeout)
+            self._deallocations.clear()
+            await cursor.execute(statement.prepare_sql, timeout=timeout)
+        except Error as exc:
+            logger.debug(f"The statement {statement.sql!r} could not be prepared: {exc!r}")
+            if in_transaction:
+                await cursor.execute("ROLLBACK TO SAVEPOINT minos_prepare", timeout=timeout)
+            return False
+        finally:
+            if in_transaction:
+                await cursor.execute("RELEASE SAVEPOINT minos_prepare", timeout=timeout)
+
+        return True
+
+
+def _expands(parameters: Any) -> bool:
+    # The tuples are expanded into a list of values (like ``IN %s``), so they cannot be bound to a single placeholder.
+    if parameters is None:
+        return False
+    values = parameters.values() if isinstance(parameters, Mapping) else parameters
+    return any(isinstance(value, tuple) for value in values)
+
+
+class _PreparedStatement(NamedTuple):
+    name: str
+    sql: str
+    keys: tuple[Union[int, str], ...]
+
+    @classmethod
+    def from_sql(cls, name: str, sql: str, raw: bool) -> Optional[_PreparedStatement]:
+        sql = sql.strip().rstrip(";").rstrip()
+        if not sql or ";" in sql or sql.split(maxsplit=1)[0].upper() not in _PREPARABLE:
+            return None
+
+        if raw:
+            # Without parameters, the query is sent as it is, so there are no placeholders to be replaced.
+            return cls(name, sql, tuple())
+
+        keys = list()
+
+        def _fn(match: re.Match) -> str:
+            key, conversion = match.groups()
+            if conversion == "%":
+                return "%"
+            if key is None:
+                key = sum(isinstance(k, int) for k in keys)
+            if key not in keys:
+                keys.append(key)
+            return f"${keys.index(key) + 1}"
+
+        sql = _PLACEHOLDER.sub(_fn, sql)
+        if len({type(key) for key in keys}) > 1:
+            # Named and positional placeholders cannot be mixed.
+            return None
+
+        return cls(name, sql, tuple(keys))
+
+    @property
+    def prepare_sql(self) -> str:
+        return f"PREPARE {self.name} AS {self.sql}"
+
+    @property
+    def execute_sql(self) -> str:
+        if not self.keys:
+            return f"EXECUTE {self.name}"
+        return f"EXECUTE {self.name} ({', '.join('%s' for _ in self.keys)})"
+
+    def values(self, parameters: Any) -> Optional[tuple[Any, ...]]:
+        if not self.keys:
+            if parameters:
+                raise TypeError("The statement does not have any placeholder.")
+            return None
+
+        if isinstance(parameters, Mapping):
+            return tuple(parameters[key] for key in self.keys)
+
+        if len(parameters) != len(self.keys):
+            raise IndexError("The number of parameters does not match the number of placeholders.")
+        return tuple(parameters[key] for key in self.keys)
@@ -56,6 +56,10 @@ class MinosLockException(MinosException):
     """Base lock exception"""
 
 
+class MinosLockTimeoutException(MinosLockException):
+    """Exception to be raised when a lock could not be acquired before the given timeout."""
+
+
 class MinosModelException(MinosException):
     """Exception to be raised when some mandatory condition is not satisfied by a model."""
 
@@ -2,10 +2,24 @@ from __future__ import (
     annotations,
 )
 
+import logging
 from asyncio import (
+    Task,
+    create_task,
     gather,
 )
+from collections.abc import (
+    Iterable,
+)
+from inspect import (
+    isfunction,
+    unwrap,
+)
+from time import (
+    perf_counter,
+)
 from typing import (
+    Any,
     Type,
     Union,
 )
@@ -17,6 +31,9 @@ from dependency_injector import (
     containers,
     providers,
 )
+from dependency_injector.wiring import (
+    Provide,
+)
 
 from .configuration import (
     MinosConfig,
@@ -24,13 +41,26 @@ from .configuration import (
 from .importlib import (
     import_module,
 )
+from .profiling import (
+    SETUP_PROFILER,
+)
 from .setup import (
     MinosSetup,
 )
 
+logger = logging.getLogger(__name__)
+
 
 class DependencyInjector:
-    """Async wrapper of ``dependency_injector.containers.Container``."""
+    """Async wrapper of ``dependency_injector.containers.Container``.
+
+    The injections are set up concurrently, but each one waits for the setup of the injections it depends on, and they
+    are destroyed in the reverse order. The dependencies are the injections referenced by the instance attributes plus
+    the ones requested through ``Provide`` markers by the instance methods. Only those edges are ordered: the side
+    effects of a setup (like the process-wide schema registry set by a ``PostgreSqlAvroSchemaRegistry``) are not
+    visible to the rest of injections, so they must reference it to be set up after it. The components shared by
+    multiple injections are only set up once, as the setup of each ``MinosSetup`` instance is serialized.
+    """
 
     def __init__(self, config: MinosConfig, **kwargs: Union[MinosSetup, Type[MinosSetup], str]):
         self.config = config
@@ -57,24 +87,83 @@ class DependencyInjector:
 
         return injections
 
+    @cached_property
+    def dependencies(self) -> dict[str, tuple[str, ...]]:
+        """Get the dependencies of each injection, ordered so that the dependencies are placed before the dependents.
+
+        The dependencies that would form a cycle are ignored.
+
+        :return: A dictionary containing the names of the dependencies of each injection name.
+        """
+        pending = {name: _get_dependencies(injection, self.injections) for name, injection in self.injections.items()}
+
+        dependencies = dict()
+        while pending:
+            name = next((name for name, names in pending.items() if names <= dependencies.keys()), None)
+            if name is None:
+                name = next(iter(pending))
+                logger.warning(f"The {name!r} injection dependencies contain a cycle: {sorted(pending[name])!r}")
+            names = pending.pop(name)
+            dependencies[name] = tuple(
+                dependency for dependency in self.injections if dependency in names & dependencies.keys()
+            )
+
+        return dependencies
+
     async def wire(self, *args, **kwargs) -> None:
         """Connect the configuration.
 
         :return: This method does not return anything.
         """
-        self.container.wire(*args, **kwargs)
+        with SETUP_PROFILER.span("wire", type(self).__name__):
+            self.container.wire(*args, **kwargs)
 
-        await gather(*(injection.setup() for injection in self.injections.values()))
+        await self._run("setup", self.dependencies)
 
     async def unwire(self) -> None:
         """Disconnect the configuration.
 
         :return: This method does not return anything.
         """
-        await gather(*(injection.destroy() for injection in self.injections.values()))
+        dependents = {name: list() for name in reversed(self.dependencies)}
+        for name, dependencies in self.dependencies.items():
+            for dependency in dependencies:
+                dependents[dependency].append(name)
+
+        await self._run("destroy", dependents)
 
         self.container.unwire()
 
+    async def _run(self, action: str, dependencies: dict[str, Iterable[str]]) -> None:
+        timings = dict()
+        tasks: dict[str, Task] = dict()
+
+        async def _fn(name: str) -> None:
+            await gather(*(tasks[dependency] for dependency in dependencies[name]))
+            injection = self.injections[name]
+            if not isinstance(injection, MinosSetup):
+                return
+            start = perf_counter()
+            await getattr(injection, action)()
+            timings[name] = perf_counter() - start
+
+        start = perf_counter()
+        for name in dependencies:
+            tasks[name] = create_task(_fn(name))
+
+        try:
+            await gather(*tasks.values())
+        except BaseException:
+            for task in tasks.values():
+                task.cancel()
+            raise
+
+        elapsed = perf_counter() - start
+        report = ", ".join(
+            f"{name!r}: {seconds * 1000:.1f} ms" for name, seconds in sorted(timings.items(), key=lambda item: -item[1])
+        )
+        logger.info(f"The {action} of the injections took {elapsed * 1000:.1f} ms ({report})")
+
     @cached_property
     def container(self) -> containers.Container:
         """Get the dependencies container.
@@ -92,3 +181,61 @@ class DependencyInjector:
         if item not in self.injections:
             raise AttributeError(f"{type(self).__name__!r} does not contain the {item!r} attribute.")
         return self.injections[item]
+
+
+def _get_dependencies(injection: Any, injections: dict[str, Any]) -> set[str]:
+    # The nested components (like the reader and writer of a repository) are set up by the injection, so their
+    # dependencies are also dependencies of the injection.
+    names = {
+        id(value): name
+        for name, value in injections.items()
+        if isinstance(value, MinosSetup) and value is not injection
+    }
+
+    dependencies = set()
+    visited = set()
+    components = [injection]
+    while components:
+        component = components.pop()
+        if id(component) in visited:
+            continue
+        visited.add(id(component))
+
+        for value in getattr(component, "__dict__", dict()).values():
+            if id(value) in names:
+                dependencies.add(names[id(value)])
+            elif isinstance(value, MinosSetup):
+                components.append(value)
+
+        dependencies |= _get_provided(type(component), names)
+
+    return dependencies
+
+
+def _get_provided(cls: type, names: dict[int, str]) -> set[str]:
+    provided = set(names.values())
+
+    dependencies = set()
+    for base in cls.__mro__:
+        for member in vars(base).values():
+            dependencies |= get_injection_markers(member) & provided
+
+    return dependencies
+
+
+def get_injection_markers(member: Any) -> set[str]:
+    """Get the names of the injections requested by the given member through ``Provide`` markers.
+
+    :param member: The member to be inspected. Functions, static and class methods and properties are supported.
+    :return: A set containing the provider names of the markers used as default values of its parameters.
+    """
+    if isinstance(member, (staticmethod, classmethod)):
+        member = member.__func__
+    elif isinstance(member, property):
+        member = member.fget
+    if not isfunction(member):
+        return set()
+
+    member = unwrap(member)
+    defaults = (member.__defaults__ or tuple()) + tuple((member.__kwdefaults__ or dict()).values())
+    return {default.provider for default in defaults if isinstance(default, Provide)}
@@ -2,16 +2,30 @@ from __future__ import (
     annotations,
 )
 
+import importlib
+import json
 import logging
+import os
 import pkgutil
-import re
 import sys
 from asyncio import (
     AbstractEventLoop,
 )
+from cProfile import (
+    Profile,
+)
 from enum import (
     Enum,
 )
+from inspect import (
+    isclass,
+)
+from itertools import (
+    chain,
+)
+from pathlib import (
+    Path,
+)
 from types import (
     ModuleType,
 )
@@ -50,6 +64,11 @@ from .importlib import (
 )
 from .injectors import (
     DependencyInjector,
+    get_injection_markers,
+)
+from .profiling import (
+    SETUP_PROFILER,
+    SetupSpan,
 )
 from .setup import (
     MinosSetup,
@@ -67,7 +86,13 @@ def _create_loop() -> AbstractEventLoop:  # pragma: no cover
 
 
 class EntrypointLauncher(MinosSetup):
-    """EntryPoint Launcher class."""
+    """EntryPoint Launcher class.
+
+    Once launched, a report with the wall time of each setup performed during the startup is logged and, if
+    ``startup_report_path`` is given, it is also stored as ``JSON``. If ``startup_profile_path`` is given, the startup
+    is run under ``cProfile`` and the stats are dumped into that file. Both paths default to the
+    ``MINOS_STARTUP_REPORT`` and ``MINOS_STARTUP_PROFILE`` environment variables, respectively.
+    """
 
     def __init__(
         self,
@@ -78,11 +103,17 @@ class EntrypointLauncher(MinosSetup):
         log_format: Union[str, LogFormat] = "color",
         log_date_format: Union[str, DateFormat] = DateFormat["color"],
         external_modules: Optional[list[ModuleType]] = None,
+        startup_report_path: Optional[Union[str, Path]] = None,
+        startup_profile_path: Optional[Union[str, Path]] = None,
         *args,
         **kwargs,
     ):
         if external_modules is None:
             external_modules = list()
+        if startup_report_path is None:
+            startup_report_path = os.environ.get("MINOS_STARTUP_REPORT")
+        if startup_profile_path is None:
+            startup_profile_path = os.environ.get("MINOS_STARTUP_PROFILE")
 
         super().__init__(*args, **kwargs)
 
@@ -99,6 +130,9 @@ class EntrypointLauncher(MinosSetup):
         self._raw_services = services
         self._external_modules = external_modules
 
+        self._startup_report_path = Path(startup_report_path) if startup_report_path is not None else None
+        self._startup_profile_path = Path(startup_profile_path) if startup_profile_path is not None else None
+
     @classmethod
     def _from_config(cls, *args, config: MinosConfig, **kwargs) -> EntrypointLauncher:
         if "injections" not in kwargs:
@@ -120,8 +154,7 @@ class EntrypointLauncher(MinosSetup):
         logger.info("Starting microservice...")
 
         try:
-            self.loop.run_until_complete(self.setup())
-            self.loop.run_until_complete(self.entrypoint.__aenter__())
+            self._start()
             logger.info("Microservice is up and running!")
             self.loop.run_forever()
         except KeyboardInterrupt:  # pragma: no cover
@@ -129,6 +162,29 @@ class EntrypointLauncher(MinosSetup):
         finally:
             self.graceful_shutdown()
 
+    def _start(self) -> None:
+        profile = Profile() if self._startup_profile_path is not None else None
+
+        with SETUP_PROFILER.span("launch", type(self).__name__) as span:
+            if profile is not None:
+                profile.enable()
+            try:
+                self.loop.run_until_complete(self.setup())
+                self.loop.run_until_complete(self.entrypoint.__aenter__())
+            finally:
+                if profile is not None:
+                    profile.disable()
+                    profile.dump_stats(self._startup_profile_path)
+                    logger.info(f"The startup profile has been stored into {str(self._startup_profile_path)!r}.")
+
+        self._report_startup(span)
+
+    def _report_startup(self, span: SetupSpan) -> None:
+        logger.info(f"The startup took {span.elapsed * 1000:.1f} ms:\n{span.format()}")
+        if self._startup_report_path is not None:
+            self._startup_report_path.write_text(json.dumps(span.as_dict(), indent=2))
+            logger.info(f"The startup report has been stored into {str(self._startup_report_path)!r}.")
+
     def graceful_shutdown(self, err: Exception = None) -> None:
         """Shutdown the services execution gracefully.
 
@@ -178,11 +234,23 @@ class EntrypointLauncher(MinosSetup):
 
     @property
     def _internal_modules(self) -> list[ModuleType]:
+        # Every installed ``minos`` package is imported (plus the modules containing the injections and the services),
+        # so that their modules are not imported after the wiring (losing their injections). However, only the ones
+        # defining some ``Provide`` marker are wired.
         import minos
 
-        for loader, module_name, _ in pkgutil.iter_modules(minos.__path__):
-            loader.find_module(module_name).load_module(module_name)
-        return [v for k, v in sys.modules.items() if re.fullmatch(r"minos\.\w+", k)]
+        for module_info in pkgutil.iter_modules(minos.__path__, f"{minos.__name__}."):
+            importlib.import_module(module_info.name)
+
+        for raw in chain(self._raw_injections.values(), self._raw_services):
+            if isinstance(raw, str):
+                import_module(raw)
+
+        return [
+            module
+            for name, module in tuple(sys.modules.items())
+            if name.startswith("minos.") and module is not None and _requires_injections(module)
+        ]
 
     async def _destroy(self) -> None:
         """Unwire the injected dependencies and destroys it.
@@ -198,3 +266,15 @@ class EntrypointLauncher(MinosSetup):
         :return: A ``DependencyInjector`` instance.
         """
         return DependencyInjector(config=self.config, **self._raw_injections)
+
+
+def _requires_injections(module: ModuleType) -> bool:
+    for member in vars(module).values():
+        if getattr(member, "__module__", None) != module.__name__:
+            continue
+        if isclass(member):
+            if any(get_injection_markers(value) for value in vars(member).values()):
+                return True
+        elif get_injection_markers(member):
+            return True
+    return False
@@ -1,14 +1,32 @@
+from __future__ import (
+    annotations,
+)
+
+from collections import (
+    OrderedDict,
+)
 from collections.abc import (
     Hashable,
 )
 from contextlib import (
     AbstractAsyncContextManager,
 )
+from hashlib import (
+    blake2b,
+)
+from typing import (
+    Any,
+)
 
 from cached_property import (
     cached_property,
 )
 
+from .metrics import (
+    Histogram,
+    MetricsSource,
+)
+
 
 class Lock(AbstractAsyncContextManager):
     """Lock base class."""
@@ -25,8 +43,108 @@ class Lock(AbstractAsyncContextManager):
     def hashed_key(self) -> int:
         """Get the hashed key.
 
+        The integer keys are used as they are. Otherwise, the key is hashed into a signed 64-bit integer from its
+        representation, so the same key is always hashed into the same value, regardless of the process.
+
         :return: An integer value.
         """
         if not isinstance(self.key, int):
-            return hash(self.key)
+            return stable_hash(self.key)
         return self.key
+
+
+def stable_hash(key: Hashable) -> int:
+    """Hash the given key into a signed 64-bit integer that does not depend on the process.
+
+    :param key: The key to be hashed. Its representation must not depend on the process.
+    :return: An integer value.
+    """
+    digest = blake2b(repr(key).encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big", signed=True)
+
+
+class LockMetrics(MetricsSource):
+    """Lock Metrics class.
+
+    Keeps the wait and hold time histograms, and the acquisition, contention and timeout counts of each lock key. Only
+    the ``maxsize`` most recently used keys are kept, so the keys generated from identifiers do not grow unbounded.
+    """
+
+    def __init__(self, maxsize: int = 256):
+        self.maxsize = maxsize
+        self._keys: OrderedDict[str, _KeyMetrics] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def observe_acquisition(self, key: Hashable, wait: float, contended: bool) -> None:
+        """Observe a lock acquisition.
+
+        :param key: The lock key.
+        :param wait: The elapsed seconds until the lock was acquired.
+        :param contended: ``True`` if the lock was held by another one when it was requested or ``False`` otherwise.
+        :return: This method does not return anything.
+        """
+        metrics = self._get(key)
+        metrics.acquisitions += 1
+        metrics.contentions += contended
+        metrics.wait.observe(wait)
+
+    def observe_timeout(self, key: Hashable, wait: float) -> None:
+        """Observe a lock acquisition that timed out.
+
+        :param key: The lock key.
+        :param wait: The elapsed seconds until the acquisition was given up.
+        :return: This method does not return anything.
+        """
+        metrics = self._get(key)
+        metrics.contentions += 1
+        metrics.timeouts += 1
+        metrics.wait.observe(wait)
+
+    def observe_release(self, key: Hashable, hold: float) -> None:
+        """Observe a lock release.
+
+        :param key: The lock key.
+        :param hold: The elapsed seconds since the lock was acquired.
+        :return: This method does not return anything.
+        """
+        self._get(key).hold.observe(hold)
+
+    def _get(self, key: Hashable) -> _KeyMetrics:
+        key = str(key)
+        if key in self._keys:
+            self._keys.move_to_end(key)
+            return self._keys[key]
+
+        metrics = self._keys[key] = _KeyMetrics()
+        if len(self._keys) > self.maxsize:
+            self._keys.popitem(last=False)
+        return metrics
+
+    def metrics(self) -> dict[str, Any]:
+        """Get a snapshot of the lock metrics.
+
+        :return: A dictionary indexed by lock key.
+        """
+        return {key: metrics.as_dict() for key, metrics in self._keys.items()}
+
+
+class _KeyMetrics:
+    __slots__ = "acquisitions", "contentions", "timeouts", "wait", "hold"
+
+    def __init__(self):
+        self.acquisitions = 0
+        self.contentions = 0
+        self.timeouts = 0
+        self.wait = Histogram()
+        self.hold = Histogram()
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "acquisitions": self.acquisitions,
+            "contentions": self.contentions,
+            "timeouts": self.timeouts,
+            "wait": self.wait.as_dict(),
+            "hold": self.hold.as_dict(),
+        }
@@ -0,0 +1,146 @@
+from __future__ import (
+    annotations,
+)
+
+from abc import (
+    ABC,
+    abstractmethod,
+)
+from bisect import (
+    bisect_left,
+)
+from collections.abc import (
+    Iterable,
+    Iterator,
+)
+from contextlib import (
+    contextmanager,
+)
+from time import (
+    perf_counter,
+)
+from typing import (
+    Any,
+    Final,
+)
+from weakref import (
+    ref,
+)
+
+DEFAULT_LATENCY_BOUNDS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class Histogram:
+    """Histogram class.
+
+    The observed values are counted into buckets delimited by the given upper bounds, plus an additional bucket for the
+    values greater than the last bound.
+    """
+
+    __slots__ = "bounds", "counts", "count", "sum"
+
+    def __init__(self, bounds: Iterable[float] = DEFAULT_LATENCY_BOUNDS):
+        self.bounds = tuple(sorted(bounds))
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        """Observe a new value.
+
+        :param value: The value to be observed.
+        :return: This method does not return anything.
+        """
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    @contextmanager
+    def time(self) -> Iterator[None]:
+        """Observe the elapsed seconds of the wrapped block.
+
+        :return: A context manager.
+        """
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(perf_counter() - start)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Get the histogram as a dictionary.
+
+        :return: A dictionary containing the count of each bucket (indexed by its upper bound), the total count and the
+            sum of the observed values.
+        """
+        buckets = {str(bound): count for bound, count in zip(self.bounds, self.counts)}
+        buckets["+Inf"] = self.counts[-1]
+        return {"buckets": buckets, "count": self.count, "sum": self.sum}
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(count={self.count!r}, sum={self.sum!r})"
+
+
+class MetricsSource(ABC):
+    """Metrics Source base class."""
+
+    @abstractmethod
+    def metrics(self) -> dict[str, Any]:
+        """Get a snapshot of the current metrics.
+
+        :return: A json-serializable dictionary.
+        """
+
+
+class MetricsRegistry:
+    """Metrics Registry class.
+
+    Collects the metrics of the registered sources under their names. The sources are weakly referenced, so they are
+    forgotten once they are garbage-collected, even if they are not unregistered explicitly.
+    """
+
+    def __init__(self):
+        self._sources: list[tuple[str, ref[MetricsSource]]] = list()
+
+    def __len__(self) -> int:
+        return sum(source() is not None for _, source in self._sources)
+
+    def register(self, name: str, source: MetricsSource) -> None:
+        """Register a new metrics source.
+
+        :param name: The name of the source. If several sources share the same name, the following ones are suffixed
+            with their position (``name[1]``, ``name[2]``...).
+        :param source: The metrics source.
+        :return: This method does not return anything.
+        """
+        self._sources = [(current_name, current) for current_name, current in self._sources if current() is not None]
+        self._sources.append((name, ref(source)))
+
+    def unregister(self, source: MetricsSource) -> None:
+        """Unregister a metrics source.
+
+        :param source: The metrics source.
+        :return: This method does not return anything.
+        """
+        self._sources = [(name, current) for name, current in self._sources if current() not in (source, None)]
+
+    def collect(self) -> dict[str, dict[str, Any]]:
+        """Collect the metrics of all the registered sources.
+
+        :return: A json-serializable dictionary indexed by source name.
+        """
+        ans = dict()
+        counts = dict()
+        for name, source in self._sources:
+            if (source := source()) is None:
+                continue
+            if name in counts:
+                counts[name] += 1
+                name = f"{name}[{counts[name]}]"
+            else:
+                counts[name] = 0
+            ans[name] = source.metrics()
+        return ans
+
+
+METRICS_REGISTRY: Final[MetricsRegistry] = MetricsRegistry()
@@ -1,6 +1,10 @@
 from .abc import (
     Model,
 )
+from .contextvars import (
+    IS_LAZY_CONSTRUCTION_CONTEXT_VAR,
+    IS_TRUSTED_CONSTRUCTION_CONTEXT_VAR,
+)
 from .declarative import (
     DeclarativeModel,
     MinosModel,
@@ -13,6 +17,7 @@ from .dynamic import (
 from .fields import (
     Field,
     ModelField,
+    SlotField,
 )
 from .serializers import (
     AvroDataDecoder,
@@ -21,14 +26,23 @@ from .serializers import (
     AvroSchemaEncoder,
     DataDecoder,
     DataEncoder,
+    JsonDataEncoder,
+    LazyAvroData,
     SchemaDecoder,
     SchemaEncoder,
 )
+from .slotted import (
+    SlottedDeclarativeModel,
+)
 from .types import (
     GenericTypeProjector,
     MissingSentinel,
     ModelType,
     NoneType,
+    TrackedContainer,
+    TrackedDict,
+    TrackedList,
+    TrackedSet,
     TypeHintBuilder,
     TypeHintComparator,
     is_model_type,
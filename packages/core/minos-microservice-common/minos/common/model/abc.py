@@ -13,10 +13,18 @@ from base64 import (
 from collections.abc import (
     Mapping,
 )
+from io import (
+    BytesIO,
+)
 from typing import (
     Any,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    BinaryIO,
     Iterable,
     Iterator,
+    Optional,
     Type,
     TypedDict,
     TypeVar,
@@ -36,8 +44,13 @@ from ..meta import (
     self_or_classmethod,
 )
 from ..protocol import (
+    AvroStreamWriter,
     MinosAvroProtocol,
 )
+from .contextvars import (
+    IS_LAZY_CONSTRUCTION_CONTEXT_VAR,
+    IS_TRUSTED_CONSTRUCTION_CONTEXT_VAR,
+)
 from .fields import (
     Field,
 )
@@ -62,8 +75,13 @@ logger = logging.getLogger(__name__)
 class Model(Mapping):
     """Base class for ``minos`` model entities."""
 
+    __slots__ = ()
+
     _field_cls: Type[Field] = Field
 
+    # If ``True``, the result of an overridden ``encode_data`` only depends on the field values, so it can be cached.
+    _encode_data_cacheable: bool = False
+
     _fields: dict[str, Field]
     __eq_reversing: bool
 
@@ -113,39 +131,123 @@ class Model(Mapping):
 
     # noinspection PyUnusedLocal
     @classmethod
-    def from_avro_bytes(cls: Type[T], raw: bytes, batch_mode: bool = False, **kwargs) -> Union[T, list[T]]:
+    def from_avro_bytes(
+        cls: Type[T],
+        raw: Union[bytes, memoryview],
+        batch_mode: bool = False,
+        trusted: bool = False,
+        lazy: bool = False,
+        **kwargs,
+    ) -> Union[T, list[T]]:
         """Build a single instance or a sequence of instances from bytes
 
-        :param raw: A ``bytes`` representation of the model.
+        :param raw: A ``bytes`` (or ``memoryview``) representation of the model.
         :param batch_mode: If ``True`` the data is processed as a list of models, otherwise the data is processed as a
         single model.
+        :param trusted: If ``True`` the decoded values are assigned to the fields without being parsed and validated
+            again. It must only be used with data that was generated by a ``Model`` instance.
+        :param lazy: If ``True`` the nested models and large containers are decoded the first time they are accessed.
         :param kwargs: Additional named arguments.
         :return: A single instance or a sequence of instances.
         """
-        schema = MinosAvroProtocol.decode_schema(raw)
-        data = MinosAvroProtocol.decode(raw, batch_mode=batch_mode)
+        schema, data = MinosAvroProtocol.decode_with_schema(raw, batch_mode=batch_mode)
 
         if batch_mode:
-            return [cls.from_avro(schema, entry) for entry in data]
+            return [cls.from_avro(schema, entry, trusted=trusted, lazy=lazy) for entry in data]
 
-        return cls.from_avro(schema, data)
+        return cls.from_avro(schema, data, trusted=trusted, lazy=lazy)
 
     @classmethod
-    def from_avro(cls: Type[T], schema: Any, data: Any) -> T:
+    def from_avro(cls: Type[T], schema: Any, data: Any, trusted: bool = False, lazy: bool = False) -> T:
         """Build a new instance from the ``avro`` schema and data.
 
         :param schema: The avro schema of the model.
         :param data: The avro data of the model.
+        :param trusted: If ``True`` the decoded values are assigned to the fields without being parsed and validated
+            again. It must only be used with data that was generated by a ``Model`` instance.
+        :param lazy: If ``True`` the nested models and large containers are kept as raw data until they are accessed
+            for the first time. As a result, their decoding errors are also deferred until that moment.
         :return: A new ``DynamicModel`` instance.
         """
         schema_decoder = AvroSchemaDecoder()
         type_ = schema_decoder.build(schema)
+        return cls._from_avro_data(type_, data, trusted, lazy)
 
-        data_decoder = AvroDataDecoder()
-        instance = data_decoder.build(data, type_)
+    @classmethod
+    def _from_avro_data(cls: Type[T], type_: type, data: Any, trusted: bool, lazy: bool) -> T:
+        trusted_token = IS_TRUSTED_CONSTRUCTION_CONTEXT_VAR.set(trusted)
+        lazy_token = IS_LAZY_CONSTRUCTION_CONTEXT_VAR.set(lazy)
+        try:
+            data_decoder = AvroDataDecoder()
+            instance = data_decoder.build(data, type_)
+        finally:
+            IS_LAZY_CONSTRUCTION_CONTEXT_VAR.reset(lazy_token)
+            IS_TRUSTED_CONSTRUCTION_CONTEXT_VAR.reset(trusted_token)
 
         return instance
 
+    @classmethod
+    def iter_from_avro_bytes(
+        cls: Type[T],
+        stream: Union[bytes, memoryview, BinaryIO, AsyncIterable[bytes]],
+        trusted: bool = False,
+        lazy: bool = False,
+    ) -> Union[Iterator[T], AsyncIterator[T]]:
+        """Build the instances contained in the given stream one by one, so they do not need to be kept in memory.
+
+        :param stream: An avro object container file (as the ones generated by ``to_avro_bytes`` or
+            ``write_avro_stream``) given as a ``bytes`` object, a binary file object or an asynchronous iterable of
+            ``bytes`` chunks.
+        :param trusted: If ``True`` the decoded values are assigned to the fields without being parsed and validated
+            again. It must only be used with data that was generated by a ``Model`` instance.
+        :param lazy: If ``True`` the nested models and large containers are decoded the first time they are accessed.
+        :return: An iterator over the instances, or an asynchronous iterator if the stream is asynchronous.
+        """
+        if isinstance(stream, AsyncIterable):
+            return cls._aiter_from_avro_chunks(stream, trusted, lazy)
+
+        if isinstance(stream, (bytes, memoryview)):
+            stream = BytesIO(stream)
+
+        return cls._iter_from_avro_file(stream, trusted, lazy)
+
+    @classmethod
+    def _iter_from_avro_file(cls: Type[T], file: BinaryIO, trusted: bool, lazy: bool) -> Iterator[T]:
+        schema, values = MinosAvroProtocol.decode_stream(file)
+        type_ = AvroSchemaDecoder().build(schema)
+        for value in values:
+            yield cls._from_avro_data(type_, value, trusted, lazy)
+
+    @classmethod
+    async def _aiter_from_avro_chunks(
+        cls: Type[T], chunks: AsyncIterable[bytes], trusted: bool, lazy: bool
+    ) -> AsyncIterator[T]:
+        reader = MinosAvroProtocol.stream_reader()
+        type_ = None
+        async for chunk in chunks:
+            values = reader.feed(chunk)
+            if type_ is None and reader.schema is not None:
+                type_ = AvroSchemaDecoder().build(reader.schema)
+            for value in values:
+                yield cls._from_avro_data(type_, value, trusted, lazy)
+        reader.close()
+
+    @classmethod
+    def from_trusted(cls: Type[T], *args, **kwargs) -> T:
+        """Build a new instance from already typed values, assigning them without parsing and validating them again.
+
+        It must only be used with values that were obtained from other ``Model`` instances.
+
+        :param args: Positional arguments to be passed to the model constructor.
+        :param kwargs: Named arguments to be passed to the model constructor.
+        :return: A new ``Model`` instance.
+        """
+        token = IS_TRUSTED_CONSTRUCTION_CONTEXT_VAR.set(True)
+        try:
+            return cls(*args, **kwargs)
+        finally:
+            IS_TRUSTED_CONSTRUCTION_CONTEXT_VAR.reset(token)
+
     @classmethod
     def to_avro_str(cls: Type[T], models: list[T]) -> str:
         """Build the avro string representation of the given object instances.
@@ -162,18 +264,62 @@ class Model(Mapping):
         :param models: A sequence of minos models.
         :return: A bytes object.
         """
-        if len(models) == 0:
-            raise EmptyMinosModelSequenceException("'models' parameter cannot be empty.")
+        with BytesIO() as file:
+            cls.write_avro_stream(models, file)
+            return file.getvalue()
+
+    @classmethod
+    def write_avro_stream(
+        cls: Type[T], models: Union[Iterable[T], AsyncIterable[T]], file: BinaryIO
+    ) -> Union[int, Awaitable[int]]:
+        """Write the given object instances one by one into the given file, so they do not need to be kept in memory.
+
+        The written content is the same as the one generated by ``to_avro_bytes``.
+
+        :param models: A sequence of minos models, given as an iterable or an asynchronous iterable.
+        :param file: A binary file object.
+        :return: The number of written instances, or an awaitable returning it if the models are asynchronous.
+        """
+        if isinstance(models, AsyncIterable):
+            return cls._awrite_avro_stream(models, file)
 
-        model_type = type(models[0])
-        if not all(model_type == type(model) for model in models):
+        writer, model_cls = None, None
+        for model in models:
+            if writer is None:
+                writer, model_cls = cls._build_avro_stream_writer(model, file), type(model)
+            cls._write_avro_stream_model(writer, model_cls, model)
+        return cls._close_avro_stream_writer(writer)
+
+    @classmethod
+    async def _awrite_avro_stream(cls, models: AsyncIterable[T], file: BinaryIO) -> int:
+        writer, model_cls = None, None
+        async for model in models:
+            if writer is None:
+                writer, model_cls = cls._build_avro_stream_writer(model, file), type(model)
+            cls._write_avro_stream_model(writer, model_cls, model)
+        return cls._close_avro_stream_writer(writer)
+
+    @staticmethod
+    def _build_avro_stream_writer(model: Model, file: BinaryIO) -> AvroStreamWriter:
+        # The schema of the first instance is used for all of them, so they must have the same type.
+        _, avro_schema = model._avro_schemas
+        return MinosAvroProtocol.stream_writer(file, [avro_schema])
+
+    @staticmethod
+    def _write_avro_stream_model(writer: AvroStreamWriter, model_cls: type[Model], model: Model) -> None:
+        if type(model) is not model_cls:
             raise MultiTypeMinosModelSequenceException(
-                f"Every model must have type {model_type} to be valid. Found types: {[type(model) for model in models]}"
+                f"Every model must have type {model_cls} to be valid. Found type: {type(model)}"
             )
+        writer.write(model.avro_data)
 
-        avro_schema = models[0].avro_schema
-        # noinspection PyTypeChecker
-        return MinosAvroProtocol.encode([model.avro_data for model in models], avro_schema, batch_mode=True)
+    @staticmethod
+    def _close_avro_stream_writer(writer: Optional[AvroStreamWriter]) -> int:
+        if writer is None:
+            raise EmptyMinosModelSequenceException("'models' parameter cannot be empty.")
+
+        writer.flush()
+        return writer.count
 
     # noinspection PyMethodParameters
     @property_or_classproperty
@@ -223,6 +369,11 @@ class Model(Mapping):
         """Fields getter"""
         return self._fields
 
+    def _field_values(self) -> dict[str, Any]:
+        # The stored values are returned, so the lazy ones are not materialized.
+        # noinspection PyProtectedMember
+        return {name: field._value for name, field in self.fields.items()}
+
     def __setitem__(self, key: str, value: Any) -> None:
         try:
             setattr(self, key, value)
@@ -240,6 +391,8 @@ class Model(Mapping):
             object.__setattr__(self, key, value)
         elif key in self._fields:
             self._fields[key].value = value
+            # The cached encoded data is outdated, so it is discarded.
+            object.__setattr__(self, "_avro_data_cache", None)
         else:
             raise AttributeError(f"{type(self).__name__!r} does not contain the {key!r} field")
 
@@ -254,16 +407,42 @@ class Model(Mapping):
     def avro_schema(self_or_cls) -> list[dict[str, Any]]:
         """Compute the avro schema of the model.
 
+        The returned value is cached and shared between models with the same type, so it must not be modified.
+
         :return: A dictionary object.
         """
+        return self_or_cls._avro_schemas[0]
+
+    # noinspection PyMethodParameters
+    @property_or_classproperty
+    def _avro_schemas(self_or_cls) -> tuple[list[dict[str, Any]], dict[str, Any]]:
+        if isinstance(self_or_cls, type):
+            key = self_or_cls
+        else:
+            key = tuple(self_or_cls.model_type)
+
+        try:
+            return _AVRO_SCHEMAS[key]
+        except KeyError:
+            pass
+
         # noinspection PyTypeChecker
         encoder = AvroSchemaEncoder()
-        return encoder.build(self_or_cls)
+        schema = encoder.build(self_or_cls)
+        schemas = schema, MinosAvroProtocol.parse_schema(schema)
+
+        if len(_AVRO_SCHEMAS) >= _AVRO_SCHEMAS_MAX_SIZE:
+            del _AVRO_SCHEMAS[next(iter(_AVRO_SCHEMAS))]
+        _AVRO_SCHEMAS[key] = schemas
+
+        return schemas
 
     @property
     def avro_data(self) -> dict[str, Any]:
         """Compute the avro data of the model.
 
+        The returned value is cached while the model is not modified, so it must not be modified.
+
         :return: A dictionary object.
         """
         encoder = AvroDataEncoder()
@@ -282,10 +461,26 @@ class Model(Mapping):
     def avro_bytes(self) -> bytes:
         """Generate bytes representation of the current instance.
 
+        The returned value is cached while the avro data of the instance is the cached one.
+
         :return: A bytes object.
         """
+        avro_data = self.avro_data
+
+        # The cached avro data is only reused while the field values are the same, so the schema is also the same.
+        cached = getattr(self, "_avro_bytes_cache", None)
+        if cached is not None and cached[0] is avro_data:
+            return cached[1]
+
+        _, avro_schema = self._avro_schemas
         # noinspection PyTypeChecker
-        return MinosAvroProtocol.encode(self.avro_data, self.avro_schema)
+        ans = MinosAvroProtocol.encode(avro_data, [avro_schema])
+
+        entry = getattr(self, "_avro_data_cache", None)
+        if entry is not None and entry.data is avro_data:
+            self._avro_bytes_cache = avro_data, ans
+
+        return ans
 
     # noinspection PyUnusedLocal
     @staticmethod
@@ -364,3 +559,6 @@ class Model(Mapping):
 
 
 T = TypeVar("T", bound=Model)
+
+_AVRO_SCHEMAS_MAX_SIZE = 1024
+_AVRO_SCHEMAS: dict[Any, tuple[list[dict[str, Any]], dict[str, Any]]] = dict()
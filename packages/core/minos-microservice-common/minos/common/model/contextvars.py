@@ -0,0 +1,10 @@
+from contextvars import (
+    ContextVar,
+)
+from typing import (
+    Final,
+)
+
+IS_TRUSTED_CONSTRUCTION_CONTEXT_VAR: Final[ContextVar[bool]] = ContextVar("is_trusted_construction", default=False)
+
+IS_LAZY_CONSTRUCTION_CONTEXT_VAR: Final[ContextVar[bool]] = ContextVar("is_lazy_construction", default=False)
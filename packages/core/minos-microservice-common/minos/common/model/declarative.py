@@ -8,7 +8,9 @@ from itertools import (
 )
 from typing import (
     Any,
+    Callable,
     Iterator,
+    NamedTuple,
     Optional,
     Type,
     TypeVar,
@@ -21,6 +23,12 @@ from ..meta import (
 from .abc import (
     Model,
 )
+from .contextvars import (
+    IS_TRUSTED_CONSTRUCTION_CONTEXT_VAR,
+)
+from .serializers import (
+    LazyAvroData,
+)
 from .types import (
     MissingSentinel,
     ModelType,
@@ -33,6 +41,10 @@ logger = logging.getLogger(__name__)
 class DeclarativeModel(Model):
     """Base class for ``minos`` declarative model entities."""
 
+    __slots__ = ()
+
+    _field_plans_maxsize: int = 128
+
     def __init__(self, *args, **kwargs):
         """Class constructor.
 
@@ -54,31 +66,127 @@ class DeclarativeModel(Model):
         return cls(*args, **kwargs)
 
     def _build_fields(self, *args, additional_type_hints: Optional[dict[str, type]] = None, **kwargs) -> None:
-        for (name, type_val), value in zip_longest(
-            self._type_hints(additional_type_hints), args, fillvalue=MissingSentinel
-        ):
+        plan = self._field_plan(additional_type_hints)
+        for (name, type_val, parser, validator, trusted), value in zip_longest(plan, args, fillvalue=MissingSentinel):
             if name in kwargs and value is not MissingSentinel:
                 raise TypeError(f"got multiple values for argument {repr(name)}")
 
             if value is MissingSentinel and name in kwargs:
                 value = kwargs[name]
 
-            self._fields[name] = self._field_cls(
-                name, type_val, value, getattr(self, f"parse_{name}", None), getattr(self, f"validate_{name}", None)
-            )
+            if parser is not None:
+                parser = getattr(self, parser)
+            if validator is not None:
+                validator = getattr(self, validator)
+
+            if trusted:
+                self._build_field(name, type_val, value, parser, validator)
+            else:
+                self._build_untrusted_field(name, type_val, value, parser, validator)
+
+    def _build_untrusted_field(
+        self,
+        name: str,
+        type_: type,
+        value: Any,
+        parser: Optional[Callable[[Any], Any]],
+        validator: Optional[Callable[[Any], Any]],
+    ) -> None:
+        # The value was decoded with the type it was written with, so it is parsed, decoded and validated again.
+        if isinstance(value, LazyAvroData):
+            value = value.decode()
+
+        token = IS_TRUSTED_CONSTRUCTION_CONTEXT_VAR.set(False)
+        try:
+            self._build_field(name, type_, value, parser, validator)
+        finally:
+            IS_TRUSTED_CONSTRUCTION_CONTEXT_VAR.reset(token)
+
+    def _build_field(
+        self,
+        name: str,
+        type_: type,
+        value: Any,
+        parser: Optional[Callable[[Any], Any]],
+        validator: Optional[Callable[[Any], Any]],
+    ) -> None:
+        self._fields[name] = self._field_cls(name, type_, value, parser, validator)
+
+    @classmethod
+    def _field_plan(cls, additional_type_hints: Optional[dict[str, type]] = None) -> tuple[FieldPlan, ...]:
+        try:
+            plan = cls.__dict__["_field_plan_cache"]
+        except KeyError:
+            plan = tuple(cls._build_field_plan(name, type_) for name, type_ in cls._class_type_hints().items())
+            setattr(cls, "_field_plan_cache", plan)
+
+        if not additional_type_hints:
+            return plan
+
+        # The decoded instances receive the same type hint objects again and again, so the merged plans are reused
+        # based on their identity. The entries keep the type hints alive, so their identities cannot be reused.
+        key = tuple((name, id(hint)) for name, hint in additional_type_hints.items())
+        try:
+            plans = cls.__dict__["_field_plans_cache"]
+        except KeyError:
+            plans = dict()
+            setattr(cls, "_field_plans_cache", plans)
+
+        try:
+            return plans[key][1]
+        except KeyError:
+            pass
+
+        merged = {entry.name: entry for entry in plan}
+        for name, hint in additional_type_hints.items():
+            if name not in merged:
+                merged[name] = cls._build_field_plan(name, hint)
+            elif TypeHintComparator(hint, merged[name].type).match():
+                merged[name] = merged[name]._replace(type=hint)
+            else:
+                # The values written with a different type (i.e. by a previous version of the model) must be converted.
+                merged[name] = merged[name]._replace(trusted=False)
+        plan = tuple(merged.values())
+
+        plans[key] = tuple(additional_type_hints.values()), plan
+        if len(plans) > cls._field_plans_maxsize:
+            del plans[next(iter(plans))]
+
+        return plan
+
+    @classmethod
+    def _build_field_plan(cls, name: str, type_: type) -> FieldPlan:
+        parser, validator = f"parse_{name}", f"validate_{name}"
+        if not hasattr(cls, parser):
+            parser = None
+        if not hasattr(cls, validator):
+            validator = None
+        return FieldPlan(name, type_, parser, validator)
+
+    @classmethod
+    def _class_type_hints(cls) -> dict[str, type]:
+        try:
+            return cls.__dict__["_type_hints_cache"]
+        except KeyError:
+            pass
+
+        type_hints = dict()
+        for b in cls.__mro__[::-1]:
+            list_fields = {k: v for k, v in get_type_hints(b).items() if not k.startswith("_")}
+            type_hints |= list_fields
+        logger.debug(f"The obtained type hints are: {type_hints!r}")
+
+        setattr(cls, "_type_hints_cache", type_hints)
+        return type_hints
 
     # noinspection PyMethodParameters
     @self_or_classmethod
     def _type_hints(self_or_cls, additional_type_hints: Optional[dict[str, type]] = None) -> Iterator[tuple[str, Any]]:
-        type_hints = dict()
         if isinstance(self_or_cls, type):
             cls = self_or_cls
         else:
             cls = type(self_or_cls)
-        for b in cls.__mro__[::-1]:
-            list_fields = {k: v for k, v in get_type_hints(b).items() if not k.startswith("_")}
-            type_hints |= list_fields
-        logger.debug(f"The obtained type hints are: {type_hints!r}")
+        type_hints = dict(cls._class_type_hints())
 
         if additional_type_hints:
             for name, hint in additional_type_hints.items():
@@ -89,5 +197,19 @@ class DeclarativeModel(Model):
         yield from type_hints.items()
 
 
+class FieldPlan(NamedTuple):
+    """Field Plan class.
+
+    The ``trusted`` flag is ``False`` when the values are written with a type that differs from the declared one, so
+    they are never assigned without being parsed, decoded and validated.
+    """
+
+    name: str
+    type: type
+    parser: Optional[str]
+    validator: Optional[str]
+    trusted: bool = True
+
+
 T = TypeVar("T", bound=DeclarativeModel)
 MinosModel = DeclarativeModel
@@ -5,6 +5,7 @@ from __future__ import (
 import inspect
 import logging
 from typing import (
+    TYPE_CHECKING,
     Any,
     Callable,
     Iterable,
@@ -21,11 +22,15 @@ from ..exceptions import (
     MinosReqAttributeException,
     MinosTypeAttributeException,
 )
+from .contextvars import (
+    IS_TRUSTED_CONSTRUCTION_CONTEXT_VAR,
+)
 from .serializers import (
     AvroDataDecoder,
     AvroDataEncoder,
     AvroSchemaDecoder,
     AvroSchemaEncoder,
+    LazyAvroData,
 )
 from .types import (
     MissingSentinel,
@@ -33,6 +38,11 @@ from .types import (
     TypeHintComparator,
 )
 
+if TYPE_CHECKING:
+    from .abc import (
+        Model,
+    )
+
 logger = logging.getLogger(__name__)
 
 
@@ -54,7 +64,14 @@ class Field:
         self._parser = parser
         self._validator = validator
 
-        self.value = value
+        if isinstance(value, LazyAvroData):
+            # The value is decoded the first time it is accessed.
+            self._value = value
+        elif value is not None and value is not MissingSentinel and IS_TRUSTED_CONSTRUCTION_CONTEXT_VAR.get():
+            # The value is already typed, so the parsing, decoding and validation steps are skipped.
+            self._value = value
+        else:
+            self.value = value
 
     @property
     def name(self) -> str:
@@ -69,6 +86,9 @@ class Field:
     @property
     def real_type(self) -> type:
         """Real Type getter."""
+        if isinstance(self._value, LazyAvroData):
+            # The type used to decode the value is already a real type, so it is not needed to materialize the value.
+            return self._value.type_
         return TypeHintBuilder(self.value, self.type).build()
 
     @property
@@ -101,7 +121,10 @@ class Field:
     @property
     def value(self) -> Any:
         """Value getter."""
-        return self._value
+        value = self._value
+        if isinstance(value, LazyAvroData):
+            value = self._materialize(value)
+        return value
 
     @value.setter
     def value(self, data: Any) -> None:
@@ -110,7 +133,8 @@ class Field:
         :param data: new value.
         :return: This method does not return anything.
         """
-        logger.debug(f"Setting {data!r} value to {self._name!r} field with {self._type!r} type...")
+        # The message is formatted only if it is emitted, as the representation of the data can be expensive.
+        logger.debug("Setting %r value to %r field with %r type...", data, self._name, self._type)
 
         if self._parser is not None:
             try:
@@ -132,6 +156,22 @@ class Field:
 
         self._value = value
 
+    def _materialize(self, lazy: LazyAvroData) -> Any:
+        value = lazy.decode()
+        if lazy.trusted:
+            self._value = value
+        else:
+            self.value = value
+        return self._value
+
+    @property
+    def is_lazy(self) -> bool:
+        """Check if the value is still pending to be decoded.
+
+        :return: ``True`` if the value has not been accessed yet or ``False`` otherwise.
+        """
+        return isinstance(self._value, LazyAvroData)
+
     @property
     def avro_schema(self) -> dict[str, Any]:
         """Compute the avro schema of the field.
@@ -182,4 +222,44 @@ class Field:
         return f"{self.name}={self.value!r}"
 
 
+class SlotField(Field):
+    """Model field whose value is stored in a slot of the model instead of in the field itself."""
+
+    __slots__ = ("_model",)
+
+    @classmethod
+    def from_model(
+        cls,
+        model: Model,
+        name: str,
+        type_: type,
+        parser: Optional[Callable[[Any], Any]] = None,
+        validator: Optional[Callable[[Any], Any]] = None,
+    ) -> SlotField:
+        """Build a field backed by an already assigned slot of the given model.
+
+        :param model: The model instance.
+        :param name: The field name, which is also the slot name.
+        :param type_: The field type.
+        :param parser: The optional parser function.
+        :param validator: The optional validator function.
+        :return: A ``SlotField`` instance.
+        """
+        field = cls.__new__(cls)
+        field._model = model
+        field._name = name
+        field._type = type_
+        field._parser = parser
+        field._validator = validator
+        return field
+
+    @property
+    def _value(self) -> Any:
+        return getattr(self._model, self._name)
+
+    @_value.setter
+    def _value(self, value: Any) -> None:
+        object.__setattr__(self._model, self._name, value)
+
+
 ModelField = Field
@@ -9,4 +9,8 @@ from .avro import (
     AvroDataEncoder,
     AvroSchemaDecoder,
     AvroSchemaEncoder,
+    LazyAvroData,
+)
+from .json import (
+    JsonDataEncoder,
 )
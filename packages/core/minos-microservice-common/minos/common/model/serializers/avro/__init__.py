@@ -1,6 +1,7 @@
 from .data import (
     AvroDataDecoder,
     AvroDataEncoder,
+    LazyAvroData,
 )
 from .schema import (
     AvroSchemaDecoder,
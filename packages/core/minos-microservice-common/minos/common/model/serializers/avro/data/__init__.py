@@ -1,5 +1,6 @@
 from .decoder import (
     AvroDataDecoder,
+    LazyAvroData,
 )
 from .encoder import (
     AvroDataEncoder,
@@ -23,6 +23,7 @@ from itertools import (
 from typing import (
     TYPE_CHECKING,
     Any,
+    Callable,
     Optional,
     Type,
     TypeVar,
@@ -39,10 +40,17 @@ from .....exceptions import (
     DataDecoderRequiredValueException,
     DataDecoderTypeException,
 )
+from ....contextvars import (
+    IS_LAZY_CONSTRUCTION_CONTEXT_VAR,
+    IS_TRUSTED_CONSTRUCTION_CONTEXT_VAR,
+)
 from ....types import (
     MissingSentinel,
     ModelType,
     NoneType,
+    TrackedDict,
+    TrackedList,
+    TrackedSet,
     TypeHintBuilder,
     is_model_subclass,
     is_type_subclass,
@@ -60,8 +68,25 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+DecodeFn = Callable[["AvroDataDecoder", Any, dict[str, Any]], Any]
+
+
 class AvroDataDecoder(DataDecoder):
-    """Avro Data Decoder class."""
+    """Avro Data Decoder class.
+
+    Each type is compiled once into a tree of specialized decoding functions, which is shared between instances.
+
+    If the ``IS_LAZY_CONSTRUCTION_CONTEXT_VAR`` is set, the nested models and the large containers of the decoded
+    models are wrapped into ``LazyAvroData`` instances, so that they are decoded the first time they are accessed.
+    """
+
+    compiled_maxsize: int = 1024
+    lazy_min_size: int = 16
+    _compiled: dict[Any, DecodeFn] = dict()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._compiled = dict()
 
     def __init__(self, type_: Optional[type] = None):
         self.type_ = type_
@@ -78,81 +103,194 @@ class AvroDataDecoder(DataDecoder):
         return self._build(type_, data, **kwargs)
 
     def _build(self, type_: type, data: Any, **kwargs) -> Any:
+        return self._compile(type_)(self, data, kwargs)
+
+    @classmethod
+    def _compile(cls, type_: type) -> DecodeFn:
+        try:
+            key = cls._build_compile_key(type_)
+            return cls._compiled[key]
+        except KeyError:
+            pass
+        except TypeError:
+            return cls._compile_type(type_)
+
+        fn = cls._compiled[key] = cls._compile_type(type_)
+        if len(cls._compiled) > cls.compiled_maxsize:
+            del cls._compiled[next(iter(cls._compiled))]
+        return fn
+
+    @classmethod
+    def _build_compile_key(cls, type_: type) -> Any:
+        # Unions (also when nested) are compared regardless of their order and model types use a relaxed equality, so
+        # the types are converted into an order-sensitive structural key.
+        if isinstance(type_, ModelType):
+            hints = tuple((name, cls._build_compile_key(hint)) for name, hint in type_.type_hints.items())
+            return ModelType, type_.name, type_.namespace, hints
+
         origin = get_origin(type_)
-        if origin is not Union:
-            return self._build_single(type_, data, **kwargs)
-        return self._build_union(type_, data, **kwargs)
+        if origin is None:
+            return type_
+
+        return origin, tuple(cls._build_compile_key(arg) for arg in get_args(type_))
+
+    @classmethod
+    def _compile_type(cls, type_: type) -> DecodeFn:
+        if get_origin(type_) is not Union:
+            return cls._compile_single(type_)
+        return cls._compile_union(type_)
 
-    def _build_union(self, type_: type, data: Any, **kwargs) -> Any:
-        alternatives = get_args(type_)
-        for alternative_type in alternatives:
-            with suppress(Exception):
-                return self._build_single(alternative_type, data, **kwargs)
+    @classmethod
+    def _compile_union(cls, type_: type) -> DecodeFn:
+        alternatives = tuple((cls._compile_single(alt), cls._build_acceptor(alt)) for alt in get_args(type_))
+        candidates_by_type: dict[type, tuple[DecodeFn, ...]] = dict()
+
+        def _fn(decoder: AvroDataDecoder, data: Any, kwargs: dict[str, Any]) -> Any:
+            data_type = type(data)
+            try:
+                candidates = candidates_by_type[data_type]
+            except KeyError:
+                candidates = tuple(fn for fn, accepts in alternatives if accepts(data_type))
+                candidates_by_type[data_type] = candidates
+
+            if len(candidates) > 1 and IS_LAZY_CONSTRUCTION_CONTEXT_VAR.get():
+                # The alternatives are discarded by their decoding errors, so they cannot be deferred.
+                token = IS_LAZY_CONSTRUCTION_CONTEXT_VAR.set(False)
+                try:
+                    return _decode(decoder, data, kwargs, candidates)
+                finally:
+                    IS_LAZY_CONSTRUCTION_CONTEXT_VAR.reset(token)
+
+            return _decode(decoder, data, kwargs, candidates)
+
+        def _decode(
+            decoder: AvroDataDecoder, data: Any, kwargs: dict[str, Any], candidates: tuple[DecodeFn, ...]
+        ) -> Any:
+            for fn in candidates:
+                with suppress(Exception):
+                    return fn(decoder, data, kwargs)
 
-        if type_ is not NoneType:
             if data is None:
                 raise DataDecoderRequiredValueException(f"Value is {None!r}.")
 
             if data is MissingSentinel:
                 raise DataDecoderRequiredValueException("Value is missing.")
 
-        raise DataDecoderTypeException(type_, data)
+            raise DataDecoderTypeException(type_, data)
 
-    def _build_single(self, type_: type, data: Any, **kwargs) -> Any:
+        return _fn
+
+    @staticmethod
+    def _build_acceptor(type_: type) -> Callable[[type], bool]:
+        # The predicates discard the value types for which decoding as ``type_`` always fails, so they only need to be
+        # conservative, as the remaining alternatives are still tried in order.
+        if type_ is Any or isinstance(type_, TypeVar):
+            return lambda data_type: True
+
+        if type_ is NoneType:
+            return lambda data_type: data_type is NoneType or data_type is type
+
+        if is_model_subclass(type_) or isinstance(type_, ModelType):
+            return lambda data_type: data_type is not NoneType
+
+        if is_type_subclass(type_):
+            if issubclass(type_, bool):
+                accepted = bool
+            elif type_ in (int, float):
+                return lambda data_type: not issubclass(data_type, (NoneType, list, tuple, set, dict))
+            elif issubclass(type_, (int, float)):
+                return lambda data_type: data_type is not NoneType
+            elif issubclass(type_, str):
+                accepted = str
+            elif issubclass(type_, bytes):
+                accepted = bytes
+            elif issubclass(type_, (datetime, timedelta, date, time)):
+                accepted = (datetime, timedelta, date, time, int)
+            elif issubclass(type_, UUID):
+                accepted = (UUID, str, bytes)
+            else:
+                return lambda data_type: False
+            return lambda data_type: issubclass(data_type, accepted)
+
+        origin_type = get_origin(type_)
+        if origin_type in (list, set):
+            return lambda data_type: issubclass(data_type, Iterable) and not issubclass(data_type, str)
+
+        if origin_type is dict:
+            return lambda data_type: issubclass(data_type, Mapping)
+
+        return lambda data_type: False
+
+    @classmethod
+    def _compile_single(cls, type_: type) -> DecodeFn:
         if type_ is Any:
-            type_ = TypeHintBuilder(data).build()
+            return cls._build_any
+
         if isinstance(type_, TypeVar):
-            unpacked_type = unpack_typevar(type_)
-            return self._build(unpacked_type, data, **kwargs)
+            return cls._compile(unpack_typevar(type_))
 
         if type_ is NoneType:
-            return self._build_none(type_, data, **kwargs)
+            return lambda decoder, data, kwargs: cls._build_none(type_, data)
 
-        if data is None:
-            raise DataDecoderRequiredValueException(f"Value is {None!r}.")
+        fn = cls._compile_required(type_)
 
-        if data is MissingSentinel:
-            raise DataDecoderRequiredValueException("Value is missing.")
+        def _fn(decoder: AvroDataDecoder, data: Any, kwargs: dict[str, Any]) -> Any:
+            if data is None:
+                raise DataDecoderRequiredValueException(f"Value is {None!r}.")
+
+            if data is MissingSentinel:
+                raise DataDecoderRequiredValueException("Value is missing.")
 
+            return fn(decoder, data, kwargs)
+
+        return _fn
+
+    @classmethod
+    def _build_any(cls, decoder: AvroDataDecoder, data: Any, kwargs: dict[str, Any]) -> Any:
+        type_ = TypeHintBuilder(data).build()
+        return cls._compile(type_)(decoder, data, kwargs)
+
+    @classmethod
+    def _compile_required(cls, type_: type) -> DecodeFn:
         if is_model_subclass(type_):
             # noinspection PyTypeChecker
-            return self._build_model(type_, data, **kwargs)
+            return cls._compile_model(type_)
 
         if is_type_subclass(type_):
             if issubclass(type_, bool):
-                return self._build_bool(data, **kwargs)
+                return lambda decoder, data, kwargs: cls._build_bool(data)
 
             if issubclass(type_, int):
-                return self._build_int(type_, data, **kwargs)
+                return lambda decoder, data, kwargs: cls._build_int(type_, data)
 
             if issubclass(type_, float):
-                return self._build_float(data, **kwargs)
+                return lambda decoder, data, kwargs: cls._build_float(data)
 
             if issubclass(type_, str):
-                return self._build_string(type_, data, **kwargs)
+                return lambda decoder, data, kwargs: cls._build_string(type_, data)
 
             if issubclass(type_, bytes):
-                return self._build_bytes(data, **kwargs)
+                return lambda decoder, data, kwargs: cls._build_bytes(data)
 
             if issubclass(type_, datetime):
-                return self._build_datetime(data, **kwargs)
+                return lambda decoder, data, kwargs: cls._build_datetime(data)
 
             if issubclass(type_, timedelta):
-                return self._build_timedelta(data, **kwargs)
+                return lambda decoder, data, kwargs: cls._build_timedelta(data)
 
             if issubclass(type_, date):
-                return self._build_date(data, **kwargs)
+                return lambda decoder, data, kwargs: cls._build_date(data)
 
             if issubclass(type_, time):
-                return self._build_time(data, **kwargs)
+                return lambda decoder, data, kwargs: cls._build_time(data)
 
             if issubclass(type_, UUID):
-                return self._build_uuid(data, **kwargs)
+                return lambda decoder, data, kwargs: cls._build_uuid(data)
 
             if isinstance(type_, ModelType):
-                return self._build_model_type(type_, data, **kwargs)
+                return cls._compile_model_type(type_)
 
-        return self._build_collection(type_, data, **kwargs)
+        return cls._compile_collection(type_)
 
     @staticmethod
     def _build_none(type_: type, data: Any, **kwargs) -> Any:
@@ -241,71 +379,175 @@ class AvroDataDecoder(DataDecoder):
                 pass
         raise DataDecoderTypeException(UUID, data)
 
-    def _build_model(self, type_: Type[Model], data: Any, **kwargs) -> Any:
-        if is_type_subclass(type_) and isinstance(data, type_):
-            return data
-        return self._build_model_type(ModelType.from_model(type_), data, **kwargs)
+    @classmethod
+    def _compile_model(cls, type_: Type[Model]) -> DecodeFn:
+        is_type = is_type_subclass(type_)
+        model_type_fn = None
 
-    def _build_model_type(self, type_: ModelType, data: Any, **kwargs) -> Any:
-        if hasattr(data, "model_type"):
-            if ModelType.from_model(data) >= type_:
+        def _fn(decoder: AvroDataDecoder, data: Any, kwargs: dict[str, Any]) -> Any:
+            nonlocal model_type_fn
+            if is_type and isinstance(data, type_):
                 return data
+            if model_type_fn is None:
+                model_type_fn = cls._compile_model_type(ModelType.from_model(type_))
+            return model_type_fn(decoder, data, kwargs)
+
+        return _fn
+
+    @classmethod
+    def _compile_model_type(cls, type_: ModelType) -> DecodeFn:
+        fields = None
+
+        def _fn(decoder: AvroDataDecoder, data: Any, kwargs: dict[str, Any]) -> Any:
+            nonlocal fields
+            if hasattr(data, "model_type"):
+                if ModelType.from_model(data) >= type_:
+                    return data
+
+            if (ans := type_.model_cls.decode_data(decoder, data, type_, **kwargs)) is not MissingSentinel:
+                return ans
+
+            if fields is None:
+                # The field decoders are compiled lazily to support recursive types.
+                fields = tuple(
+                    (name, cls._compile(t), t, cls._get_lazy_min_size(t)) for name, t in type_.type_hints.items()
+                )
+
+            if isinstance(data, dict):
+                if IS_LAZY_CONSTRUCTION_CONTEXT_VAR.get():
+                    with suppress(Exception):
+                        decoded_data = {
+                            name: cls._build_lazy(decoder, data.get(name, None), kwargs, fn, t, min_size)
+                            for name, fn, t, min_size in fields
+                        }
+                        return type_(**decoded_data, additional_type_hints=type_.type_hints)
+
+                with suppress(Exception):
+                    decoded_data = {name: fn(decoder, data.get(name, None), kwargs) for name, fn, _, _ in fields}
+                    return type_(**decoded_data, additional_type_hints=type_.type_hints)
+
+            if fields:
+                with suppress(Exception):
+                    decoded_data = (fn(decoder, d, kwargs) for d, (_, fn, _, _) in zip_longest((data,), fields))
+                    return type_(*decoded_data, additional_type_hints=type_.type_hints)
 
-        if (ans := type_.model_cls.decode_data(self, data, type_, **kwargs)) is not MissingSentinel:
-            return ans
+            raise DataDecoderTypeException(type_, data)
 
-        if isinstance(data, dict):
-            with suppress(Exception):
-                decoded_data = {n: self._build(t, data.get(n, None), **kwargs) for n, t in type_.type_hints.items()}
-                return type_(**decoded_data, additional_type_hints=type_.type_hints)
+        return _fn
 
-        with suppress(Exception):
-            decoded_data = (self._build(t, d, **kwargs) for d, t in zip_longest((data,), type_.type_hints.values()))
-            return type_(*decoded_data, additional_type_hints=type_.type_hints)
+    @classmethod
+    def _get_lazy_min_size(cls, type_: type) -> Optional[int]:
+        # The nested models (also when they are contained) are deferred whenever they are not empty, but the remaining
+        # containers are only deferred if they are large enough to compensate the overhead of wrapping them.
+        if get_origin(type_) is Union:
+            sizes = [size for arg in get_args(type_) if (size := cls._get_lazy_min_size(arg)) is not None]
+            return min(sizes, default=None)
 
-        raise DataDecoderTypeException(type_, data)
+        if isinstance(type_, TypeVar):
+            return cls._get_lazy_min_size(unpack_typevar(type_))
+
+        if type_ is Any or is_model_subclass(type_) or isinstance(type_, ModelType):
+            return 1
 
-    def _build_collection(self, type_: type, data: Any, **kwargs) -> Any:
+        if get_origin(type_) in (list, set, dict):
+            if cls._get_lazy_min_size(get_args(type_)[-1]) == 1:
+                return 1
+            return cls.lazy_min_size
+
+        return None
+
+    @staticmethod
+    def _build_lazy(
+        decoder: AvroDataDecoder,
+        data: Any,
+        kwargs: dict[str, Any],
+        fn: DecodeFn,
+        type_: type,
+        min_size: Optional[int],
+    ) -> Any:
+        if min_size is not None and isinstance(data, (dict, list)) and len(data) >= min_size:
+            return LazyAvroData(data, type_, fn, decoder, kwargs)
+        return fn(decoder, data, kwargs)
+
+    @classmethod
+    def _compile_collection(cls, type_: type) -> DecodeFn:
         origin_type = get_origin(type_)
         if origin_type is None:
-            raise DataDecoderMalformedTypeException(f"Type is malformed. Obtained: '{type_}'.")
+
+            def _fn(decoder: AvroDataDecoder, data: Any, kwargs: dict[str, Any]) -> Any:
+                raise DataDecoderMalformedTypeException(f"Type is malformed. Obtained: '{type_}'.")
+
+            return _fn
 
         if origin_type is list:
-            return self._build_list(data, type_, **kwargs)
+            return cls._compile_iterable(list, get_args(type_)[0], TrackedList)
 
         if origin_type is set:
-            return self._build_set(data, type_, **kwargs)
+            return cls._compile_iterable(set, get_args(type_)[0], TrackedSet)
 
         if origin_type is dict:
-            return self._build_dict(data, type_, **kwargs)
+            return cls._compile_dict(type_)
 
-        raise DataDecoderTypeException(type_, data)
+        def _fn(decoder: AvroDataDecoder, data: Any, kwargs: dict[str, Any]) -> Any:
+            raise DataDecoderTypeException(type_, data)
+
+        return _fn
 
-    def _build_list(self, data: Any, type_values: Any, **kwargs) -> list[Any]:
-        type_values = get_args(type_values)[0]
-        if isinstance(data, str) or not isinstance(data, Iterable):
-            raise DataDecoderTypeException(list, data)
+    @classmethod
+    def _compile_iterable(cls, iterable_type: type, type_values: type, tracked_type: type) -> DecodeFn:
+        fn = cls._compile(type_values)
 
-        return list(self._build_iterable(data, type_values, **kwargs))
+        def _fn(decoder: AvroDataDecoder, data: Any, kwargs: dict[str, Any]) -> Any:
+            if isinstance(data, str) or not isinstance(data, Iterable):
+                raise DataDecoderTypeException(iterable_type, data)
 
-    def _build_set(self, data: Any, type_values: Any, **kwargs) -> set[Any]:
-        type_values = get_args(type_values)[0]
-        if isinstance(data, str) or not isinstance(data, Iterable):
-            raise DataDecoderTypeException(set, data)
+            # The in-place modifications of the container are tracked, so the models can reuse their encoded data.
+            return tracked_type([fn(decoder, item, kwargs) for item in data])
 
-        return set(self._build_iterable(data, type_values, **kwargs))
+        return _fn
 
-    def _build_dict(self, data: dict, type_: type, **kwargs) -> dict[str, Any]:
+    @classmethod
+    def _compile_dict(cls, type_: type) -> DecodeFn:
         type_keys, type_values = get_args(type_)
-        if not isinstance(data, Mapping):
-            raise DataDecoderTypeException(dict, data)
+        keys_fn, values_fn = cls._compile(type_keys), cls._compile(type_values)
+
+        def _fn(decoder: AvroDataDecoder, data: Any, kwargs: dict[str, Any]) -> Any:
+            if not isinstance(data, Mapping):
+                raise DataDecoderTypeException(dict, data)
+
+            if type_keys is not str:
+                raise DataDecoderMalformedTypeException(f"dictionary keys must be {str!r}. Obtained: {type_keys!r}")
+
+            return TrackedDict({keys_fn(decoder, k, kwargs): values_fn(decoder, v, kwargs) for k, v in data.items()})
+
+        return _fn
 
-        if type_keys is not str:
-            raise DataDecoderMalformedTypeException(f"dictionary keys must be {str!r}. Obtained: {type_keys!r}")
 
-        keys = self._build_iterable(data.keys(), type_keys, **kwargs)
-        values = self._build_iterable(data.values(), type_values, **kwargs)
-        return dict(zip(keys, values))
+class LazyAvroData:
+    """Avro data whose decoding is deferred until it is needed for the first time."""
+
+    __slots__ = "data", "type_", "trusted", "_fn", "_decoder", "_kwargs"
+
+    def __init__(self, data: Any, type_: type, fn: DecodeFn, decoder: AvroDataDecoder, kwargs: dict[str, Any]):
+        self.data = data
+        self.type_ = type_
+        self.trusted = IS_TRUSTED_CONSTRUCTION_CONTEXT_VAR.get()
+        self._fn = fn
+        self._decoder = decoder
+        self._kwargs = kwargs
+
+    def decode(self) -> Any:
+        """Decode the data, deferring again the decoding of its nested models and large containers.
+
+        :return: The decoded value.
+        """
+        trusted_token = IS_TRUSTED_CONSTRUCTION_CONTEXT_VAR.set(self.trusted)
+        lazy_token = IS_LAZY_CONSTRUCTION_CONTEXT_VAR.set(True)
+        try:
+            return self._fn(self._decoder, self.data, self._kwargs)
+        finally:
+            IS_LAZY_CONSTRUCTION_CONTEXT_VAR.reset(lazy_token)
+            IS_TRUSTED_CONSTRUCTION_CONTEXT_VAR.reset(trusted_token)
 
-    def _build_iterable(self, data: Iterable, type_params: type, **kwargs) -> Iterable:
-        return (self._build(type_params, item, **kwargs) for item in data)
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.data!r})"
@@ -13,9 +13,14 @@ from datetime import (
 from decimal import (
     Decimal,
 )
+from enum import (
+    Enum,
+)
 from typing import (
     TYPE_CHECKING,
     Any,
+    Callable,
+    NamedTuple,
 )
 from uuid import (
     UUID,
@@ -26,10 +31,15 @@ from .....exceptions import (
 )
 from ....types import (
     MissingSentinel,
+    NoneType,
+    TrackedContainer,
 )
 from ...abc import (
     DataEncoder,
 )
+from .decoder import (
+    LazyAvroData,
+)
 
 if TYPE_CHECKING:
     from ....abc import (
@@ -42,8 +52,27 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+EncodeFn = Callable[["AvroDataEncoder", Any, dict[str, Any]], Any]
+
+_IMMUTABLE_TYPES = frozenset({NoneType, str, int, bool, float, bytes, Decimal, datetime, timedelta, date, time, UUID})
+
+
 class AvroDataEncoder(DataEncoder):
-    """Avro Data Encoder class."""
+    """Avro Data Encoder class.
+
+    The encoding function of each value type is resolved once and shared between instances. The encoded data of each
+    model is cached on the model instance and reused while none of its field values has been replaced, none of its
+    tracked containers (the ones built by the decoder) has been modified in place and none of its nested models has
+    been modified, so it must not be modified. Models containing other mutable values, or whose ``encode_data`` method
+    has been overridden without setting ``_encode_data_cacheable``, are not cached.
+    """
+
+    compiled_maxsize: int = 1024
+    _compiled: dict[type, EncodeFn] = dict()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._compiled = dict()
 
     def __init__(self, value: Any = None):
         self.value = value
@@ -59,65 +88,158 @@ class AvroDataEncoder(DataEncoder):
         return self._build(value, **kwargs)
 
     def _build(self, value: Any, **kwargs) -> Any:
-        if value is None:
-            return None
+        return self._compile(type(value))(self, value, kwargs)
+
+    @classmethod
+    def _compile(cls, type_: type) -> EncodeFn:
+        try:
+            return cls._compiled[type_]
+        except KeyError:
+            pass
+
+        fn = cls._compiled[type_] = cls._compile_type(type_)
+        if len(cls._compiled) > cls.compiled_maxsize:
+            del cls._compiled[next(iter(cls._compiled))]
+        return fn
+
+    @classmethod
+    def _compile_type(cls, type_: type) -> EncodeFn:
+        if type_ is NoneType:
+            return lambda encoder, value, kwargs: None
 
         from ....abc import (
             Model,
         )
 
-        if isinstance(value, Model):
-            return self._build_model(value, **kwargs)
+        if issubclass(type_, Model):
+            return lambda encoder, value, kwargs: encoder._build_model(value, **kwargs)
 
         from ....abc import (
             Field,
         )
 
-        if isinstance(value, Field):
-            return self._build_field(value, **kwargs)
+        if issubclass(type_, Field):
+            return lambda encoder, value, kwargs: encoder._build_field(value, **kwargs)
 
-        if isinstance(value, (str, int, bool, float, bytes)):
-            return value
+        if issubclass(type_, (str, int, bool, float, bytes)):
+            return lambda encoder, value, kwargs: value
 
-        if isinstance(value, memoryview):
-            return value.tobytes()
+        if issubclass(type_, memoryview):
+            return lambda encoder, value, kwargs: value.tobytes()
 
-        if isinstance(value, Decimal):
-            return float(value)
+        if issubclass(type_, Decimal):
+            return lambda encoder, value, kwargs: float(value)
 
-        if isinstance(value, datetime):
-            return self._build_datetime(value, **kwargs)
+        if issubclass(type_, datetime):
+            return lambda encoder, value, kwargs: cls._build_datetime(value)
 
-        if isinstance(value, timedelta):
-            return self._build_timedelta(value, **kwargs)
+        if issubclass(type_, timedelta):
+            return lambda encoder, value, kwargs: cls._build_timedelta(value)
 
-        if isinstance(value, date):
-            return self._build_date(value, **kwargs)
+        if issubclass(type_, date):
+            return lambda encoder, value, kwargs: cls._build_date(value)
 
-        if isinstance(value, time):
-            return self._build_time(value, **kwargs)
+        if issubclass(type_, time):
+            return lambda encoder, value, kwargs: cls._build_time(value)
 
-        if isinstance(value, UUID):
-            return self._build_uuid(value, **kwargs)
+        if issubclass(type_, UUID):
+            return lambda encoder, value, kwargs: cls._build_uuid(value)
 
-        if isinstance(value, (list, set)):
-            return [self._build(v, **kwargs) for v in value]
+        if issubclass(type_, (list, set)):
+            return lambda encoder, value, kwargs: [cls._compile(type(v))(encoder, v, kwargs) for v in value]
 
-        if isinstance(value, dict):
-            return {k: self._build(v, **kwargs) for k, v in value.items()}
+        if issubclass(type_, dict):
+            return lambda encoder, value, kwargs: {
+                k: cls._compile(type(v))(encoder, v, kwargs) for k, v in value.items()
+            }
 
-        raise MinosMalformedAttributeException(f"Given type is not supported: {type(value)!r} ({value!r})")
+        def _fn(encoder: AvroDataEncoder, value: Any, kwargs: dict[str, Any]) -> Any:
+            raise MinosMalformedAttributeException(f"Given type is not supported: {type(value)!r} ({value!r})")
 
-    def _build_model(self, model: Model, **kwargs) -> Any:
-        raw = {name: self._build_field(field, **kwargs) for name, field in model.fields.items()}
+        return _fn
 
-        if (ans := model.encode_data(self, raw, **kwargs)) is not MissingSentinel:
-            return ans
+    def _build_model(self, model: Model, **kwargs) -> Any:
+        from ....abc import (
+            Model,
+        )
 
-        return self._build(raw, **kwargs)
+        # noinspection PyProtectedMember
+        values = model._field_values()
+
+        # noinspection PyProtectedMember
+        cacheable = not kwargs and (type(model).encode_data is Model.encode_data or model._encode_data_cacheable)
+
+        if cacheable:
+            entry = getattr(model, "_avro_data_cache", None)
+            if entry is not None and self._is_cache_entry_valid(entry, values):
+                return entry.data
+
+        raw = {name: self._build_value(value, **kwargs) for name, value in values.items()}
+
+        if (ans := model.encode_data(self, raw, **kwargs)) is MissingSentinel:
+            # The field values are already encoded, so the raw dictionary is the encoded data.
+            ans = raw
+
+        if cacheable:
+            containers, models = list(), list()
+            if all(self._collect_dependencies(value, containers, models, Model) for value in values.values()):
+                entry = _CacheEntry(type(self), tuple(values.items()), tuple(containers), tuple(models), ans)
+            else:
+                entry = None
+            object.__setattr__(model, "_avro_data_cache", entry)
+
+        return ans
+
+    def _collect_dependencies(
+        self,
+        value: Any,
+        containers: list[tuple[TrackedContainer, int]],
+        models: list[tuple[Model, Any]],
+        model_cls: type[Model],
+    ) -> bool:
+        if type(value) in _IMMUTABLE_TYPES or isinstance(value, (Enum, LazyAvroData)):
+            return True
+
+        if isinstance(value, TrackedContainer):
+            containers.append((value, value.version))
+            items = value.values() if isinstance(value, dict) else value
+            return all(self._collect_dependencies(item, containers, models, model_cls) for item in items)
+
+        if isinstance(value, model_cls):
+            # The nested model has just been encoded, so its cache entry is up to date (if it is cacheable).
+            entry = getattr(value, "_avro_data_cache", None)
+            if entry is None:
+                return False
+            models.append((value, entry.data))
+            return True
+
+        # The in-place modifications of the remaining values cannot be detected.
+        return False
+
+    def _is_cache_entry_valid(self, entry: _CacheEntry, values: dict[str, Any]) -> bool:
+        if entry.encoder_cls is not type(self) or len(entry.values) != len(values):
+            return False
+
+        # The values replaced through the fields are also detected, as the fields do not reference their models.
+        for (name, value), (cached_name, cached_value) in zip(values.items(), entry.values):
+            if value is not cached_value or name != cached_name:
+                return False
+
+        if any(container.version != version for container, version in entry.containers):
+            return False
+
+        # The nested models are shared with other parents, so they could have been modified by them.
+        return all(self._build_model(model) is data for model, data in entry.models)
 
     def _build_field(self, field: Field, **kwargs) -> Any:
-        return self._build(field.value, **kwargs)
+        # noinspection PyProtectedMember
+        return self._build_value(field._value, **kwargs)
+
+    def _build_value(self, value: Any, **kwargs) -> Any:
+        if isinstance(value, LazyAvroData):
+            # The value has not been accessed yet, so its original data is encoded instead of materializing it.
+            return self._build(value.data, **kwargs)
+        return self._build(value, **kwargs)
 
     @staticmethod
     def _build_date(value: date, **kwargs) -> int:
@@ -138,3 +260,11 @@ class AvroDataEncoder(DataEncoder):
     @staticmethod
     def _build_uuid(value: UUID, **kwargs) -> str:
         return str(value)
+
+
+class _CacheEntry(NamedTuple):
+    encoder_cls: type[AvroDataEncoder]
+    values: tuple[tuple[str, Any], ...]
+    containers: tuple[tuple[TrackedContainer, int], ...]
+    models: tuple[tuple[Model, Any], ...]
+    data: Any
@@ -3,6 +3,9 @@ from __future__ import (
 )
 
 import logging
+from collections import (
+    OrderedDict,
+)
 from contextlib import (
     suppress,
 )
@@ -14,12 +17,16 @@ from datetime import (
 )
 from typing import (
     Any,
+    NamedTuple,
+    Optional,
     Union,
 )
 from uuid import (
     UUID,
 )
 
+import orjson
+
 from .....exceptions import (
     MinosImportException,
     MinosMalformedAttributeException,
@@ -59,8 +66,32 @@ from .constants import (
 logger = logging.getLogger(__name__)
 
 
+class CacheInfo(NamedTuple):
+    """Cache Info class."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
 class AvroSchemaDecoder(SchemaDecoder):
-    """Avro Schema Decoder class."""
+    """Avro Schema Decoder class.
+
+    The decoded types are shared between instances through a bounded LRU cache keyed by the canonical (key-sorted json)
+    representation of the schema, so the same writer schema is decoded only once.
+    """
+
+    cache_maxsize: int = 1024
+    _cache: OrderedDict[bytes, type] = OrderedDict()
+    _cache_hits: int = 0
+    _cache_misses: int = 0
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._cache = OrderedDict()
+        cls._cache_hits = 0
+        cls._cache_misses = 0
 
     def __init__(self, schema: Any = None):
         self._schema = schema
@@ -73,7 +104,49 @@ class AvroSchemaDecoder(SchemaDecoder):
         """
         if schema is MissingSentinel:
             schema = self._schema
-        return self._build(schema, **kwargs)
+
+        if kwargs or (key := self._build_cache_key(schema)) is None:
+            return self._build(schema, **kwargs)
+
+        cls = type(self)
+        try:
+            type_ = cls._cache[key]
+        except KeyError:
+            cls._cache_misses += 1
+        else:
+            cls._cache_hits += 1
+            cls._cache.move_to_end(key)
+            return type_
+
+        type_ = cls._cache[key] = self._build(schema)
+        if len(cls._cache) > cls.cache_maxsize:
+            cls._cache.popitem(last=False)
+        return type_
+
+    @classmethod
+    def cache_info(cls) -> CacheInfo:
+        """Get the statistics of the decoded types cache.
+
+        :return: A ``CacheInfo`` instance.
+        """
+        return CacheInfo(cls._cache_hits, cls._cache_misses, cls.cache_maxsize, len(cls._cache))
+
+    @classmethod
+    def cache_clear(cls) -> None:
+        """Clear the decoded types cache and its statistics.
+
+        :return: This method does not return anything.
+        """
+        cls._cache.clear()
+        cls._cache_hits = 0
+        cls._cache_misses = 0
+
+    @staticmethod
+    def _build_cache_key(schema: Any) -> Optional[bytes]:
+        try:
+            return orjson.dumps(schema, option=orjson.OPT_SORT_KEYS)
+        except TypeError:
+            return None
 
     def _build(self, schema: Union[dict, list, str], **kwargs) -> type:
         if isinstance(schema, dict):
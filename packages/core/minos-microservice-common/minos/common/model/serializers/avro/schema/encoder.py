@@ -3,6 +3,10 @@ from __future__ import (
 )
 
 import logging
+import warnings
+from collections import (
+    Counter,
+)
 from datetime import (
     date,
     datetime,
@@ -73,6 +77,8 @@ class AvroSchemaEncoder(SchemaEncoder):
 
     def __init__(self, type_: type = None):
         self.type_ = type_
+        self._depth = 0
+        self._occurrences = Counter()
 
     def build(self, type_=MissingSentinel, **kwargs) -> Union[dict, list, str]:
         """Build the avro schema for the given field.
@@ -82,7 +88,15 @@ class AvroSchemaEncoder(SchemaEncoder):
         """
         if type_ is MissingSentinel:
             type_ = self.type_
-        return self._build(type_, **kwargs)
+
+        if not self._depth:
+            self._occurrences.clear()
+
+        self._depth += 1
+        try:
+            return self._build(type_, **kwargs)
+        finally:
+            self._depth -= 1
 
     def _build(self, type_, **kwargs) -> Any:
         if get_origin(type_) is Union:
@@ -176,16 +190,19 @@ class AvroSchemaEncoder(SchemaEncoder):
 
         schema = {
             "name": type_.name,
-            "namespace": self._patch_namespace(type_.namespace),
+            "namespace": self._patch_namespace(type_.namespace, type_.name),
             "type": "record",
             "fields": [self._build_field(FieldType(n, t), **kwargs) for n, t in type_.type_hints.items()],
         }
         return schema
 
-    @classmethod
-    def _patch_namespace(cls, namespace: Optional[str]) -> Optional[str]:
+    def _patch_namespace(self, namespace: Optional[str], name: str) -> Optional[str]:
         if len(namespace) > 0:
-            namespace += f".{cls.generate_random_str()}"
+            # The suffix only depends on the number of previous occurrences of the same record name, so that the
+            # schema is deterministic while avro's "redefined named type" restriction is still satisfied.
+            classname = f"{namespace}.{name}"
+            namespace += f"._{self._occurrences[classname]}"
+            self._occurrences[classname] += 1
         return namespace
 
     def _build_field(self, field: Union[Field, FieldType], **kwargs):
@@ -217,8 +234,11 @@ class AvroSchemaEncoder(SchemaEncoder):
 
     @staticmethod
     def generate_random_str() -> str:
-        """Generate a random string
+        """Generate a random string.
+
+        The schemas are not suffixed with random strings anymore, so this method is deprecated.
 
         :return: A random string value.
         """
+        warnings.warn("The `AvroSchemaEncoder.generate_random_str` method has been deprecated", DeprecationWarning)
         return str(uuid4())
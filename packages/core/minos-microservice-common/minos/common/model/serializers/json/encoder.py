@@ -0,0 +1,252 @@
+from __future__ import (
+    annotations,
+)
+
+import logging
+from datetime import (
+    date,
+    datetime,
+    time,
+    timedelta,
+)
+from decimal import (
+    Decimal,
+)
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Union,
+)
+
+import orjson
+
+from ...types import (
+    MissingSentinel,
+)
+from ..abc import (
+    DataEncoder,
+)
+from ..avro import (
+    AvroDataDecoder,
+    AvroDataEncoder,
+    LazyAvroData,
+)
+from ..avro.schema.constants import (
+    AVRO_ARRAY,
+    AVRO_BOOLEAN,
+    AVRO_BYTES,
+    AVRO_DATE,
+    AVRO_DOUBLE,
+    AVRO_FLOAT,
+    AVRO_INT,
+    AVRO_LONG,
+    AVRO_MAP,
+    AVRO_NULL,
+    AVRO_RECORD,
+    AVRO_STRING,
+    AVRO_TIME,
+    AVRO_TIMESTAMP,
+)
+
+if TYPE_CHECKING:
+    from ...abc import (
+        Model,
+    )
+
+logger = logging.getLogger(__name__)
+
+DefaultFn = Callable[["JsonDataEncoder", Any], Any]
+
+
+class JsonDataEncoder(DataEncoder):
+    """Json Data Encoder class.
+
+    The values are serialized by ``orjson`` without building their avro data first. The built-in containers, strings,
+    numbers and uuids are serialized natively, and the rest of the values (like models, decimals or sets) are converted
+    on demand through the ``default`` hook, with a conversion function resolved once for each value type. The models
+    are converted into a dictionary of their field values, so their nested values are also serialized natively.
+
+    If ``avro_compatible`` is ``True`` the output is the same as serializing the avro data of the value (so dates,
+    times and datetimes are serialized as integers), otherwise they are serialized natively as strings. In that case
+    the lazy values are decoded, and the avro data built by the models with a customized ``encode_data`` method is
+    converted back to the native dates, times and datetimes following the avro schema of the model.
+    """
+
+    compiled_maxsize: int = 1024
+    _compiled: dict[type, DefaultFn] = dict()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._compiled = dict()
+
+    def __init__(self, value: Any = None, avro_compatible: bool = True):
+        self.value = value
+        self.avro_compatible = avro_compatible
+
+    def build(self, value=MissingSentinel, **kwargs) -> bytes:
+        """Build the json representation of the given value.
+
+        :param value: The value to be encoded.
+        :return: A ``bytes`` instance.
+        """
+        if value is MissingSentinel:
+            value = self.value
+
+        option = orjson.OPT_PASSTHROUGH_DATETIME if self.avro_compatible else None
+        return orjson.dumps(value, default=self._default, option=option)
+
+    def _default(self, value: Any) -> Any:
+        return self._compile(type(value))(self, value)
+
+    @classmethod
+    def _compile(cls, type_: type) -> DefaultFn:
+        try:
+            return cls._compiled[type_]
+        except KeyError:
+            pass
+
+        fn = cls._compiled[type_] = cls._compile_type(type_)
+        if len(cls._compiled) > cls.compiled_maxsize:
+            del cls._compiled[next(iter(cls._compiled))]
+        return fn
+
+    @classmethod
+    def _compile_type(cls, type_: type) -> DefaultFn:
+        from ...abc import (
+            Model,
+        )
+
+        if issubclass(type_, Model):
+            return cls._compile_model(type_, Model)
+
+        if issubclass(type_, LazyAvroData):
+            return lambda encoder, value: value.data if encoder.avro_compatible else value.decode()
+
+        if issubclass(type_, Decimal):
+            return lambda encoder, value: float(value)
+
+        if issubclass(type_, (set, frozenset)):
+            return lambda encoder, value: list(value)
+
+        # The following types are only passed to the hook if the output must be compatible with the avro data.
+        if issubclass(type_, datetime):
+            return lambda encoder, value: AvroDataEncoder._build_datetime(value)
+
+        if issubclass(type_, timedelta):
+            return lambda encoder, value: AvroDataEncoder._build_timedelta(value)
+
+        if issubclass(type_, date):
+            return lambda encoder, value: AvroDataEncoder._build_date(value)
+
+        if issubclass(type_, time):
+            return lambda encoder, value: AvroDataEncoder._build_time(value)
+
+        def _fn(encoder: JsonDataEncoder, value: Any) -> Any:
+            raise TypeError(f"Given type is not supported: {type(value)!r} ({value!r})")
+
+        return _fn
+
+    @staticmethod
+    def _compile_model(type_: type[Model], model_cls: type[Model]) -> DefaultFn:
+        def _fn(encoder: JsonDataEncoder, value: Model) -> Any:
+            if type_.encode_data is not model_cls.encode_data:
+                # The customized encodings are defined in terms of the avro data.
+                data = AvroDataEncoder().build(value)
+                if not encoder.avro_compatible:
+                    data = encoder._restore_native(data, value.avro_schema, dict())
+                return data
+            # noinspection PyProtectedMember
+            return value._field_values()
+
+        return _fn
+
+    @classmethod
+    def _restore_native(cls, data: Any, schema: Any, names: dict[str, Any]) -> Any:
+        if isinstance(schema, list):
+            for option in schema:
+                if cls._matches(data, option, names):
+                    return cls._restore_native(data, option, names)
+            return data
+
+        if isinstance(schema, str):
+            if schema in names:
+                return cls._restore_native(data, names[schema], names)
+            return data
+
+        if (fn := _NATIVE_LOGICAL_TYPES.get(schema.get("logicalType"))) is not None:
+            return fn(data) if cls._is_int(data) else data
+
+        type_ = schema["type"]
+        if type_ == AVRO_RECORD:
+            cls._register_name(schema, names)
+            if not isinstance(data, dict):
+                return data
+            fields = {field["name"]: field["type"] for field in schema["fields"]}
+            return {k: cls._restore_native(v, fields[k], names) if k in fields else v for k, v in data.items()}
+
+        if type_ == AVRO_ARRAY:
+            if not isinstance(data, list):
+                return data
+            return [cls._restore_native(v, schema["items"], names) for v in data]
+
+        if type_ == AVRO_MAP:
+            if not isinstance(data, dict):
+                return data
+            return {k: cls._restore_native(v, schema["values"], names) for k, v in data.items()}
+
+        if isinstance(type_, (dict, list)) or type_ in names:
+            return cls._restore_native(data, type_, names)
+
+        return data
+
+    @classmethod
+    def _matches(cls, data: Any, schema: Any, names: dict[str, Any]) -> bool:
+        if isinstance(schema, list):
+            return any(cls._matches(data, option, names) for option in schema)
+
+        if isinstance(schema, str):
+            if schema in names:
+                return cls._matches(data, names[schema], names)
+            type_ = schema
+        else:
+            type_ = schema["type"]
+            if isinstance(type_, (dict, list)):
+                return cls._matches(data, type_, names)
+
+        if type_ == AVRO_RECORD:
+            cls._register_name(schema, names)
+            return isinstance(data, dict) and set(data) <= {field["name"] for field in schema["fields"]}
+
+        if type_ in (AVRO_INT, AVRO_LONG):
+            return cls._is_int(data)
+
+        return isinstance(data, _AVRO_PYTHON_TYPES.get(type_, object))
+
+    @staticmethod
+    def _register_name(schema: dict[str, Any], names: dict[str, Any]) -> None:
+        names[schema["name"]] = schema
+        if "namespace" in schema:
+            names[f"{schema['namespace']}.{schema['name']}"] = schema
+
+    @staticmethod
+    def _is_int(data: Any) -> bool:
+        return isinstance(data, int) and not isinstance(data, bool)
+
+
+_NATIVE_LOGICAL_TYPES: dict[str, Callable[[int], Any]] = {
+    AVRO_DATE["logicalType"]: AvroDataDecoder._build_date,
+    AVRO_TIME["logicalType"]: AvroDataDecoder._build_time,
+    AVRO_TIMESTAMP["logicalType"]: AvroDataDecoder._build_datetime,
+}
+
+_AVRO_PYTHON_TYPES: dict[str, Union[type, tuple[type, ...]]] = {
+    AVRO_NULL: type(None),
+    AVRO_BOOLEAN: bool,
+    AVRO_FLOAT: (float, int),
+    AVRO_DOUBLE: (float, int),
+    AVRO_STRING: str,
+    AVRO_BYTES: bytes,
+    AVRO_ARRAY: list,
+    AVRO_MAP: dict,
+}
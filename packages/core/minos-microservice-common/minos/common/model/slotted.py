@@ -0,0 +1,148 @@
+from __future__ import (
+    annotations,
+)
+
+import logging
+from abc import (
+    ABCMeta,
+)
+from typing import (
+    Any,
+    Callable,
+    Iterable,
+    Optional,
+)
+
+from .declarative import (
+    DeclarativeModel,
+)
+from .fields import (
+    SlotField,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class SlottedDeclarativeModelMeta(ABCMeta):
+    """Slotted Declarative Model Meta class.
+
+    Generates a slot for each declared field that is not already stored in a slot of any base class.
+    """
+
+    def __new__(mcs, name: str, bases: tuple[type, ...], namespace: dict[str, Any], **kwargs):
+        inherited = set()
+        annotations = list()
+        for base in bases:
+            for cls in base.__mro__[::-1]:
+                inherited |= set(mcs._get_slots(cls))
+                annotations.extend(cls.__dict__.get("__annotations__", dict()))
+        annotations.extend(namespace.get("__annotations__", dict()))
+
+        slots = list(mcs._get_slots(namespace))
+        for field_name in annotations:
+            if field_name.startswith("_") or field_name in inherited or field_name in slots:
+                continue
+            slots.append(field_name)
+
+        namespace["__slots__"] = tuple(slots)
+        return super().__new__(mcs, name, bases, namespace, **kwargs)
+
+    @staticmethod
+    def _get_slots(cls_or_namespace: Any) -> Iterable[str]:
+        if isinstance(cls_or_namespace, dict):
+            slots = cls_or_namespace.get("__slots__", tuple())
+        else:
+            slots = cls_or_namespace.__dict__.get("__slots__", tuple())
+        if isinstance(slots, str):
+            slots = (slots,)
+        return slots
+
+
+class SlottedDeclarativeModel(DeclarativeModel, metaclass=SlottedDeclarativeModelMeta):
+    """Slotted Declarative Model class.
+
+    It is a compact alternative to ``DeclarativeModel``, as the field values are stored in slots generated from the
+    declared type hints instead of in ``Field`` instances. The ``Field`` instances are only built when the ``fields``
+    attribute is accessed, and they read and write the values from the slots. The declared fields must not collide
+    with any other class attribute.
+    """
+
+    __slots__ = "_plan", "_Model__eq_reversing", "_avro_data_cache", "_avro_bytes_cache"
+
+    def __init__(self, *args, **kwargs):
+        """Class constructor.
+
+        :param kwargs: Named arguments to be set as model attributes.
+        """
+        # The fields dictionary of the base class is not needed, so the base constructor is not called.
+        object.__setattr__(self, "_Model__eq_reversing", False)
+        self._build_fields(*args, **kwargs)
+
+    def _build_fields(self, *args, additional_type_hints: Optional[dict[str, type]] = None, **kwargs) -> None:
+        object.__setattr__(self, "_plan", self._field_plan(additional_type_hints))
+        super()._build_fields(*args, additional_type_hints=additional_type_hints, **kwargs)
+
+    def _build_field(
+        self,
+        name: str,
+        type_: type,
+        value: Any,
+        parser: Optional[Callable[[Any], Any]],
+        validator: Optional[Callable[[Any], Any]],
+    ) -> None:
+        # The field is only used to parse, decode and validate the value, so it is discarded afterwards.
+        field = self._field_cls(name, type_, value, parser, validator)
+        object.__setattr__(self, name, field.value)
+
+    def _get_field(self, name: str, type_: type, parser: Optional[str], validator: Optional[str]) -> SlotField:
+        if parser is not None:
+            parser = getattr(self, parser)
+        if validator is not None:
+            validator = getattr(self, validator)
+        return SlotField.from_model(self, name, type_, parser, validator)
+
+    @property
+    def fields(self) -> dict[str, SlotField]:
+        """Fields getter.
+
+        The fields are built on each access, but their values are always read and written from the slots.
+        """
+        return {
+            entry.name: self._get_field(entry.name, entry.type, entry.parser, entry.validator) for entry in self._plan
+        }
+
+    def _field_values(self) -> dict[str, Any]:
+        return {entry.name: getattr(self, entry.name) for entry in self._plan}
+
+    def __setattr__(self, key: str, value: Any) -> None:
+        if key.startswith("_"):
+            object.__setattr__(self, key, value)
+            return
+
+        for entry in self._plan:
+            if entry.name == key:
+                self._get_field(entry.name, entry.type, entry.parser, entry.validator).value = value
+                # The cached encoded data is outdated, so it is discarded.
+                object.__setattr__(self, "_avro_data_cache", None)
+                return
+
+        raise AttributeError(f"{type(self).__name__!r} does not contain the {key!r} field")
+
+    def __getattr__(self, item: str) -> Any:
+        # The field values are read directly from the slots, so this method is only called for unknown attributes.
+        raise AttributeError(f"{type(self).__name__!r} does not contain the {item!r} field.")
+
+    def __eq__(self, other: Any) -> bool:
+        if type(self) is type(other) and self._plan is other._plan:
+            # Both instances share the field names, types, parsers and validators, so only the values are compared.
+            return all(getattr(self, entry.name) == getattr(other, entry.name) for entry in self._plan)
+        return super().__eq__(other)
+
+    def __hash__(self) -> int:
+        return super().__hash__()
+
+    def __iter__(self) -> Iterable[str]:
+        yield from (entry.name for entry in self._plan)
+
+    def __len__(self):
+        return len(self._plan)
@@ -12,6 +12,12 @@ from .constants import (
     MissingSentinel,
     NoneType,
 )
+from .containers import (
+    TrackedContainer,
+    TrackedDict,
+    TrackedList,
+    TrackedSet,
+)
 from .generics import (
     GenericTypeProjector,
     unpack_typevar,
@@ -59,13 +59,13 @@ class TypeHintBuilder:
 
         if isinstance(value, (tuple, list, set)):
             b1 = Any if (type_ is None or len(get_args(type_)) != 1) else get_args(type_)[0]
-            return type(value)[self._build_from_iterable(value, b1)]
+            # The subclasses (like the tracked containers) are described by the container type they extend.
+            origin_type = list if isinstance(value, list) else (set if isinstance(value, set) else tuple)
+            return origin_type[self._build_from_iterable(value, b1)]
 
         if isinstance(value, dict):
             b1, b2 = (str, Any) if (type_ is None or len(get_args(type_)) != 2) else get_args(type_)
-            return type(value)[
-                self._build_from_iterable(value.keys(), b1), self._build_from_iterable(value.values(), b2)
-            ]
+            return dict[self._build_from_iterable(value.keys(), b1), self._build_from_iterable(value.values(), b2)]
 
         if is_model_type(value):
             return ModelType.from_model(value)
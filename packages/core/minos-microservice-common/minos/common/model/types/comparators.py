@@ -16,6 +16,7 @@ from .generics import (
 )
 from .model_types import (
     ModelType,
+    _type_hint_key,
 )
 
 
@@ -51,7 +52,17 @@ K = TypeVar("K", bound=type)
 
 
 class TypeHintComparator:
-    """Type Hint Comparator class."""
+    """Type Hint Comparator class.
+
+    The results are memoized for each pair of type hints and shared between instances.
+    """
+
+    cache_maxsize: int = 4096
+    _cache: dict[tuple[Any, Any], tuple[T, K, bool]] = dict()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._cache = dict()
 
     def __init__(self, first: T, second: K):
         self._first = first
@@ -62,8 +73,34 @@ class TypeHintComparator:
 
         :return: ``True`` if there is a match or ``False`` otherwise.
         """
+        first, second = self._first, self._second
+        if first is second:
+            return True
+
+        try:
+            key = _type_hint_key(first), _type_hint_key(second)
+            return self._cache[key][2]
+        except KeyError:
+            pass
+        except TypeError:
+            return self._compare(first, second)
 
-        return self._compare(self._first, self._second)
+        ans = self._compare(first, second)
+
+        # The type hints are stored together with the result, so the identities used by the key cannot be reused.
+        self._cache[key] = first, second, ans
+        if len(self._cache) > self.cache_maxsize:
+            del self._cache[next(iter(self._cache))]
+
+        return ans
+
+    @classmethod
+    def cache_clear(cls) -> None:
+        """Clear the memoized results.
+
+        :return: This method does not return anything.
+        """
+        cls._cache.clear()
 
     def _compare(self, first: T, second: K) -> bool:
         if isinstance(first, TypeVar):
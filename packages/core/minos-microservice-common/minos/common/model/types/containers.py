@@ -0,0 +1,103 @@
+from __future__ import (
+    annotations,
+)
+
+from typing import (
+    Any,
+    Callable,
+)
+
+
+def _mutating(fn: Callable) -> Callable:
+    def _fn(self: TrackedContainer, *args, **kwargs) -> Any:
+        self.version += 1
+        return fn(self, *args, **kwargs)
+
+    # The builtin method is not referenced as wrapped, as the signature of some builtin methods cannot be inspected.
+    _fn.__name__, _fn.__doc__ = fn.__name__, fn.__doc__
+    return _fn
+
+
+class TrackedContainer:
+    """Tracked Container class.
+
+    Base class of the containers whose ``version`` is increased on each in-place modification, so that the values
+    computed from them (like the encoded data of the models holding them) can be reused while they are not modified.
+    """
+
+    __slots__ = ()
+
+    _base: type
+    version: int
+
+    def __init__(self, *args, **kwargs):
+        self.version = 0
+        # noinspection PyArgumentList
+        super().__init__(*args, **kwargs)
+
+    def __reduce__(self):
+        # The version is only meaningful for the instance, so the copies start from scratch.
+        return type(self), (self._base(self),)
+
+
+class TrackedList(TrackedContainer, list):
+    """Tracked List class."""
+
+    __slots__ = ("version",)
+
+    _base = list
+
+    __setitem__ = _mutating(list.__setitem__)
+    __delitem__ = _mutating(list.__delitem__)
+    __iadd__ = _mutating(list.__iadd__)
+    __imul__ = _mutating(list.__imul__)
+    append = _mutating(list.append)
+    extend = _mutating(list.extend)
+    insert = _mutating(list.insert)
+    pop = _mutating(list.pop)
+    remove = _mutating(list.remove)
+    clear = _mutating(list.clear)
+    sort = _mutating(list.sort)
+    reverse = _mutating(list.reverse)
+
+
+class TrackedSet(TrackedContainer, set):
+    """Tracked Set class."""
+
+    __slots__ = ("version",)
+
+    _base = set
+
+    __ior__ = _mutating(set.__ior__)
+    __iand__ = _mutating(set.__iand__)
+    __isub__ = _mutating(set.__isub__)
+    __ixor__ = _mutating(set.__ixor__)
+    add = _mutating(set.add)
+    discard = _mutating(set.discard)
+    remove = _mutating(set.remove)
+    pop = _mutating(set.pop)
+    clear = _mutating(set.clear)
+    update = _mutating(set.update)
+    difference_update = _mutating(set.difference_update)
+    intersection_update = _mutating(set.intersection_update)
+    symmetric_difference_update = _mutating(set.symmetric_difference_update)
+
+    def __repr__(self) -> str:
+        return repr(set(self))
+
+
+class TrackedDict(TrackedContainer, dict):
+    """Tracked Dict class."""
+
+    __slots__ = ("version",)
+
+    _base = dict
+
+    __setitem__ = _mutating(dict.__setitem__)
+    __delitem__ = _mutating(dict.__delitem__)
+    __ior__ = _mutating(dict.__ior__)
+    pop = _mutating(dict.pop)
+    popitem = _mutating(dict.popitem)
+    setdefault = _mutating(dict.setdefault)
+    update = _mutating(dict.update)
+    clear = _mutating(dict.clear)
@@ -5,10 +5,13 @@ from __future__ import (
 from typing import (
     TYPE_CHECKING,
     Any,
+    Hashable,
     Iterable,
     NamedTuple,
     Optional,
     Type,
+    get_args,
+    get_origin,
 )
 
 from ...exceptions import (
@@ -28,7 +31,12 @@ if TYPE_CHECKING:
 
 
 class ModelType(type):
-    """Model Type class."""
+    """Model Type class.
+
+    The instances are interned by their name, namespace and type hints, so building the same type twice returns the
+    same instance. The results of ``from_model`` (for model classes), the hashes and the comparisons between instances
+    are also memoized, so the type hints of an instance must not be modified.
+    """
 
     name: str
     namespace: str
@@ -58,8 +66,24 @@ class ModelType(type):
             except ValueError:
                 namespace_ = str()
 
+        try:
+            key = mcs, name_, namespace_, tuple((k, _type_hint_key(v)) for k, v in type_hints_.items())
+            hash(key)
+        except TypeError:
+            # noinspection PyTypeChecker
+            return mcs(name_, tuple(), {"type_hints": dict(type_hints_), "namespace": namespace_})
+
+        try:
+            return _MODEL_TYPES[key]
+        except KeyError:
+            pass
+
         # noinspection PyTypeChecker
-        return mcs(name_, tuple(), {"type_hints": type_hints_, "namespace": namespace_})
+        model_type = _MODEL_TYPES[key] = mcs(name_, tuple(), {"type_hints": dict(type_hints_), "namespace": namespace_})
+        if len(_MODEL_TYPES) > _MODEL_TYPES_MAX_SIZE:
+            del _MODEL_TYPES[next(iter(_MODEL_TYPES))]
+
+        return model_type
 
     @classmethod
     def from_typed_dict(mcs, typed_dict) -> ModelType:
@@ -77,7 +101,24 @@ class ModelType(type):
         :param type_: The model class.
         :return: A new ``ModelType`` instance.
         """
-        return ModelType.build(name_=type_.classname, type_hints_=GenericTypeProjector.from_model(type_).build())
+        if not isinstance(type_, type) and get_origin(type_) is None:
+            # The type hints of model instances depend on their values, so they are not memoized.
+            return ModelType.build(name_=type_.classname, type_hints_=GenericTypeProjector.from_model(type_).build())
+
+        key = _type_hint_key(type_)
+        try:
+            return _FROM_MODEL[key][1]
+        except KeyError:
+            pass
+
+        model_type = ModelType.build(name_=type_.classname, type_hints_=GenericTypeProjector.from_model(type_).build())
+
+        # The model class is stored together with the result, so the identities used by the key cannot be reused.
+        _FROM_MODEL[key] = type_, model_type
+        if len(_FROM_MODEL) > _MODEL_TYPES_MAX_SIZE:
+            del _FROM_MODEL[next(iter(_FROM_MODEL))]
+
+        return model_type
 
     def __call__(cls, *args, **kwargs) -> Model:
         return cls.model_cls.from_model_type(cls, *args, **kwargs)
@@ -169,6 +210,28 @@ class ModelType(type):
         )
 
     def __eq__(cls, other: Any) -> bool:
+        if cls is other:
+            return True
+
+        if not isinstance(other, ModelType):
+            return cls._equal(other)
+
+        key = id(cls), id(other)
+        try:
+            return _EQUALITY[key][2]
+        except KeyError:
+            pass
+
+        ans = cls._equal(other)
+
+        # Both instances are stored together with the result, so their identities cannot be reused.
+        _EQUALITY[key] = cls, other, ans
+        if len(_EQUALITY) > _MODEL_TYPES_MAX_SIZE:
+            del _EQUALITY[next(iter(_EQUALITY))]
+
+        return ans
+
+    def _equal(cls, other: Any) -> bool:
         conditions = (
             cls._equal_with_model_type,
             cls._equal_with_model,
@@ -211,7 +274,14 @@ class ModelType(type):
         )
 
     def __hash__(cls) -> int:
-        return hash(tuple(cls))
+        try:
+            return cls.__dict__["_hash_cache"]
+        except KeyError:
+            pass
+
+        ans = hash(tuple(cls))
+        type.__setattr__(cls, "_hash_cache", ans)
+        return ans
 
     def __iter__(cls) -> Iterable:
         # noinspection PyRedundantParentheses
@@ -226,3 +296,21 @@ class FieldType(NamedTuple):
 
     name: str
     type: type
+
+
+def _type_hint_key(type_hint: Any) -> Hashable:
+    # The model types are compared by identity, as their equality is looser than the one required by the keys.
+    if isinstance(type_hint, ModelType):
+        return ModelType, id(type_hint)
+
+    origin = get_origin(type_hint)
+    if origin is None:
+        return type_hint
+
+    return type(type_hint), _type_hint_key(origin), tuple(_type_hint_key(arg) for arg in get_args(type_hint))
+
+
+_MODEL_TYPES_MAX_SIZE = 1024
+_MODEL_TYPES: dict[Hashable, ModelType] = dict()
+_FROM_MODEL: dict[Hashable, tuple[type, ModelType]] = dict()
+_EQUALITY: dict[tuple[int, int], tuple[ModelType, ModelType, bool]] = dict()
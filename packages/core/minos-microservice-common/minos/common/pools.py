@@ -3,11 +3,25 @@ from abc import (
     ABC,
 )
 from asyncio import (
+    CancelledError,
+    Event,
+    Task,
+    TimeoutError,
+    create_task,
+    gather,
     sleep,
+    wait_for,
+)
+from contextlib import (
+    suppress,
+)
+from random import (
+    random,
 )
 from typing import (
     Any,
     Generic,
+    NoReturn,
     Optional,
     TypeVar,
 )
@@ -19,6 +33,11 @@ from aiomisc.pool import (
     ContextManager,
 )
 
+from .metrics import (
+    METRICS_REGISTRY,
+    Histogram,
+    MetricsSource,
+)
 from .setup import (
     MinosSetup,
 )
@@ -28,33 +47,142 @@ logger = logging.getLogger(__name__)
 P = TypeVar("P")
 
 
-class MinosPool(MinosSetup, PoolBase, Generic[P], ABC):
-    """Base class for Pool implementations in minos"""
+class MinosPool(MinosSetup, PoolBase, MetricsSource, Generic[P], ABC):
+    """Base class for Pool implementations in minos
+
+    If ``minsize`` is greater than zero, the pool creates that number of instances during the setup and replenishes them
+    in background each time an instance is recycled, so the first acquisitions do not wait for the instances creation.
+    Pools with a ``minsize`` greater than zero are not set up by default.
+    """
+
+    _replenisher: Optional[Task]
+
+    def __init__(
+        self,
+        *args,
+        minsize: int = 0,
+        maxsize: int = 10,
+        recycle: Optional[int] = 300,
+        replenish_interval: float = 1.0,
+        already_setup: Optional[bool] = None,
+        **kwargs,
+    ):
+        if already_setup is None:
+            already_setup = not minsize
 
-    def __init__(self, *args, maxsize: int = 10, recycle: Optional[int] = 300, already_setup: bool = True, **kwargs):
         MinosSetup.__init__(self, *args, already_setup=already_setup, **kwargs)
+        if not 0 <= minsize <= maxsize:
+            raise ValueError(f"The minsize must be between 0 and maxsize. Obtained: {minsize!r}, {maxsize!r}")
         PoolBase.__init__(self, maxsize=maxsize, recycle=recycle)
 
+        self.minsize = minsize
+        self.maxsize = maxsize
+        self.replenish_interval = replenish_interval
+
+        self.acquire_wait = Histogram()
+        self.creations = 0
+        self.recycles = 0
+        self.failed_checks = 0
+
+        self._replenish_event = Event()
+        self._replenisher = None
+
+        METRICS_REGISTRY.register(type(self).__name__, self)
+
+    def metrics(self) -> dict[str, Any]:
+        """Get a snapshot of the pool metrics.
+
+        :return: A dictionary containing the number of instances (total, in use and idle), the pool bounds, the number
+            of created and recycled instances, the number of failed health checks and the acquire wait histogram.
+        """
+        return {
+            "size": len(self),
+            "in_use": len(self._used),
+            "idle": self._instances.qsize(),
+            "minsize": self.minsize,
+            "maxsize": self.maxsize,
+            "creations": self.creations,
+            "recycles": self.recycles,
+            "failed_checks": self.failed_checks,
+            "acquire_wait": self.acquire_wait.as_dict(),
+        }
+
+    async def _setup(self) -> None:
+        await super()._setup()
+        await self._replenish()
+        self._replenisher = create_task(self._replenish_forever())
+
+    async def _replenish_forever(self) -> NoReturn:
+        while True:
+            with suppress(TimeoutError):
+                await wait_for(self._replenish_event.wait(), self.replenish_interval)
+            self._replenish_event.clear()
+            try:
+                await self._replenish()
+            except Exception as exc:
+                logger.warning(f"There was an {exc!r} while trying to replenish the {type(self).__name__!r} pool.")
+
+    async def _replenish(self) -> None:
+        missing = self.minsize - len(self)
+        if missing > 0:
+            await gather(*(self.__create_new_instance(discard=True) for _ in range(missing)))
+
     async def __acquire(self) -> Any:  # pragma: no cover
         # FIXME: This method inheritance should be improved.
 
-        if self._instances.empty() and not self._semaphore.locked():
-            await self._PoolBase__create_new_instance()
+        with self.acquire_wait.time():
+            while True:
+                if self._instances.empty() and not self._semaphore.locked():
+                    await self.__create_new_instance()
 
-        instance = await self._instances.get()
+                instance = await self._instances.get()
 
-        try:
-            result = await self._check_instance(instance)
-        except Exception:
-            self._PoolBase__recycle_instance(instance)
-        else:
-            if not result:
+                try:
+                    result = await self._check_instance(instance)
+                except Exception:
+                    result = False
+
+                if result:
+                    break
+
+                if instance is not None:
+                    self.failed_checks += 1
                 self._PoolBase__recycle_instance(instance)
-                return await self._PoolBase__acquire()
 
         self._used.add(instance)
         return instance
 
+    async def __create_new_instance(self, discard: bool = False) -> None:
+        if discard and self._semaphore.locked():
+            return
+        await self._semaphore.acquire()
+
+        try:
+            instance = await self._create_instance()
+        except BaseException:
+            self._semaphore.release()
+            raise
+
+        if instance is None and discard:
+            # The instance could not be created, so it is not enqueued to be recycled later.
+            self._semaphore.release()
+            return
+
+        self._len += 1
+        if instance is not None:
+            self.creations += 1
+
+        if self._recycle:
+            self._recycle_times[instance] += self._recycle * (1 + random())
+
+        self._instances.put_nowait(instance)
+
+    def _PoolBase__recycle_instance(self, instance: Any) -> None:
+        PoolBase._PoolBase__recycle_instance(self, instance)
+        if instance is not None:
+            self.recycles += 1
+        self._replenish_event.set()
+
     def acquire(self, *args, **kwargs) -> P:
         """Acquire a new instance wrapped on an asynchronous context manager.
 
@@ -65,12 +193,19 @@ class MinosPool(MinosSetup, PoolBase, Generic[P], ABC):
         return ContextManager(self.__acquire, self._PoolBase__release)
 
     async def _destroy(self) -> None:
+        if self._replenisher is not None:
+            self._replenisher.cancel()
+            with suppress(CancelledError):
+                await self._replenisher
+            self._replenisher = None
+
         if len(self._used):
             logger.info("Waiting for instances releasing...")
             while len(self._used):
                 await sleep(0.1)
 
         await self.close()
+        METRICS_REGISTRY.unregister(self)
 
     async def _check_instance(self, instance: P) -> bool:
         return True
@@ -0,0 +1,139 @@
+from __future__ import (
+    annotations,
+)
+
+from collections import (
+    deque,
+)
+from collections.abc import (
+    Iterator,
+)
+from contextlib import (
+    contextmanager,
+)
+from time import (
+    perf_counter,
+)
+from typing import (
+    Any,
+    Final,
+    Optional,
+)
+
+from .contextvars import (
+    SETUP_SPAN_CONTEXT_VAR,
+)
+
+
+class SetupSpan:
+    """Setup Span class.
+
+    Stores the wall time of an action performed by a component (like its setup or destroy), together with the spans of
+    the actions nested into it. The nested spans may overlap, as the components can be set up concurrently.
+    """
+
+    def __init__(self, action: str, name: str):
+        self.action = action
+        self.name = name
+        self.start = perf_counter()
+        self.end: Optional[float] = None
+        self.children: list[SetupSpan] = list()
+
+    @property
+    def finished(self) -> bool:
+        """Check if the span is already finished.
+
+        :return: ``True`` if the span is finished or ``False`` otherwise.
+        """
+        return self.end is not None
+
+    @property
+    def elapsed(self) -> float:
+        """Get the elapsed seconds of the span (until now, if it is not finished yet).
+
+        :return: A ``float`` value.
+        """
+        end = self.end if self.end is not None else perf_counter()
+        return end - self.start
+
+    def as_dict(self, origin: Optional[float] = None) -> dict[str, Any]:
+        """Get the span as a dictionary.
+
+        :param origin: The instant from which the offsets are computed. If ``None``, the span start is used.
+        :return: A dictionary containing the action, the name, the offset and the elapsed milliseconds of the span, plus
+            its children.
+        """
+        if origin is None:
+            origin = self.start
+
+        return {
+            "action": self.action,
+            "name": self.name,
+            "offset_ms": (self.start - origin) * 1000,
+            "elapsed_ms": self.elapsed * 1000,
+            "children": [child.as_dict(origin) for child in self.children],
+        }
+
+    def format(self) -> str:
+        """Format the span as a human-readable tree.
+
+        :return: A string value, containing one line per span.
+        """
+        return "\n".join(self._format_lines(self.start, 0))
+
+    def _format_lines(self, origin: float, depth: int) -> Iterator[str]:
+        yield (
+            f"{'  ' * depth}{self.action} {self.name!r}: {self.elapsed * 1000:.1f} ms "
+            f"(+{(self.start - origin) * 1000:.1f} ms)"
+        )
+        for child in self.children:
+            yield from child._format_lines(origin, depth + 1)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.action!r}, {self.name!r}, {self.elapsed * 1000:.1f} ms)"
+
+
+class SetupProfiler:
+    """Setup Profiler class.
+
+    Records the spans of the setups and destroys of the components. The spans opened while another one is in progress
+    (within the same task or in the tasks created by it) are nested into it, and the other ones are kept as roots. Only
+    the last ``maxsize`` roots are kept.
+    """
+
+    def __init__(self, maxsize: int = 256):
+        self.spans: deque[SetupSpan] = deque(maxlen=maxsize)
+
+    @contextmanager
+    def span(self, action: str, name: str) -> Iterator[SetupSpan]:
+        """Record the wall time of the wrapped block as a new span.
+
+        :param action: The action performed by the block.
+        :param name: The name of the component performing the action.
+        :return: A ``SetupSpan`` instance.
+        """
+        span = SetupSpan(action, name)
+
+        parent = SETUP_SPAN_CONTEXT_VAR.get()
+        if parent is not None and not parent.finished:
+            parent.children.append(span)
+        else:
+            # The tasks created within a span inherit it, even after it is finished, so their spans are kept as roots.
+            self.spans.append(span)
+
+        token = SETUP_SPAN_CONTEXT_VAR.set(span)
+        try:
+            yield span
+        finally:
+            span.end = perf_counter()
+            SETUP_SPAN_CONTEXT_VAR.reset(token)
+
+    def clear(self) -> None:
+        """Remove all the recorded spans.
+
+        :return: This method does not return anything.
+        """
+        self.spans.clear()
+
+
+SETUP_PROFILER: Final[SetupProfiler] = SetupProfiler()
@@ -2,9 +2,15 @@ from .abc import (
     MinosBinaryProtocol,
 )
 from .avro import (
+    AvroSchemaRegistry,
+    AvroStreamReader,
+    AvroStreamWriter,
+    InMemoryAvroSchemaRegistry,
     MinosAvroDatabaseProtocol,
     MinosAvroMessageProtocol,
     MinosAvroProtocol,
+    PostgreSqlAvroSchemaRegistry,
+    StorageAvroSchemaRegistry,
 )
 from .json import (
     MinosJsonBinaryProtocol,
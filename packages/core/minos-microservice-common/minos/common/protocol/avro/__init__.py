@@ -7,3 +7,13 @@ from .databases import (
 from .messages import (
     MinosAvroMessageProtocol,
 )
+from .registries import (
+    AvroSchemaRegistry,
+    InMemoryAvroSchemaRegistry,
+    PostgreSqlAvroSchemaRegistry,
+    StorageAvroSchemaRegistry,
+)
+from .streams import (
+    AvroStreamReader,
+    AvroStreamWriter,
+)
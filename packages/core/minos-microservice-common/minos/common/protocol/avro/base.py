@@ -1,12 +1,17 @@
 import io
 from typing import (
     Any,
+    BinaryIO,
+    Iterator,
+    Optional,
     Union,
 )
 
 from fastavro import (
     parse_schema,
     reader,
+    schemaless_reader,
+    schemaless_writer,
     writer,
 )
 
@@ -16,10 +21,31 @@ from ...exceptions import (
 from ..abc import (
     MinosBinaryProtocol,
 )
+from .registries import (
+    AvroSchemaRegistry,
+)
+from .streams import (
+    AvroStreamReader,
+    AvroStreamWriter,
+)
+
+SINGLE_OBJECT_MAGIC = b"\xc3\x01"
 
 
 class MinosAvroProtocol(MinosBinaryProtocol):
-    """Minos Avro Protocol class."""
+    """Minos Avro Protocol class.
+
+    By default, values are encoded as avro object container files, which embed the writer schema. If a
+    ``schema_registry`` is set, single values are encoded with the avro single-object encoding instead (a two bytes
+    marker, the schema fingerprint and the schemaless body), unless the registry has not stored the schema yet, in which
+    case the container format is used. Decoding supports both formats.
+
+    The ``schema_registry`` is shared by the whole process. It is usually set by a ``PostgreSqlAvroSchemaRegistry``
+    injection (configured by the ``schema_registry`` config section) when it is set up, so that the data can be decoded
+    by other services and replicas.
+    """
+
+    schema_registry: Optional[AvroSchemaRegistry] = None
 
     @classmethod
     def encode(cls, value: Any, schema: Any, *args, batch_mode: bool = False, **kwargs) -> bytes:
@@ -43,12 +69,64 @@ class MinosAvroProtocol(MinosBinaryProtocol):
 
         try:
             raw_schema = cls._parse_schema(schema)
+            if cls.schema_registry is not None and not batch_mode:
+                fingerprint_ = cls.schema_registry.register(raw_schema)
+                if fingerprint_ is not None:
+                    return cls._write_single_object(value[0], raw_schema, fingerprint_)
             return cls._write_data(value, raw_schema)
         except Exception as exc:
             raise MinosProtocolException(f"Error encoding data: {exc!r}")
 
+    @classmethod
+    def parse_schema(cls, schema: Any) -> dict[str, Any]:
+        """Parse the given schema so that it can be reused by multiple ``encode`` calls without being parsed again.
+
+        The parsed schema must be passed to ``encode`` wrapped into a single-item list, as the schema could be a union.
+
+        :param schema: The schema to be parsed.
+        :return: The parsed schema.
+        """
+        if not isinstance(schema, list):
+            schema = [schema]
+
+        try:
+            return cls._parse_schema(schema)
+        except Exception as exc:
+            raise MinosProtocolException(f"Error parsing schema: {exc!r}")
+
+    @classmethod
+    def stream_writer(cls, file: BinaryIO, schema: Any, **kwargs) -> AvroStreamWriter:
+        """Build an incremental writer of values into the given file, encoded as an avro object container file.
+
+        :param file: A binary file object.
+        :param schema: The schema relative to the values.
+        :param kwargs: Additional named arguments.
+        :return: An ``AvroStreamWriter`` instance.
+        """
+        return AvroStreamWriter(file, cls.parse_schema(schema), **kwargs)
+
+    @staticmethod
+    def stream_reader() -> AvroStreamReader:
+        """Build an incremental reader of an avro object container file fed by chunks of bytes.
+
+        :return: An ``AvroStreamReader`` instance.
+        """
+        return AvroStreamReader()
+
+    @staticmethod
+    def decode_stream(file: BinaryIO) -> tuple[Any, Iterator[Any]]:
+        """Decode the values of the given avro object container file one by one.
+
+        :param file: A binary file object.
+        :return: A tuple containing the writer schema and an iterator over the values.
+        """
+        return AvroStreamReader.read(file)
+
     @staticmethod
     def _parse_schema(schema: list[dict[str, Any]]) -> dict[str, Any]:
+        if len(schema) == 1 and isinstance(schema[0], dict) and "__fastavro_parsed" in schema[0]:
+            return schema[0]
+
         named_schemas = {}
         for item in schema[1::-1]:
             parse_schema(item, named_schemas)
@@ -62,8 +140,17 @@ class MinosAvroProtocol(MinosBinaryProtocol):
             content = file.getvalue()
         return content
 
+    @staticmethod
+    def _write_single_object(value: dict[str, Any], schema: dict[str, Any], fingerprint_: bytes) -> bytes:
+        with io.BytesIO() as file:
+            file.write(SINGLE_OBJECT_MAGIC)
+            file.write(fingerprint_)
+            schemaless_writer(file, schema, value)
+            content = file.getvalue()
+        return content
+
     @classmethod
-    def decode(cls, data: bytes, *args, batch_mode: bool = False, **kwargs) -> Any:
+    def decode(cls, data: Union[bytes, memoryview], *args, batch_mode: bool = False, **kwargs) -> Any:
         """Decode the given bytes of data into a single dictionary or a sequence of dictionaries.
 
         :param data: A bytes object.
@@ -75,11 +162,47 @@ class MinosAvroProtocol(MinosBinaryProtocol):
         """
 
         try:
-            with io.BytesIO(data) as file:
-                ans = list(reader(file))
+            if cls._is_single_object(data):
+                ans = [cls._read_single_object(data)]
+            else:
+                with io.BytesIO(data) as file:
+                    ans = list(reader(file))
         except Exception as exc:
             raise MinosProtocolException(f"Error decoding the avro bytes: {exc}")
 
+        return cls._unpack_batch(ans, batch_mode)
+
+    # noinspection PyUnusedLocal
+    @classmethod
+    def decode_with_schema(
+        cls, data: Union[bytes, memoryview], *args, batch_mode: bool = False, **kwargs
+    ) -> tuple[Union[dict[str, Any], list[dict[str, Any]]], Any]:
+        """Decode the given bytes of data into the writer schema and the values, reading the data only once.
+
+        :param data: A bytes object.
+        :param args: Additional positional arguments.
+        :param batch_mode: If ``True`` the data is processed as a list of models, otherwise the data is processed as a
+        single model.
+        :param kwargs: Additional named arguments.
+        :return: A tuple containing the schema and a dictionary or a list of dictionaries.
+        """
+
+        try:
+            if cls._is_single_object(data):
+                schema = cls._get_schema_registry().get(data[2:10])
+                ans = [cls._read_single_object(data)]
+            else:
+                with io.BytesIO(data) as file:
+                    r = reader(file)
+                    schema = r.writer_schema
+                    ans = list(r)
+        except Exception as exc:
+            raise MinosProtocolException(f"Error decoding the avro bytes: {exc}")
+
+        return schema, cls._unpack_batch(ans, batch_mode)
+
+    @staticmethod
+    def _unpack_batch(ans: list[Any], batch_mode: bool) -> Any:
         if not batch_mode:
             if len(ans) > 1:
                 raise MinosProtocolException(
@@ -91,7 +214,9 @@ class MinosAvroProtocol(MinosBinaryProtocol):
 
     # noinspection PyUnusedLocal
     @classmethod
-    def decode_schema(cls, data: bytes, *args, **kwargs) -> Union[dict[str, Any], list[dict[str, Any]]]:
+    def decode_schema(
+        cls, data: Union[bytes, memoryview], *args, **kwargs
+    ) -> Union[dict[str, Any], list[dict[str, Any]]]:
         """Decode the given bytes of data into a single dictionary or a sequence of dictionaries.
 
         :param data: A bytes object.
@@ -101,11 +226,31 @@ class MinosAvroProtocol(MinosBinaryProtocol):
         """
 
         try:
-            with io.BytesIO(data) as file:
-                r = reader(file)
-                schema = r.writer_schema
+            if cls._is_single_object(data):
+                schema = cls._get_schema_registry().get(data[2:10])
+            else:
+                with io.BytesIO(data) as file:
+                    r = reader(file)
+                    schema = r.writer_schema
 
         except Exception as exc:
             raise MinosProtocolException(f"Error getting avro schema: {exc}")
 
         return schema
+
+    @staticmethod
+    def _is_single_object(data: Union[bytes, memoryview]) -> bool:
+        return data[:2] == SINGLE_OBJECT_MAGIC
+
+    @classmethod
+    def _read_single_object(cls, data: Union[bytes, memoryview]) -> Any:
+        schema = cls._get_schema_registry().get_parsed(data[2:10])
+        with io.BytesIO(data) as file:
+            file.seek(10)
+            return schemaless_reader(file, schema, None)
+
+    @classmethod
+    def _get_schema_registry(cls) -> AvroSchemaRegistry:
+        if cls.schema_registry is None:
+            raise MinosProtocolException("A schema registry is required to decode single-object encoded data.")
+        return cls.schema_registry
@@ -0,0 +1,431 @@
+from __future__ import (
+    annotations,
+)
+
+import logging
+from abc import (
+    ABC,
+    abstractmethod,
+)
+from asyncio import (
+    FIRST_COMPLETED,
+    AbstractEventLoop,
+    CancelledError,
+    Event,
+    Task,
+    create_task,
+    gather,
+    get_running_loop,
+    run_coroutine_threadsafe,
+    wait,
+    wrap_future,
+)
+from collections import (
+    OrderedDict,
+)
+from collections.abc import (
+    Awaitable,
+    Callable,
+)
+from concurrent.futures import (
+    Future,
+)
+from contextlib import (
+    suppress,
+)
+from functools import (
+    partial,
+)
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    NoReturn,
+    Optional,
+    Union,
+)
+
+import orjson
+from fastavro import (
+    parse_schema,
+)
+from fastavro.schema import (
+    fingerprint,
+)
+from psycopg2.sql import (
+    SQL,
+    Identifier,
+)
+
+from ...database import (
+    PostgreSqlMinosDatabase,
+    PostgreSqlPool,
+)
+from ...exceptions import (
+    MinosProtocolException,
+)
+
+if TYPE_CHECKING:
+    from ...configuration import (
+        MinosConfig,
+    )
+    from ...storage import (
+        MinosStorage,
+    )
+
+SchemaType = Union[dict[str, Any], list[Any]]
+
+logger = logging.getLogger(__name__)
+
+
+class AvroSchemaRegistry(ABC):
+    """Avro Schema Registry base class.
+
+    Maps schema fingerprints to the writer schemas they were computed from, so that single-object encoded values only
+    need to carry the fingerprint instead of the full schema. The most recently used entries are kept in memory, keyed
+    by the identity of the parsed schemas (which are usually cached by the models) and, on a miss, by their canonical
+    form (the json schema sorted by keys), so equal schemas are only fingerprinted once.
+    """
+
+    def __init__(self, max_size: int = 1024):
+        self._max_size = max_size
+        self._identities: OrderedDict[int, tuple[SchemaType, bytes]] = OrderedDict()
+        self._fingerprints: OrderedDict[bytes, bytes] = OrderedDict()
+        self._schemas: OrderedDict[bytes, tuple[SchemaType, SchemaType]] = OrderedDict()
+
+    def register(self, schema: SchemaType) -> Optional[bytes]:
+        """Register the given schema (if it was not registered yet) and return its fingerprint.
+
+        :param schema: A parsed schema, as returned by ``MinosAvroProtocol.parse_schema``.
+        :return: The fingerprint as a bytes object of length 8, or ``None`` if the schema is not stored yet (so the
+            fingerprint cannot be resolved by others and the schema must be embedded into the data).
+        """
+        # The parsed schema is held by the entry, so its identity cannot be reused by another object meanwhile.
+        entry = self._identities.get(id(schema))
+        if entry is not None:
+            self._identities.move_to_end(id(schema))
+            return entry[1]
+
+        writer_schema = self._strip_schema(schema)
+        raw = orjson.dumps(writer_schema, option=orjson.OPT_SORT_KEYS)
+
+        fingerprint_ = self._fingerprints.get(raw)
+        if fingerprint_ is not None:
+            self._fingerprints.move_to_end(raw)
+        else:
+            fingerprint_ = self.fingerprint(raw)
+
+            if fingerprint_ not in self._schemas and not self._store(fingerprint_, raw):
+                return None
+            self._set_schema(fingerprint_, writer_schema, schema)
+
+            self._fingerprints[raw] = fingerprint_
+            if len(self._fingerprints) > self._max_size:
+                self._fingerprints.popitem(last=False)
+
+        self._identities[id(schema)] = (schema, fingerprint_)
+        if len(self._identities) > self._max_size:
+            self._identities.popitem(last=False)
+
+        return fingerprint_
+
+    def get(self, fingerprint_: bytes) -> SchemaType:
+        """Get the writer schema identified by the given fingerprint.
+
+        :param fingerprint_: The fingerprint as a bytes object of length 8.
+        :return: The writer schema.
+        """
+        return self._get(fingerprint_)[0]
+
+    def get_parsed(self, fingerprint_: bytes) -> SchemaType:
+        """Get the parsed writer schema identified by the given fingerprint.
+
+        :param fingerprint_: The fingerprint as a bytes object of length 8.
+        :return: The parsed writer schema.
+        """
+        return self._get(fingerprint_)[1]
+
+    def _get(self, fingerprint_: bytes) -> tuple[SchemaType, SchemaType]:
+        fingerprint_ = bytes(fingerprint_)
+        entry = self._schemas.get(fingerprint_)
+        if entry is not None:
+            self._schemas.move_to_end(fingerprint_)
+            return entry
+
+        raw = self._load(fingerprint_)
+        if raw is None:
+            raise MinosProtocolException(f"There is not any schema registered with {fingerprint_.hex()!r} fingerprint.")
+
+        writer_schema = orjson.loads(raw)
+        return self._set_schema(fingerprint_, writer_schema, parse_schema(writer_schema))
+
+    def _set_schema(
+        self, fingerprint_: bytes, writer_schema: SchemaType, parsed: SchemaType
+    ) -> tuple[SchemaType, SchemaType]:
+        entry = self._schemas[fingerprint_] = (writer_schema, parsed)
+        self._schemas.move_to_end(fingerprint_)
+        if len(self._schemas) > self._max_size:
+            self._schemas.popitem(last=False)
+        return entry
+
+    @staticmethod
+    def fingerprint(raw: bytes) -> bytes:
+        """Compute the fingerprint of the given serialized schema.
+
+        The ``CRC-64-AVRO`` algorithm is computed over the full json schema (sorted by keys) instead of over the
+        parsing canonical form, as the latter drops the logical types.
+
+        :param raw: The serialized schema.
+        :return: The fingerprint as a bytes object of length 8.
+        """
+        return bytes.fromhex(fingerprint(raw.decode(), "CRC-64-AVRO"))
+
+    @staticmethod
+    def _strip_schema(schema: SchemaType) -> SchemaType:
+        if isinstance(schema, list):
+            return [AvroSchemaRegistry._strip_schema(item) for item in schema]
+        if isinstance(schema, dict):
+            return {k: v for k, v in schema.items() if k not in ("__fastavro_parsed", "__named_schemas")}
+        return schema
+
+    @abstractmethod
+    def _store(self, fingerprint_: bytes, raw: bytes) -> bool:
+        raise NotImplementedError
+
+    @abstractmethod
+    def _load(self, fingerprint_: bytes) -> Optional[bytes]:
+        raise NotImplementedError
+
+
+class InMemoryAvroSchemaRegistry(AvroSchemaRegistry):
+    """In Memory Avro Schema Registry class."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._storage: dict[bytes, bytes] = dict()
+
+    def _store(self, fingerprint_: bytes, raw: bytes) -> bool:
+        self._storage[fingerprint_] = raw
+        return True
+
+    def _load(self, fingerprint_: bytes) -> Optional[bytes]:
+        return self._storage.get(fingerprint_)
+
+
+class StorageAvroSchemaRegistry(AvroSchemaRegistry):
+    """Avro Schema Registry class backed by a ``MinosStorage`` instance, so that fingerprints survive restarts.
+
+    The schemas are only visible to the processes sharing the storage (a local file, in the case of
+    ``MinosStorageLmdb``), so this registry must only be used for data that is decoded on the same host. The data sent
+    to other services (or replicas) must use a shared registry, like the ``PostgreSqlAvroSchemaRegistry``.
+
+    The storage must not be configured with an avro-based protocol, otherwise storing a schema would require
+    registering the storage's own schema first.
+    """
+
+    def __init__(self, storage: MinosStorage, *args, table: str = "avro_schemas", **kwargs):
+        super().__init__(*args, **kwargs)
+        self._storage = storage
+        self._table = table
+
+    @classmethod
+    def build(cls, path: str, *args, **kwargs) -> StorageAvroSchemaRegistry:
+        """Build a new instance backed by a ``MinosStorageLmdb`` instance.
+
+        :param path: Path in which the database is stored.
+        :param args: Additional positional arguments.
+        :param kwargs: Additional named arguments.
+        :return: A ``StorageAvroSchemaRegistry`` instance.
+        """
+        from ...storage import (
+            MinosStorageLmdb,
+        )
+        from ..json import (
+            MinosJsonBinaryProtocol,
+        )
+
+        storage = MinosStorageLmdb.build(path, protocol=MinosJsonBinaryProtocol)
+        return cls(storage, *args, **kwargs)
+
+    def _store(self, fingerprint_: bytes, raw: bytes) -> bool:
+        if self._load(fingerprint_) is None:
+            self._storage.add(self._table, fingerprint_.hex(), raw.decode())
+        return True
+
+    def _load(self, fingerprint_: bytes) -> Optional[bytes]:
+        raw = self._storage.get(self._table, fingerprint_.hex())
+        if raw is None:
+            return None
+        return raw.encode()
+
+
+class PostgreSqlAvroSchemaRegistry(AvroSchemaRegistry, PostgreSqlMinosDatabase):
+    """PostgreSql Avro Schema Registry class.
+
+    The schemas are stored into a PostgreSql table, so the fingerprints can be resolved by every service (and replica)
+    connected to the same database, which is configured by the ``schema_registry`` section of the ``MinosConfig``.
+    Once set up (for example, as an injection), the registry is used by the ``MinosAvroProtocol``.
+
+    The registry methods are synchronous, like the protocol ones, so they never access the database. Instead, the stored
+    schemas are loaded during the setup, and the ones stored later by other registries are loaded as soon as they are
+    notified. The unknown schemas are stored (or loaded) in the background, so meanwhile the values are encoded with the
+    schema embedded, and the values referencing an unknown fingerprint cannot be decoded. The ``aregister`` and ``aget``
+    methods can be used to wait for the database instead.
+    """
+
+    def __init__(
+        self,
+        database: str,
+        host: Optional[str] = None,
+        port: Optional[int] = None,
+        user: Optional[str] = None,
+        password: Optional[str] = None,
+        *args,
+        table: str = "avro_schemas",
+        max_size: int = 1024,
+        **kwargs,
+    ):
+        AvroSchemaRegistry.__init__(self, max_size=max_size)
+        PostgreSqlMinosDatabase.__init__(self, host, port, database, user, password, *args, **kwargs)
+
+        self.table = table
+
+        self._loop: Optional[AbstractEventLoop] = None
+        self._listen_task: Optional[Task] = None
+        self._pending: dict[bytes, Future] = dict()
+        self._loaded: dict[bytes, bytes] = dict()
+
+    @classmethod
+    def _from_config(cls, *args, config: MinosConfig, **kwargs) -> PostgreSqlAvroSchemaRegistry:
+        return cls(*args, **config.schema_registry._asdict(), **kwargs)
+
+    async def _setup(self) -> None:
+        from .base import (
+            MinosAvroProtocol,
+        )
+
+        await super()._setup()
+        self._loop = get_running_loop()
+
+        query = SQL("CREATE TABLE IF NOT EXISTS {table} (fingerprint BYTEA PRIMARY KEY, schema TEXT NOT NULL)")
+        await self.submit_query(query.format(table=Identifier(self.table)), lock=self.table)
+
+        # The schemas are listened before loading the stored ones, so that none of them is missed.
+        listening = Event()
+        self._listen_task = create_task(self._listen(listening))
+        await wait({self._listen_task, create_task(listening.wait())}, return_when=FIRST_COMPLETED)
+        if self._listen_task.done():
+            await self._listen_task
+
+        query = SQL("SELECT fingerprint, schema FROM {table} LIMIT %s").format(table=Identifier(self.table))
+        async for fingerprint_, raw in self.submit_query_and_iter(query, (self._max_size,)):
+            self._loaded[bytes(fingerprint_)] = raw.encode()
+
+        MinosAvroProtocol.schema_registry = self
+
+    async def _destroy(self) -> None:
+        from .base import (
+            MinosAvroProtocol,
+        )
+
+        if MinosAvroProtocol.schema_registry is self:
+            MinosAvroProtocol.schema_registry = None
+
+        if self._pending:
+            await gather(*(wrap_future(future) for future in tuple(self._pending.values())), return_exceptions=True)
+
+        if self._listen_task is not None:
+            task, self._listen_task = self._listen_task, None
+            task.cancel()
+            with suppress(CancelledError):
+                await task
+
+        self._loop = None
+        await super()._destroy()
+
+    async def aregister(self, schema: SchemaType) -> bytes:
+        """Register the given schema (if it was not registered yet), waiting until it is stored, and return its
+        fingerprint.
+
+        :param schema: A parsed schema, as returned by ``MinosAvroProtocol.parse_schema``.
+        :return: The fingerprint as a bytes object of length 8.
+        """
+        raw = orjson.dumps(self._strip_schema(schema), option=orjson.OPT_SORT_KEYS)
+        fingerprint_ = self.fingerprint(raw)
+        if fingerprint_ not in self._loaded:
+            await self._store_async(fingerprint_, raw)
+        return self.register(schema)
+
+    async def aget(self, fingerprint_: bytes) -> SchemaType:
+        """Get the writer schema identified by the given fingerprint, waiting until it is loaded.
+
+        :param fingerprint_: The fingerprint as a bytes object of length 8.
+        :return: The writer schema.
+        """
+        fingerprint_ = bytes(fingerprint_)
+        if fingerprint_ not in self._schemas and fingerprint_ not in self._loaded:
+            await self._load_async(fingerprint_)
+        return self.get(fingerprint_)
+
+    def _store(self, fingerprint_: bytes, raw: bytes) -> bool:
+        if fingerprint_ in self._loaded:
+            return True
+        self._submit(fingerprint_, self._store_async, raw)
+        return False
+
+    def _load(self, fingerprint_: bytes) -> Optional[bytes]:
+        if fingerprint_ in self._loaded:
+            return self._loaded[fingerprint_]
+        self._submit(fingerprint_, self._load_async)
+        return None
+
+    def _submit(self, fingerprint_: bytes, fn: Callable[..., Awaitable[None]], *args) -> None:
+        # The registry methods may be called from any thread, but the database is only accessed from the event loop.
+        if self._loop is None or self._loop.is_closed() or fingerprint_ in self._pending:
+            return
+
+        future = self._pending[fingerprint_] = run_coroutine_threadsafe(fn(fingerprint_, *args), self._loop)
+        future.add_done_callback(partial(self._submitted, fingerprint_))
+
+    def _submitted(self, fingerprint_: bytes, future: Future) -> None:
+        self._pending.pop(fingerprint_, None)
+        if not future.cancelled() and future.exception() is not None:
+            logger.warning(
+                f"There was a problem while trying to sync the schema with {fingerprint_.hex()!r} fingerprint: "
+                f"{future.exception()!r}"
+            )
+
+    async def _store_async(self, fingerprint_: bytes, raw: bytes) -> None:
+        insert = SQL("INSERT INTO {table} (fingerprint, schema) VALUES (%s, %s) ON CONFLICT DO NOTHING").format(
+            table=Identifier(self.table)
+        )
+        # The notification is delivered once the transaction is committed, so the schema is already visible.
+        async with self.session(transaction=True):
+            await self.submit_query(insert, (fingerprint_, raw.decode()))
+            await self.submit_query(SQL("SELECT pg_notify(%s, %s)"), (self.table, fingerprint_.hex()))
+        self._loaded[fingerprint_] = raw
+
+    async def _load_async(self, fingerprint_: bytes) -> None:
+        query = SQL("SELECT schema FROM {table} WHERE fingerprint = %s").format(table=Identifier(self.table))
+        async for (raw,) in self.submit_query_and_iter(query, (fingerprint_,)):
+            self._loaded[fingerprint_] = raw.encode()
+
+    async def _listen(self, listening: Event) -> NoReturn:
+        async with self.cursor() as cursor:
+            await cursor.execute(SQL("LISTEN {table}").format(table=Identifier(self.table)))
+            listening.set()
+            try:
+                while True:
+                    notification = await cursor.connection.notifies.get()
+                    fingerprint_ = bytes.fromhex(notification.payload)
+                    if fingerprint_ not in self._loaded:
+                        await self._load_async(fingerprint_)
+            finally:
+                if not cursor.closed:
+                    await cursor.execute(SQL("UNLISTEN {table}").format(table=Identifier(self.table)))
+
+    def _build_pool(self) -> tuple[PostgreSqlPool, bool]:
+        # The schemas may be stored into another database than the one of the injected pool.
+        pool = PostgreSqlPool(
+            host=self.host, port=self.port, database=self.database, user=self.user, password=self.password
+        )
+        return pool, True
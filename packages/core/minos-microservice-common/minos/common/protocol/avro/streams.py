@@ -0,0 +1,225 @@
+import bz2
+import io
+import lzma
+import zlib
+from collections.abc import (
+    Callable,
+)
+from typing import (
+    Any,
+    BinaryIO,
+    Iterator,
+    Optional,
+    Union,
+)
+
+from fastavro import (
+    parse_schema,
+    reader,
+    schemaless_reader,
+)
+from fastavro.write import (
+    Writer,
+)
+
+from ...exceptions import (
+    MinosProtocolException,
+)
+
+_MAGIC = b"Obj\x01"
+_SYNC_SIZE = 16
+
+_DECOMPRESSORS: dict[str, Callable[[memoryview], Union[bytes, memoryview]]] = {
+    "null": lambda data: data,
+    # The deflate codec is encoded without the zlib header and checksum, so a negative window size is used.
+    "deflate": lambda data: zlib.decompress(data, -15),
+    "bzip2": bz2.decompress,
+    "xz": lzma.decompress,
+}
+
+
+class AvroStreamWriter:
+    """Avro Stream Writer class.
+
+    Writes the values one by one into an avro object container file, flushing a block of values each time the
+    ``sync_interval`` size is reached, so the values do not need to be kept in memory.
+    """
+
+    def __init__(self, file: BinaryIO, schema: dict[str, Any], sync_interval: int = 16000):
+        try:
+            self._writer = Writer(file, schema, sync_interval=sync_interval)
+        except Exception as exc:
+            raise MinosProtocolException(f"Error encoding data: {exc!r}")
+        self.count = 0
+
+    def write(self, value: Any) -> None:
+        """Write a new value.
+
+        :param value: The value to be written.
+        :return: This method does not return anything.
+        """
+        try:
+            self._writer.write(value)
+        except Exception as exc:
+            raise MinosProtocolException(f"Error encoding data: {exc!r}")
+        self.count += 1
+
+    def flush(self) -> None:
+        """Write the pending values into the file.
+
+        :return: This method does not return anything.
+        """
+        try:
+            self._writer.flush()
+        except Exception as exc:
+            raise MinosProtocolException(f"Error encoding data: {exc!r}")
+
+
+class AvroStreamReader:
+    """Avro Stream Reader class.
+
+    Reads an avro object container file from chunks of bytes of any size. The values of each block are returned as
+    soon as the block is complete, so only the pending block needs to be kept in memory.
+    """
+
+    def __init__(self):
+        self._buffer = bytearray()
+        self._header: Optional[bytes] = None
+        self._block_schema: Optional[dict[str, Any]] = None
+        self._decompress: Optional[Callable[[memoryview], Union[bytes, memoryview]]] = None
+        self.schema: Optional[dict[str, Any]] = None
+
+    @classmethod
+    def read(cls, file: BinaryIO) -> tuple[dict[str, Any], Iterator[Any]]:
+        """Read the values of the given file one by one.
+
+        :param file: A binary file object positioned at the beginning of an avro object container file.
+        :return: A tuple containing the writer schema and an iterator over the values.
+        """
+        try:
+            r = reader(file)
+        except Exception as exc:
+            raise MinosProtocolException(f"Error decoding the avro bytes: {exc}")
+
+        def _fn() -> Iterator[Any]:
+            try:
+                yield from r
+            except Exception as exc:
+                raise MinosProtocolException(f"Error decoding the avro bytes: {exc}")
+
+        return r.writer_schema, _fn()
+
+    def feed(self, chunk: Union[bytes, memoryview]) -> list[Any]:
+        """Feed a new chunk of bytes.
+
+        :param chunk: The chunk of bytes.
+        :return: The values of the blocks completed by the given chunk.
+        """
+        self._buffer += chunk
+        try:
+            if self._header is None and not self._read_header():
+                return list()
+            return self._read_blocks()
+        except MinosProtocolException:
+            raise
+        except Exception as exc:
+            raise MinosProtocolException(f"Error decoding the avro bytes: {exc}")
+
+    def close(self) -> None:
+        """Check that all the fed bytes have been read.
+
+        :return: This method does not return anything.
+        """
+        if self._header is None or len(self._buffer):
+            raise MinosProtocolException("Error decoding the avro bytes: The stream has been truncated.")
+
+    def _read_header(self) -> bool:
+        if len(self._buffer) < len(_MAGIC):
+            return False
+        if self._buffer[: len(_MAGIC)] != _MAGIC:
+            raise MinosProtocolException("Error decoding the avro bytes: The stream is not an avro container file.")
+
+        # The header contains the magic bytes, the metadata map and the sync marker.
+        try:
+            pos = len(_MAGIC)
+            while True:
+                count, pos = _read_long(self._buffer, pos)
+                if count == 0:
+                    break
+                if count < 0:
+                    count = -count
+                    _, pos = _read_long(self._buffer, pos)
+                for _ in range(2 * count):
+                    size, pos = _read_long(self._buffer, pos)
+                    pos += size
+            pos += _SYNC_SIZE
+        except IndexError:
+            return False
+
+        if pos > len(self._buffer):
+            return False
+
+        self._header = bytes(self._buffer[:pos])
+        del self._buffer[:pos]
+
+        # The header is only parsed once. The values of a block are encoded like the items of an array (without the
+        # leading count and the trailing zero), so each block is decoded at once as an array of the writer schema.
+        r = reader(io.BytesIO(self._header))
+        self.schema = r.writer_schema
+        self._block_schema = parse_schema({"type": "array", "items": self.schema})
+        self._decompress = _DECOMPRESSORS.get(r.metadata.get("avro.codec", "null"))
+        return True
+
+    def _read_blocks(self) -> list[Any]:
+        ans = list()
+        while len(self._buffer):
+            try:
+                count, pos = _read_long(self._buffer, 0)
+                size, pos = _read_long(self._buffer, pos)
+            except IndexError:
+                break
+
+            sync = pos + size
+            end = sync + _SYNC_SIZE
+            if end > len(self._buffer):
+                break
+
+            if self._buffer[sync:end] != self._header[-_SYNC_SIZE:]:
+                raise MinosProtocolException("Error decoding the avro bytes: The block sync marker does not match.")
+
+            if self._decompress is None:
+                # The codecs without a standard library implementation are read as a container file with one block.
+                with io.BytesIO(self._header + self._buffer[:end]) as file:
+                    ans.extend(reader(file))
+            else:
+                # The view is released before the block is removed from the buffer, so that it can be resized.
+                with memoryview(self._buffer) as view:
+                    data = b"".join((_encode_long(count), self._decompress(view[pos:sync]), b"\x00"))
+                with io.BytesIO(data) as file:
+                    ans.extend(schemaless_reader(file, self._block_schema, None))
+            del self._buffer[:end]
+
+        return ans
+
+
+def _encode_long(value: int) -> bytes:
+    value = (value << 1) ^ (value >> 63)
+    ans = bytearray()
+    while value & ~0x7F:
+        ans.append((value & 0x7F) | 0x80)
+        value >>= 7
+    ans.append(value)
+    return bytes(ans)
+
+
+def _read_long(buffer: bytearray, pos: int) -> tuple[int, int]:
+    # The avro longs are encoded as zig-zag variable-length integers.
+    value, shift = 0, 0
+    while True:
+        byte = buffer[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            break
+        shift += 7
+    return (value >> 1) ^ -(value & 1), pos
@@ -21,7 +21,12 @@ class MinosJsonBinaryProtocol(MinosBinaryProtocol):
         :param kwargs: Additional named arguments.
         :return: A bytes instance.
         """
-        return orjson.dumps(data)
+        from ..model import (
+            JsonDataEncoder,
+        )
+
+        # The models are serialized directly, but the rest of values keep the native ``orjson`` serialization.
+        return JsonDataEncoder(avro_compatible=False).build(data)
 
     @classmethod
     def decode(cls, data: bytes, *args, **kwargs) -> Any:
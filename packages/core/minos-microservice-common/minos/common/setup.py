@@ -4,6 +4,9 @@ from __future__ import (
 
 import logging
 import warnings
+from asyncio import (
+    Lock,
+)
 from pathlib import (
     Path,
 )
@@ -25,15 +28,23 @@ from .configuration import (
 from .exceptions import (
     NotProvidedException,
 )
+from .profiling import (
+    SETUP_PROFILER,
+)
 
 logger = logging.getLogger(__name__)
 
 
 class MinosSetup:
-    """Minos setup base class."""
+    """Minos setup base class.
+
+    The wall time of each setup and destroy is recorded into the ``SETUP_PROFILER``. The setup and destroy are
+    serialized, so the instance is only set up once even if it is shared by multiple components set up concurrently.
+    """
 
     def __init__(self, *args, already_setup: bool = False, **kwargs):
         self._already_setup = already_setup
+        self._setup_lock: Optional[Lock] = None
 
     @property
     def already_setup(self) -> bool:
@@ -87,10 +98,12 @@ class MinosSetup:
 
         :return: This method does not return anything.
         """
-        if not self._already_setup:
-            logger.info(f"Setting up a {type(self).__name__!r} instance...")
-            await self._setup()
-            self._already_setup = True
+        async with self._get_setup_lock():
+            if not self._already_setup:
+                logger.info(f"Setting up a {type(self).__name__!r} instance...")
+                with SETUP_PROFILER.span("setup", type(self).__name__):
+                    await self._setup()
+                self._already_setup = True
 
     async def _setup(self) -> None:
         return
@@ -103,14 +116,22 @@ class MinosSetup:
 
         :return: This method does not return anything.
         """
-        if self._already_setup:
-            logger.info(f"Destroying a {type(self).__name__!r} instance...")
-            await self._destroy()
-            self._already_setup = False
+        async with self._get_setup_lock():
+            if self._already_setup:
+                logger.info(f"Destroying a {type(self).__name__!r} instance...")
+                with SETUP_PROFILER.span("destroy", type(self).__name__):
+                    await self._destroy()
+                self._already_setup = False
 
     async def _destroy(self) -> None:
         """Destroy miscellaneous repository things."""
 
+    def _get_setup_lock(self) -> Lock:
+        # The lock is built lazily, so that it is bound to the running event loop.
+        if self._setup_lock is None:
+            self._setup_lock = Lock()
+        return self._setup_lock
+
     def __del__(self):
         if not self.already_destroyed:
             warnings.warn(
@@ -6,6 +6,9 @@ from abc import (
     ABC,
     abstractmethod,
 )
+from collections.abc import (
+    Iterable,
+)
 from typing import (
     Any,
     Optional,
@@ -51,6 +54,78 @@ class MinosStorage(ABC):
         """
         raise NotImplementedError
 
+    def get_many(self, table: str, keys: Iterable[str], **kwargs) -> list[Optional[Any]]:
+        """Get the stored values of the given keys.
+
+        :param table: Table in which the data is stored.
+        :param keys: Keys that identify the data.
+        :param kwargs: Additional named arguments.
+        :return: A list containing the stored values (or ``None`` if empty) in the same order as the keys.
+        """
+        return [self.get(table=table, key=key, **kwargs) for key in keys]
+
+    def put_many(self, table: str, items: Iterable[tuple[str, Any]], **kwargs) -> None:
+        """Store the given values, overwriting the previous ones.
+
+        :param table: Table in which the data is stored.
+        :param items: Pairs of key and value to be stored.
+        :param kwargs: Additional named arguments.
+        :return: This method does not return anything.
+        """
+        for key, value in items:
+            self.update(table=table, key=key, value=value, **kwargs)
+
+    async def aget(self, table: str, key: str, **kwargs) -> Optional[Any]:
+        """Get the stored value without blocking the event loop.
+
+        :param table: Table in which the data is stored.
+        :param key: Key that identifies the data.
+        :param kwargs: Additional named arguments.
+        :return: The stored value or ``None`` if it's empty.
+        """
+        return self.get(table=table, key=key, **kwargs)
+
+    async def aget_many(self, table: str, keys: Iterable[str], **kwargs) -> list[Optional[Any]]:
+        """Get the stored values of the given keys without blocking the event loop.
+
+        :param table: Table in which the data is stored.
+        :param keys: Keys that identify the data.
+        :param kwargs: Additional named arguments.
+        :return: A list containing the stored values (or ``None`` if empty) in the same order as the keys.
+        """
+        return self.get_many(table, keys, **kwargs)
+
+    async def aput(self, table: str, key: str, value: Any, **kwargs) -> None:
+        """Store a value, overwriting the previous one, without blocking the event loop.
+
+        :param table: Table in which the data is stored.
+        :param key: Key that identifies the data.
+        :param value: Data to be stored.
+        :param kwargs: Additional named arguments.
+        :return: This method does not return anything.
+        """
+        self.update(table=table, key=key, value=value, **kwargs)
+
+    async def aput_many(self, table: str, items: Iterable[tuple[str, Any]], **kwargs) -> None:
+        """Store the given values, overwriting the previous ones, without blocking the event loop.
+
+        :param table: Table in which the data is stored.
+        :param items: Pairs of key and value to be stored.
+        :param kwargs: Additional named arguments.
+        :return: This method does not return anything.
+        """
+        self.put_many(table, items, **kwargs)
+
+    async def adelete(self, table: str, key: str, **kwargs) -> None:
+        """Delete the stored value without blocking the event loop.
+
+        :param table: Table in which the data is stored.
+        :param key: Key that identifies the data.
+        :param kwargs: Additional named arguments.
+        :return: This method does not return anything.
+        """
+        self.delete(table=table, key=key, **kwargs)
+
     @classmethod
     @abstractmethod
     def build(cls, **kwargs) -> MinosStorage:
@@ -2,18 +2,42 @@ from __future__ import (
     annotations,
 )
 
+import asyncio
+import logging
+import os
+import threading
+from asyncio import (
+    Future,
+    Task,
+)
+from collections.abc import (
+    Callable,
+    Iterable,
+    Iterator,
+)
+from concurrent.futures import (
+    ThreadPoolExecutor,
+)
+from contextlib import (
+    contextmanager,
+)
 from pathlib import (
     Path,
 )
 from typing import (
     Any,
+    NoReturn,
     Optional,
     Type,
+    TypeVar,
     Union,
 )
 
 import lmdb
 
+from ..metrics import (
+    Histogram,
+)
 from ..protocol import (
     MinosAvroDatabaseProtocol,
     MinosBinaryProtocol,
@@ -22,19 +46,61 @@ from .abc import (
     MinosStorage,
 )
 
+logger = logging.getLogger(__name__)
+
+_Operation = tuple[str, bytes, Optional[bytes]]
+
+T = TypeVar("T")
+
 
 class MinosStorageLmdb(MinosStorage):
-    """Minos Storage LMDB class"""
+    """Minos Storage LMDB class
+
+    The asynchronous reads are performed by the default executor, and the asynchronous writes by a dedicated writer
+    thread, in which the ones issued while a transaction is being committed are grouped into the next one, so the event
+    loop is never blocked on the disk synchronization. The writer thread is released by ``close``.
 
-    __slots__ = "_env", "_protocol", "_tables"
+    When the memory map is full, its size is multiplied by the ``growth_factor`` (up to ``max_map_size``, if set) and
+    the write is retried, waiting for the transactions in progress to finish before resizing it.
+    """
+
+    __slots__ = (
+        "_env",
+        "_protocol",
+        "_tables",
+        "_executor",
+        "_pending",
+        "_flushing",
+        "_growth_factor",
+        "_max_map_size",
+        "_guard",
+        "_resizes",
+        "_write_latency",
+    )
 
     # noinspection PyUnusedLocal
     def __init__(
-        self, env: lmdb.Environment, protocol: Type[MinosBinaryProtocol] = MinosAvroDatabaseProtocol, **kwargs
+        self,
+        env: lmdb.Environment,
+        protocol: Type[MinosBinaryProtocol] = MinosAvroDatabaseProtocol,
+        growth_factor: float = 2.0,
+        max_map_size: Optional[int] = None,
+        **kwargs,
     ):
+        if growth_factor <= 1:
+            raise ValueError(f"The growth factor must be greater than 1. Obtained: {growth_factor!r}")
+
         self._env: lmdb.Environment = env
         self._protocol = protocol
         self._tables = {}
+        self._growth_factor = growth_factor
+        self._max_map_size = max_map_size
+        self._guard = _ResizeGuard()
+        self._resizes = 0
+        self._write_latency = Histogram()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending: list[tuple[list[_Operation], Future]] = list()
+        self._flushing: Optional[Task] = None
 
     def add(self, table: str, key: str, value: Any) -> None:
         """Store a value.
@@ -44,10 +110,8 @@ class MinosStorageLmdb(MinosStorage):
         :param value: Data to be stored.
         :return: This method does not return anything.
         """
-        db_instance = self._get_table(table)
-        with self._env.begin(write=True) as txn:
-            value_bytes: bytes = self._protocol.encode(value)
-            txn.put(key.encode(), value_bytes, db=db_instance)
+        value_bytes: bytes = self._protocol.encode(value)
+        self._commit([(table, key.encode(), value_bytes)])
 
     def get(self, table: str, key: str) -> Optional[Any]:
         """Get the stored value..
@@ -56,13 +120,24 @@ class MinosStorageLmdb(MinosStorage):
         :param key: Key that identifies the data.
         :return: The stored value or ``None`` if it's empty.
         """
-        db_instance = self._get_table(table)
-        with self._env.begin(db=db_instance) as txn:
-            value_binary = txn.get(key.encode())
-            if value_binary is not None:
-                # decode the returned value
-                return self._protocol.decode(value_binary)
+        value_binary = self._read(table, lambda txn: txn.get(key.encode()))
+        return self._decode(value_binary)
+
+    def get_many(self, table: str, keys: Iterable[str], **kwargs) -> list[Optional[Any]]:
+        """Get the stored values of the given keys, using a single transaction.
+
+        :param table: Table in which the data is stored.
+        :param keys: Keys that identify the data.
+        :param kwargs: Additional named arguments.
+        :return: A list containing the stored values (or ``None`` if empty) in the same order as the keys.
+        """
+        values_binary = self._read(table, lambda txn: [txn.get(key.encode()) for key in keys])
+        return [self._decode(value_binary) for value_binary in values_binary]
+
+    def _decode(self, value_binary: Optional[bytes]) -> Optional[Any]:
+        if value_binary is None:
             return None
+        return self._protocol.decode(value_binary)
 
     def delete(self, table: str, key: str) -> None:
         """Delete the stored value.
@@ -71,9 +146,7 @@ class MinosStorageLmdb(MinosStorage):
         :param key: Key that identifies the data.
         :return: This method does not return anything.
         """
-        db_instance = self._get_table(table)
-        with self._env.begin(write=True, db=db_instance) as txn:
-            txn.delete(key.encode())
+        self._commit([(table, key.encode(), None)])
 
     def update(self, table: str, key: str, value: Any) -> None:
         """Update the stored value.
@@ -83,10 +156,259 @@ class MinosStorageLmdb(MinosStorage):
         :param value: Data to be stored.
         :return: This method does not return anything.
         """
+        value_bytes: bytes = self._protocol.encode(value)
+        self._commit([(table, key.encode(), value_bytes)])
+
+    def put_many(self, table: str, items: Iterable[tuple[str, Any]], **kwargs) -> None:
+        """Store the given values, overwriting the previous ones, using a single transaction.
+
+        :param table: Table in which the data is stored.
+        :param items: Pairs of key and value to be stored.
+        :param kwargs: Additional named arguments.
+        :return: This method does not return anything.
+        """
+        self._commit([(table, key.encode(), self._protocol.encode(value)) for key, value in items])
+
+    async def aget(self, table: str, key: str, **kwargs) -> Optional[Any]:
+        """Get the stored value without blocking the event loop.
+
+        :param table: Table in which the data is stored.
+        :param key: Key that identifies the data.
+        :param kwargs: Additional named arguments.
+        :return: The stored value or ``None`` if it's empty.
+        """
+        await self._aget_table(table)
+        return await asyncio.get_running_loop().run_in_executor(None, self.get, table, key)
+
+    async def aget_many(self, table: str, keys: Iterable[str], **kwargs) -> list[Optional[Any]]:
+        """Get the stored values of the given keys without blocking the event loop.
+
+        :param table: Table in which the data is stored.
+        :param keys: Keys that identify the data.
+        :param kwargs: Additional named arguments.
+        :return: A list containing the stored values (or ``None`` if empty) in the same order as the keys.
+        """
+        await self._aget_table(table)
+        return await asyncio.get_running_loop().run_in_executor(None, self.get_many, table, list(keys))
+
+    async def aput(self, table: str, key: str, value: Any, **kwargs) -> None:
+        """Store a value, overwriting the previous one, without blocking the event loop.
+
+        The write is committed together with the rest of writes issued concurrently, so if the transaction fails,
+        all of them fail.
+
+        :param table: Table in which the data is stored.
+        :param key: Key that identifies the data.
+        :param value: Data to be stored.
+        :param kwargs: Additional named arguments.
+        :return: This method does not return anything.
+        """
+        await self._write(table, [(key, self._protocol.encode(value))])
+
+    async def aput_many(self, table: str, items: Iterable[tuple[str, Any]], **kwargs) -> None:
+        """Store the given values, overwriting the previous ones, without blocking the event loop.
+
+        The writes are committed together with the rest of writes issued concurrently, so if the transaction fails,
+        all of them fail.
+
+        :param table: Table in which the data is stored.
+        :param items: Pairs of key and value to be stored.
+        :param kwargs: Additional named arguments.
+        :return: This method does not return anything.
+        """
+        await self._write(table, [(key, self._protocol.encode(value)) for key, value in items])
+
+    async def adelete(self, table: str, key: str, **kwargs) -> None:
+        """Delete the stored value without blocking the event loop.
+
+        The deletion is committed together with the rest of writes issued concurrently, so if the transaction fails,
+        all of them fail.
+
+        :param table: Table in which the data is stored.
+        :param key: Key that identifies the data.
+        :param kwargs: Additional named arguments.
+        :return: This method does not return anything.
+        """
+        await self._write(table, [(key, None)])
+
+    def stats(self) -> dict[str, Any]:
+        """Get the usage statistics of the storage.
+
+        :return: A dictionary containing the map size, the page usage, the reader slots, the number of resizes, the
+            number of entries of each table opened by this instance and the latency histogram of the write transactions.
+        """
+        info = self._env.info()
+        page_size = self._env.stat()["psize"]
+        used_pages = info["last_pgno"] + 1
+        total_pages = info["map_size"] // page_size
+
+        with self._guard.transaction(), self._env.begin() as txn:
+            tables = {name: txn.stat(db_instance)["entries"] for name, db_instance in self._tables.items()}
+
+        return {
+            "map_size": info["map_size"],
+            "page_size": page_size,
+            "used_pages": used_pages,
+            "total_pages": total_pages,
+            "usage": used_pages / total_pages,
+            "readers": info["num_readers"],
+            "max_readers": info["max_readers"],
+            "resizes": self._resizes,
+            "tables": tables,
+            "write_latency": self._write_latency.as_dict(),
+        }
+
+    def copy(self, path: Union[str, Path], compact: bool = True) -> Path:
+        """Copy the database into the given directory, as a consistent snapshot that can be opened as a new storage.
+
+        The previous copy of the directory (if any) is atomically replaced once the new one is complete.
+
+        :param path: Directory in which the copy is stored.
+        :param compact: If ``True`` the free pages are omitted and the pages are renumbered sequentially.
+        :return: The path of the copied data file.
+        """
+        path = Path(path)
+        path.mkdir(parents=True, exist_ok=True)
+
+        target = path / "data.mdb"
+        tmp = path / "data.mdb.tmp"
+        with self._guard.transaction(), tmp.open("wb") as file:
+            self._env.copyfd(file.fileno(), compact=compact)
+            os.fsync(file.fileno())
+        os.replace(tmp, target)
+        return target
+
+    async def acopy(self, path: Union[str, Path], compact: bool = True) -> Path:
+        """Copy the database into the given directory without blocking the event loop.
+
+        :param path: Directory in which the copy is stored.
+        :param compact: If ``True`` the free pages are omitted and the pages are renumbered sequentially.
+        :return: The path of the copied data file.
+        """
+        # The copy is not performed by the writer thread, so that the writes are not blocked meanwhile.
+        return await asyncio.get_running_loop().run_in_executor(None, self.copy, path, compact)
+
+    async def copy_periodically(self, path: Union[str, Path], interval: float, compact: bool = True) -> NoReturn:
+        """Copy the database into the given directory periodically, until cancelled.
+
+        :param path: Directory in which the copy is stored.
+        :param interval: The number of seconds between copies.
+        :param compact: If ``True`` the free pages are omitted and the pages are renumbered sequentially.
+        :return: This method never returns.
+        """
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.acopy(path, compact)
+            except Exception as exc:
+                logger.warning(f"An exception was raised while copying the LMDB map into {str(path)!r}: {exc!r}")
+
+    async def close(self) -> None:
+        """Wait for the pending writes to be committed and release the writer thread.
+
+        The storage can still be used afterwards, as the writer thread is started again if needed.
+
+        :return: This method does not return anything.
+        """
+        while self._flushing is not None:
+            await asyncio.shield(self._flushing)
+
+        if self._executor is not None:
+            executor, self._executor = self._executor, None
+            # The executor may still be opening a table, so the shutdown is not awaited on the event loop.
+            await asyncio.get_running_loop().run_in_executor(None, executor.shutdown)
+
+    async def _write(self, table: str, entries: list[tuple[str, Optional[bytes]]]) -> None:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append(([(table, key.encode(), value) for key, value in entries], future))
+        if self._flushing is None:
+            self._flushing = loop.create_task(self._flush())
+        await future
+
+    async def _flush(self) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            while self._pending:
+                # The writes enqueued while the previous transaction was being committed are grouped into a new one.
+                batch, self._pending = self._pending, list()
+                operations = [operation for operations, _ in batch for operation in operations]
+                try:
+                    await loop.run_in_executor(self._get_executor(), self._commit, operations)
+                except Exception as exc:
+                    for _, future in batch:
+                        if not future.done():
+                            future.set_exception(exc)
+                else:
+                    for _, future in batch:
+                        if not future.done():
+                            future.set_result(None)
+        finally:
+            self._flushing = None
+
+    def _read(self, table: str, fn: Callable[[lmdb.Transaction], T]) -> T:
         db_instance = self._get_table(table)
-        with self._env.begin(write=True, db=db_instance) as txn:
-            value_bytes: bytes = self._protocol.encode(value)
-            txn.put(key.encode(), value_bytes, db=db_instance, overwrite=True)
+        while True:
+            try:
+                with self._guard.transaction(), self._env.begin(db=db_instance) as txn:
+                    return fn(txn)
+            except lmdb.MapResizedError:
+                self._adopt_map_size()
+
+    def _commit(self, operations: list[_Operation]) -> None:
+        # The tables are opened before starting the transaction, as opening them requires a write transaction too.
+        db_instances = {table: self._get_table(table) for table, _, _ in operations}
+        while True:
+            map_size = self._env.info()["map_size"]
+            try:
+                with self._guard.transaction(), self._write_latency.time(), self._env.begin(write=True) as txn:
+                    for table, key, value in operations:
+                        if value is None:
+                            txn.delete(key, db=db_instances[table])
+                        else:
+                            txn.put(key, value, db=db_instances[table])
+                return
+            except lmdb.MapFullError:
+                if not self._grow(map_size):
+                    raise
+            except lmdb.MapResizedError:
+                self._adopt_map_size()
+
+    def _grow(self, map_size: int) -> bool:
+        with self._guard.resize():
+            current = self._env.info()["map_size"]
+            if current > map_size:
+                # Another thread has already grown the map while this one was waiting.
+                return True
+
+            if self._max_map_size is not None and current >= self._max_map_size:
+                return False
+
+            new = int(current * self._growth_factor)
+            if self._max_map_size is not None:
+                new = min(new, self._max_map_size)
+
+            self._env.set_mapsize(new)
+            self._resizes += 1
+
+        logger.warning(f"The LMDB map at {self._env.path()!r} is full, so it has been grown from {current} to {new}.")
+        return True
+
+    def _adopt_map_size(self) -> None:
+        # Another process has grown the map, so the new size must be adopted before starting new transactions.
+        with self._guard.resize():
+            self._env.set_mapsize(0)
+
+    async def _aget_table(self, table: str):
+        if table in self._tables:
+            return self._tables[table]
+        # Opening a table requires a write transaction, so it must not be performed on the event loop.
+        return await asyncio.get_running_loop().run_in_executor(self._get_executor(), self._get_table, table)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=type(self).__name__)
+        return self._executor
 
     def _get_table(self, table: str):
         if table in self._tables:
@@ -102,10 +424,50 @@ class MinosStorageLmdb(MinosStorage):
 
         :param path: Path in which the database is stored.
         :param max_db: Maximum number of available databases.
-        :param map_size: Maximum number of entries to be stored on the database. Default set to 1GB
-        :param kwargs: Additional named arguments.
+        :param map_size: Initial size of the memory map, in bytes. Default set to 1GB. It grows automatically.
+        :param kwargs: Additional named arguments, like ``growth_factor`` and ``max_map_size``.
         :return: A ``MinosStorageLmdb`` instance.
         """
 
         env: lmdb.Environment = lmdb.open(str(path), max_dbs=max_db, map_size=map_size)
         return cls(env, **kwargs)
+
+
+class _ResizeGuard:
+    """Allow any number of concurrent transactions, or a single resize of the memory map."""
+
+    __slots__ = "_condition", "_active", "_resizing"
+
+    def __init__(self):
+        self._condition = threading.Condition()
+        self._active = 0
+        self._resizing = False
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        with self._condition:
+            while self._resizing:
+                self._condition.wait()
+            self._active += 1
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._active -= 1
+                if not self._active:
+                    self._condition.notify_all()
+
+    @contextmanager
+    def resize(self) -> Iterator[None]:
+        with self._condition:
+            while self._resizing:
+                self._condition.wait()
+            self._resizing = True
+            while self._active:
+                self._condition.wait()
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._resizing = False
+                self._condition.notify_all()
@@ -14,6 +14,7 @@ from minos.common import (
     DeclarativeModel,
     MinosModel,
     MissingSentinel,
+    SlottedDeclarativeModel,
 )
 
 
@@ -182,6 +183,45 @@ class Car(DeclarativeModel):
     owner: Optional[list[Owner]]
 
 
+class Measurement(DeclarativeModel):
+    """For testing purposes."""
+
+    value: float
+    samples: list[float]
+
+
+class SlottedOwner(SlottedDeclarativeModel):
+    """For testing purposes."""
+
+    name: str
+    surname: str
+    age: Optional[int]
+
+    @staticmethod
+    def parse_name(value: str) -> str:
+        """For testing purposes."""
+        return value.title() if isinstance(value, str) else value
+
+    @staticmethod
+    def validate_age(value: int) -> bool:
+        """For testing purposes."""
+        return value >= 0
+
+
+class SlottedCar(SlottedDeclarativeModel):
+    """For testing purposes."""
+
+    doors: int
+    color: str
+    owner: Optional[SlottedOwner]
+
+
+class SlottedElectricCar(SlottedCar):
+    """For testing purposes."""
+
+    autonomy: int
+
+
 class Status(str, Enum):
     """For testing purposes."""
 
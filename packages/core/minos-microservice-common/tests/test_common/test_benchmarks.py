@@ -0,0 +1,32 @@
+import unittest
+
+from minos.common.benchmarks import (
+    Case,
+    compare,
+    measure,
+    run,
+)
+
+
+class TestBenchmarks(unittest.TestCase):
+    def test_measure(self):
+        self.assertGreater(measure(lambda: None, repeat=1), 0)
+
+    def test_run(self):
+        observed = run([Case("foo", lambda: None), Case("bar", lambda: None)], repeat=1, pattern="fo")
+
+        self.assertEqual(
+            {"commit", "timestamp", "python", "implementation", "machine", "system"}, observed["metadata"].keys()
+        )
+        self.assertEqual({"foo"}, observed["results"].keys())
+        self.assertEqual({"ops_per_sec", "usec_per_op"}, observed["results"]["foo"].keys())
+
+    def test_compare(self):
+        previous = {"results": {"foo": {"ops_per_sec": 100.0}, "bar": {"ops_per_sec": 100.0}}}
+        current = {"results": {"foo": {"ops_per_sec": 95.0}, "bar": {"ops_per_sec": 50.0}, "baz": {"ops_per_sec": 1.0}}}
+
+        self.assertEqual(["bar"], compare(previous, current, threshold=0.1))
+
+
+if __name__ == "__main__":
+    unittest.main()
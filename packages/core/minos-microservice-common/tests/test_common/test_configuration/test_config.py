@@ -97,6 +97,22 @@ class TestMinosConfig(unittest.TestCase):
         self.assertEqual("localhost", snapshot.host)
         self.assertEqual(5432, snapshot.port)
 
+    def test_config_schema_registry(self):
+        config = MinosConfig(path=self.config_file_path, with_environment=False)
+        schema_registry = config.schema_registry
+        self.assertEqual("order_db", schema_registry.database)
+        self.assertEqual("minos", schema_registry.user)
+        self.assertEqual("min0s", schema_registry.password)
+        self.assertEqual("localhost", schema_registry.host)
+        self.assertEqual(5432, schema_registry.port)
+
+    def test_config_pool_not_defined(self):
+        config = MinosConfig(path=self.config_file_path, with_environment=False)
+        pool = config.pool
+        self.assertEqual(None, pool.minsize)
+        self.assertEqual(None, pool.maxsize)
+        self.assertEqual(None, pool.replenish_interval)
+
     def test_config_discovery(self):
         config = MinosConfig(path=self.config_file_path, with_environment=False)
         discovery = config.discovery
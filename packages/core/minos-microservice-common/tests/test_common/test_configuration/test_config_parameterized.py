@@ -38,3 +38,10 @@ class TestMinosConfigParameterized(unittest.TestCase):
         self.assertEqual("some-type", discovery.client)
         self.assertEqual("some-host", discovery.host)
         self.assertEqual(333, discovery.port)
+
+    def test_config_pool(self):
+        config = MinosConfig(path=self.config_file_path, pool_minsize=2, pool_replenish_interval="0.5")
+        pool = config.pool
+        self.assertEqual(2, pool.minsize)
+        self.assertEqual(None, pool.maxsize)
+        self.assertEqual(0.5, pool.replenish_interval)
@@ -36,3 +36,10 @@ class TestMinosConfigWithEnvironment(unittest.TestCase):
         self.assertEqual("some-type", discovery.client)
         self.assertEqual("some-host", discovery.host)
         self.assertEqual("333", discovery.port)
+
+    @mock.patch.dict(os.environ, {"MINOS_POOL_MINSIZE": "2", "MINOS_POOL_MAXSIZE": "4"})
+    def test_config_pool(self):
+        pool = self.config.pool
+        self.assertEqual(2, pool.minsize)
+        self.assertEqual(4, pool.maxsize)
+        self.assertEqual(None, pool.replenish_interval)
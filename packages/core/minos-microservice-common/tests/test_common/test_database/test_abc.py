@@ -2,11 +2,20 @@ import sys
 import unittest
 
 import aiopg
+from psycopg2 import (
+    IntegrityError,
+)
+from psycopg2.sql import (
+    SQL,
+    Identifier,
+    Placeholder,
+)
 
 from minos.common import (
     DependencyInjector,
     PostgreSqlMinosDatabase,
     PostgreSqlPool,
+    PostgreSqlSession,
 )
 from minos.common.testing import (
     PostgresAsyncTestCase,
@@ -94,6 +103,150 @@ class TestPostgreSqlMinosDatabase(PostgresAsyncTestCase):
 
         self.assertEqual([(3,), (4,), (5,)], observed)
 
+    async def test_submit_many(self):
+        async with PostgreSqlMinosDatabase(**self.repository_db) as database:
+            await database.submit_query("CREATE TABLE foo (id INT NOT NULL);")
+            await database.submit_many("INSERT INTO foo (id) VALUES (%s);", ((i,) for i in range(5)), page_size=2)
+
+            observed = [v async for v in database.submit_query_and_iter("SELECT * FROM foo ORDER BY id;")]
+
+        self.assertEqual([(0,), (1,), (2,), (3,), (4,)], observed)
+
+    async def test_submit_many_locked(self):
+        async with PostgreSqlMinosDatabase(**self.repository_db) as database:
+            await database.submit_query("CREATE TABLE foo (id INT NOT NULL);")
+            await database.submit_many("INSERT INTO foo (id) VALUES (%(id)s);", [{"id": 3}, {"id": 4}], lock=1234)
+
+            observed = [v async for v in database.submit_query_and_iter("SELECT * FROM foo ORDER BY id;")]
+
+        self.assertEqual([(3,), (4,)], observed)
+
+    async def test_submit_many_atomic(self):
+        async with PostgreSqlMinosDatabase(**self.repository_db) as database:
+            await database.submit_query("CREATE TABLE foo (id INT NOT NULL PRIMARY KEY);")
+            with self.assertRaises(IntegrityError):
+                await database.submit_many("INSERT INTO foo (id) VALUES (%s);", [(1,), (2,), (1,)], page_size=1)
+
+            observed = await database.submit_query_and_fetchone("SELECT COUNT(*) FROM foo;")
+
+        self.assertEqual((0,), observed)
+
+    async def test_submit_many_in_session_transaction(self):
+        async with PostgreSqlMinosDatabase(**self.repository_db) as database:
+            await database.submit_query("CREATE TABLE foo (id INT NOT NULL PRIMARY KEY);")
+            async with database.session(transaction=True):
+                await database.submit_query("INSERT INTO foo (id) VALUES (0);")
+                with self.assertRaises(IntegrityError):
+                    await database.submit_many("INSERT INTO foo (id) VALUES (%s);", [(1,), (1,)])
+                await database.submit_many("INSERT INTO foo (id) VALUES (%s);", [(2,), (3,)])
+
+            observed = [v async for v in database.submit_query_and_iter("SELECT * FROM foo ORDER BY id;")]
+
+        self.assertEqual([(0,), (2,), (3,)], observed)
+
+    async def test_session(self):
+        async with PostgreSqlMinosDatabase(**self.repository_db) as database:
+            async with database.session() as session:
+                self.assertIsInstance(session, PostgreSqlSession)
+                pid = session.connection.raw.get_backend_pid()
+                self.assertEqual((pid,), await database.submit_query_and_fetchone("SELECT pg_backend_pid();"))
+                async with database.cursor() as cursor:
+                    self.assertEqual(session.connection, cursor.connection)
+                async with database.locked_cursor("foo") as cursor:
+                    self.assertEqual(session.connection, cursor.connection)
+
+            self.assertEqual(0, len(database.pool._used))
+
+    async def test_session_shared_pool(self):
+        injector = DependencyInjector(self.config, postgresql_pool=PostgreSqlPool)
+        await injector.wire(modules=[sys.modules[__name__]])
+
+        async with PostgreSqlMinosDatabase(**self.repository_db) as one, PostgreSqlMinosDatabase(
+            **self.repository_db
+        ) as two:
+            await one.submit_query("CREATE TABLE foo (id INT NOT NULL);")
+            async with one.session(transaction=True):
+                await one.submit_query("INSERT INTO foo (id) VALUES (1);")
+                # The uncommitted row is only visible from the same connection.
+                observed = await two.submit_query_and_fetchone("SELECT COUNT(*) FROM foo;")
+
+        await injector.unwire()
+
+        self.assertEqual((1,), observed)
+
+    async def test_session_transaction_rollback(self):
+        async with PostgreSqlMinosDatabase(**self.repository_db) as database:
+            await database.submit_query("CREATE TABLE foo (id INT NOT NULL);")
+            with self.assertRaises(ValueError):
+                async with database.session(transaction=True):
+                    await database.submit_query("INSERT INTO foo (id) VALUES (1);")
+                    raise ValueError()
+
+            observed = await database.submit_query_and_fetchone("SELECT COUNT(*) FROM foo;")
+
+        self.assertEqual((0,), observed)
+
+    async def test_insert_many(self):
+        async with PostgreSqlMinosDatabase(**self.repository_db) as database:
+            await database.submit_query("CREATE TABLE foo (id INT NOT NULL, name TEXT);")
+            count = await database.insert_many("foo", ["id", "name"], ((i, str(i)) for i in range(7)), page_size=3)
+
+            observed = [v async for v in database.submit_query_and_iter("SELECT * FROM foo ORDER BY id;")]
+
+        self.assertEqual(7, count)
+        self.assertEqual([(i, str(i)) for i in range(7)], observed)
+
+    def test_build_insert_many(self):
+        operation, parameters = PostgreSqlMinosDatabase.build_insert_many(
+            "public.foo", ["id", "name"], [(1, "one"), (2, "two")], returning=["id"]
+        )
+
+        self.assertEqual(
+            SQL("INSERT INTO {} ({}) VALUES {} RETURNING {}").format(
+                Identifier("public", "foo"),
+                SQL(", ").join([Identifier("id"), Identifier("name")]),
+                SQL(", ").join([SQL("({})").format(SQL(", ").join(Placeholder() * 2))] * 2),
+                SQL(", ").join([Identifier("id")]),
+            ),
+            operation,
+        )
+        self.assertEqual((1, "one", 2, "two"), parameters)
+
+    def test_build_insert_many_raises(self):
+        with self.assertRaises(ValueError):
+            PostgreSqlMinosDatabase.build_insert_many("foo", ["id", "name"], [])
+        with self.assertRaises(ValueError):
+            PostgreSqlMinosDatabase.build_insert_many("foo", ["id", "name"], [(1,)])
+
+    async def test_build_insert_many_returning(self):
+        async with PostgreSqlMinosDatabase(**self.repository_db) as database:
+            await database.submit_query("CREATE TABLE foo (id SERIAL PRIMARY KEY, name TEXT NOT NULL);")
+
+            operation, parameters = database.build_insert_many("foo", ["name"], [("one",), ("two",)], returning=["id"])
+            observed = [v async for v in database.submit_query_and_iter(operation, parameters)]
+
+        self.assertEqual([(1,), (2,)], observed)
+
+    async def test_submit_query_prepared(self):
+        async with PostgreSqlMinosDatabase(**self.repository_db) as database:
+            await database.submit_query("CREATE TABLE foo (id INT NOT NULL);")
+            for i in range(database.pool.prepare_threshold + 1):
+                await database.submit_query("INSERT INTO foo (id) VALUES (%s);", (i,))
+
+            observed = [v async for v in database.submit_query_and_iter("SELECT statement FROM pg_prepared_statements")]
+            count = await database.submit_query_and_fetchone("SELECT COUNT(*) FROM foo;")
+
+        self.assertEqual([("PREPARE minos_0 AS INSERT INTO foo (id) VALUES ($1)",)], observed)
+        self.assertEqual((database.pool.prepare_threshold + 1,), count)
+
+    async def test_execute(self):
+        async with PostgreSqlMinosDatabase(**self.repository_db) as database:
+            async with database.cursor() as cursor:
+                await database.execute(cursor, "SELECT %s::INT + 1;", (3,))
+                observed = await cursor.fetchone()
+
+        self.assertEqual((4,), observed)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,4 +1,13 @@
 import unittest
+from asyncio import (
+    create_task,
+    gather,
+    sleep,
+)
+from unittest.mock import (
+    MagicMock,
+    patch,
+)
 
 import aiopg
 from aiopg import (
@@ -6,8 +15,17 @@ from aiopg import (
 )
 
 from minos.common import (
+    METRICS_REGISTRY,
     Lock,
+    LockMetrics,
+    MinosLockException,
+    MinosLockTimeoutException,
     PostgreSqlLock,
+    PostgreSqlPool,
+    stable_hash,
+)
+from minos.common.database.locks import (
+    _LocalLock,
 )
 from minos.common.testing import (
     PostgresAsyncTestCase,
@@ -41,13 +59,146 @@ class TestPostgreSqlLock(PostgresAsyncTestCase):
     async def test_hashed_key(self):
         wrapped_connection = aiopg.connect(**self.repository_db)
         lock = PostgreSqlLock(wrapped_connection, "foo")
-        self.assertEqual(hash("foo"), lock.hashed_key)
+        self.assertEqual(stable_hash("foo"), lock.hashed_key)
 
     async def test_cursor(self):
         wrapped_connection = aiopg.connect(**self.repository_db)
         async with PostgreSqlLock(wrapped_connection, "foo") as lock:
             self.assertIsInstance(lock.cursor, Cursor)
 
+    async def test_release_on_error(self):
+        wrapped_connection = aiopg.connect(**self.repository_db)
+        with self.assertRaises(ValueError):
+            async with PostgreSqlLock(wrapped_connection, "foo"):
+                raise ValueError()
+
+        self.assertEqual(dict(), _LocalLock._locks)
+
+    async def test_coalescing(self):
+        observed = list()
+
+        async def _fn(pool: PostgreSqlPool) -> None:
+            async with PostgreSqlLock(pool.acquire(), "foo"):
+                observed.append(len(pool._used))
+                await sleep(0.01)
+
+        async with PostgreSqlPool(**self.repository_db) as pool:
+            await gather(*(_fn(pool) for _ in range(10)))
+
+            self.assertEqual([1] * 10, observed)
+            self.assertEqual(1, len(pool))
+        self.assertEqual(dict(), _LocalLock._locks)
+
+    async def test_distinct_keys(self):
+        async with PostgreSqlPool(**self.repository_db) as pool:
+            async with PostgreSqlLock(pool.acquire(), "foo"):
+                async with PostgreSqlLock(pool.acquire(), "bar"):
+                    self.assertEqual(2, len(pool._used))
+
+    async def test_reentrant(self):
+        async with PostgreSqlPool(**self.repository_db) as pool:
+            async with pool.acquire() as connection:
+                async with PostgreSqlLock(_Connection(connection), "foo"):
+                    async with PostgreSqlLock(_Connection(connection), "foo") as lock:
+                        await lock.cursor.execute("SELECT COUNT(*) FROM pg_locks WHERE locktype = 'advisory';")
+                        self.assertEqual((1,), await lock.cursor.fetchone())
+
+        self.assertEqual(dict(), _LocalLock._locks)
+
+    async def test_scope(self):
+        async with PostgreSqlLock(aiopg.connect(**self.repository_db), "foo", scope="one"):
+            self.assertEqual({("one", stable_hash("foo"))}, _LocalLock._locks.keys())
+
+        self.assertEqual(dict(), _LocalLock._locks)
+
+    async def test_reentrant_other_connection_raises(self):
+        async with PostgreSqlPool(**self.repository_db) as pool:
+            async with PostgreSqlLock(pool.acquire(), "foo"):
+                with self.assertRaises(MinosLockException):
+                    async with PostgreSqlLock(pool.acquire(), "foo"):
+                        pass
+                self.assertEqual(1, len(pool._used))
+
+        self.assertEqual(dict(), _LocalLock._locks)
+
+    async def test_timeout_advisory(self):
+        async with aiopg.connect(**self.repository_db) as other:
+            async with other.cursor() as cursor:
+                await cursor.execute("SELECT pg_advisory_lock(%s);", (stable_hash("foo"),))
+
+            lock = PostgreSqlLock(aiopg.connect(**self.repository_db), "foo", timeout=0.1, backoff=0.02)
+            with self.assertRaises(MinosLockTimeoutException):
+                async with lock:
+                    pass
+
+        self.assertIsNone(lock.cursor)
+        self.assertEqual(dict(), _LocalLock._locks)
+
+    async def test_timeout_local(self):
+        async def _fn() -> None:
+            async with PostgreSqlLock(wrapped_connection, "foo", timeout=0.1):
+                pass
+
+        wrapped_connection = MagicMock()
+        async with PostgreSqlLock(aiopg.connect(**self.repository_db), "foo"):
+            with self.assertRaises(MinosLockTimeoutException):
+                await create_task(_fn())
+
+            self.assertEqual(1, _LocalLock._locks[(None, stable_hash("foo"))].references)
+        self.assertEqual(0, wrapped_connection.__aenter__.call_count)
+
+    async def test_timeout_zero(self):
+        async with PostgreSqlLock(aiopg.connect(**self.repository_db), "foo", timeout=0) as lock:
+            self.assertIsInstance(lock.cursor, Cursor)
+
+    async def test_backoff(self):
+        async def _release(cursor) -> None:
+            await sleep(0.1)
+            await cursor.execute("SELECT pg_advisory_unlock(%s);", (stable_hash("foo"),))
+
+        async with aiopg.connect(**self.repository_db) as other:
+            async with other.cursor() as cursor:
+                await cursor.execute("SELECT pg_advisory_lock(%s);", (stable_hash("foo"),))
+                lock = PostgreSqlLock(aiopg.connect(**self.repository_db), "foo", timeout=5, backoff=0.01)
+
+                async def _acquire() -> None:
+                    async with lock:
+                        pass
+
+                await gather(_acquire(), _release(cursor))
+
+    async def test_metrics(self):
+        async def _fn() -> None:
+            async with PostgreSqlLock(aiopg.connect(**self.repository_db), "foo", timeout=0):
+                pass
+
+        metrics = LockMetrics()
+        with patch.object(PostgreSqlLock, "metrics", metrics):
+            async with PostgreSqlLock(aiopg.connect(**self.repository_db), "foo"):
+                with self.assertRaises(MinosLockTimeoutException):
+                    await create_task(_fn())
+
+        observed = metrics.metrics()["foo"]
+        self.assertEqual(1, observed["acquisitions"])
+        self.assertEqual(1, observed["contentions"])
+        self.assertEqual(1, observed["timeouts"])
+        self.assertEqual(2, observed["wait"]["count"])
+        self.assertEqual(1, observed["hold"]["count"])
+
+    def test_metrics_registered(self):
+        self.assertIn("PostgreSqlLock", METRICS_REGISTRY.collect())
+
+
+class _Connection:
+    def __init__(self, connection):
+        self.connection = connection
+
+    async def __aenter__(self):
+        return self.connection
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        pass
+
 
 if __name__ == "__main__":
     unittest.main()
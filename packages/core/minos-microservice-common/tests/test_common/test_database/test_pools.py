@@ -1,4 +1,7 @@
 import unittest
+from asyncio import (
+    create_task,
+)
 from unittest.mock import (
     PropertyMock,
     patch,
@@ -13,9 +16,12 @@ from psycopg2 import (
 )
 
 from minos.common import (
+    MinosConfig,
+    MinosLockTimeoutException,
     PostgreSqlLock,
     PostgreSqlLockPool,
     PostgreSqlPool,
+    PostgreSqlPreparedStatementCache,
 )
 from minos.common.testing import (
     PostgresAsyncTestCase,
@@ -47,6 +53,21 @@ class TestPostgreSqlPool(PostgresAsyncTestCase):
         self.assertEqual(self.config.repository.host, self.pool.host)
         self.assertEqual(self.config.repository.port, self.pool.port)
 
+    def test_from_config_pool(self):
+        config = MinosConfig(self.CONFIG_FILE_PATH, pool_minsize=2, pool_replenish_interval=0.5)
+        pool = PostgreSqlPool.from_config(config, maxsize=4)
+
+        self.assertEqual(2, pool.minsize)
+        self.assertEqual(4, pool.maxsize)
+        self.assertEqual(0.5, pool.replenish_interval)
+        self.assertFalse(pool.already_setup)
+
+    def test_from_config_pool_overridden(self):
+        config = MinosConfig(self.CONFIG_FILE_PATH, pool_minsize=2)
+        pool = PostgreSqlPool.from_config(config, minsize=1)
+
+        self.assertEqual(1, pool.minsize)
+
     async def test_acquire(self):
         async with self.pool.acquire() as c1:
             self.assertIsInstance(c1, Connection)
@@ -72,6 +93,64 @@ class TestPostgreSqlPool(PostgresAsyncTestCase):
             async with self.pool.acquire() as connection:
                 self.assertIsInstance(connection, Connection)
 
+    async def test_get_prepared_statements(self):
+        async with self.pool.acquire() as connection:
+            statements = self.pool.get_prepared_statements(connection)
+            self.assertIsInstance(statements, PostgreSqlPreparedStatementCache)
+            self.assertEqual(self.pool.prepare_threshold, statements.threshold)
+            self.assertEqual(self.pool.prepared_statements_maxsize, statements.maxsize)
+            self.assertEqual(statements, self.pool.get_prepared_statements(connection))
+
+    async def test_get_prepared_statements_disabled(self):
+        pool = PostgreSqlPool.from_config(self.config, prepare_threshold=None)
+        async with pool:
+            async with pool.acquire() as connection:
+                self.assertIsNone(pool.get_prepared_statements(connection))
+
+    async def test_get_prepared_statements_recycled(self):
+        async with self.pool.acquire() as connection:
+            statements = self.pool.get_prepared_statements(connection)
+
+        await self.pool._destroy_instance(connection)
+
+        self.assertIsNot(statements, self.pool.get_prepared_statements(connection))
+
+    async def test_warm_up(self):
+        async with PostgreSqlPool.from_config(self.config, minsize=2) as pool:
+            self.assertEqual(2, len(pool))
+            self.assertEqual(2, pool._instances.qsize())
+            self.assertEqual(2, pool.creations)
+
+    async def test_check_instance_idle(self):
+        pool = PostgreSqlPool.from_config(self.config, health_check_interval=0)
+        async with pool:
+            async with pool.acquire() as c1:
+                pass
+            await c1.close()
+            async with pool.acquire() as c2:
+                self.assertIsNot(c1, c2)
+                self.assertFalse(c2.closed)
+
+        self.assertEqual(1, pool.failed_checks)
+
+    async def test_check_instance_ping_failure(self):
+        pool = PostgreSqlPool.from_config(self.config, health_check_interval=0)
+        async with pool:
+            async with pool.acquire() as connection:
+                pass
+
+            with patch("aiopg.Cursor.execute", side_effect=OperationalError):
+                self.assertFalse(await pool._check_instance(connection))
+            self.assertTrue(await pool._check_instance(connection))
+
+    async def test_metrics(self):
+        async with self.pool.acquire():
+            observed = self.pool.metrics()
+
+        self.assertEqual(self.config.repository.database, observed["database"])
+        self.assertEqual(0, observed["prepared_statements"])
+        self.assertEqual(1, observed["in_use"])
+
 
 class TestPostgreSqlLockPool(PostgresAsyncTestCase):
     CONFIG_FILE_PATH = BASE_PATH / "test_config.yml"
@@ -92,6 +171,21 @@ class TestPostgreSqlLockPool(PostgresAsyncTestCase):
         async with self.pool.acquire("foo") as lock:
             self.assertIsInstance(lock, PostgreSqlLock)
             self.assertEqual("foo", lock.key)
+            self.assertIsNone(lock.timeout)
+
+    async def test_acquire_timeout(self):
+        async def _fn() -> None:
+            async with self.pool.acquire("foo", timeout=0.05):
+                pass
+
+        async with self.pool.acquire("foo"):
+            with self.assertRaises(MinosLockTimeoutException):
+                await create_task(_fn())
+
+    async def test_acquire_scope(self):
+        self.assertEqual((self.pool.host, self.pool.port, self.pool.database), self.pool.address)
+        async with self.pool.acquire("foo") as lock:
+            self.assertEqual(self.pool.address, lock.scope)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,139 @@
+import unittest
+from asyncio import (
+    create_task,
+)
+
+from minos.common import (
+    POSTGRESQL_SESSION_CONTEXT_VAR,
+    PostgreSqlPool,
+    PostgreSqlSession,
+)
+from minos.common.testing import (
+    PostgresAsyncTestCase,
+)
+from tests.utils import (
+    BASE_PATH,
+)
+
+
+class TestPostgreSqlSession(PostgresAsyncTestCase):
+    CONFIG_FILE_PATH = BASE_PATH / "test_config.yml"
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.pool = PostgreSqlPool.from_config(self.config)
+
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        await self.pool.setup()
+        async with self.pool.acquire() as connection:
+            async with connection.cursor() as cursor:
+                await cursor.execute("CREATE TABLE foo (id INT NOT NULL);")
+
+    async def asyncTearDown(self):
+        await self.pool.destroy()
+        await super().asyncTearDown()
+
+    async def _count(self) -> int:
+        async with self.pool.acquire() as connection:
+            async with connection.cursor() as cursor:
+                await cursor.execute("SELECT COUNT(*) FROM foo;")
+                return (await cursor.fetchone())[0]
+
+    async def test_enter(self):
+        self.assertIsNone(PostgreSqlSession.get_current(self.pool))
+
+        async with PostgreSqlSession(self.pool) as session:
+            self.assertEqual(session, POSTGRESQL_SESSION_CONTEXT_VAR.get())
+            self.assertEqual(session, PostgreSqlSession.get_current(self.pool))
+            self.assertEqual(1, len(self.pool._used))
+
+            async with PostgreSqlSession(self.pool) as inner:
+                self.assertEqual(session.connection, inner.connection)
+                self.assertEqual(1, len(self.pool._used))
+
+            self.assertEqual(session, PostgreSqlSession.get_current(self.pool))
+
+        self.assertIsNone(PostgreSqlSession.get_current(self.pool))
+        self.assertIsNone(session.connection)
+        self.assertEqual(0, len(self.pool._used))
+
+    async def test_acquire(self):
+        async with PostgreSqlSession(self.pool) as session:
+            async with session.acquire() as connection:
+                self.assertEqual(session.connection, connection)
+            self.assertFalse(connection.closed)
+
+    async def test_acquire_raises(self):
+        with self.assertRaises(ValueError):
+            async with PostgreSqlSession(self.pool).acquire():
+                pass
+
+    async def test_other_task(self):
+        async def _fn():
+            return PostgreSqlSession.get_current(self.pool)
+
+        async with PostgreSqlSession(self.pool):
+            self.assertIsNone(await create_task(_fn()))
+
+    async def test_transaction_commit(self):
+        async with PostgreSqlSession(self.pool, transaction=True) as session:
+            async with session.connection.cursor() as cursor:
+                await cursor.execute("INSERT INTO foo (id) VALUES (1);")
+            self.assertEqual(0, await self._count())
+
+        self.assertEqual(1, await self._count())
+
+    async def test_transaction_rollback(self):
+        with self.assertRaises(ValueError):
+            async with PostgreSqlSession(self.pool, transaction=True) as session:
+                async with session.connection.cursor() as cursor:
+                    await cursor.execute("INSERT INTO foo (id) VALUES (1);")
+                raise ValueError()
+
+        self.assertEqual(0, await self._count())
+
+    async def test_transaction_nested(self):
+        async with PostgreSqlSession(self.pool, transaction=True) as session:
+            async with session.connection.cursor() as cursor:
+                await cursor.execute("INSERT INTO foo (id) VALUES (1);")
+
+            with self.assertRaises(ValueError):
+                async with PostgreSqlSession(self.pool, transaction=True):
+                    async with session.connection.cursor() as cursor:
+                        await cursor.execute("INSERT INTO foo (id) VALUES (2);")
+                    raise ValueError()
+
+            async with PostgreSqlSession(self.pool, transaction=True):
+                async with session.connection.cursor() as cursor:
+                    await cursor.execute("INSERT INTO foo (id) VALUES (3);")
+
+        async with self.pool.acquire() as connection:
+            async with connection.cursor() as cursor:
+                await cursor.execute("SELECT id FROM foo ORDER BY id;")
+                self.assertEqual([(1,), (3,)], await cursor.fetchall())
+
+    async def test_lock(self):
+        query = "SELECT COUNT(*) FROM pg_locks WHERE locktype = 'advisory';"
+
+        async with PostgreSqlSession(self.pool, lock="foo") as session:
+            async with session.connection.cursor() as cursor:
+                await cursor.execute(query)
+                self.assertEqual((1,), await cursor.fetchone())
+
+        async with self.pool.acquire() as connection:
+            async with connection.cursor() as cursor:
+                await cursor.execute(query)
+                self.assertEqual((0,), await cursor.fetchone())
+
+    async def test_release_discards_transaction(self):
+        async with PostgreSqlSession(self.pool) as session:
+            async with session.connection.cursor() as cursor:
+                await cursor.execute("BEGIN;")
+                await cursor.execute("INSERT INTO foo (id) VALUES (1);")
+
+        self.assertEqual(0, await self._count())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,160 @@
+import unittest
+
+import aiopg
+from psycopg2 import (
+    IntegrityError,
+)
+from psycopg2.sql import (
+    SQL,
+    Identifier,
+)
+
+from minos.common import (
+    PostgreSqlPreparedStatementCache,
+)
+from minos.common.testing import (
+    PostgresAsyncTestCase,
+)
+from tests.utils import (
+    BASE_PATH,
+)
+
+
+class TestPostgreSqlPreparedStatementCache(PostgresAsyncTestCase):
+    CONFIG_FILE_PATH = BASE_PATH / "test_config.yml"
+
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        self.connection = await aiopg.connect(**self.repository_db)
+        self.cursor = await self.connection.cursor()
+        await self.cursor.execute("CREATE TABLE foo (id INT NOT NULL PRIMARY KEY, name TEXT NOT NULL);")
+
+    async def asyncTearDown(self):
+        self.cursor.close()
+        await self.connection.close()
+        await super().asyncTearDown()
+
+    async def _get_prepared(self) -> list[str]:
+        await self.cursor.execute("SELECT statement FROM pg_prepared_statements ORDER BY prepare_time;")
+        return [row[0] async for row in self.cursor]
+
+    async def test_execute_threshold(self):
+        statements = PostgreSqlPreparedStatementCache(threshold=2)
+
+        await statements.execute(self.cursor, "INSERT INTO foo (id, name) VALUES (%s, %s);", (1, "one"))
+        self.assertEqual(0, len(statements))
+        self.assertEqual([], await self._get_prepared())
+
+        await statements.execute(self.cursor, "INSERT INTO foo (id, name) VALUES (%s, %s);", (2, "two"))
+        await statements.execute(self.cursor, "INSERT INTO foo (id, name) VALUES (%s, %s);", (3, "three"))
+        self.assertEqual(1, len(statements))
+        self.assertEqual(["PREPARE minos_0 AS INSERT INTO foo (id, name) VALUES ($1, $2)"], await self._get_prepared())
+
+        await self.cursor.execute("SELECT * FROM foo ORDER BY id;")
+        self.assertEqual([(1, "one"), (2, "two"), (3, "three")], await self.cursor.fetchall())
+
+    async def test_execute_named_parameters(self):
+        statements = PostgreSqlPreparedStatementCache(threshold=1)
+        await self.cursor.execute("INSERT INTO foo (id, name) VALUES (1, 'one'), (2, 'two');")
+
+        query = "SELECT name FROM foo WHERE id = %(id)s OR (id > %(id)s AND name LIKE %(name)s) ORDER BY id;"
+        await statements.execute(self.cursor, query, {"id": 1, "name": "%w%"})
+
+        self.assertEqual([("one",), ("two",)], await self.cursor.fetchall())
+        self.assertEqual(
+            ["PREPARE minos_0 AS SELECT name FROM foo WHERE id = $1 OR (id > $1 AND name LIKE $2) ORDER BY id"],
+            await self._get_prepared(),
+        )
+
+    async def test_execute_composed(self):
+        statements = PostgreSqlPreparedStatementCache(threshold=1)
+        await self.cursor.execute("INSERT INTO foo (id, name) VALUES (1, 'one');")
+
+        query = SQL("SELECT {} FROM foo WHERE id = %s").format(Identifier("name"))
+        for _ in range(2):
+            await statements.execute(self.cursor, query, (1,))
+            self.assertEqual([("one",)], await self.cursor.fetchall())
+
+        self.assertEqual(1, len(statements))
+
+    async def test_execute_not_preparable(self):
+        statements = PostgreSqlPreparedStatementCache(threshold=1)
+        await self.cursor.execute("INSERT INTO foo (id, name) VALUES (1, 'one'), (2, 'two');")
+
+        await statements.execute(self.cursor, "SELECT name FROM foo WHERE id IN %s ORDER BY id;", ((1, 2),))
+        self.assertEqual([("one",), ("two",)], await self.cursor.fetchall())
+
+        await statements.execute(self.cursor, "CREATE TABLE bar (id INT NOT NULL);")
+        await statements.execute(self.cursor, "SELECT 1; SELECT 2;")
+
+        self.assertEqual(0, len(statements))
+        self.assertEqual([], await self._get_prepared())
+
+    async def test_execute_prepare_failure(self):
+        statements = PostgreSqlPreparedStatementCache(threshold=1)
+
+        # The type of the parameter cannot be determined, so the statement cannot be prepared.
+        await statements.execute(self.cursor, "SELECT %s + %s;", (1, 2))
+
+        self.assertEqual([(3,)], await self.cursor.fetchall())
+        self.assertEqual(0, len(statements))
+
+    async def test_execute_in_transaction(self):
+        statements = PostgreSqlPreparedStatementCache(threshold=1)
+
+        async with self.cursor.begin():
+            await statements.execute(self.cursor, "SELECT %s + %s;", (1, 2))
+            self.assertEqual([(3,)], await self.cursor.fetchall())
+            await statements.execute(self.cursor, "INSERT INTO foo (id, name) VALUES (%s, %s);", (1, "one"))
+
+        self.assertEqual(1, len(statements))
+        await self.cursor.execute("SELECT * FROM foo;")
+        self.assertEqual([(1, "one")], await self.cursor.fetchall())
+
+    async def test_execute_raises(self):
+        statements = PostgreSqlPreparedStatementCache(threshold=1)
+        await statements.execute(self.cursor, "INSERT INTO foo (id, name) VALUES (%s, %s);", (1, "one"))
+
+        with self.assertRaises(IntegrityError):
+            await statements.execute(self.cursor, "INSERT INTO foo (id, name) VALUES (%s, %s);", (1, "one"))
+
+        self.assertEqual(1, len(statements))
+
+    async def test_execute_reset(self):
+        statements = PostgreSqlPreparedStatementCache(threshold=1)
+        await statements.execute(self.cursor, "INSERT INTO foo (id, name) VALUES (%s, %s);", (1, "one"))
+
+        await self.cursor.execute("DEALLOCATE ALL;")
+        await statements.execute(self.cursor, "INSERT INTO foo (id, name) VALUES (%s, %s);", (2, "two"))
+
+        self.assertEqual(0, len(statements))
+        await self.cursor.execute("SELECT COUNT(*) FROM foo;")
+        self.assertEqual((2,), await self.cursor.fetchone())
+
+    async def test_execute_maxsize(self):
+        statements = PostgreSqlPreparedStatementCache(maxsize=2, threshold=1)
+
+        for i in range(4):
+            await statements.execute(self.cursor, f"SELECT name AS name_{i} FROM foo WHERE id = %s;", (i,))
+
+        self.assertEqual(2, len(statements))
+        self.assertEqual(
+            [
+                "PREPARE minos_2 AS SELECT name AS name_2 FROM foo WHERE id = $1",
+                "PREPARE minos_3 AS SELECT name AS name_3 FROM foo WHERE id = $1",
+            ],
+            await self._get_prepared(),
+        )
+
+    async def test_clear(self):
+        statements = PostgreSqlPreparedStatementCache(threshold=1)
+        await statements.execute(self.cursor, "SELECT * FROM foo WHERE id = %s;", (1,))
+        self.assertEqual(1, len(statements))
+
+        statements.clear()
+
+        self.assertEqual(0, len(statements))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,8 @@
 import sys
 import unittest
+from asyncio import (
+    sleep,
+)
 from unittest.mock import (
     MagicMock,
     call,
@@ -8,17 +11,55 @@ from unittest.mock import (
 from dependency_injector.containers import (
     Container,
 )
+from dependency_injector.wiring import (
+    Provide,
+)
 
 from minos.common import (
     DependencyInjector,
     MinosConfig,
+    MinosSetup,
     classname,
+    get_injection_markers,
 )
 from tests.utils import (
     BASE_PATH,
     FakeLockPool,
 )
 
+EVENTS = list()
+
+
+class _Base(MinosSetup):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.other = None
+
+    async def _setup(self) -> None:
+        EVENTS.append(("setup_start", type(self).__name__))
+        await sleep(0.01)
+        EVENTS.append(("setup_end", type(self).__name__))
+
+    async def _destroy(self) -> None:
+        EVENTS.append(("destroy_start", type(self).__name__))
+        await sleep(0.01)
+        EVENTS.append(("destroy_end", type(self).__name__))
+
+
+class _Pool(_Base):
+    pass
+
+
+class _Repository(_Base):
+    def __init__(self, pool: MinosSetup, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.pool = pool
+
+
+class _Publisher(_Base):
+    def get_pool(self, pool: MinosSetup = Provide["pool"]) -> MinosSetup:
+        return pool
+
 
 class TestMinosDependencyInjector(unittest.IsolatedAsyncioTestCase):
     def setUp(self) -> None:
@@ -65,6 +106,76 @@ class TestMinosDependencyInjector(unittest.IsolatedAsyncioTestCase):
         await injector.unwire()
         self.assertEqual(1, mock.call_count)
 
+    def test_dependencies(self):
+        injector = DependencyInjector(self.config, pool=_Pool, repository=_Repository, publisher=_Publisher, foo=1)
+
+        expected = {"pool": tuple(), "repository": ("pool",), "publisher": ("pool",), "foo": tuple()}
+        self.assertEqual(expected, injector.dependencies)
+
+    def test_dependencies_order(self):
+        pool = _Pool()
+        injector = DependencyInjector(self.config, repository=_Repository(pool), pool=pool)
+
+        self.assertEqual(["pool", "repository"], list(injector.dependencies))
+        self.assertEqual({"pool": tuple(), "repository": ("pool",)}, injector.dependencies)
+
+    def test_dependencies_nested(self):
+        pool = _Pool()
+        wrapper = _Pool()
+        wrapper.other = _Repository(pool)
+        injector = DependencyInjector(self.config, pool=pool, wrapper=wrapper)
+
+        self.assertEqual({"pool": tuple(), "wrapper": ("pool",)}, injector.dependencies)
+
+    def test_dependencies_cycle(self):
+        one, two = _Pool(), _Pool()
+        one.other, two.other = two, one
+        injector = DependencyInjector(self.config, one=one, two=two)
+
+        with self.assertLogs("minos.common.injectors", level="WARNING"):
+            observed = injector.dependencies
+
+        self.assertEqual({"one": tuple(), "two": ("one",)}, observed)
+
+    async def test_wire_unwire_order(self):
+        EVENTS.clear()
+        injector = DependencyInjector(self.config, pool=_Pool, repository=_Repository, publisher=_Publisher)
+
+        with self.assertLogs("minos.common.injectors", level="INFO") as logs:
+            await injector.wire(modules=[sys.modules[__name__]])
+        self.assertIn("'repository'", logs.output[0])
+
+        self.assertEqual(("setup_start", "_Pool"), EVENTS[0])
+        self.assertEqual(("setup_end", "_Pool"), EVENTS[1])
+        # The independent injections are set up concurrently.
+        self.assertEqual({("setup_start", "_Repository"), ("setup_start", "_Publisher")}, set(EVENTS[2:4]))
+
+        EVENTS.clear()
+        await injector.unwire()
+
+        self.assertEqual({("destroy_start", "_Repository"), ("destroy_start", "_Publisher")}, set(EVENTS[:2]))
+        self.assertEqual(("destroy_start", "_Pool"), EVENTS[4])
+        self.assertEqual(("destroy_end", "_Pool"), EVENTS[5])
+
+
+class TestGetInjectionMarkers(unittest.TestCase):
+    def test_function(self):
+        self.assertEqual({"pool"}, get_injection_markers(_Publisher.get_pool))
+
+    def test_static_and_class_methods(self):
+        def _fn(lock_pool=Provide["lock_pool"], *, pool=Provide["pool"]):
+            pass
+
+        self.assertEqual({"lock_pool", "pool"}, get_injection_markers(staticmethod(_fn)))
+        self.assertEqual({"lock_pool", "pool"}, get_injection_markers(classmethod(_fn)))
+
+    def test_property(self):
+        self.assertEqual({"pool"}, get_injection_markers(property(_Publisher.get_pool)))
+
+    def test_without_markers(self):
+        self.assertEqual(set(), get_injection_markers(_Repository.__init__))
+        self.assertEqual(set(), get_injection_markers(1))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,5 +1,13 @@
+import importlib
+import json
 import unittest
 import warnings
+from pathlib import (
+    Path,
+)
+from tempfile import (
+    TemporaryDirectory,
+)
 from unittest.mock import (
     AsyncMock,
     call,
@@ -83,13 +91,30 @@ class TestEntrypointLauncher(PostgresAsyncTestCase):
         from minos import (
             common,
         )
+        from minos.common import (
+            database,
+            setup,
+        )
 
         self.assertEqual(0, len(mock.call_args.args))
         self.assertEqual(1, len(mock.call_args.kwargs))
         observed = mock.call_args.kwargs["modules"]
 
         self.assertIn(tests, observed)
-        self.assertIn(common, observed)
+        self.assertIn(database.abc, observed)
+        self.assertIn(setup, observed)
+        self.assertNotIn(common, observed)
+        self.assertNotIn(database.pools, observed)
+
+        await self.launcher.destroy()
+
+    async def test_setup_imports_packages(self):
+        self.launcher.injector.wire = AsyncMock()
+
+        with patch("importlib.import_module", side_effect=importlib.import_module) as mock:
+            await self.launcher.setup()
+
+        self.assertIn(call("minos.common"), mock.call_args_list)
 
         await self.launcher.destroy()
 
@@ -126,6 +151,33 @@ class TestEntrypointLauncher(PostgresAsyncTestCase):
         self.assertEqual(1, mock_entrypoint.call_count)
         self.assertEqual(1, mock_loop.call_count)
 
+    def test_launch_startup_report(self):
+        with TemporaryDirectory() as directory:
+            report_path, profile_path = Path(directory) / "startup.json", Path(directory) / "startup.prof"
+            with patch.dict("os.environ", {"MINOS_STARTUP_REPORT": str(report_path)}):
+                launcher = EntrypointLauncher(
+                    config=self.config,
+                    injections=self.injections,
+                    services=self.services,
+                    startup_profile_path=profile_path,
+                )
+            launcher.setup = AsyncMock()
+            launcher.destroy = AsyncMock()
+
+            with patch("minos.common.launchers._create_loop", return_value=FakeLoop()):
+                with patch("minos.common.launchers._create_entrypoint", return_value=FakeEntrypoint()):
+                    with warnings.catch_warnings():
+                        warnings.simplefilter("ignore")
+
+                        with self.assertLogs("minos.common.launchers", level="INFO") as logs:
+                            launcher.launch()
+
+            report = json.loads(report_path.read_text())
+            self.assertTrue(profile_path.exists())
+
+        self.assertEqual(("launch", "EntrypointLauncher"), (report["action"], report["name"]))
+        self.assertIn("The startup took", "\n".join(logs.output))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,7 +1,15 @@
+import os
+import subprocess
+import sys
 import unittest
+from uuid import (
+    UUID,
+)
 
 from minos.common import (
     Lock,
+    LockMetrics,
+    stable_hash,
 )
 from tests.utils import (
     FakeLock,
@@ -23,7 +31,59 @@ class TestLock(unittest.TestCase):
 
     def test_hashed_key(self):
         lock = FakeLock("foo")
-        self.assertEqual(hash("foo"), lock.hashed_key)
+        self.assertEqual(stable_hash("foo"), lock.hashed_key)
+
+    def test_hashed_key_int(self):
+        lock = FakeLock(56)
+        self.assertEqual(56, lock.hashed_key)
+
+
+class TestStableHash(unittest.TestCase):
+    def test_stable_hash(self):
+        self.assertEqual(3761932507381599811, stable_hash("aggregate_event_write_lock"))
+
+    def test_stable_hash_range(self):
+        for key in ("foo", b"foo", ("foo", 1), UUID("c7b6b1b3-58a8-4e4f-9f5c-e9d0a8f4b3a6")):
+            self.assertTrue(-(2**63) <= stable_hash(key) < 2**63)
+
+    def test_stable_hash_distinct(self):
+        self.assertNotEqual(stable_hash("foo"), stable_hash(b"foo"))
+        self.assertNotEqual(stable_hash("foo"), stable_hash(("foo",)))
+
+    def test_stable_hash_across_processes(self):
+        code = "from minos.common import stable_hash; print(stable_hash('foo'))"
+        observed = set()
+        for seed in ("1", "2"):
+            env = os.environ | {"PYTHONHASHSEED": seed}
+            output = subprocess.check_output([sys.executable, "-c", code], env=env)
+            observed.add(int(output.split()[0]))
+
+        self.assertEqual({stable_hash("foo")}, observed)
+
+
+class TestLockMetrics(unittest.TestCase):
+    def test_observe(self):
+        metrics = LockMetrics()
+        metrics.observe_acquisition("foo", 0.001, contended=False)
+        metrics.observe_acquisition("foo", 0.3, contended=True)
+        metrics.observe_timeout("foo", 1.0)
+        metrics.observe_release("foo", 0.02)
+
+        observed = metrics.metrics()["foo"]
+        self.assertEqual(2, observed["acquisitions"])
+        self.assertEqual(2, observed["contentions"])
+        self.assertEqual(1, observed["timeouts"])
+        self.assertEqual(3, observed["wait"]["count"])
+        self.assertAlmostEqual(1.301, observed["wait"]["sum"])
+        self.assertEqual(1, observed["hold"]["count"])
+
+    def test_maxsize(self):
+        metrics = LockMetrics(maxsize=2)
+        for key in ("foo", "bar", "foo", "baz"):
+            metrics.observe_release(key, 0.1)
+
+        self.assertEqual(2, len(metrics))
+        self.assertEqual({"foo", "baz"}, metrics.metrics().keys())
 
 
 if __name__ == "__main__":
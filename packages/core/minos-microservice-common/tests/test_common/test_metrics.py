@@ -0,0 +1,100 @@
+import unittest
+from unittest.mock import (
+    patch,
+)
+
+from minos.common import (
+    METRICS_REGISTRY,
+    Histogram,
+    MetricsRegistry,
+    MetricsSource,
+)
+
+
+class _Source(MetricsSource):
+    def __init__(self, value: int):
+        self.value = value
+
+    def metrics(self):
+        return {"value": self.value}
+
+
+class TestHistogram(unittest.TestCase):
+    def test_constructor(self):
+        histogram = Histogram([0.5, 0.1])
+
+        self.assertEqual((0.1, 0.5), histogram.bounds)
+        self.assertEqual([0, 0, 0], histogram.counts)
+        self.assertEqual(0, histogram.count)
+        self.assertEqual(0.0, histogram.sum)
+
+    def test_observe(self):
+        histogram = Histogram([0.1, 0.5])
+        for value in (0.05, 0.1, 0.3, 0.7, 2.0):
+            histogram.observe(value)
+
+        self.assertEqual([2, 1, 2], histogram.counts)
+        self.assertEqual(5, histogram.count)
+        self.assertAlmostEqual(3.15, histogram.sum)
+
+    def test_time(self):
+        histogram = Histogram([0.1, 0.5])
+
+        with patch("minos.common.metrics.perf_counter", side_effect=[1.0, 1.25]):
+            with histogram.time():
+                pass
+
+        self.assertEqual([0, 1, 0], histogram.counts)
+        self.assertEqual(0.25, histogram.sum)
+
+    def test_as_dict(self):
+        histogram = Histogram([0.1, 0.5])
+        histogram.observe(0.3)
+
+        expected = {"buckets": {"0.1": 0, "0.5": 1, "+Inf": 0}, "count": 1, "sum": 0.3}
+        self.assertEqual(expected, histogram.as_dict())
+
+    def test_repr(self):
+        histogram = Histogram()
+        histogram.observe(2)
+
+        self.assertEqual("Histogram(count=1, sum=2.0)", repr(histogram))
+
+
+class TestMetricsRegistry(unittest.TestCase):
+    def test_default(self):
+        self.assertIsInstance(METRICS_REGISTRY, MetricsRegistry)
+
+    def test_collect(self):
+        registry = MetricsRegistry()
+        one, two, three = _Source(1), _Source(2), _Source(3)
+        registry.register("foo", one)
+        registry.register("bar", two)
+        registry.register("foo", three)
+
+        self.assertEqual(3, len(registry))
+        self.assertEqual({"foo": {"value": 1}, "bar": {"value": 2}, "foo[1]": {"value": 3}}, registry.collect())
+
+    def test_unregister(self):
+        registry = MetricsRegistry()
+        one, two = _Source(1), _Source(2)
+        registry.register("foo", one)
+        registry.register("foo", two)
+
+        registry.unregister(one)
+
+        self.assertEqual({"foo": {"value": 2}}, registry.collect())
+
+    def test_weak_references(self):
+        registry = MetricsRegistry()
+        source = _Source(1)
+        registry.register("foo", source)
+
+        del source
+
+        self.assertEqual(0, len(registry))
+        self.assertEqual({}, registry.collect())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,4 +1,7 @@
 import unittest
+from io import (
+    BytesIO,
+)
 from unittest.mock import (
     call,
     patch,
@@ -8,7 +11,10 @@ from uuid import (
 )
 
 from minos.common import (
+    AvroSchemaDecoder,
+    AvroSchemaEncoder,
     EmptyMinosModelSequenceException,
+    MinosAvroProtocol,
     MissingSentinel,
     Model,
     MultiTypeMinosModelSequenceException,
@@ -20,6 +26,7 @@ from tests.model_classes import (
     Foo,
     FooBar,
     GenericUser,
+    Measurement,
     ShoppingList,
     User,
 )
@@ -42,7 +49,7 @@ class TestModelAvro(MinosTestCase):
                                     {"name": "username", "type": ["string", "null"]},
                                 ],
                                 "name": "User",
-                                "namespace": "tests.model_classes.goodbye",
+                                "namespace": "tests.model_classes._0",
                                 "type": "record",
                             },
                             "null",
@@ -51,24 +58,22 @@ class TestModelAvro(MinosTestCase):
                     {"name": "cost", "type": "double"},
                 ],
                 "name": "ShoppingList",
-                "namespace": "tests.model_classes.hello",
+                "namespace": "tests.model_classes._0",
                 "type": "record",
             }
         ]
-        with patch("minos.common.AvroSchemaEncoder.generate_random_str", side_effect=["hello", "goodbye"]):
-            self.assertEqual(expected, ShoppingList.avro_schema)
+        self.assertEqual(expected, ShoppingList.avro_schema)
 
     def test_avro_schema_generics(self):
         expected = [
             {
                 "fields": [{"name": "username", "type": ["string", "int"]}],
                 "name": "GenericUser",
-                "namespace": "tests.model_classes.hello",
+                "namespace": "tests.model_classes._0",
                 "type": "record",
             }
         ]
-        with patch("minos.common.AvroSchemaEncoder.generate_random_str", side_effect=["hello"]):
-            self.assertEqual(expected, GenericUser.avro_schema)
+        self.assertEqual(expected, GenericUser.avro_schema)
 
     def test_avro_schema_generics_nested(self):
         expected = [
@@ -80,19 +85,18 @@ class TestModelAvro(MinosTestCase):
                             {
                                 "fields": [{"name": "username", "type": "string"}],
                                 "name": "GenericUser",
-                                "namespace": "tests.model_classes.goodbye",
+                                "namespace": "tests.model_classes._0",
                                 "type": "record",
                             }
                         ],
                     }
                 ],
                 "name": "Auth",
-                "namespace": "tests.model_classes.hello",
+                "namespace": "tests.model_classes._0",
                 "type": "record",
             }
         ]
-        with patch("minos.common.AvroSchemaEncoder.generate_random_str", side_effect=["hello", "goodbye"]):
-            self.assertEqual(expected, Auth.avro_schema)
+        self.assertEqual(expected, Auth.avro_schema)
 
     def test_avro_schema_simple(self):
         customer = Customer(1234)
@@ -107,12 +111,11 @@ class TestModelAvro(MinosTestCase):
                     {"name": "lists", "type": [{"items": "int", "type": "array"}, "null"]},
                 ],
                 "name": "Customer",
-                "namespace": "tests.model_classes.hello",
+                "namespace": "tests.model_classes._0",
                 "type": "record",
             }
         ]
-        with patch("minos.common.AvroSchemaEncoder.generate_random_str", side_effect=["hello"]):
-            self.assertEqual(expected, customer.avro_schema)
+        self.assertEqual(expected, customer.avro_schema)
 
     def test_avro_schema_multiple_fields(self):
         bar = Bar(first=Foo("one"), second=Foo("two"))
@@ -124,7 +127,7 @@ class TestModelAvro(MinosTestCase):
                         "type": {
                             "fields": [{"name": "text", "type": "string"}],
                             "name": "Foo",
-                            "namespace": "tests.model_classes.hello",
+                            "namespace": "tests.model_classes._0",
                             "type": "record",
                         },
                     },
@@ -133,26 +136,32 @@ class TestModelAvro(MinosTestCase):
                         "type": {
                             "fields": [{"name": "text", "type": "string"}],
                             "name": "Foo",
-                            "namespace": "tests.model_classes.goodbye",
+                            "namespace": "tests.model_classes._1",
                             "type": "record",
                         },
                     },
                 ],
                 "name": "Bar",
-                "namespace": "tests.model_classes.one",
+                "namespace": "tests.model_classes._0",
                 "type": "record",
             }
         ]
 
-        with patch("minos.common.AvroSchemaEncoder.generate_random_str", side_effect=["one", "hello", "goodbye"]):
-            self.assertEqual(expected, bar.avro_schema)
+        self.assertEqual(expected, bar.avro_schema)
+
+    def test_avro_schema_cached(self):
+        self.assertIs(ShoppingList.avro_schema, ShoppingList.avro_schema)
+        self.assertIs(Customer(1234).avro_schema, Customer(5678, "johndoe").avro_schema)
+
+    def test_avro_schema_deterministic(self):
+        self.assertEqual(AvroSchemaEncoder().build(Bar), AvroSchemaEncoder().build(Bar))
 
     def test_encode_schema(self):
         user = User(1234)
         shopping_list = ShoppingList(user)
         with patch.object(ShoppingList, "encode_schema", return_value=MissingSentinel) as shopping_mock:
             with patch.object(User, "encode_schema", return_value=user.avro_schema) as user_mock:
-                shopping_list.avro_schema
+                AvroSchemaEncoder().build(shopping_list)
 
         encoder = shopping_mock.call_args_list[0].args[0]
 
@@ -183,6 +192,50 @@ class TestModelAvro(MinosTestCase):
 
         self.assertEqual(expected, bar.avro_data)
 
+    def test_avro_data_cached(self):
+        bar = Bar(first=Foo("one"), second=Foo("two"))
+        self.assertIs(bar.avro_data, bar.avro_data)
+        self.assertIs(bar.first.avro_data, bar.avro_data["first"])
+
+    def test_avro_data_cache_setattr(self):
+        bar = Bar(first=Foo("one"), second=Foo("two"))
+        previous = bar.avro_data
+
+        bar.second = Foo("three")
+        self.assertEqual({"first": {"text": "one"}, "second": {"text": "three"}}, bar.avro_data)
+        self.assertIsNot(previous, bar.avro_data)
+
+    def test_avro_data_cache_nested_setattr(self):
+        foo = Foo("one")
+        first, second = Bar(first=foo, second=Foo("two")), Bar(first=Foo("three"), second=foo)
+        self.assertEqual({"first": {"text": "one"}, "second": {"text": "two"}}, first.avro_data)
+        self.assertEqual({"first": {"text": "three"}, "second": {"text": "one"}}, second.avro_data)
+
+        foo.text = "four"
+        self.assertEqual({"first": {"text": "four"}, "second": {"text": "two"}}, first.avro_data)
+        self.assertEqual({"first": {"text": "three"}, "second": {"text": "four"}}, second.avro_data)
+
+    def test_avro_data_cache_tracked_container(self):
+        customer = Customer(1234, lists=[1, 2])
+        previous = customer.avro_data
+        self.assertIs(previous, customer.avro_data)
+
+        customer.lists.append(3)
+        self.assertEqual([1, 2, 3], customer.avro_data["lists"])
+        self.assertIsNot(previous, customer.avro_data)
+
+    def test_avro_data_not_cached_untracked_container(self):
+        customer = Customer.from_trusted(1234, lists=[1, 2])
+        self.assertIsNot(customer.avro_data, customer.avro_data)
+
+        customer.lists.append(3)
+        self.assertEqual([1, 2, 3], customer.avro_data["lists"])
+
+    def test_avro_data_not_cached_encode_data(self):
+        shopping_list = ShoppingList(User(1234))
+        with patch.object(ShoppingList, "encode_data", return_value=MissingSentinel):
+            self.assertIsNot(shopping_list.avro_data, shopping_list.avro_data)
+
     def test_encode_data(self):
         user = User(1234)
         shopping_list = ShoppingList(user)
@@ -203,6 +256,13 @@ class TestModelAvro(MinosTestCase):
         shopping_list = ShoppingList(User(1234))
         self.assertIsInstance(shopping_list.avro_bytes, bytes)
 
+    def test_avro_bytes_cached(self):
+        bar = Bar(first=Foo("one"), second=Foo("two"))
+        self.assertIs(bar.avro_bytes, bar.avro_bytes)
+
+        bar.first.text = "three"
+        self.assertEqual(Bar(first=Foo("three"), second=Foo("two")), Bar.from_avro_bytes(bar.avro_bytes))
+
     def test_to_avro_bytes_sequence(self):
         customers = [Customer(1234), Customer(5678)]
         avro_bytes = Customer.to_avro_bytes(customers)
@@ -230,16 +290,16 @@ class TestModelAvro(MinosTestCase):
         user = User(1234)
         shopping_list = ShoppingList(user)
 
-        with patch("minos.common.AvroSchemaEncoder.generate_random_str", return_value="hello"):
-            with patch.object(Model, "decode_schema", side_effect=[MissingSentinel, User]) as mock:
-                # noinspection PyTypeChecker
-                Model.from_avro(shopping_list.avro_schema, shopping_list.avro_data)
+        AvroSchemaDecoder.cache_clear()
+        with patch.object(Model, "decode_schema", side_effect=[MissingSentinel, User]) as mock:
+            # noinspection PyTypeChecker
+            Model.from_avro(shopping_list.avro_schema, shopping_list.avro_data)
 
-            decoder = mock.call_args_list[0].args[0]
+        decoder = mock.call_args_list[0].args[0]
 
-            self.assertEqual(
-                [call(decoder, shopping_list.avro_schema[0]), call(decoder, user.avro_schema[0])], mock.call_args_list
-            )
+        self.assertEqual(
+            [call(decoder, shopping_list.avro_schema[0]), call(decoder, user.avro_schema[0])], mock.call_args_list
+        )
 
     def test_decode_data(self):
         user = User(1234)
@@ -266,6 +326,54 @@ class TestModelAvro(MinosTestCase):
         decoded_customer = Customer.from_avro_bytes(avro_bytes)
         self.assertEqual(customer, decoded_customer)
 
+    def test_from_avro_bytes_memoryview(self):
+        customer = Customer(1234)
+        decoded_customer = Customer.from_avro_bytes(memoryview(customer.avro_bytes))
+        self.assertEqual(customer, decoded_customer)
+
+    def test_from_avro_bytes_trusted(self):
+        user = User(1234, "johndoe")
+        self.assertEqual(user, User.from_avro_bytes(user.avro_bytes, trusted=True))
+
+        with patch.object(User, "parse_username") as mock:
+            User.from_avro_bytes(user.avro_bytes, trusted=True)
+            self.assertEqual(0, mock.call_count)
+
+    def test_from_avro_bytes_trusted_evolved_schema(self):
+        # The values were stored by a previous version of the model, in which the fields were integers.
+        schema = Measurement(3.0, list()).avro_schema
+        schema[0]["fields"] = [
+            {"name": "value", "type": "int"},
+            {"name": "samples", "type": {"type": "array", "items": "int"}},
+        ]
+        samples = list(range(32))
+        avro_bytes = MinosAvroProtocol.encode({"value": 3, "samples": samples}, schema)
+
+        for lazy in (False, True):
+            with self.subTest(lazy=lazy):
+                observed = Measurement.from_avro_bytes(avro_bytes, trusted=True, lazy=lazy)
+
+                self.assertEqual(Measurement(3.0, [float(sample) for sample in samples]), observed)
+                self.assertIsInstance(observed.value, float)
+                self.assertTrue(all(isinstance(sample, float) for sample in observed.samples))
+
+    def test_from_avro_bytes_lazy(self):
+        bar = Bar(first=Foo("one"), second=Foo("two"))
+        observed = Bar.from_avro_bytes(bar.avro_bytes, lazy=True)
+
+        self.assertTrue(observed.fields["first"].is_lazy)
+        self.assertTrue(observed.fields["second"].is_lazy)
+
+        self.assertEqual(bar.avro_data, observed.avro_data)
+        self.assertEqual(bar, Bar.from_avro_bytes(observed.avro_bytes))
+        self.assertTrue(observed.fields["first"].is_lazy)
+
+        self.assertEqual(Foo("one"), observed.first)
+        self.assertFalse(observed.fields["first"].is_lazy)
+        self.assertTrue(observed.fields["second"].is_lazy)
+
+        self.assertEqual(bar, observed)
+
     def test_from_avro_bytes_in_batch(self):
         customers = [Customer(1234), Customer(5678)]
         avro_bytes = Customer.to_avro_bytes(customers)
@@ -299,6 +407,54 @@ class TestModelAvro(MinosTestCase):
         base = Auth(GenericUser("foo"))
         self.assertEqual(base, Auth.from_avro_bytes(base.avro_bytes))
 
+    def test_iter_from_avro_bytes(self):
+        customers = [Customer(1234), Customer(5678)]
+        avro_bytes = Customer.to_avro_bytes(customers)
+
+        self.assertEqual(customers, list(Customer.iter_from_avro_bytes(avro_bytes)))
+        self.assertEqual(customers, list(Customer.iter_from_avro_bytes(BytesIO(avro_bytes), trusted=True)))
+
+    async def test_iter_from_avro_bytes_async(self):
+        customers = [Customer(i) for i in range(1, 100)]
+        avro_bytes = Customer.to_avro_bytes(customers)
+
+        async def _fn():
+            view = memoryview(avro_bytes)
+            while view:
+                chunk, view = view[:7], view[7:]
+                yield bytes(chunk)
+
+        observed = [customer async for customer in Customer.iter_from_avro_bytes(_fn())]
+        self.assertEqual(customers, observed)
+
+    def test_write_avro_stream(self):
+        customers = [Customer(1234), Customer(5678)]
+        with BytesIO() as file:
+            self.assertEqual(2, Customer.write_avro_stream(iter(customers), file))
+            avro_bytes = file.getvalue()
+
+        self.assertEqual(customers, Customer.from_avro_bytes(avro_bytes, batch_mode=True))
+
+    async def test_write_avro_stream_async(self):
+        customers = [Customer(1234), Customer(5678)]
+
+        async def _fn():
+            for customer in customers:
+                yield customer
+
+        with BytesIO() as file:
+            self.assertEqual(2, await Customer.write_avro_stream(_fn(), file))
+            file.seek(0)
+            self.assertEqual(customers, list(Customer.iter_from_avro_bytes(file)))
+
+    def test_write_avro_stream_empty(self):
+        with self.assertRaises(EmptyMinosModelSequenceException):
+            Customer.write_avro_stream(iter([]), BytesIO())
+
+    def test_write_avro_stream_multi_type(self):
+        with self.assertRaises(MultiTypeMinosModelSequenceException):
+            Customer.write_avro_stream(iter([Customer(5678), User(1234)]), BytesIO())
+
     def test_from_avro_str_single(self):
         customer = Customer(1234)
         avro_str = customer.avro_str
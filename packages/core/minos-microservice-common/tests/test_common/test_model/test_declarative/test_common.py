@@ -38,6 +38,13 @@ class TestDeclarativeModel(unittest.TestCase):
         with self.assertRaises(TypeError):
             Customer(None, id=1234)
 
+    def test_from_trusted(self):
+        model = User.from_trusted(1234, username="John Doe")
+        self.assertEqual("John Doe", model.username)
+
+        with self.assertRaises(MinosAttributeValidationException):
+            User(1234, username="John Doe")
+
     def test_constructor_kwargs(self):
         model = Customer(id=1234, username="johndoe", name="John", surname="Doe")
         self.assertEqual(1234, model.id)
@@ -285,6 +292,40 @@ class TestDeclarativeModel(unittest.TestCase):
         self.assertEqual(3, user.username)
         self.assertEqual(int, user.type_hints["username"])
 
+    def test_field_plan(self):
+        expected = (
+            ("id", int, None, "validate_id", True),
+            ("username", Optional[str], "parse_username", "validate_username", True),
+            ("name", Optional[str], "parse_name", None, True),
+            ("surname", Optional[str], None, None, True),
+            ("is_admin", Optional[bool], None, None, True),
+            ("lists", Optional[list[int]], None, None, True),
+        )
+        self.assertEqual(expected, Customer._field_plan())
+
+    def test_field_plan_cached(self):
+        self.assertIs(Customer._field_plan(), Customer._field_plan())
+        self.assertIsNot(User._field_plan(), Customer._field_plan())
+
+    def test_field_plan_with_additional_type_hints(self):
+        expected = (
+            ("id", int, None, "validate_id", True),
+            ("username", str, "parse_username", "validate_username", True),
+            ("foo", bool, None, None, True),
+        )
+        self.assertEqual(expected, User._field_plan({"username": str, "foo": bool}))
+
+    def test_field_plan_with_additional_type_hints_not_matching(self):
+        expected = (
+            ("id", int, None, "validate_id", False),
+            ("username", Optional[str], "parse_username", "validate_username", True),
+        )
+        self.assertEqual(expected, User._field_plan({"id": float}))
+
+    def test_field_plan_with_additional_type_hints_cached(self):
+        self.assertIs(User._field_plan({"username": str}), User._field_plan({"username": str}))
+        self.assertIsNot(User._field_plan({"username": str}), User._field_plan({"username": Optional[str]}))
+
 
 if __name__ == "__main__":
     unittest.main()
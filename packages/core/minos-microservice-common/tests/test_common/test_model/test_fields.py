@@ -8,8 +8,12 @@ from unittest.mock import (
 )
 
 from minos.common import (
+    IS_TRUSTED_CONSTRUCTION_CONTEXT_VAR,
+    AvroDataDecoder,
     Field,
+    LazyAvroData,
     MinosAttributeValidationException,
+    MinosReqAttributeException,
 )
 
 
@@ -103,6 +107,46 @@ class TestField(unittest.IsolatedAsyncioTestCase):
         field = Field("test", Optional[str], validator=lambda x: not x.count(" "))
         self.assertEqual(None, field.value)
 
+    def test_trusted(self):
+        token = IS_TRUSTED_CONSTRUCTION_CONTEXT_VAR.set(True)
+        try:
+            with patch("minos.common.AvroDataDecoder.build") as mock_build:
+                field = Field("test", str, "foo bar", lambda x: x.title(), lambda x: not x.count(" "))
+                self.assertEqual(0, mock_build.call_count)
+        finally:
+            IS_TRUSTED_CONSTRUCTION_CONTEXT_VAR.reset(token)
+
+        self.assertEqual("foo bar", field.value)
+
+        with self.assertRaises(MinosAttributeValidationException):
+            field.value = "foo bar"
+
+    def test_trusted_missing(self):
+        token = IS_TRUSTED_CONSTRUCTION_CONTEXT_VAR.set(True)
+        try:
+            self.assertEqual(None, Field("test", Optional[str]).value)
+            with self.assertRaises(MinosReqAttributeException):
+                Field("test", str, None)
+        finally:
+            IS_TRUSTED_CONSTRUCTION_CONTEXT_VAR.reset(token)
+
+    def test_lazy(self):
+        lazy = LazyAvroData([1, 2, 3], list[int], AvroDataDecoder._compile(list[int]), AvroDataDecoder(), dict())
+        field = Field("test", list[int], lazy, validator=lambda x: len(x) > 1)
+        self.assertTrue(field.is_lazy)
+        self.assertEqual([1, 2, 3], field.avro_data)
+        self.assertEqual(list[int], field.real_type)
+        self.assertTrue(field.is_lazy)
+
+        self.assertEqual([1, 2, 3], field.value)
+        self.assertFalse(field.is_lazy)
+
+    def test_lazy_raises(self):
+        lazy = LazyAvroData([1], list[int], AvroDataDecoder._compile(list[int]), AvroDataDecoder(), dict())
+        field = Field("test", list[int], lazy, validator=lambda x: len(x) > 1)
+        with self.assertRaises(MinosAttributeValidationException):
+            field.value
+
     def test_equal(self):
         self.assertEqual(Field("id", Optional[int], 3), Field("id", Optional[int], 3))
         self.assertNotEqual(Field("id", Optional[int], 3), Field("id", Optional[int], None))
@@ -17,6 +17,7 @@ from uuid import (
 )
 
 from minos.common import (
+    IS_LAZY_CONSTRUCTION_CONTEXT_VAR,
     AvroDataDecoder,
     DataDecoderException,
     DataDecoderMalformedTypeException,
@@ -348,11 +349,36 @@ class TestAvroDataDecoder(MinosTestCase):
         with self.assertRaises(DataDecoderTypeException):
             decoder.build("hello")
 
+    def test_union_order(self):
+        self.assertEqual("12", AvroDataDecoder(Union[str, int]).build("12"))
+        self.assertEqual(12, AvroDataDecoder(Union[int, str]).build("12"))
+        self.assertEqual("foo", AvroDataDecoder(Union[int, str]).build("foo"))
+        self.assertEqual(["12"], AvroDataDecoder(list[Union[str, int]]).build(["12"]))
+        self.assertEqual([12], AvroDataDecoder(list[Union[int, str]]).build(["12"]))
+
+    def test_union_uuid(self):
+        uuid = uuid4()
+        decoder = AvroDataDecoder(Union[int, UUID])
+        self.assertEqual(uuid, decoder.build(str(uuid)))
+        self.assertEqual(uuid, decoder.build(uuid.bytes))
+
     def test_optional_type(self):
         decoder = AvroDataDecoder(Optional[int])
         observed = decoder.build(None)
         self.assertIsNone(observed)
 
+    def test_optional_nested(self):
+        uuid = uuid4()
+        decoder = AvroDataDecoder(Optional[dict[str, list[UUID]]])
+        self.assertEqual({"foo": [uuid]}, decoder.build({"foo": [str(uuid)]}))
+        self.assertIsNone(decoder.build(MissingSentinel))
+        with self.assertRaises(DataDecoderTypeException):
+            decoder.build({"foo": ["bar"]})
+
+    def test_compiled_cached(self):
+        # noinspection PyProtectedMember
+        self.assertIs(AvroDataDecoder._compile(dict[str, list[UUID]]), AvroDataDecoder._compile(dict[str, list[UUID]]))
+
     def test_model_generic(self):
         value = GenericUser("foo")
         decoder = AvroDataDecoder(GenericUser[str])
@@ -374,6 +400,40 @@ class TestAvroDataDecoder(MinosTestCase):
 
         self.assertEqual(raw, observed)
 
+    def test_model_type_lazy(self):
+        # noinspection PyPep8Naming
+        Foo = ModelType.build("Foo", {"small": list[int], "large": list[int], "user": Optional[User]})
+        data = {
+            "small": [1, 2],
+            "large": list(range(AvroDataDecoder.lazy_min_size)),
+            "user": {"id": 1, "username": None},
+        }
+
+        token = IS_LAZY_CONSTRUCTION_CONTEXT_VAR.set(True)
+        try:
+            observed = AvroDataDecoder(Foo).build(data)
+        finally:
+            IS_LAZY_CONSTRUCTION_CONTEXT_VAR.reset(token)
+
+        self.assertFalse(observed.fields["small"].is_lazy)
+        self.assertTrue(observed.fields["large"].is_lazy)
+        self.assertTrue(observed.fields["user"].is_lazy)
+        self.assertEqual(Foo(**data), observed)
+
+    def test_model_type_lazy_union(self):
+        first = ModelType.build("Bar", {"bar": int})
+        second = ModelType.build("Bar", {"bar": str})
+        # noinspection PyPep8Naming
+        Foo = ModelType.build("Foo", {"bar": Union[first, second]})
+
+        token = IS_LAZY_CONSTRUCTION_CONTEXT_VAR.set(True)
+        try:
+            observed = AvroDataDecoder(Foo).build({"bar": {"bar": "one"}})
+        finally:
+            IS_LAZY_CONSTRUCTION_CONTEXT_VAR.reset(token)
+
+        self.assertEqual("one", observed.bar.bar)
+
 
 if __name__ == "__main__":
     unittest.main()
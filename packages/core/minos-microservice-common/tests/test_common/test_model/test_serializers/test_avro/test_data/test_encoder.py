@@ -44,6 +44,10 @@ class TestAvroDataEncoder(unittest.TestCase):
         encoder = AvroDataEncoder(memoryview(b"test"))
         self.assertEqual(b"test", encoder.build())
 
+    def test_build_compiled_cached(self):
+        # noinspection PyProtectedMember
+        self.assertIs(AvroDataEncoder._compile(User), AvroDataEncoder._compile(User))
+
     def test_build_raises(self):
         encoder = AvroDataEncoder(_Foo())
         with self.assertRaises(MinosMalformedAttributeException):
@@ -29,6 +29,12 @@ from tests.model_classes import (
 
 
 class TestAvroSchemaDecoder(unittest.TestCase):
+    def setUp(self) -> None:
+        AvroSchemaDecoder.cache_clear()
+
+    def tearDown(self) -> None:
+        AvroSchemaDecoder.cache_clear()
+
     def test_model_type(self):
         expected = ModelType.build("User", {"username": str}, namespace_="path.to")
         field_schema = {
@@ -171,6 +177,36 @@ class TestAvroSchemaDecoder(unittest.TestCase):
             observed = AvroSchemaDecoder({"type": "string", "logicalType": classname(ShoppingList)}).build()
         self.assertEqual(ShoppingList, observed)
 
+    def test_cache(self):
+        schema = {
+            "fields": [{"name": "username", "type": "string"}],
+            "name": "User",
+            "namespace": "path.to.class",
+            "type": "record",
+        }
+        observed = AvroSchemaDecoder().build(schema)
+        self.assertEqual((0, 1, 1024, 1), AvroSchemaDecoder.cache_info())
+
+        self.assertIs(observed, AvroSchemaDecoder().build(dict(reversed(schema.items()))))
+        self.assertEqual((1, 1, 1024, 1), AvroSchemaDecoder.cache_info())
+
+    def test_cache_eviction(self):
+        with patch.object(AvroSchemaDecoder, "cache_maxsize", 1):
+            AvroSchemaDecoder().build("int")
+            AvroSchemaDecoder().build("string")
+            AvroSchemaDecoder().build("int")
+            self.assertEqual((0, 3, 1, 1), AvroSchemaDecoder.cache_info())
+
+    def test_cache_clear(self):
+        AvroSchemaDecoder().build("int")
+        AvroSchemaDecoder.cache_clear()
+        self.assertEqual((0, 0, 1024, 0), AvroSchemaDecoder.cache_info())
+
+    def test_cache_raises(self):
+        with self.assertRaises(MinosMalformedAttributeException):
+            AvroSchemaDecoder().build("foo")
+        self.assertEqual(0, AvroSchemaDecoder.cache_info().currsize)
+
 
 if __name__ == "__main__":
     unittest.main()
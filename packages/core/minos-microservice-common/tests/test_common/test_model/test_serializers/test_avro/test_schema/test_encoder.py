@@ -9,9 +9,6 @@ from typing import (
     Any,
     Optional,
 )
-from unittest.mock import (
-    patch,
-)
 from uuid import (
     UUID,
 )
@@ -32,16 +29,21 @@ class TestAvroSchemaEncoder(unittest.TestCase):
         expected = {
             "fields": [{"name": "username", "type": "string"}],
             "name": "User",
-            "namespace": "path.to.hello",
+            "namespace": "path.to._0",
             "type": "record",
         }
         encoder = AvroSchemaEncoder(ModelType.build("User", {"username": str}, namespace_="path.to"))
 
-        with patch("minos.common.AvroSchemaEncoder.generate_random_str", return_value="hello"):
-            observed = encoder.build()
+        observed = encoder.build()
 
         self.assertEqual(expected, observed)
 
+    def test_generate_random_str(self):
+        with self.assertWarns(DeprecationWarning):
+            observed = AvroSchemaEncoder.generate_random_str()
+
+        self.assertIsInstance(observed, str)
+
     def test_int(self):
         observed = AvroSchemaEncoder(int).build()
         expected = "int"
@@ -103,7 +105,7 @@ class TestAvroSchemaEncoder(unittest.TestCase):
                 {
                     "fields": [{"name": "id", "type": "int"}, {"name": "username", "type": ["string", "null"]}],
                     "name": "User",
-                    "namespace": "tests.model_classes.hello",
+                    "namespace": "tests.model_classes._0",
                     "type": "record",
                 },
                 "null",
@@ -112,8 +114,7 @@ class TestAvroSchemaEncoder(unittest.TestCase):
         }
         encoder = AvroSchemaEncoder(list[Optional[User]])
 
-        with patch("minos.common.AvroSchemaEncoder.generate_random_str", return_value="hello"):
-            observed = encoder.build()
+        observed = encoder.build()
 
         self.assertEqual(expected, observed)
 
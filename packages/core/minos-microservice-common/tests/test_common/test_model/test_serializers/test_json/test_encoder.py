@@ -0,0 +1,141 @@
+import unittest
+from datetime import (
+    date,
+    datetime,
+    time,
+    timedelta,
+    timezone,
+)
+from decimal import (
+    Decimal,
+)
+from typing import (
+    Any,
+    Optional,
+)
+from unittest.mock import (
+    patch,
+)
+from uuid import (
+    uuid4,
+)
+
+import orjson
+
+from minos.common import (
+    AvroDataEncoder,
+    DataEncoder,
+    DeclarativeModel,
+    JsonDataEncoder,
+)
+from tests.model_classes import (
+    Bar,
+    Customer,
+    Foo,
+    ShoppingList,
+    User,
+)
+
+
+class _Foo:
+    """For testing purposes."""
+
+
+class _Event(DeclarativeModel):
+    """For testing purposes."""
+
+    at: datetime
+    day: Optional[date]
+    times: dict[str, list[time]]
+
+
+class _EncodedEvent(_Event):
+    """For testing purposes."""
+
+    @staticmethod
+    def encode_data(encoder: DataEncoder, target: Any, **kwargs) -> Any:
+        """For testing purposes."""
+        return encoder.build(target, **kwargs)
+
+
+class _Wrapper(DeclarativeModel):
+    """For testing purposes."""
+
+    event: _Event
+
+
+class TestJsonDataEncoder(unittest.TestCase):
+    def test_is_subclass(self):
+        self.assertTrue(issubclass(JsonDataEncoder, DataEncoder))
+
+    def test_build(self):
+        value = {"foo": [1, 2.5, "three", None, True]}
+        self.assertEqual(orjson.dumps(value), JsonDataEncoder(value).build())
+        self.assertEqual(orjson.dumps(value), JsonDataEncoder().build(value))
+
+    def test_build_avro_compatible(self):
+        value = {
+            "uuid": uuid4(),
+            "datetime": datetime(2021, 3, 12, 21, 32, 21, tzinfo=timezone.utc),
+            "date": date(2021, 3, 12),
+            "time": time(21, 32, 21),
+            "timedelta": timedelta(days=1, microseconds=3),
+            "decimal": Decimal("3.14"),
+            "set": {1},
+        }
+        self.assertEqual(orjson.dumps(AvroDataEncoder(value).build()), JsonDataEncoder(value).build())
+
+    def test_build_native(self):
+        now = datetime(2021, 3, 12, 21, 32, 21, tzinfo=timezone.utc)
+        self.assertEqual(orjson.dumps(now), JsonDataEncoder(now, avro_compatible=False).build())
+
+    def test_build_model(self):
+        value = [ShoppingList(User(1234), cost="1.234,56"), ShoppingList(None, cost=3.14)]
+        self.assertEqual(orjson.dumps(AvroDataEncoder(value).build()), JsonDataEncoder(value).build())
+
+    def test_build_model_nested(self):
+        value = Bar(first=Foo("one"), second=Foo("two"))
+        self.assertEqual(b'{"first":{"text":"one"},"second":{"text":"two"}}', JsonDataEncoder(value).build())
+
+    def test_build_model_lazy(self):
+        bar = Bar(first=Foo("one"), second=Foo("two"))
+        value = Bar.from_avro_bytes(bar.avro_bytes, lazy=True)
+        self.assertEqual(JsonDataEncoder(bar).build(), JsonDataEncoder(value).build())
+        self.assertTrue(value.fields["first"].is_lazy)
+
+    def test_build_model_encode_data(self):
+        value = Customer(1234, lists=[1, 2])
+        with patch.object(Customer, "encode_data", return_value="foo"):
+            self.assertEqual(b'"foo"', JsonDataEncoder(value).build())
+
+    def test_build_native_model_lazy(self):
+        now = datetime(2021, 3, 12, 21, 32, 21, tzinfo=timezone.utc)
+        wrapper = _Wrapper(_Event(now, date(2021, 3, 12), {"foo": [time(21, 32, 21)]}))
+        value = _Wrapper.from_avro_bytes(wrapper.avro_bytes, lazy=True)
+
+        observed = JsonDataEncoder(value, avro_compatible=False).build()
+
+        self.assertEqual(JsonDataEncoder(wrapper, avro_compatible=False).build(), observed)
+        self.assertEqual(now.isoformat(), orjson.loads(observed)["event"]["at"])
+
+    def test_build_native_model_encode_data(self):
+        now = datetime(2021, 3, 12, 21, 32, 21, tzinfo=timezone.utc)
+        values = [(now, date(2021, 3, 12), {"foo": [time(21, 32, 21)]}), (now, None, {})]
+
+        for args in values:
+            with self.subTest(args=args):
+                expected = JsonDataEncoder(_Event(*args), avro_compatible=False).build()
+                observed = JsonDataEncoder(_EncodedEvent(*args), avro_compatible=False).build()
+                self.assertEqual(expected, observed)
+
+    def test_build_avro_compatible_model_encode_data(self):
+        value = _EncodedEvent(datetime(2021, 3, 12, tzinfo=timezone.utc), date(2021, 3, 12), {})
+        self.assertEqual(orjson.dumps(AvroDataEncoder(value).build()), JsonDataEncoder(value).build())
+
+    def test_build_raises(self):
+        with self.assertRaises(TypeError):
+            JsonDataEncoder(_Foo()).build()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,144 @@
+import unittest
+from typing import (
+    Optional,
+)
+
+from minos.common import (
+    IS_LAZY_CONSTRUCTION_CONTEXT_VAR,
+    AvroDataDecoder,
+    DataDecoderException,
+    MinosAttributeValidationException,
+    MinosReqAttributeException,
+    MinosTypeAttributeException,
+    Model,
+    ModelType,
+    SlotField,
+    SlottedDeclarativeModel,
+)
+from tests.model_classes import (
+    SlottedCar,
+    SlottedElectricCar,
+    SlottedOwner,
+)
+
+
+class TestSlottedDeclarativeModel(unittest.TestCase):
+    def test_slots(self):
+        self.assertEqual(("name", "surname", "age"), SlottedOwner.__slots__)
+        self.assertEqual(("autonomy",), SlottedElectricCar.__slots__)
+        self.assertFalse(hasattr(SlottedOwner("john", "doe", 32), "__dict__"))
+
+    def test_slots_collision(self):
+        with self.assertRaises(ValueError):
+
+            class _Foo(SlottedDeclarativeModel):
+                bar: int
+
+                @property
+                def bar(self) -> int:
+                    return 3
+
+    def test_constructor(self):
+        owner = SlottedOwner("john", "doe", age=32)
+        self.assertEqual("John", owner.name)
+        self.assertEqual("doe", owner.surname)
+        self.assertEqual(32, owner.age)
+
+    def test_constructor_inheritance(self):
+        car = SlottedElectricCar(5, "red", None, 400)
+        self.assertEqual(5, car.doors)
+        self.assertEqual(400, car.autonomy)
+
+    def test_constructor_raises(self):
+        with self.assertRaises(MinosReqAttributeException):
+            SlottedOwner("john", None, 32)
+        with self.assertRaises(MinosTypeAttributeException):
+            SlottedOwner("john", "doe", "foo")
+        with self.assertRaises(MinosAttributeValidationException):
+            SlottedOwner("john", "doe", -1)
+        with self.assertRaises(TypeError):
+            SlottedOwner("john", "doe", 32, age=32)
+
+    def test_setattr(self):
+        owner = SlottedOwner("john", "doe", 32)
+        owner.name = "jane"
+        owner.age = None
+        self.assertEqual("Jane", owner.name)
+        self.assertEqual(None, owner.age)
+
+    def test_setattr_raises(self):
+        owner = SlottedOwner("john", "doe", 32)
+        with self.assertRaises(MinosAttributeValidationException):
+            owner.age = -1
+        with self.assertRaises(AttributeError):
+            owner.foo = "bar"
+        with self.assertRaises(AttributeError):
+            owner.foo
+
+    def test_fields(self):
+        owner = SlottedOwner("john", "doe", 32)
+        fields = owner.fields
+        self.assertEqual(["name", "surname", "age"], list(fields))
+        self.assertIsInstance(fields["name"], SlotField)
+        self.assertEqual("John", fields["name"].value)
+        self.assertEqual(Optional[int], fields["age"].type)
+
+    def test_fields_write_through(self):
+        owner = SlottedOwner("john", "doe", 32)
+        owner.fields["name"].value = "jane"
+        self.assertEqual("Jane", owner.name)
+        with self.assertRaises(MinosAttributeValidationException):
+            owner.fields["age"].value = -1
+
+    def test_mapping(self):
+        owner = SlottedOwner("john", "doe", 32)
+        self.assertEqual({"name": "John", "surname": "doe", "age": 32}, dict(owner))
+        self.assertEqual(3, len(owner))
+        self.assertEqual("doe", owner["surname"])
+
+    def test_equal(self):
+        self.assertEqual(SlottedOwner("john", "doe", 32), SlottedOwner("john", "doe", 32))
+        self.assertNotEqual(SlottedOwner("john", "doe", 32), SlottedOwner("john", "doe", 33))
+        self.assertEqual(hash(SlottedOwner("john", "doe", 32)), hash(SlottedOwner("john", "doe", 32)))
+
+    def test_repr(self):
+        self.assertEqual("SlottedOwner(name='John', surname='doe', age=32)", repr(SlottedOwner("john", "doe", 32)))
+
+    def test_avro(self):
+        car = SlottedCar(3, "blue", SlottedOwner("john", "doe", 32))
+        self.assertEqual(
+            {"doors": 3, "color": "blue", "owner": {"name": "John", "surname": "doe", "age": 32}}, car.avro_data
+        )
+        self.assertEqual(car, Model.from_avro_bytes(car.avro_bytes))
+        self.assertEqual(car, SlottedCar.from_avro_bytes(car.avro_bytes, trusted=True))
+
+    def test_avro_cached(self):
+        car = SlottedCar(3, "blue", SlottedOwner("john", "doe", 32))
+        self.assertIs(car.avro_data, car.avro_data)
+        self.assertIs(car.avro_bytes, car.avro_bytes)
+
+        car.owner.age = 33
+        self.assertEqual(
+            {"doors": 3, "color": "blue", "owner": {"name": "John", "surname": "doe", "age": 33}}, car.avro_data
+        )
+        self.assertEqual(car, SlottedCar.from_avro_bytes(car.avro_bytes))
+
+    def test_avro_lazy(self):
+        car = SlottedCar(3, "blue", SlottedOwner("john", "doe", 32))
+        observed = Model.from_avro_bytes(car.avro_bytes, lazy=True)
+        self.assertIsInstance(observed.owner, SlottedOwner)
+        self.assertEqual(car, observed)
+
+    def test_decoder_lazy_not_deferred(self):
+        # noinspection PyTypeChecker
+        decoder = AvroDataDecoder(ModelType.from_model(SlottedCar))
+        token = IS_LAZY_CONSTRUCTION_CONTEXT_VAR.set(True)
+        try:
+            with self.assertRaises(DataDecoderException):
+                decoder.build({"doors": 3, "color": "blue", "owner": {"name": "john"}})
+        finally:
+            IS_LAZY_CONSTRUCTION_CONTEXT_VAR.reset(token)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -6,6 +6,8 @@ from typing import (
 
 from minos.common import (
     ModelType,
+    TrackedDict,
+    TrackedList,
     TypeHintBuilder,
 )
 from tests.model_classes import (
@@ -26,9 +28,15 @@ class TestTypeHintBuilder(unittest.TestCase):
     def test_list_empty_with_base(self):
         self.assertEqual(list[int], TypeHintBuilder([], list[int]).build())
 
+    def test_list_tracked(self):
+        self.assertEqual(list[int], TypeHintBuilder(TrackedList([34, 12])).build())
+
     def test_dict(self):
         self.assertEqual(dict[str, int], TypeHintBuilder({"one": 1, "two": 2}).build())
 
+    def test_dict_tracked(self):
+        self.assertEqual(dict[str, int], TypeHintBuilder(TrackedDict({"one": 1})).build())
+
     def test_dict_empty(self):
         self.assertEqual(dict[str, Any], TypeHintBuilder(dict()).build())
 
@@ -4,6 +4,9 @@ from typing import (
     Optional,
     Union,
 )
+from unittest.mock import (
+    patch,
+)
 
 from minos.common import (
     Model,
@@ -136,6 +139,23 @@ class TestTypeHintComparator(unittest.TestCase):
         two = ModelType.build("tests.model_classes.Foo", {"text": float})
         self.assertFalse(TypeHintComparator(Optional[one], Optional[two]).match())
 
+    def test_cached(self):
+        TypeHintComparator.cache_clear()
+        one = ModelType.build("tests.model_classes.Foo", {"text": str})
+        self.assertTrue(TypeHintComparator(Optional[one], Optional[Foo]).match())
+
+        with patch.object(TypeHintComparator, "_compare") as mock:
+            self.assertTrue(TypeHintComparator(Optional[one], Optional[Foo]).match())
+            self.assertEqual(0, mock.call_count)
+
+    def test_cache_clear(self):
+        TypeHintComparator(list[int], list[float]).match()
+        TypeHintComparator.cache_clear()
+
+        with patch.object(TypeHintComparator, "_compare", return_value=True) as mock:
+            self.assertTrue(TypeHintComparator(list[int], list[float]).match())
+            self.assertEqual(1, mock.call_count)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,100 @@
+import pickle
+import unittest
+from copy import (
+    deepcopy,
+)
+
+from minos.common import (
+    TrackedContainer,
+    TrackedDict,
+    TrackedList,
+    TrackedSet,
+)
+
+
+class TestTrackedList(unittest.TestCase):
+    def test_is_subclass(self):
+        self.assertTrue(issubclass(TrackedList, (TrackedContainer, list)))
+
+    def test_version(self):
+        value = TrackedList([1, 2])
+        self.assertEqual(0, value.version)
+        self.assertEqual([1, 2], value)
+
+        value.append(3)
+        value[0] = 4
+        value += [5]
+        value.sort()
+
+        self.assertEqual(4, value.version)
+        self.assertEqual([2, 3, 4, 5], value)
+
+    def test_version_not_modified(self):
+        value = TrackedList([1, 2])
+        value.index(2)
+        _ = value + [3]
+        self.assertEqual(0, value.version)
+
+    def test_pickle(self):
+        value = TrackedList([1, 2])
+        value.append(3)
+
+        observed = pickle.loads(pickle.dumps(value))
+
+        self.assertIsInstance(observed, TrackedList)
+        self.assertEqual([1, 2, 3], observed)
+        self.assertEqual(0, observed.version)
+
+    def test_deepcopy(self):
+        value = TrackedList([[1], [2]])
+        observed = deepcopy(value)
+
+        self.assertIsInstance(observed, TrackedList)
+        self.assertEqual(value, observed)
+        self.assertIsNot(value[0], observed[0])
+
+
+class TestTrackedSet(unittest.TestCase):
+    def test_is_subclass(self):
+        self.assertTrue(issubclass(TrackedSet, (TrackedContainer, set)))
+
+    def test_version(self):
+        value = TrackedSet({1, 2})
+        self.assertEqual(0, value.version)
+
+        value.add(3)
+        value.discard(1)
+        value |= {4}
+
+        self.assertEqual(3, value.version)
+        self.assertEqual({2, 3, 4}, value)
+
+    def test_repr(self):
+        self.assertEqual("{1}", repr(TrackedSet({1})))
+
+
+class TestTrackedDict(unittest.TestCase):
+    def test_is_subclass(self):
+        self.assertTrue(issubclass(TrackedDict, (TrackedContainer, dict)))
+
+    def test_version(self):
+        value = TrackedDict({"one": 1})
+        self.assertEqual(0, value.version)
+
+        value["two"] = 2
+        value.update(three=3)
+        del value["one"]
+        value |= {"four": 4}
+
+        self.assertEqual(4, value.version)
+        self.assertEqual({"two": 2, "three": 3, "four": 4}, value)
+
+    def test_pickle(self):
+        observed = pickle.loads(pickle.dumps(TrackedDict({"one": 1})))
+
+        self.assertIsInstance(observed, TrackedDict)
+        self.assertEqual({"one": 1}, observed)
+
+
+if __name__ == "__main__":
+    unittest.main()
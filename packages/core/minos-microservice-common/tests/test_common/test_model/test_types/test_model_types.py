@@ -2,6 +2,9 @@ import unittest
 from typing import (
     TypedDict,
 )
+from unittest.mock import (
+    patch,
+)
 
 from minos.common import (
     DataTransferObject,
@@ -37,6 +40,27 @@ class TestModelType(unittest.TestCase):
         with self.assertRaises(ValueError):
             ModelType.build("Foo", {"text": int}, foo=int)
 
+    def test_build_interned(self):
+        one = ModelType.build("bar.Foo", {"text": int, "numbers": list[int]})
+        self.assertIs(one, ModelType.build("Foo", {"text": int, "numbers": list[int]}, namespace_="bar"))
+        self.assertIsNot(one, ModelType.build("bar.Foo", {"text": int, "numbers": list[float]}))
+        self.assertIsNot(one, ModelType.build("bar.Foo", {"text": int}))
+
+    def test_build_interned_nested(self):
+        one = ModelType.build("Foo", {"bar": ModelType.build("Bar", {"text": int})})
+        two = ModelType.build("Foo", {"bar": ModelType.build("Bar", {"text": int})})
+        self.assertIs(one, two)
+
+    def test_build_type_hints_copied(self):
+        type_hints = {"text": int}
+        model_type = ModelType.build("Foo", type_hints)
+        type_hints["number"] = int
+        self.assertEqual({"text": int}, model_type.type_hints)
+
+    def test_from_model_cached(self):
+        self.assertIs(ModelType.from_model(Foo), ModelType.from_model(Foo))
+        self.assertIs(ModelType.from_model(Foo), Foo.model_type)
+
     def test_classname(self):
         model_type = ModelType.build("Foo", {"text": int}, namespace_="bar")
         self.assertEqual("bar.Foo", model_type.classname)
@@ -45,6 +69,16 @@ class TestModelType(unittest.TestCase):
         model_type = ModelType.build("Foo", {"text": int}, namespace_="bar")
         self.assertIsInstance(hash(model_type), int)
 
+    def test_eq_cached(self):
+        one = ModelType.build("Foo", {"text": int, "number": int}, namespace_="bar")
+        two = ModelType.build("Foo", {"number": int, "text": int}, namespace_="bar")
+        self.assertIsNot(one, two)
+        self.assertEqual(one, two)
+
+        with patch.object(ModelType, "_equal") as mock:
+            self.assertEqual(one, two)
+            self.assertEqual(0, mock.call_count)
+
     def test_lt(self):
         one = ModelType.build("Foo", {"text": int}, namespace_="bar")
         two = ModelType.build("Foo", {"text": int, "number": int}, namespace_="bar")
@@ -8,6 +8,7 @@ from asyncio import (
     sleep,
 )
 from unittest.mock import (
+    AsyncMock,
     MagicMock,
 )
 
@@ -19,20 +20,21 @@ from aiomisc.pool import (
 )
 
 from minos.common import (
+    METRICS_REGISTRY,
     MinosPool,
     MinosSetup,
 )
 
 
 class _Pool(MinosPool):
-    def __init__(self):
-        super().__init__()
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
         self.create_instance_call_count = 0
         self.destroy_instance_call_count = 0
 
     async def _create_instance(self) -> T:
         self.create_instance_call_count += 1
-        return "foo"
+        return f"foo-{self.create_instance_call_count}"
 
     async def _destroy_instance(self, instance: t.Any) -> None:
         self.destroy_instance_call_count += 1
@@ -51,7 +53,7 @@ class TestMinosPool(unittest.IsolatedAsyncioTestCase):
             async with pool.acquire() as observed:
                 self.assertEqual(1, pool.create_instance_call_count)
                 self.assertEqual(0, pool.destroy_instance_call_count)
-                self.assertEqual("foo", observed)
+                self.assertEqual("foo-1", observed)
         self.assertEqual(1, pool.create_instance_call_count)
         self.assertLess(0, pool.destroy_instance_call_count)
 
@@ -70,6 +72,61 @@ class TestMinosPool(unittest.IsolatedAsyncioTestCase):
 
         self.assertEqual(1, pool_mock.call_count)
 
+    def test_minsize_raises(self):
+        with self.assertRaises(ValueError):
+            _Pool(minsize=3, maxsize=2)
+
+    async def test_warm_up(self):
+        pool = _Pool(minsize=2)
+        self.assertFalse(pool.already_setup)
+
+        async with pool:
+            self.assertEqual(2, pool.create_instance_call_count)
+            self.assertEqual(2, len(pool))
+            async with pool.acquire(), pool.acquire():
+                pass
+            self.assertEqual(2, pool.create_instance_call_count)
+
+    async def test_replenish(self):
+        async with _Pool(minsize=2, recycle=None, replenish_interval=0.01) as pool:
+            async with pool.acquire() as instance:
+                pass
+            pool._PoolBase__recycle_instance(instance)
+            self.assertEqual(1, len(pool))
+
+            await sleep(0.1)
+
+            self.assertEqual(2, len(pool))
+            self.assertEqual(3, pool.create_instance_call_count)
+            self.assertEqual(1, pool.recycles)
+
+    async def test_failed_check(self):
+        async with _Pool() as pool:
+            pool._check_instance = AsyncMock(side_effect=[False, True])
+            async with pool.acquire() as observed:
+                self.assertEqual("foo-2", observed)
+
+        self.assertEqual(1, pool.failed_checks)
+        self.assertEqual(1, pool.recycles)
+
+    async def test_metrics(self):
+        async with _Pool(minsize=1) as pool:
+            async with pool.acquire():
+                observed = pool.metrics()
+                self.assertIn(pool, {ref() for _, ref in METRICS_REGISTRY._sources})
+
+        self.assertEqual(1, observed["size"])
+        self.assertEqual(1, observed["in_use"])
+        self.assertEqual(0, observed["idle"])
+        self.assertEqual(1, observed["minsize"])
+        self.assertEqual(10, observed["maxsize"])
+        self.assertEqual(1, observed["creations"])
+        self.assertEqual(0, observed["recycles"])
+        self.assertEqual(0, observed["failed_checks"])
+        self.assertEqual(1, observed["acquire_wait"]["count"])
+
+        self.assertNotIn(pool, {ref() for _, ref in METRICS_REGISTRY._sources})
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,107 @@
+import unittest
+from asyncio import (
+    create_task,
+    gather,
+    sleep,
+)
+
+from minos.common import (
+    SETUP_PROFILER,
+    SETUP_SPAN_CONTEXT_VAR,
+    SetupProfiler,
+    SetupSpan,
+)
+
+
+class TestSetupSpan(unittest.TestCase):
+    def setUp(self) -> None:
+        self.span = SetupSpan("setup", "foo")
+        self.span.start = 10.0
+        self.span.end = 10.5
+
+        child = SetupSpan("setup", "bar")
+        child.start = 10.1
+        child.end = 10.3
+        self.span.children.append(child)
+
+    def test_elapsed(self):
+        self.assertAlmostEqual(0.5, self.span.elapsed)
+        self.assertTrue(self.span.finished)
+
+    def test_elapsed_not_finished(self):
+        span = SetupSpan("setup", "foo")
+        self.assertFalse(span.finished)
+        self.assertGreaterEqual(span.elapsed, 0)
+
+    def test_as_dict(self):
+        observed = self.span.as_dict()
+
+        self.assertEqual({"action", "name", "offset_ms", "elapsed_ms", "children"}, observed.keys())
+        self.assertEqual(("setup", "foo"), (observed["action"], observed["name"]))
+        self.assertAlmostEqual(0.0, observed["offset_ms"])
+        self.assertAlmostEqual(500.0, observed["elapsed_ms"])
+
+        self.assertEqual(1, len(observed["children"]))
+        self.assertEqual("bar", observed["children"][0]["name"])
+        self.assertAlmostEqual(100.0, observed["children"][0]["offset_ms"])
+        self.assertAlmostEqual(200.0, observed["children"][0]["elapsed_ms"])
+
+    def test_format(self):
+        expected = "setup 'foo': 500.0 ms (+0.0 ms)\n  setup 'bar': 200.0 ms (+100.0 ms)"
+        self.assertEqual(expected, self.span.format())
+
+
+class TestSetupProfiler(unittest.IsolatedAsyncioTestCase):
+    def test_global(self):
+        self.assertIsInstance(SETUP_PROFILER, SetupProfiler)
+
+    def test_span(self):
+        profiler = SetupProfiler()
+
+        with profiler.span("setup", "foo") as span:
+            self.assertEqual(span, SETUP_SPAN_CONTEXT_VAR.get())
+            self.assertFalse(span.finished)
+            with profiler.span("wire", "bar") as child:
+                pass
+
+        self.assertIsNone(SETUP_SPAN_CONTEXT_VAR.get())
+        self.assertTrue(span.finished)
+        self.assertEqual([span], list(profiler.spans))
+        self.assertEqual([child], span.children)
+
+    async def test_span_tasks(self):
+        profiler = SetupProfiler()
+
+        async def _fn(name: str) -> None:
+            with profiler.span("setup", name):
+                await sleep(0.01)
+
+        with profiler.span("setup", "foo") as span:
+            await gather(create_task(_fn("one")), create_task(_fn("two")))
+            task = create_task(_fn("three"))
+
+        await task
+
+        self.assertEqual(["foo", "three"], [root.name for root in profiler.spans])
+        self.assertEqual({"one", "two"}, {child.name for child in span.children})
+
+    def test_maxsize(self):
+        profiler = SetupProfiler(maxsize=2)
+        for name in ("one", "two", "three"):
+            with profiler.span("setup", name):
+                pass
+
+        self.assertEqual(["two", "three"], [span.name for span in profiler.spans])
+
+    def test_clear(self):
+        profiler = SetupProfiler()
+        with profiler.span("setup", "foo"):
+            pass
+
+        profiler.clear()
+
+        self.assertEqual(0, len(profiler.spans))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,10 @@
 import unittest
+from unittest.mock import (
+    patch,
+)
 
 from minos.common import (
+    InMemoryAvroSchemaRegistry,
     MinosAvroProtocol,
     MinosProtocolException,
 )
@@ -123,6 +127,102 @@ class TestMinosAvroProtocol(unittest.TestCase):
         with self.assertRaises(MinosProtocolException):
             MinosAvroProtocol.decode(serialized)
 
+    def test_decode_with_schema(self):
+        serialized = MinosAvroProtocol.encode("one", [["string", "int"]])
+        self.assertEqual((["string", "int"], "one"), MinosAvroProtocol.decode_with_schema(serialized))
+
+    def test_decode_with_schema_memoryview(self):
+        serialized = MinosAvroProtocol.encode("one", [["string", "int"]])
+        self.assertEqual((["string", "int"], "one"), MinosAvroProtocol.decode_with_schema(memoryview(serialized)))
+
+    def test_decode_with_schema_batch_mode(self):
+        serialized = MinosAvroProtocol.encode(["one", 1], [["string", "int"]], batch_mode=True)
+        self.assertEqual(
+            (["string", "int"], ["one", 1]), MinosAvroProtocol.decode_with_schema(serialized, batch_mode=True)
+        )
+
+        with self.assertRaises(MinosProtocolException):
+            MinosAvroProtocol.decode_with_schema(serialized)
+
+    def test_decode_with_schema_raises(self):
+        with self.assertRaises(MinosProtocolException):
+            MinosAvroProtocol.decode_with_schema(b"Test")
+
+    def test_parse_schema(self):
+        schema = {
+            "type": "record",
+            "name": "tests.model_classes.ShoppingList",
+            "fields": [{"type": "double", "name": "foo"}],
+        }
+        parsed = MinosAvroProtocol.parse_schema(schema)
+        self.assertIs(parsed, MinosAvroProtocol.parse_schema(parsed))
+
+        data = {"foo": 3.14159265359}
+        serialized = MinosAvroProtocol.encode(data, [parsed])
+        self.assertEqual(data, MinosAvroProtocol.decode(serialized))
+
+    def test_parse_schema_raises(self):
+        with self.assertRaises(MinosProtocolException):
+            MinosAvroProtocol.parse_schema({"type": "record", "name": "Foo", "fields": [{"type": "foo", "name": "f"}]})
+
+
+class TestMinosAvroProtocolSingleObject(unittest.TestCase):
+    def setUp(self) -> None:
+        self.registry = InMemoryAvroSchemaRegistry()
+        self.schema = {
+            "type": "record",
+            "name": "tests.model_classes.ShoppingList",
+            "fields": [{"type": {"type": "array", "items": "string", "logicalType": "set"}, "name": "foo"}],
+        }
+        self.data = {"foo": ["one", "two"]}
+
+    def test_encode(self):
+        with patch.object(MinosAvroProtocol, "schema_registry", self.registry):
+            serialized = MinosAvroProtocol.encode(self.data, self.schema)
+            self.assertEqual(b"\xc3\x01", serialized[:2])
+            self.assertLess(len(serialized), len(MinosAvroProtocol.encode([self.data], self.schema, batch_mode=True)))
+
+            self.assertEqual(self.data, MinosAvroProtocol.decode(serialized))
+            self.assertEqual([self.data], MinosAvroProtocol.decode(serialized, batch_mode=True))
+
+    def test_decode_schema(self):
+        with patch.object(MinosAvroProtocol, "schema_registry", self.registry):
+            serialized = MinosAvroProtocol.encode(self.data, self.schema)
+            self.assertEqual(self.schema, MinosAvroProtocol.decode_schema(serialized))
+
+    def test_decode_with_schema(self):
+        with patch.object(MinosAvroProtocol, "schema_registry", self.registry):
+            serialized = MinosAvroProtocol.encode(self.data, self.schema)
+            self.assertEqual((self.schema, self.data), MinosAvroProtocol.decode_with_schema(memoryview(serialized)))
+
+    def test_union_schema(self):
+        with patch.object(MinosAvroProtocol, "schema_registry", self.registry):
+            serialized = MinosAvroProtocol.encode("one", [["string", "int"]])
+            self.assertEqual(["string", "int"], MinosAvroProtocol.decode_schema(serialized))
+            self.assertEqual("one", MinosAvroProtocol.decode(serialized))
+
+    def test_decode_container(self):
+        serialized = MinosAvroProtocol.encode(self.data, self.schema)
+        with patch.object(MinosAvroProtocol, "schema_registry", self.registry):
+            self.assertEqual(self.data, MinosAvroProtocol.decode(serialized))
+
+    def test_decode_without_registry_raises(self):
+        with patch.object(MinosAvroProtocol, "schema_registry", self.registry):
+            serialized = MinosAvroProtocol.encode(self.data, self.schema)
+
+        with self.assertRaises(MinosProtocolException):
+            MinosAvroProtocol.decode(serialized)
+        with self.assertRaises(MinosProtocolException):
+            MinosAvroProtocol.decode_schema(serialized)
+
+    def test_decode_unknown_fingerprint_raises(self):
+        with patch.object(MinosAvroProtocol, "schema_registry", self.registry):
+            serialized = MinosAvroProtocol.encode(self.data, self.schema)
+
+        with patch.object(MinosAvroProtocol, "schema_registry", InMemoryAvroSchemaRegistry()):
+            with self.assertRaises(MinosProtocolException):
+                MinosAvroProtocol.decode(serialized)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,241 @@
+import shutil
+import unittest
+from asyncio import (
+    gather,
+    sleep,
+    wrap_future,
+)
+from unittest.mock import (
+    patch,
+)
+
+import aiopg
+
+from minos.common import (
+    AvroSchemaRegistry,
+    InMemoryAvroSchemaRegistry,
+    MinosAvroProtocol,
+    MinosConfig,
+    MinosProtocolException,
+    MinosSetup,
+    PostgreSqlAvroSchemaRegistry,
+    StorageAvroSchemaRegistry,
+)
+from minos.common.protocol.avro.base import (
+    SINGLE_OBJECT_MAGIC,
+)
+from minos.common.testing import (
+    PostgresAsyncTestCase,
+)
+from tests.utils import (
+    BASE_PATH,
+)
+
+
+class TestInMemoryAvroSchemaRegistry(unittest.TestCase):
+    def setUp(self) -> None:
+        self.schema = {
+            "type": "record",
+            "name": "tests.model_classes.ShoppingList",
+            "fields": [{"type": {"type": "string", "logicalType": "uuid"}, "name": "foo"}],
+        }
+
+    def test_abstract(self):
+        self.assertTrue(issubclass(InMemoryAvroSchemaRegistry, AvroSchemaRegistry))
+        # noinspection PyUnresolvedReferences
+        self.assertEqual({"_store", "_load"}, AvroSchemaRegistry.__abstractmethods__)
+
+    def test_register(self):
+        registry = InMemoryAvroSchemaRegistry()
+        fingerprint = registry.register(MinosAvroProtocol.parse_schema(self.schema))
+        self.assertIsInstance(fingerprint, bytes)
+        self.assertEqual(8, len(fingerprint))
+        self.assertEqual(fingerprint, registry.register(MinosAvroProtocol.parse_schema(self.schema)))
+
+    def test_register_cached(self):
+        registry = InMemoryAvroSchemaRegistry()
+        with patch.object(
+            InMemoryAvroSchemaRegistry, "fingerprint", side_effect=AvroSchemaRegistry.fingerprint
+        ) as mock:
+            first = registry.register(MinosAvroProtocol.parse_schema(self.schema))
+            second = registry.register(MinosAvroProtocol.parse_schema(dict(self.schema)))
+
+        self.assertEqual(first, second)
+        self.assertEqual(1, mock.call_count)
+
+    def test_register_cached_identity(self):
+        registry = InMemoryAvroSchemaRegistry()
+        schema = MinosAvroProtocol.parse_schema(self.schema)
+        first = registry.register(schema)
+
+        with patch("orjson.dumps") as mock:
+            second = registry.register(schema)
+
+        self.assertEqual(first, second)
+        self.assertEqual(0, mock.call_count)
+
+    def test_register_logical_type(self):
+        registry = InMemoryAvroSchemaRegistry()
+        other = {
+            "type": "record",
+            "name": "tests.model_classes.ShoppingList",
+            "fields": [{"type": "string", "name": "foo"}],
+        }
+        self.assertNotEqual(
+            registry.register(MinosAvroProtocol.parse_schema(self.schema)),
+            registry.register(MinosAvroProtocol.parse_schema(other)),
+        )
+
+    def test_get(self):
+        registry = InMemoryAvroSchemaRegistry()
+        fingerprint = registry.register(MinosAvroProtocol.parse_schema(self.schema))
+        self.assertEqual(self.schema, registry.get(fingerprint))
+
+    def test_get_evicted(self):
+        registry = InMemoryAvroSchemaRegistry(max_size=1)
+        fingerprint = registry.register(MinosAvroProtocol.parse_schema(self.schema))
+        registry.register(MinosAvroProtocol.parse_schema(["string", "int"]))
+
+        self.assertEqual(self.schema, registry.get(fingerprint))
+        self.assertIn("__fastavro_parsed", registry.get_parsed(fingerprint))
+
+    def test_get_raises(self):
+        registry = InMemoryAvroSchemaRegistry()
+        with self.assertRaises(MinosProtocolException):
+            registry.get(bytes(8))
+
+
+class TestStorageAvroSchemaRegistry(unittest.TestCase):
+    def setUp(self) -> None:
+        self.path = BASE_PATH / "schemas.lmdb"
+        self.schema = {
+            "type": "record",
+            "name": "tests.model_classes.ShoppingList",
+            "fields": [{"type": "double", "name": "foo"}],
+        }
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.path, ignore_errors=True)
+
+    def test_get(self):
+        registry = StorageAvroSchemaRegistry.build(self.path)
+        fingerprint = registry.register(MinosAvroProtocol.parse_schema(self.schema))
+        self.assertEqual(self.schema, registry.get(fingerprint))
+
+    def test_get_persisted(self):
+        registry = StorageAvroSchemaRegistry.build(self.path)
+        fingerprint = registry.register(MinosAvroProtocol.parse_schema(self.schema))
+        # noinspection PyProtectedMember
+        storage = registry._storage
+
+        self.assertEqual(self.schema, StorageAvroSchemaRegistry(storage).get(fingerprint))
+
+
+class TestPostgreSqlAvroSchemaRegistry(PostgresAsyncTestCase):
+    CONFIG_FILE_PATH = BASE_PATH / "test_config.yml"
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.schema = {
+            "type": "record",
+            "name": "tests.model_classes.ShoppingList",
+            "fields": [{"type": "double", "name": "foo"}],
+        }
+
+    def test_is_subclass(self):
+        self.assertTrue(issubclass(PostgreSqlAvroSchemaRegistry, (AvroSchemaRegistry, MinosSetup)))
+
+    def test_from_config(self):
+        config = MinosConfig(
+            self.CONFIG_FILE_PATH,
+            schema_registry_database=self.repository_db["database"],
+            schema_registry_user=self.repository_db["user"],
+        )
+        registry = PostgreSqlAvroSchemaRegistry.from_config(config)
+
+        self.assertEqual(self.repository_db["database"], registry.database)
+        self.assertEqual(self.repository_db["user"], registry.user)
+        self.assertEqual(self.repository_db["password"], registry.password)
+        self.assertEqual(self.repository_db["host"], registry.host)
+        self.assertEqual(self.repository_db["port"], registry.port)
+
+    async def test_register_not_stored(self):
+        async with PostgreSqlAvroSchemaRegistry(**self.repository_db) as registry:
+            schema = MinosAvroProtocol.parse_schema(self.schema)
+            self.assertIsNone(registry.register(schema))
+
+            # noinspection PyProtectedMember
+            await gather(*(wrap_future(future) for future in registry._pending.values()))
+
+            fingerprint = registry.register(schema)
+            self.assertEqual(fingerprint, await registry.aregister(schema))
+
+    async def test_register_without_setup(self):
+        registry = PostgreSqlAvroSchemaRegistry(**self.repository_db)
+        self.assertIsNone(registry.register(MinosAvroProtocol.parse_schema(self.schema)))
+        # noinspection PyProtectedMember
+        self.assertEqual(dict(), registry._pending)
+
+    async def test_get_shared(self):
+        async with PostgreSqlAvroSchemaRegistry(**self.repository_db) as registry:
+            fingerprint = await registry.aregister(MinosAvroProtocol.parse_schema(self.schema))
+
+        async with PostgreSqlAvroSchemaRegistry(**self.repository_db) as other:
+            self.assertEqual(self.schema, other.get(fingerprint))
+
+    async def test_get_registered_after_setup(self):
+        async with PostgreSqlAvroSchemaRegistry(**self.repository_db) as registry:
+            async with PostgreSqlAvroSchemaRegistry(**self.repository_db) as other:
+                fingerprint = await registry.aregister(MinosAvroProtocol.parse_schema(self.schema))
+                self.assertEqual(self.schema, await other.aget(fingerprint))
+
+    async def test_get_notified(self):
+        async with PostgreSqlAvroSchemaRegistry(**self.repository_db) as registry:
+            async with PostgreSqlAvroSchemaRegistry(**self.repository_db) as other:
+                fingerprint = await registry.aregister(MinosAvroProtocol.parse_schema(self.schema))
+                for _ in range(100):
+                    # noinspection PyProtectedMember
+                    if fingerprint in other._loaded:
+                        break
+                    await sleep(0.01)
+
+                self.assertEqual(self.schema, other.get(fingerprint))
+
+    async def test_get_raises(self):
+        async with PostgreSqlAvroSchemaRegistry(**self.repository_db) as registry:
+            with self.assertRaises(MinosProtocolException):
+                registry.get(bytes(8))
+            with self.assertRaises(MinosProtocolException):
+                await registry.aget(bytes(8))
+
+    async def test_register_stored_once(self):
+        async with PostgreSqlAvroSchemaRegistry(**self.repository_db) as registry:
+            await registry.aregister(MinosAvroProtocol.parse_schema(self.schema))
+        async with PostgreSqlAvroSchemaRegistry(**self.repository_db) as registry:
+            await registry.aregister(MinosAvroProtocol.parse_schema(self.schema))
+
+        async with aiopg.connect(**self.repository_db) as connection:
+            async with connection.cursor() as cursor:
+                await cursor.execute("SELECT COUNT(*) FROM avro_schemas;")
+                self.assertEqual((1,), await cursor.fetchone())
+
+    async def test_protocol(self):
+        async with PostgreSqlAvroSchemaRegistry(**self.repository_db) as registry:
+            self.assertEqual(registry, MinosAvroProtocol.schema_registry)
+
+            container = MinosAvroProtocol.encode({"foo": 3.5}, self.schema)
+            self.assertFalse(container.startswith(SINGLE_OBJECT_MAGIC))
+
+            await registry.aregister(MinosAvroProtocol.parse_schema(self.schema))
+            data = MinosAvroProtocol.encode({"foo": 3.5}, self.schema)
+            self.assertTrue(data.startswith(SINGLE_OBJECT_MAGIC))
+
+        self.assertIsNone(MinosAvroProtocol.schema_registry)
+
+        async with PostgreSqlAvroSchemaRegistry(**self.repository_db):
+            self.assertEqual({"foo": 3.5}, MinosAvroProtocol.decode(container))
+            self.assertEqual({"foo": 3.5}, MinosAvroProtocol.decode(data))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,135 @@
+import unittest
+from io import (
+    BytesIO,
+)
+from unittest.mock import (
+    patch,
+)
+
+import fastavro
+
+from minos.common import (
+    AvroStreamReader,
+    AvroStreamWriter,
+    MinosAvroProtocol,
+    MinosProtocolException,
+)
+
+
+class TestAvroStreams(unittest.TestCase):
+    def setUp(self) -> None:
+        self.schema = {
+            "fields": [{"name": "id", "type": "int"}, {"name": "username", "type": ["string", "null"]}],
+            "name": "User",
+            "namespace": "tests.model_classes",
+            "type": "record",
+        }
+        self.values = [{"id": i, "username": f"user-{i}"} for i in range(100)]
+
+    def _write(self, **kwargs) -> bytes:
+        with BytesIO() as file:
+            writer = MinosAvroProtocol.stream_writer(file, self.schema, **kwargs)
+            for value in self.values:
+                writer.write(value)
+            writer.flush()
+            return file.getvalue()
+
+    def test_writer(self):
+        with BytesIO() as file:
+            writer = MinosAvroProtocol.stream_writer(file, self.schema)
+            self.assertIsInstance(writer, AvroStreamWriter)
+            for value in self.values:
+                writer.write(value)
+            writer.flush()
+            self.assertEqual(len(self.values), writer.count)
+
+            self.assertEqual(self.values, MinosAvroProtocol.decode(file.getvalue(), batch_mode=True))
+
+    def test_writer_raises(self):
+        with BytesIO() as file:
+            writer = MinosAvroProtocol.stream_writer(file, self.schema)
+            with self.assertRaises(MinosProtocolException):
+                writer.write({"id": "foo"})
+
+    def test_decode_stream(self):
+        with BytesIO(self._write(sync_interval=100)) as file:
+            schema, values = MinosAvroProtocol.decode_stream(file)
+            self.assertEqual("tests.model_classes.User", schema["name"])
+            self.assertEqual(self.values, list(values))
+
+    def test_decode_stream_raises(self):
+        with self.assertRaises(MinosProtocolException):
+            MinosAvroProtocol.decode_stream(BytesIO(b"foo"))
+
+    def test_reader(self):
+        data = self._write(sync_interval=100)
+
+        reader = MinosAvroProtocol.stream_reader()
+        self.assertIsInstance(reader, AvroStreamReader)
+
+        observed = list()
+        for byte in data:
+            observed.extend(reader.feed(bytes((byte,))))
+        reader.close()
+
+        self.assertEqual("tests.model_classes.User", reader.schema["name"])
+        self.assertEqual(self.values, observed)
+
+    def test_reader_blocks(self):
+        data = self._write(sync_interval=100)
+        reader = MinosAvroProtocol.stream_reader()
+
+        half = len(data) // 2
+
+        observed = reader.feed(data[:half])
+        self.assertLess(0, len(observed))
+        self.assertGreater(len(self.values), len(observed))
+
+        observed += reader.feed(data[half:])
+        self.assertEqual(self.values, observed)
+
+    def test_reader_header_parsed_once(self):
+        data = self._write(sync_interval=100)
+        reader = MinosAvroProtocol.stream_reader()
+
+        with patch("minos.common.protocol.avro.streams.reader", side_effect=fastavro.reader) as mock:
+            observed = reader.feed(data)
+
+        self.assertEqual(self.values, observed)
+        self.assertEqual(1, mock.call_count)
+
+    def test_reader_codecs(self):
+        for codec in ("null", "deflate", "bzip2", "xz"):
+            with self.subTest(codec=codec):
+                with BytesIO() as file:
+                    fastavro.writer(file, self.schema, self.values, codec=codec, sync_interval=100)
+                    data = file.getvalue()
+
+                reader = MinosAvroProtocol.stream_reader()
+                observed = reader.feed(data)
+                reader.close()
+
+                self.assertEqual(self.values, observed)
+
+    def test_reader_sync_marker_raises(self):
+        data = bytearray(self._write())
+        data[-1] ^= 0xFF
+        reader = MinosAvroProtocol.stream_reader()
+        with self.assertRaises(MinosProtocolException):
+            reader.feed(data)
+
+    def test_reader_truncated_raises(self):
+        data = self._write()
+        reader = MinosAvroProtocol.stream_reader()
+        reader.feed(data[:-1])
+        with self.assertRaises(MinosProtocolException):
+            reader.close()
+
+    def test_reader_not_container_raises(self):
+        reader = MinosAvroProtocol.stream_reader()
+        with self.assertRaises(MinosProtocolException):
+            reader.feed(b"foobar")
+
+
+if __name__ == "__main__":
+    unittest.main()
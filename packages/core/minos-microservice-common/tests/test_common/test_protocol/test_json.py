@@ -1,8 +1,14 @@
 import unittest
 
+import orjson
+
 from minos.common import (
     MinosJsonBinaryProtocol,
 )
+from tests.model_classes import (
+    Bar,
+    Foo,
+)
 
 
 class TestMinosJsonBinaryProtocol(unittest.TestCase):
@@ -14,6 +20,11 @@ class TestMinosJsonBinaryProtocol(unittest.TestCase):
         decoded = MinosJsonBinaryProtocol.decode(encoded)
         self.assertEqual(data, decoded)
 
+    def test_encode_model(self):
+        data = {"foo": Bar(first=Foo("one"), second=Foo("two"))}
+        encoded = MinosJsonBinaryProtocol.encode(data)
+        self.assertEqual({"foo": {"first": {"text": "one"}, "second": {"text": "two"}}}, orjson.loads(encoded))
+
 
 if __name__ == "__main__":
     unittest.main()
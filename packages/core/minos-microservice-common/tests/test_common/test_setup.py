@@ -1,7 +1,12 @@
 import sys
 import unittest
+from asyncio import (
+    gather,
+    sleep,
+)
 
 from minos.common import (
+    SETUP_PROFILER,
     DependencyInjector,
     MinosConfig,
     MinosSetup,
@@ -41,6 +46,18 @@ class TestMinosSetup(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(1, instance.setup_calls)
         self.assertEqual(1, instance.destroy_calls)
 
+    async def test_setup_destroy_profiled(self):
+        instance = _MinosSetupMock()
+
+        with SETUP_PROFILER.span("launch", "foo") as span:
+            await instance.setup()
+            await instance.destroy()
+
+        self.assertEqual(
+            [("setup", "_MinosSetupMock"), ("destroy", "_MinosSetupMock")],
+            [(child.action, child.name) for child in span.children],
+        )
+
     async def test_setup_already_setup(self):
         instance = _MinosSetupMock(already_setup=True)
         await instance.setup()
@@ -57,6 +74,15 @@ class TestMinosSetup(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(0, instance.setup_calls)
         self.assertEqual(0, instance.destroy_calls)
 
+    async def test_setup_destroy_concurrently(self):
+        instance = _MinosSetupMock()
+
+        await gather(instance.setup(), instance.setup())
+        self.assertEqual(1, instance.setup_calls)
+
+        await gather(instance.destroy(), instance.destroy())
+        self.assertEqual(1, instance.destroy_calls)
+
     def test_from_config(self):
         config = MinosConfig(BASE_PATH / "test_config.yml")
         _MinosSetupMock.from_config(config)
@@ -90,9 +116,11 @@ class _MinosSetupMock(MinosSetup):
         self.destroy_calls = 0
 
     async def _setup(self) -> None:
+        await sleep(0)
         self.setup_calls += 1
 
     async def _destroy(self) -> None:
+        await sleep(0)
         self.destroy_calls += 1
 
 
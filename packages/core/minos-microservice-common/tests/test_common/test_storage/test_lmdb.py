@@ -1,5 +1,12 @@
+import asyncio
 import shutil
+import threading
 import unittest
+from unittest.mock import (
+    patch,
+)
+
+import lmdb
 
 from minos.common import (
     MinosStorageLmdb,
@@ -92,6 +99,204 @@ class TestMinosStorageLmdb(unittest.TestCase):
         updated_value = storage.get("TestOne", "first")
         assert updated_value == "Updated Text Value"
 
+    def test_storage_get_many(self):
+        storage = MinosStorageLmdb.build(self.path)
+        storage.add("TestOne", "first", "Text Value")
+        storage.add("TestOne", "second", {"key_one": "hello"})
+
+        self.assertEqual(
+            ["Text Value", None, {"key_one": "hello"}], storage.get_many("TestOne", ["first", "missing", "second"])
+        )
+
+    def test_storage_put_many(self):
+        storage = MinosStorageLmdb.build(self.path)
+        storage.add("TestOne", "first", "Text Value")
+
+        with patch.object(MinosStorageLmdb, "_commit", side_effect=MinosStorageLmdb._commit, autospec=True) as mock:
+            storage.put_many("TestOne", [("first", "Updated Text Value"), ("second", 123)])
+
+        self.assertEqual(1, mock.call_count)
+        self.assertEqual(["Updated Text Value", 123], storage.get_many("TestOne", ["first", "second"]))
+
+    def test_build_raises_growth_factor(self):
+        with self.assertRaises(ValueError):
+            MinosStorageLmdb.build(self.path, growth_factor=1)
+
+    def test_grow(self):
+        storage = MinosStorageLmdb.build(self.path, map_size=2**16)
+        storage.put_many("TestOne", [(str(i), "x" * 4096) for i in range(64)])
+
+        self.assertEqual("x" * 4096, storage.get("TestOne", "63"))
+        stats = storage.stats()
+        self.assertLess(2**16, stats["map_size"])
+        self.assertLess(0, stats["resizes"])
+
+    def test_grow_raises_max_map_size(self):
+        storage = MinosStorageLmdb.build(self.path, map_size=2**16, max_map_size=2**17)
+
+        with self.assertRaises(lmdb.MapFullError):
+            storage.put_many("TestOne", [(str(i), "x" * 4096) for i in range(64)])
+
+        self.assertEqual(2**17, storage.stats()["map_size"])
+        self.assertEqual(None, storage.get("TestOne", "0"))
+
+    def test_stats(self):
+        storage = MinosStorageLmdb.build(self.path)
+        storage.put_many("TestOne", [("first", "one"), ("second", "two")])
+        storage.add("TestTwo", "first", "one")
+
+        stats = storage.stats()
+
+        self.assertEqual({"TestOne": 2, "TestTwo": 1}, stats["tables"])
+        self.assertEqual(int(1e9), stats["map_size"])
+        self.assertEqual(stats["map_size"] // stats["page_size"], stats["total_pages"])
+        self.assertLess(0, stats["used_pages"])
+        self.assertAlmostEqual(stats["used_pages"] / stats["total_pages"], stats["usage"])
+        self.assertLessEqual(0, stats["readers"])
+        self.assertLess(0, stats["max_readers"])
+        self.assertEqual(0, stats["resizes"])
+        self.assertEqual(2, stats["write_latency"]["count"])
+
+    def test_copy(self):
+        storage = MinosStorageLmdb.build(self.path)
+        storage.add("TestOne", "first", "one")
+
+        target = self.path / "backup"
+        self.assertEqual(target / "data.mdb", storage.copy(target))
+
+        storage.add("TestOne", "first", "two")
+        storage.copy(target)
+
+        observed = MinosStorageLmdb.build(target).get("TestOne", "first")
+        self.assertEqual("two", observed)
+
+
+class TestMinosStorageLmdbAsync(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.path = BASE_PATH / "order.lmdb"
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.path, ignore_errors=True)
+
+    async def test_aput(self):
+        storage = MinosStorageLmdb.build(self.path)
+        await storage.aput("TestOne", "first", {"key_one": "hello"})
+
+        self.assertEqual({"key_one": "hello"}, await storage.aget("TestOne", "first"))
+        self.assertEqual({"key_one": "hello"}, storage.get("TestOne", "first"))
+
+    async def test_aget_missing(self):
+        storage = MinosStorageLmdb.build(self.path)
+
+        self.assertEqual(None, await storage.aget("TestOne", "first"))
+
+    async def test_aput_many(self):
+        storage = MinosStorageLmdb.build(self.path)
+        await storage.aput_many("TestOne", [("first", "Text Value"), ("second", 123)])
+
+        self.assertEqual(["Text Value", 123, None], await storage.aget_many("TestOne", ["first", "second", "third"]))
+
+    async def test_adelete(self):
+        storage = MinosStorageLmdb.build(self.path)
+        await storage.aput("TestOne", "first", "Text Value")
+        await storage.aput("TestOne", "second", "Text Second Value")
+
+        await storage.adelete("TestOne", "first")
+
+        self.assertEqual([None, "Text Second Value"], await storage.aget_many("TestOne", ["first", "second"]))
+
+    async def test_aget_offloaded(self):
+        storage = MinosStorageLmdb.build(self.path)
+        await storage.aput("TestOne", "first", "one")
+
+        threads = list()
+        read = MinosStorageLmdb._read
+
+        def _side_effect(*args, **kwargs):
+            threads.append(threading.current_thread())
+            return read(*args, **kwargs)
+
+        with patch.object(MinosStorageLmdb, "_read", side_effect=_side_effect, autospec=True):
+            self.assertEqual("one", await storage.aget("TestOne", "first"))
+            self.assertEqual(["one"], await storage.aget_many("TestOne", ["first"]))
+
+        self.assertEqual(2, len(threads))
+        self.assertNotIn(threading.main_thread(), threads)
+
+    async def test_close(self):
+        storage = MinosStorageLmdb.build(self.path)
+        writes = [asyncio.create_task(storage.aput("TestOne", str(i), i)) for i in range(10)]
+        await asyncio.sleep(0)
+
+        await storage.close()
+
+        self.assertTrue(all(write.done() for write in writes))
+        # noinspection PyProtectedMember
+        self.assertIsNone(storage._executor)
+        self.assertEqual(list(range(10)), storage.get_many("TestOne", map(str, range(10))))
+
+        await storage.aput("TestOne", "first", "one")
+        self.assertEqual("one", await storage.aget("TestOne", "first"))
+        await storage.close()
+
+    async def test_group_commit(self):
+        storage = MinosStorageLmdb.build(self.path)
+
+        with patch.object(MinosStorageLmdb, "_commit", side_effect=MinosStorageLmdb._commit, autospec=True) as mock:
+            await asyncio.gather(*(storage.aput("TestOne", str(i), i) for i in range(100)))
+
+        self.assertEqual(1, mock.call_count)
+        self.assertEqual(list(range(100)), storage.get_many("TestOne", map(str, range(100))))
+
+    async def test_group_commit_ordering(self):
+        storage = MinosStorageLmdb.build(self.path)
+
+        await asyncio.gather(
+            storage.aput("TestOne", "first", "one"),
+            storage.adelete("TestOne", "first"),
+            storage.aput("TestOne", "first", "two"),
+        )
+
+        self.assertEqual("two", await storage.aget("TestOne", "first"))
+
+    async def test_group_commit_raises(self):
+        storage = MinosStorageLmdb.build(self.path)
+
+        with patch.object(MinosStorageLmdb, "_commit", side_effect=ValueError):
+            results = await asyncio.gather(
+                storage.aput("TestOne", "first", "one"),
+                storage.aput("TestOne", "second", "two"),
+                return_exceptions=True,
+            )
+
+        self.assertEqual(2, len(results))
+        self.assertTrue(all(isinstance(result, ValueError) for result in results))
+        self.assertEqual([None, None], await storage.aget_many("TestOne", ["first", "second"]))
+
+        await storage.aput("TestOne", "first", "one")
+        self.assertEqual("one", await storage.aget("TestOne", "first"))
+
+    async def test_acopy(self):
+        storage = MinosStorageLmdb.build(self.path)
+        await storage.aput("TestOne", "first", "one")
+
+        target = await storage.acopy(self.path / "backup", compact=False)
+
+        self.assertEqual("one", MinosStorageLmdb.build(target.parent).get("TestOne", "first"))
+
+    async def test_copy_periodically(self):
+        storage = MinosStorageLmdb.build(self.path)
+        await storage.aput("TestOne", "first", "one")
+
+        task = asyncio.create_task(storage.copy_periodically(self.path / "backup", 0.01))
+        try:
+            while not (self.path / "backup" / "data.mdb").exists():
+                await asyncio.sleep(0.01)
+        finally:
+            task.cancel()
+
+        self.assertEqual("one", MinosStorageLmdb.build(self.path / "backup").get("TestOne", "first"))
+
 
 if __name__ == "__main__":
     unittest.main()
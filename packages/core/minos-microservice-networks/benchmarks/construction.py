@@ -0,0 +1,47 @@
+"""Construction throughput of the broker message models.
+
+Run it from the package root with ``python -m benchmarks.construction``. The JSON results are written to the standard output
+(or to the ``--output`` file), and they can be compared with the results of a previous run with ``--compare``.
+"""
+
+from collections.abc import (
+    Iterator,
+)
+from uuid import (
+    uuid4,
+)
+
+from minos.common.benchmarks import (
+    Case,
+    main,
+)
+from minos.networks import (
+    BrokerMessageV1,
+    BrokerMessageV1Payload,
+    BrokerMessageV1Status,
+)
+
+CONTENT = {"uuid": str(uuid4()), "name": "foo", "price": 34.5, "tags": ["one", "two", "three"]}
+
+
+def build_payload() -> BrokerMessageV1Payload:
+    """Build a payload instance."""
+    return BrokerMessageV1Payload(CONTENT, headers={"foo": "bar"}, status=BrokerMessageV1Status.SUCCESS)
+
+
+def build_message() -> BrokerMessageV1:
+    """Build a message instance (payload included)."""
+    return BrokerMessageV1("AddOrder", build_payload(), reply_topic="AddOrderReply")
+
+
+def build_cases() -> Iterator[Case]:
+    """Build all the cases of the suite.
+
+    :return: An iterator of ``Case`` instances.
+    """
+    yield Case("BrokerMessageV1Payload", build_payload)
+    yield Case("BrokerMessageV1", build_message)
+
+
+if __name__ == "__main__":
+    main(build_cases(), __doc__)
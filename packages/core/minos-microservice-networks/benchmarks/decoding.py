@@ -0,0 +1,66 @@
+"""Decoding throughput of avro encoded broker messages.
+
+Run it from the package root with ``python -m benchmarks.decoding``. The JSON results are written to the standard output
+(or to the ``--output`` file), and they can be compared with the results of a previous run with ``--compare``.
+"""
+
+from collections.abc import (
+    Iterator,
+)
+from uuid import (
+    uuid4,
+)
+
+from minos.common import (
+    MinosAvroProtocol,
+)
+from minos.common.benchmarks import (
+    Case,
+    main,
+)
+from minos.networks import (
+    BrokerMessage,
+    BrokerMessageV1,
+    BrokerMessageV1Payload,
+)
+
+RAW = BrokerMessageV1(
+    "AddOrder",
+    BrokerMessageV1Payload({"uuid": str(uuid4()), "name": "foo", "price": 34.5, "tags": ["one", "two", "three"]}),
+    reply_topic="AddOrderReply",
+).avro_bytes
+
+
+def decode_two_passes() -> tuple:
+    """Decode the schema and the data with two independent reader passes."""
+    return MinosAvroProtocol.decode_schema(RAW), MinosAvroProtocol.decode(RAW)
+
+
+def decode_single_pass() -> tuple:
+    """Decode the schema and the data with a single reader pass."""
+    return MinosAvroProtocol.decode_with_schema(RAW)
+
+
+def decode_single_pass_memoryview() -> tuple:
+    """Decode the schema and the data with a single reader pass over a ``memoryview``."""
+    return MinosAvroProtocol.decode_with_schema(memoryview(RAW))
+
+
+def build_message() -> BrokerMessage:
+    """Build a message from its avro bytes."""
+    return BrokerMessage.from_avro_bytes(RAW)
+
+
+def build_cases() -> Iterator[Case]:
+    """Build all the cases of the suite.
+
+    :return: An iterator of ``Case`` instances.
+    """
+    yield Case("decode_schema + decode", decode_two_passes)
+    yield Case("decode_with_schema", decode_single_pass)
+    yield Case("decode_with_schema (memoryview)", decode_single_pass_memoryview)
+    yield Case("BrokerMessage.from_avro_bytes", build_message)
+
+
+if __name__ == "__main__":
+    main(build_cases(), __doc__)
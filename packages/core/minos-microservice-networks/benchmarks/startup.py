@@ -0,0 +1,94 @@
+"""Startup time of a microservice: package imports, dependency wiring and enroute analysis.
+
+Run it from the package root with ``python -m benchmarks.startup``. The JSON results are written to the standard output
+(or to the ``--output`` file), and they can be compared with the results of a previous run with ``--compare``.
+"""
+
+import subprocess
+import sys
+from asyncio import (
+    run,
+)
+from collections.abc import (
+    Iterator,
+)
+
+from minos.common import (
+    EntrypointLauncher,
+    MinosConfig,
+)
+from minos.common.benchmarks import (
+    Case,
+    main,
+)
+from minos.networks import (
+    EnrouteAnalyzer,
+    EnrouteBuilder,
+    Request,
+    Response,
+    enroute,
+)
+from tests.utils import (
+    CONFIG_FILE_PATH,
+)
+
+CONFIG = MinosConfig(CONFIG_FILE_PATH)
+
+METHODS = 30
+
+
+def build_service() -> type:
+    """Build a new service class (so that its analysis is not cached) with rest, broker and periodic handlers."""
+
+    async def _fn(self, request: Request) -> Response:
+        return Response(request)
+
+    namespace = dict()
+    for i in range(METHODS):
+        fn = enroute.rest.command(f"/orders/{i}", "POST")(_fn)
+        fn = enroute.broker.command(f"CreateOrder{i}")(fn)
+        namespace[f"create_order_{i}"] = fn
+        namespace[f"order_created_{i}"] = enroute.broker.event(f"OrderCreated{i}")(_fn)
+        namespace[f"send_report_{i}"] = enroute.periodic.event(f"{i % 60} * * * *")(_fn)
+
+    return type("_Service", (), namespace)
+
+
+def import_packages() -> None:
+    """Import the networks package (and its dependencies) from a new interpreter."""
+    subprocess.run([sys.executable, "-c", "import minos.networks"], check=True)
+
+
+def wire_unwire() -> None:
+    """Select the modules to be wired and wire and unwire them."""
+    launcher = EntrypointLauncher(CONFIG, injections=dict(), services=list())
+    run(_wire_unwire(launcher))
+
+
+async def _wire_unwire(launcher: EntrypointLauncher) -> None:
+    await launcher.setup()
+    await launcher.destroy()
+
+
+def analyze_services() -> None:
+    """Build the rest, broker and periodic handlers and the discovery endpoints of a new service."""
+    service = build_service()
+    builder = EnrouteBuilder(service)
+    builder.get_rest_command_query(config=CONFIG)
+    builder.get_broker_command_query_event(config=CONFIG)
+    builder.get_periodic_event(config=CONFIG)
+    EnrouteAnalyzer(service, CONFIG).get_rest_command_query()
+
+
+def build_cases() -> Iterator[Case]:
+    """Build all the cases of the suite.
+
+    :return: An iterator of ``Case`` instances.
+    """
+    yield Case("import", import_packages)
+    yield Case("wire/unwire", wire_unwire)
+    yield Case(f"enroute ({METHODS * 3} handlers)", analyze_services)
+
+
+if __name__ == "__main__":
+    main(build_cases(), __doc__)
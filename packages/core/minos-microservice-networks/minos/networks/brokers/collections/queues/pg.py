@@ -108,17 +108,27 @@ class PostgreSqlBrokerQueue(BrokerQueue, PostgreSqlMinosDatabase):
                 await wait_for(task, 0.5)
 
     async def _flush_queue(self):
+        entries = list()
         while True:
             try:
-                entry = self._queue.get_nowait()
+                entries.append(self._queue.get_nowait())
             except QueueEmpty:
                 break
-            await self.submit_query(self._query_factory.build_update_not_processed(), (entry.id_,))
+
+        if entries:
+            parameters = [(entry.id_,) for entry in entries]
+            await self.submit_many(self._query_factory.build_update_not_processed(), parameters)
+
+        for _ in entries:
             self._queue.task_done()
 
     async def _enqueue(self, message: BrokerMessage) -> None:
-        await self.submit_query_and_fetchone(self._query_factory.build_insert(), (message.topic, message.avro_bytes))
-        await self._notify_enqueued(message)
+        # The notification is delivered once the transaction is committed, so the entry is already visible.
+        async with self.session(transaction=True):
+            await self.submit_query_and_fetchone(
+                self._query_factory.build_insert(), (message.topic, message.avro_bytes)
+            )
+            await self._notify_enqueued(message)
 
     async def _notify_enqueued(self, message: BrokerMessage) -> None:
         await self.submit_query(self._query_factory.build_notify())
@@ -171,7 +181,7 @@ class PostgreSqlBrokerQueue(BrokerQueue, PostgreSqlMinosDatabase):
 
     async def _get_count(self, cursor: Cursor) -> int:
         # noinspection PyTypeChecker
-        await cursor.execute(self._query_factory.build_count_not_processed(), (self._retry,))
+        await self.execute(cursor, self._query_factory.build_count_not_processed(), (self._retry,))
         count = (await cursor.fetchone())[0]
         return count
 
@@ -185,14 +195,14 @@ class PostgreSqlBrokerQueue(BrokerQueue, PostgreSqlMinosDatabase):
             entries = [_Entry(*row) for row in rows]
 
             # noinspection PyTypeChecker
-            await cursor.execute(self._query_factory.build_mark_processing(), (tuple(entry.id_ for entry in entries),))
+            await self.execute(cursor, self._query_factory.build_mark_processing(), ([entry.id_ for entry in entries],))
 
             for entry in entries:
                 await self._queue.put(entry)
 
     async def _dequeue_rows(self, cursor: Cursor) -> list[Any]:
         # noinspection PyTypeChecker
-        await cursor.execute(self._query_factory.build_select_not_processed(), (self._retry, self._records))
+        await self.execute(cursor, self._query_factory.build_select_not_processed(), (self._retry, self._records))
         return await cursor.fetchall()
 
 
@@ -245,7 +255,7 @@ class PostgreSqlBrokerQueueQueryFactory(ABC):
 
         :return: A ``SQL`` instance.
         """
-        return SQL(f"UPDATE {self.build_table_name()} SET processing = TRUE WHERE id IN %s")
+        return SQL(f"UPDATE {self.build_table_name()} SET processing = TRUE WHERE id = ANY(%s)")
 
     def build_notify(self) -> SQL:
         """Build the "notify" query.
@@ -312,6 +322,7 @@ class _Entry:
 
         :return: A ``Model`` inherited instance.
         """
+        # The message is decoded eagerly, as the entry is only deleted if its whole payload can be decoded.
         return BrokerMessage.from_avro_bytes(self.data_bytes)
 
     def __lt__(self, other: Any) -> bool:
@@ -26,6 +26,9 @@ from minos.common import (
 class BrokerMessage(ABC, Model):
     """Broker Message base class."""
 
+    # The encoded data only adds the version to the field values, so it can be cached.
+    _encode_data_cacheable = True
+
     @property
     @abstractmethod
     def topic(self) -> str:
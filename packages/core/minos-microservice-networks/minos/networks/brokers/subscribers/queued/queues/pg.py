@@ -59,14 +59,14 @@ class PostgreSqlBrokerSubscriberQueue(PostgreSqlBrokerQueue, BrokerSubscriberQue
 
     async def _get_count(self, cursor: Cursor) -> int:
         # noinspection PyTypeChecker
-        await cursor.execute(self._query_factory.build_count_not_processed(), (self._retry, tuple(self.topics)))
+        await self.execute(cursor, self._query_factory.build_count_not_processed(), (self._retry, list(self.topics)))
         count = (await cursor.fetchone())[0]
         return count
 
     async def _dequeue_rows(self, cursor: Cursor) -> list[Any]:
         # noinspection PyTypeChecker
-        await cursor.execute(
-            self._query_factory.build_select_not_processed(), (self._retry, tuple(self.topics), self._records)
+        await self.execute(
+            cursor, self._query_factory.build_select_not_processed(), (self._retry, list(self.topics), self._records)
         )
         return await cursor.fetchall()
 
@@ -109,7 +109,7 @@ class PostgreSqlBrokerSubscriberQueueQueryFactory(PostgreSqlBrokerQueueQueryFact
         """
         return SQL(
             f"SELECT COUNT(*) FROM (SELECT id FROM {self.build_table_name()} "
-            "WHERE NOT processing AND retry < %s AND topic IN %s FOR UPDATE SKIP LOCKED) s"
+            "WHERE NOT processing AND retry < %s AND topic = ANY(%s) FOR UPDATE SKIP LOCKED) s"
         )
 
     def build_select_not_processed(self) -> SQL:
@@ -120,7 +120,7 @@ class PostgreSqlBrokerSubscriberQueueQueryFactory(PostgreSqlBrokerQueueQueryFact
         return SQL(
             "SELECT id, data "
             f"FROM {self.build_table_name()} "
-            "WHERE NOT processing AND retry < %s AND topic IN %s "
+            "WHERE NOT processing AND retry < %s AND topic = ANY(%s) "
             "ORDER BY created_at "
             "LIMIT %s "
             "FOR UPDATE SKIP LOCKED"
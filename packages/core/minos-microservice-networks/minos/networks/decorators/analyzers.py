@@ -5,10 +5,14 @@ from inspect import (
 )
 from typing import (
     Callable,
+    ClassVar,
     Optional,
     Type,
     Union,
 )
+from weakref import (
+    WeakKeyDictionary,
+)
 
 from minos.common import (
     MinosConfig,
@@ -32,7 +36,14 @@ from .definitions import (
 
 
 class EnrouteAnalyzer:
-    """Search decorators in specified class"""
+    """Search decorators in specified class.
+
+    The search is performed only once for each class and config, so the rest handler, the broker dispatcher, the
+    periodic task scheduler and the discovery connector share the same analysis of the services.
+    """
+
+    _cache: ClassVar[WeakKeyDictionary[type, dict[Optional[MinosConfig], dict[str, set[EnrouteDecorator]]]]]
+    _cache = WeakKeyDictionary()
 
     # noinspection PyUnusedLocal
     def __init__(self, decorated: Union[str, Type], config: Optional[MinosConfig] = None, **kwargs):
@@ -97,8 +108,16 @@ class EnrouteAnalyzer:
 
         :return: A mapping with functions as keys and a sets of decorators as values.
         """
-        fn: Callable = getattr(self.decorated, "__get_enroute__", self._get_all)
-        return fn(config=self.config)
+        try:
+            cached = self._cache.setdefault(self.decorated, dict())
+        except TypeError:
+            cached = dict()
+
+        if self.config not in cached:
+            fn: Callable = getattr(self.decorated, "__get_enroute__", self._get_all)
+            cached[self.config] = fn(config=self.config)
+
+        return {name: set(decorators) for name, decorators in cached[self.config].items()}
 
     # noinspection PyUnusedLocal
     def _get_all(self, *args, **kwargs) -> dict[str, set[EnrouteDecorator]]:
@@ -22,6 +22,7 @@ from aiohttp import (
 )
 
 from minos.common import (
+    METRICS_REGISTRY,
     MinosConfig,
     MinosSetup,
 )
@@ -109,6 +110,7 @@ class RestHandler(MinosSetup):
 
         # Load default routes
         self._mount_system_health(app)
+        self._mount_system_metrics(app)
 
     def _mount_one_route(self, method: str, url: str, action: Callable, app: web.Application) -> None:
         handler = self.get_callback(action)
@@ -167,3 +169,15 @@ class RestHandler(MinosSetup):
         """
         logger.info(f"Dispatching '{request!s}' from '{request.remote!s}'...")
         return web.json_response({"host": request.host})
+
+    def _mount_system_metrics(self, app: web.Application):
+        """Mount System Metrics Route."""
+        app.router.add_get("/system/metrics", self._system_metrics_handler)
+
+    @staticmethod
+    async def _system_metrics_handler(request: web.Request) -> web.Response:
+        """System Metrics Route Handler.
+        :return: A `web.json_response` response.
+        """
+        logger.info(f"Dispatching '{request!s}' from '{request.remote!s}'...")
+        return web.json_response(METRICS_REGISTRY.collect())
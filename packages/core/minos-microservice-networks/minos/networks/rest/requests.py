@@ -31,15 +31,13 @@ from aiohttp.web import Request as AioHttpRequest
 from cached_property import (
     cached_property,
 )
-from orjson import (
-    orjson,
-)
 
 from minos.common import (
     AvroDataDecoder,
     AvroDataEncoder,
     AvroSchemaDecoder,
     AvroSchemaEncoder,
+    JsonDataEncoder,
     MinosAvroProtocol,
     TypeHintBuilder,
     import_module,
@@ -142,8 +140,7 @@ class RestRequest(Request):
         return self._parse_multi_dict(form)
 
     async def _raw_avro(self) -> Any:
-        data = MinosAvroProtocol.decode(await self._raw_bytes())
-        schema = MinosAvroProtocol.decode_schema(await self._raw_bytes())
+        schema, data = MinosAvroProtocol.decode_with_schema(await self._raw_bytes())
 
         type_ = AvroSchemaDecoder(schema).build()
         return AvroDataDecoder(type_).build(data)
@@ -296,7 +293,7 @@ class RestResponse(Response):
         return mapper[self.content_type]
 
     async def _raw_json(self) -> bytes:
-        return orjson.dumps(self._raw_data)
+        return JsonDataEncoder(self._data).build()
 
     async def _raw_form(self) -> bytes:
         return urlencode(self._raw_data).encode()
@@ -7,7 +7,12 @@ from unittest.mock import (
     patch,
 )
 
+from psycopg2.sql import (
+    SQL,
+)
+
 from minos.common import (
+    MinosAvroProtocol,
     PostgreSqlMinosDatabase,
 )
 from minos.common.testing import (
@@ -92,6 +97,27 @@ class TestPostgreSqlBrokerQueue(PostgresAsyncTestCase):
 
         self.assertEqual(messages, observed)
 
+    async def test_dequeue_with_bad_payload(self):
+        message = BrokerMessageV1("foo", BrokerMessageV1Payload("bar"))
+
+        # The message envelope is valid, but the headers of the model nested into the payload are not a dictionary.
+        bad = BrokerMessageV1("foo", BrokerMessageV1Payload(BrokerMessageV1Payload("bar")))
+        schema, data = MinosAvroProtocol.decode_with_schema(bad.avro_bytes)
+        schema["fields"][4]["type"]["fields"][0]["type"]["fields"][2]["type"] = {"type": "array", "items": "string"}
+        data["payload"]["content"]["headers"] = ["bar"]
+        bad_bytes = MinosAvroProtocol.encode(data, schema)
+
+        async with PostgreSqlBrokerQueue.from_config(self.config, query_factory=self.query_factory) as queue:
+            await queue.submit_query(self.query_factory.build_insert(), ("foo", bad_bytes))
+            await queue.enqueue(message)
+
+            observed = await queue.dequeue()
+
+            rows = [row async for row in queue.submit_query_and_iter(SQL("SELECT data, retry FROM test_table"))]
+
+        self.assertEqual(message, observed)
+        self.assertEqual([(bad_bytes, 1)], [(bytes(data), retry) for data, retry in rows])
+
     async def test_dequeue_with_notify(self):
         messages = [
             BrokerMessageV1("foo", BrokerMessageV1Payload("bar")),
@@ -127,6 +153,22 @@ class TestPostgreSqlBrokerQueue(PostgresAsyncTestCase):
 
         self.assertEqual(expected, observed)
 
+    async def test_destroy_flushes_queue(self):
+        messages = [
+            BrokerMessageV1("foo", BrokerMessageV1Payload("bar")),
+            BrokerMessageV1("bar", BrokerMessageV1Payload("foo")),
+        ]
+
+        async with PostgreSqlBrokerQueue.from_config(self.config, query_factory=self.query_factory) as queue:
+            for message in messages:
+                await queue.enqueue(message)
+            await sleep(0.5)
+
+        async with PostgreSqlBrokerQueue.from_config(self.config, query_factory=self.query_factory) as queue:
+            observed = [await queue.dequeue(), await queue.dequeue()]
+
+        self.assertEqual(messages, observed)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,8 +1,5 @@
 import unittest
 import warnings
-from unittest.mock import (
-    patch,
-)
 from uuid import (
     UUID,
     uuid4,
@@ -149,7 +146,7 @@ class TestBrokerMessageV1(unittest.TestCase):
                                     "items": {
                                         "fields": [{"name": "data", "type": "string"}],
                                         "name": "FakeModel",
-                                        "namespace": "tests.utils.hello",
+                                        "namespace": "tests.utils._0",
                                         "type": "record",
                                     },
                                     "type": "array",
@@ -165,14 +162,14 @@ class TestBrokerMessageV1(unittest.TestCase):
                             {"name": "headers", "type": {"type": "map", "values": "string"}},
                         ],
                         "name": "BrokerMessageV1Payload",
-                        "namespace": "minos.networks.brokers.messages.models.v1.hello",
+                        "namespace": "minos.networks.brokers.messages.models.v1._0",
                         "type": "record",
                     },
                 },
                 {"name": "version", "type": "int"},
             ],
             "name": "BrokerMessage",
-            "namespace": "minos.networks.brokers.messages.models.abc.hello",
+            "namespace": "minos.networks.brokers.messages.models.abc._0",
             "type": "record",
         }
         data = {
@@ -210,7 +207,7 @@ class TestBrokerMessageV1(unittest.TestCase):
                                     "items": {
                                         "fields": [{"name": "data", "type": "string"}],
                                         "name": "FakeModel",
-                                        "namespace": "tests.utils.hello",
+                                        "namespace": "tests.utils._0",
                                         "type": "record",
                                     },
                                     "type": "array",
@@ -226,18 +223,17 @@ class TestBrokerMessageV1(unittest.TestCase):
                             {"name": "headers", "type": {"type": "map", "values": "string"}},
                         ],
                         "name": "BrokerMessageV1Payload",
-                        "namespace": "minos.networks.brokers.messages.models.v1.hello",
+                        "namespace": "minos.networks.brokers.messages.models.v1._0",
                         "type": "record",
                     },
                 },
                 {"name": "version", "type": "int"},
             ],
             "name": "BrokerMessage",
-            "namespace": "minos.networks.brokers.messages.models.abc.hello",
+            "namespace": "minos.networks.brokers.messages.models.abc._0",
             "type": "record",
         }
-        with patch("minos.common.AvroSchemaEncoder.generate_random_str", return_value="hello"):
-            observed = BrokerMessageV1(self.topic, self.payload).avro_schema
+        observed = BrokerMessageV1(self.topic, self.payload).avro_schema
         self.assertEqual([schema], observed)
 
     def test_avro_data(self):
@@ -256,6 +252,34 @@ class TestBrokerMessageV1(unittest.TestCase):
         expected = BrokerMessageV1(self.topic, self.payload)
         self.assertEqual(expected, Model.from_avro_bytes(expected.avro_bytes))
 
+    def test_avro_cached(self):
+        message = BrokerMessageV1(self.topic, self.payload)
+
+        avro_bytes = message.avro_bytes
+        self.assertIs(message.avro_data, message.avro_data)
+        self.assertIs(avro_bytes, message.avro_bytes)
+
+        message.payload.headers["bar"] = "foo"
+        self.assertEqual({"foo": "bar", "bar": "foo"}, message.avro_data["payload"]["headers"])
+        self.assertEqual(message, Model.from_avro_bytes(message.avro_bytes))
+
+        message.set_reply_topic(self.reply_topic)
+        self.assertEqual(self.reply_topic, message.avro_data["reply_topic"])
+        self.assertEqual(message, Model.from_avro_bytes(message.avro_bytes))
+
+    def test_avro_bytes_lazy(self):
+        expected = BrokerMessageV1(self.topic, self.payload)
+        observed = Model.from_avro_bytes(expected.avro_bytes, lazy=True)
+
+        self.assertEqual(self.topic, observed.topic)
+        self.assertTrue(observed.fields["payload"].is_lazy)
+
+        self.assertEqual({"foo": "bar"}, observed.headers)
+        self.assertFalse(observed.fields["payload"].is_lazy)
+        self.assertTrue(observed.payload.fields["content"].is_lazy)
+
+        self.assertEqual(expected, observed)
+
 
 class TestBrokerMessagePayload(unittest.TestCase):
     def setUp(self) -> None:
@@ -1,4 +1,7 @@
 import unittest
+from unittest.mock import (
+    MagicMock,
+)
 
 from minos.common import (
     classname,
@@ -115,6 +118,22 @@ class TestEnrouteAnalyzer(unittest.IsolatedAsyncioTestCase):
 
         self.assertEqual(expected, observed)
 
+    def test_get_all_cached(self):
+        mock = MagicMock(return_value={"create_foo": {BrokerCommandEnrouteDecorator("CreateFoo")}})
+        decorated = type("_FakeService", (), {"__get_enroute__": mock})
+
+        first = EnrouteAnalyzer(decorated, "config").get_all()
+        first["create_foo"].clear()
+        second = EnrouteAnalyzer(decorated, "config").get_rest_command_query()
+        third = EnrouteAnalyzer(decorated, "config").get_broker_command_query()
+
+        self.assertEqual(1, mock.call_count)
+        self.assertEqual(dict(), second)
+        self.assertEqual({"create_foo": {BrokerCommandEnrouteDecorator("CreateFoo")}}, third)
+
+        EnrouteAnalyzer(decorated, "another").get_all()
+        self.assertEqual(2, mock.call_count)
+
 
 if __name__ == "__main__":
     unittest.main()
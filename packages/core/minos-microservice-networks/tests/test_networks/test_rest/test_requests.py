@@ -9,9 +9,11 @@ from orjson import (
 )
 
 from minos.common import (
+    AvroDataEncoder,
     MinosAvroProtocol,
     ModelType,
     classname,
+    current_datetime,
 )
 from minos.networks import (
     NotHasContentException,
@@ -385,6 +387,11 @@ class TestRestResponse(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(orjson.dumps([item.avro_data for item in data]), await response.content())
         self.assertEqual("application/json", response.content_type)
 
+    async def test_content_json_avro_compatible(self):
+        data = {"uuid": uuid4(), "now": current_datetime(), "items": [FakeModel("foo")]}
+        response = RestResponse(data)
+        self.assertEqual(orjson.dumps(AvroDataEncoder(data).build()), await response.content())
+
     async def test_content_form(self):
         data = {"foo": "bar", "one": "two"}
         response = RestResponse(data, content_type="application/x-www-form-urlencoded")
@@ -43,6 +43,11 @@ class TestRestService(AioHTTPTestCase):
         resp = await self.client.request("GET", "/system/health")
         assert resp.status == 200
 
+    async def test_system_metrics(self):
+        resp = await self.client.request("GET", "/system/metrics")
+        assert resp.status == 200
+        assert isinstance(await resp.json(), dict)
+
 
 if __name__ == "__main__":
     unittest.main()
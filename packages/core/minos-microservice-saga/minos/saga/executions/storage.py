@@ -3,6 +3,8 @@ from __future__ import (
 )
 
 from typing import (
+    Any,
+    Optional,
     Type,
     Union,
 )
@@ -59,6 +61,16 @@ class SagaExecutionStorage:
         value = execution.raw
         self._storage.update(table=self.db_name, key=key, value=value)
 
+    async def astore(self, execution: SagaExecution) -> None:
+        """Store an execution without blocking the event loop.
+
+        :param execution: Execution to be stored.
+        :return: This method does not return anything.
+        """
+        key = str(execution.uuid)
+        value = execution.raw
+        await self._storage.aput(table=self.db_name, key=key, value=value)
+
     def load(self, key: Union[str, UUID]) -> SagaExecution:
         """Load the saga execution stored on the given key.
 
@@ -67,6 +79,20 @@ class SagaExecutionStorage:
         """
         key = str(key)
         value = self._storage.get(table=self.db_name, key=key)
+        return self._build_execution(key, value)
+
+    async def aload(self, key: Union[str, UUID]) -> SagaExecution:
+        """Load the saga execution stored on the given key without blocking the event loop.
+
+        :param key: The key to identify the execution.
+        :return: A ``SagaExecution`` instance.
+        """
+        key = str(key)
+        value = await self._storage.aget(table=self.db_name, key=key)
+        return self._build_execution(key, value)
+
+    @staticmethod
+    def _build_execution(key: str, value: Optional[dict[str, Any]]) -> SagaExecution:
         if value is None:
             raise SagaExecutionNotFoundException(f"The execution identified by {key} was not found.")
         execution = SagaExecution.from_raw(value)
@@ -83,3 +109,15 @@ class SagaExecutionStorage:
 
         key = str(key)
         self._storage.delete(table=self.db_name, key=key)
+
+    async def adelete(self, key: Union[SagaExecution, str, UUID]) -> None:
+        """Delete the reference of the given key without blocking the event loop.
+
+        :param key: Execution key to be deleted.
+        :return: This method does not return anything.
+        """
+        if isinstance(key, SagaExecution):
+            key = key.uuid
+
+        key = str(key)
+        await self._storage.adelete(table=self.db_name, key=key)
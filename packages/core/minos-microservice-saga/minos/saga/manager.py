@@ -154,7 +154,7 @@ class SagaManager(MinosSetup):
         return await self._run(execution, **kwargs)
 
     async def _load_and_run(self, response: SagaResponse, **kwargs) -> Union[UUID, SagaExecution]:
-        execution = self.storage.load(response.uuid)
+        execution = await self.storage.aload(response.uuid)
         return await self._run(execution, response=response, **kwargs)
 
     async def _run(
@@ -171,7 +171,7 @@ class SagaManager(MinosSetup):
             else:
                 await self._run_with_pause_on_memory(execution, **kwargs)
         except SagaFailedExecutionException as exc:
-            self.storage.store(execution)
+            await self.storage.astore(execution)
             if raise_on_error:
                 raise exc
             logger.warning(f"The execution identified by {execution.uuid!s} failed: {exc.exception!r}")
@@ -187,7 +187,7 @@ class SagaManager(MinosSetup):
                 headers["related_services"] = ",".join(related_services)
 
         if execution.status == SagaStatus.Finished:
-            self.storage.delete(execution)
+            await self.storage.adelete(execution)
 
         if return_execution:
             return execution
@@ -200,7 +200,7 @@ class SagaManager(MinosSetup):
             if autocommit:
                 await execution.commit(**kwargs)
         except SagaPausedExecutionStepException:
-            self.storage.store(execution)
+            await self.storage.astore(execution)
         except SagaFailedExecutionException as exc:
             if autocommit:
                 await execution.reject(**kwargs)
@@ -218,7 +218,7 @@ class SagaManager(MinosSetup):
                         await execution.execute(response=response, autocommit=False, **kwargs)
                     except SagaPausedExecutionStepException:
                         response = await self._get_response(broker, execution, **kwargs)
-                    self.storage.store(execution)
+                    await self.storage.astore(execution)
             if autocommit:
                 await execution.commit(**kwargs)
         except SagaFailedExecutionException as exc:
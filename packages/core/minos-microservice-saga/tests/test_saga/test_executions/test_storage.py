@@ -45,6 +45,27 @@ class TestSagaExecutionStorage(MinosTestCase):
 
         self.assertEqual(self.execution, storage.load(self.execution.uuid))
 
+    async def test_astore(self):
+        storage = SagaExecutionStorage(path=self.DB_PATH)
+
+        await storage.astore(self.execution)
+
+        self.assertEqual(self.execution, await storage.aload(self.execution.uuid))
+
+    async def test_aload_raises(self):
+        storage = SagaExecutionStorage(path=self.DB_PATH)
+
+        with self.assertRaises(SagaExecutionNotFoundException):
+            await storage.aload(self.execution.uuid)
+
+    async def test_adelete(self):
+        storage = SagaExecutionStorage(path=self.DB_PATH)
+
+        await storage.astore(self.execution)
+        await storage.adelete(self.execution)
+        with self.assertRaises(SagaExecutionNotFoundException):
+            await storage.aload(self.execution.uuid)
+
     def test_store_overwrite(self):
         storage = SagaExecutionStorage(path=self.DB_PATH)
 